@@ -8,12 +8,34 @@
 """Very hacky script for benchmarking zstd.
 
 Like most benchmarks, results should be treated with skepticism.
+
+Results can be written to a JSON file with ``--json``. Two such files can be
+compared with ``--compare BASE NEW``, which flags benchmarks whose timings
+changed by a statistically significant amount. Timings taken within one
+process are correlated, so significance is assessed on the medians of
+repeated runs: run the benchmarks several times (5 or more) per side and pass
+comma delimited lists of files. A comparison of single runs only reports
+possible changes.
+
+``--backends cext,cffi,rust`` runs the benchmarks against each backend in a
+separate process and compares the throughput of the backends.
+
+``--concurrency`` runs each discrete and streaming API from several threads at
+once and reports how throughput scales with the number of threads.
 """
 
+import concurrent.futures
 import io
+import json
+import math
 import os
+import platform
 import random
 import struct
+import subprocess
+import sys
+import tempfile
+import threading
 import time
 import zlib
 
@@ -22,30 +44,47 @@ import zstandard as zstd
 bio = io.BytesIO
 
 
-def timer(fn, miniter=3, minwall=3.0):
+# Adjusted from command line arguments.
+TIMER_SETTINGS = {
+    "miniter": 3,
+    "minwall": 3.0,
+    "warmup": 1,
+}
+
+# Results of all benchmarks that have run, for writing to a JSON file.
+RESULTS = []
+
+
+def timer(fn, miniter=3, minwall=3.0, warmup=1):
     """Runs fn() multiple times and returns the results.
 
-    Runs for at least ``miniter`` iterations and ``minwall`` wall time.
+    Runs ``warmup`` untimed iterations first so caches, allocators and lazily
+    created state are primed. Then runs for at least ``miniter`` iterations
+    and ``minwall`` wall time.
+
+    Each result is a ``(cpu, user, system, wall)`` tuple, in seconds.
     """
 
+    for _ in range(warmup):
+        fn()
+
     results = []
     count = 0
 
-    # Ideally a monotonic clock, but doesn't matter too much.
-    wall_begin = time.time()
+    wall_begin = time.perf_counter_ns()
 
     while True:
-        wstart = time.time()
         start = os.times()
+        wstart = time.perf_counter_ns()
         fn()
+        wend = time.perf_counter_ns()
         end = os.times()
-        wend = time.time()
         count += 1
 
         user = end[0] - start[0]
         system = end[1] - start[1]
         cpu = user + system
-        wall = wend - wstart
+        wall = (wend - wstart) / 1e9
 
         results.append((cpu, user, system, wall))
 
@@ -54,7 +93,7 @@ def timer(fn, miniter=3, minwall=3.0):
             continue
 
         # And for ``minwall`` seconds.
-        elapsed = wend - wall_begin
+        elapsed = (wend - wall_begin) / 1e9
 
         if elapsed < minwall:
             continue
@@ -64,6 +103,93 @@ def timer(fn, miniter=3, minwall=3.0):
     return results
 
 
+def reset_peak_rss():
+    """Reset the peak resident set size of this process.
+
+    Only Linux supports this. Returns whether the peak was reset. If it
+    wasn't, ``peak_rss()`` reports the peak of the whole process.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as fh:
+            fh.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss():
+    """Obtain the peak resident set size of this process, in bytes."""
+    try:
+        with open("/proc/self/status", "r") as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes, macOS bytes.
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def percentile(values, p):
+    """Obtain a percentile of sorted values using linear interpolation."""
+    if len(values) == 1:
+        return values[0]
+
+    k = (len(values) - 1) * p / 100.0
+    f = math.floor(k)
+    c = min(f + 1, len(values) - 1)
+
+    return values[f] + (values[c] - values[f]) * (k - f)
+
+
+def mann_whitney_u(a, b):
+    """Two-sided Mann-Whitney U test of two samples. Returns the p-value.
+
+    Benchmark timings aren't normally distributed, so a rank based test is
+    used. It uses the normal approximation with tie and continuity
+    correction, which is rough for fewer than about 5 values per sample.
+    """
+    n1 = len(a)
+    n2 = len(b)
+    n = n1 + n2
+
+    combined = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+
+    rank_sum = 0.0
+    ties = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and combined[j + 1][0] == combined[i][0]:
+            j += 1
+
+        rank = (i + j) / 2.0 + 1
+        rank_sum += rank * sum(1 for k in range(i, j + 1) if not combined[k][1])
+
+        t = j - i + 1
+        ties += t**3 - t
+        i = j + 1
+
+    u = rank_sum - n1 * (n1 + 1) / 2.0
+    mean = n1 * n2 / 2.0
+    sigma = math.sqrt(n1 * n2 / 12.0 * ((n + 1) - ties / (n * (n - 1))))
+
+    if sigma == 0:
+        return 1.0
+
+    z = max(abs(u - mean) - 0.5, 0.0) / sigma
+
+    return math.erfc(z / math.sqrt(2))
+
+
 BENCHES = []
 
 
@@ -76,7 +202,7 @@ def bench(
     threads_arg=False,
     chunks_as_buffer=False,
     decompressed_sizes_arg=False,
-    cffi=True,
+    feature=None,
 ):
     def wrapper(fn):
         if not fn.__name__.startswith(("compress_", "decompress_")):
@@ -92,7 +218,7 @@ def bench(
         fn.threads_arg = threads_arg
         fn.chunks_as_buffer = chunks_as_buffer
         fn.decompressed_sizes_arg = decompressed_sizes_arg
-        fn.cffi = cffi
+        fn.feature = feature
 
         BENCHES.append(fn)
 
@@ -121,7 +247,7 @@ def compress_reuse(chunks, zparams):
     simple=True,
     threads_arg=True,
     chunks_as_buffer=True,
-    cffi=False,
+    feature="multi_compress_to_buffer",
 )
 def compress_multi_compress_to_buffer_buffer(chunks, zparams, threads):
     zctx = zstd.ZstdCompressor(compression_params=zparams)
@@ -132,7 +258,7 @@ def compress_multi_compress_to_buffer_buffer(chunks, zparams, threads):
     "discrete",
     "multi_compress_to_buffer() w/ list input",
     threads_arg=True,
-    cffi=False,
+    feature="multi_compress_to_buffer",
 )
 def compress_multi_compress_to_buffer_list(chunks, zparams, threads):
     zctx = zstd.ZstdCompressor(compression_params=zparams)
@@ -250,6 +376,21 @@ def compress_stream_stream_writer(chunks, zparams):
             compressor.flush()
 
 
+@bench("stream", "stream_reader()")
+def compress_stream_stream_reader(chunks, zparams):
+    zctx = zstd.ZstdCompressor(compression_params=zparams)
+    with zctx.stream_reader(bio(b"".join(chunks))) as reader:
+        while reader.read(131072):
+            pass
+
+
+@bench("stream", "read_to_iter()")
+def compress_stream_read_to_iter(chunks, zparams):
+    zctx = zstd.ZstdCompressor(compression_params=zparams)
+    for d in zctx.read_to_iter(bio(b"".join(chunks))):
+        pass
+
+
 @bench("stream", "compressobj()", simple=True)
 def compress_stream_compressobj(chunks, zparams):
     zctx = zstd.ZstdCompressor(compression_params=zparams)
@@ -380,7 +521,7 @@ def decompress_zlib_decompress(chunks):
     threads_arg=True,
     decompressed_sizes_arg=True,
     chunks_as_buffer=True,
-    cffi=False,
+    feature="multi_decompress_to_buffer",
 )
 def decompress_multi_decompress_to_buffer_buffer_and_size(
     chunks, opts, threads, decompressed_sizes
@@ -397,7 +538,7 @@ def decompress_multi_decompress_to_buffer_buffer_and_size(
     require_content_size=True,
     threads_arg=True,
     chunks_as_buffer=True,
-    cffi=False,
+    feature="multi_decompress_to_buffer",
 )
 def decompress_multi_decompress_to_buffer_buffer(chunks, opts, threads):
     zctx = zstd.ZstdDecompressor(**opts)
@@ -409,7 +550,7 @@ def decompress_multi_decompress_to_buffer_buffer(chunks, opts, threads):
     "multi_decompress_to_buffer() w/ list of bytes input + sizes",
     threads_arg=True,
     decompressed_sizes_arg=True,
-    cffi=False,
+    feature="multi_decompress_to_buffer",
 )
 def decompress_multi_decompress_to_buffer_list_and_sizes(
     chunks, opts, threads, decompressed_sizes
@@ -425,7 +566,7 @@ def decompress_multi_decompress_to_buffer_list_and_sizes(
     "multi_decompress_to_buffer() w/ list of bytes input",
     require_content_size=True,
     threads_arg=True,
-    cffi=False,
+    feature="multi_decompress_to_buffer",
 )
 def decompress_multi_decompress_to_buffer_list(chunks, opts, threads):
     zctx = zstd.ZstdDecompressor(**opts)
@@ -481,6 +622,21 @@ def decompress_stream_stream_writer(chunks, opts):
             decompressor.write(chunk)
 
 
+@bench("stream", "stream_reader()")
+def decompress_stream_stream_reader(chunks, opts):
+    zctx = zstd.ZstdDecompressor(**opts)
+    with zctx.stream_reader(bio(b"".join(chunks))) as reader:
+        while reader.read(131072):
+            pass
+
+
+@bench("stream", "read_to_iter()")
+def decompress_stream_read_to_iter(chunks, opts):
+    zctx = zstd.ZstdDecompressor(**opts)
+    for d in zctx.read_to_iter(bio(b"".join(chunks))):
+        pass
+
+
 @bench("stream", "decompressobj()", simple=True)
 def decompress_stream_decompressobj(chunks, opts):
     zctx = zstd.ZstdDecompressor(**opts)
@@ -606,7 +762,7 @@ def get_benches(mode, direction, zlib=False):
         if fn.zlib != zlib:
             continue
 
-        if zstd.backend == "cffi" and not fn.cffi:
+        if fn.feature and fn.feature not in zstd.backend_features:
             continue
 
         fns.append(fn)
@@ -617,27 +773,750 @@ def get_benches(mode, direction, zlib=False):
 def format_results(results, title, prefix, total_size):
     best = min(results)
     rate = float(total_size) / best[3]
+    median = percentile(sorted(r[3] for r in results), 50)
 
     print("%s %s" % (prefix, title))
     print(
-        "%.6f wall; %.6f CPU; %.6f user; %.6f sys %.2f MB/s (best of %d)"
-        % (best[3], best[0], best[1], best[2], rate / 1000000.0, len(results))
+        "%.6f wall; %.6f CPU; %.6f user; %.6f sys %.2f MB/s (best of %d); "
+        "%.2f MB/s median"
+        % (
+            best[3],
+            best[0],
+            best[1],
+            best[2],
+            rate / 1000000.0,
+            len(results),
+            total_size / median / 1000000.0,
+        )
+    )
+
+
+def run_bench(fn, title, prefix, total_size, count):
+    """Time a benchmark, print its results and record them.
+
+    ``count`` is the number of operations (usually inputs) processed by each
+    call of ``fn``.
+    """
+    peak_rss_reset = reset_peak_rss()
+    results = timer(fn, **TIMER_SETTINGS)
+    rss = peak_rss()
+
+    format_results(results, title, prefix, total_size)
+
+    record_result(
+        "%s %s" % (prefix, title),
+        [r[3] for r in results],
+        total_size,
+        count,
+        rss,
+        peak_rss_reset,
+        cpu=min(r[0] for r in results),
+    )
+
+
+def wall_stats(walls):
+    """Summarize sorted wall times."""
+    mean = sum(walls) / len(walls)
+
+    return {
+        "best": walls[0],
+        "mean": mean,
+        "stdev": math.sqrt(sum((w - mean) ** 2 for w in walls) / len(walls)),
+        "p50": percentile(walls, 50),
+        "p90": percentile(walls, 90),
+        "p99": percentile(walls, 99),
+    }
+
+
+def record_result(
+    name, samples, total_size, count, rss, peak_rss_reset, cpu=None, **extra
+):
+    """Record the results of a benchmark for writing to a JSON file.
+
+    ``samples`` are wall times in seconds of runs processing ``total_size``
+    bytes in ``count`` operations. ``extra`` holds additional fields to
+    record.
+    """
+    stats = wall_stats(sorted(samples))
+
+    result = {
+        "name": name,
+        "iterations": len(samples),
+        "total_size": total_size,
+        "operations": count,
+        "mb_per_sec": total_size / stats["p50"] / 1000000.0,
+        "ops_per_sec": count / stats["p50"],
+        "wall": stats,
+        "cpu": cpu,
+        "peak_rss": rss,
+        "peak_rss_scope": "benchmark" if peak_rss_reset else "process",
+        "samples": samples,
+    }
+    result.update(extra)
+
+    RESULTS.append(result)
+
+
+# Sizes of payloads used for latency benchmarks, in bytes.
+LATENCY_SIZES = (128, 512, 1024, 4096)
+
+# Number of per-call samples of latency benchmarks to record. There are
+# usually far too many to write all of them.
+LATENCY_MAX_SAMPLES = 2000
+
+
+def clock_overhead():
+    """Obtain the median cost of timing an empty region, in nanoseconds."""
+    clock = time.perf_counter_ns
+    samples = []
+
+    for _ in range(10000):
+        start = clock()
+        samples.append(clock() - start)
+
+    samples.sort()
+
+    return samples[len(samples) // 2]
+
+
+def latency_timer(fn, payloads, miniter=3, minwall=3.0, warmup=1):
+    """Time individual calls of fn() for every payload.
+
+    Makes passes over all payloads like ``timer()`` runs functions. Returns
+    the wall time of every call in nanoseconds, less the overhead of reading
+    the clock.
+    """
+    clock = time.perf_counter_ns
+    overhead = clock_overhead()
+
+    for _ in range(warmup):
+        for payload in payloads:
+            fn(payload)
+
+    samples = []
+    count = 0
+
+    wall_begin = clock()
+
+    while True:
+        for payload in payloads:
+            start = clock()
+            fn(payload)
+            samples.append(clock() - start - overhead)
+
+        count += 1
+
+        if count >= miniter and (clock() - wall_begin) / 1e9 >= minwall:
+            break
+
+    return [max(sample, 0) for sample in samples]
+
+
+def run_latency_bench(fn, payloads, title, size):
+    """Time calls of fn() on payloads, print results and record them."""
+    peak_rss_reset = reset_peak_rss()
+    samples = latency_timer(fn, payloads, **TIMER_SETTINGS)
+    rss = peak_rss()
+
+    walls = sorted(samples)
+    name = "latency %s %d bytes" % (title, size)
+
+    print(name)
+    print(
+        "p50 %.2f us; p90 %.2f us; p99 %.2f us; %.0f ops/s (%d calls)"
+        % (
+            percentile(walls, 50) / 1000.0,
+            percentile(walls, 90) / 1000.0,
+            percentile(walls, 99) / 1000.0,
+            1e9 / max(percentile(walls, 50), 1),
+            len(walls),
+        )
+    )
+
+    # Keep an evenly spaced selection of samples in the order they were
+    # taken.
+    stride = max(len(samples) // LATENCY_MAX_SAMPLES, 1)
+
+    record_result(
+        name,
+        [max(sample, 1) / 1e9 for sample in samples[::stride]],
+        size,
+        1,
+        rss,
+        peak_rss_reset,
+    )
+
+
+def bench_latency(
+    chunks,
+    zparams,
+    sizes,
+    count,
+    compression=True,
+    decompression=True,
+    zlib_level=None,
+):
+    """Measure the latency of one-shot APIs on small payloads.
+
+    The inputs are joined and cut into up to ``count`` payloads of each size.
+    """
+    data = b"".join(chunks)
+
+    cctx = zstd.ZstdCompressor(compression_params=zparams)
+    dctx = zstd.ZstdDecompressor()
+
+    for size in sizes:
+        payloads = [
+            data[i : i + size] for i in range(0, len(data) - size + 1, size)
+        ][:count]
+
+        if not payloads:
+            print("inputs too small for %d byte payloads" % size)
+            continue
+
+        if compression:
+            run_latency_bench(cctx.compress, payloads, "compress()", size)
+
+            if zlib_level is not None:
+                run_latency_bench(
+                    lambda p: zlib.compress(p, zlib_level),
+                    payloads,
+                    "zlib compress()",
+                    size,
+                )
+
+        # decompress() requires the content size in frames.
+        if decompression and zparams.write_content_size:
+            frames = [cctx.compress(p) for p in payloads]
+            run_latency_bench(dctx.decompress, frames, "decompress()", size)
+
+        if decompression and zlib_level is not None:
+            frames = [zlib.compress(p, zlib_level) for p in payloads]
+            run_latency_bench(
+                zlib.decompress, frames, "zlib decompress()", size
+            )
+
+
+# Thread counts used for concurrency benchmarks.
+CONCURRENCY_THREADS = (1, 2, 4, 8)
+
+
+def gil_enabled():
+    """Whether the GIL is enabled. It always is before Python 3.13."""
+    fn = getattr(sys, "_is_gil_enabled", None)
+
+    return fn() if fn else True
+
+
+def concurrent_timer(fn, threads, miniter=3, minwall=3.0, warmup=1):
+    """Runs fn() on multiple threads at once and returns the results.
+
+    Each run calls ``fn()`` once on each of ``threads`` threads. Threads are
+    released together and the run ends when the last thread finishes. Runs
+    are repeated like ``timer()`` does.
+
+    Each result is a ``(cpu, wall)`` tuple, in seconds. ``cpu`` is the CPU
+    time of the whole process, which includes all threads.
+    """
+    clock = time.perf_counter_ns
+
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+
+        def run():
+            barrier = threading.Barrier(threads + 1)
+
+            # Threads may run before the releasing thread resumes, so each
+            # thread records its own start and end.
+            def work():
+                barrier.wait()
+                start = clock()
+                fn()
+                return start, clock()
+
+            futures = [executor.submit(work) for _ in range(threads)]
+
+            cpu_start = time.process_time()
+            barrier.wait()
+            times = [future.result() for future in futures]
+            cpu = time.process_time() - cpu_start
+
+            return (
+                cpu,
+                (max(t[1] for t in times) - min(t[0] for t in times)) / 1e9,
+            )
+
+        for _ in range(warmup):
+            run()
+
+        results = []
+        wall_begin = clock()
+
+        while True:
+            results.append(run())
+
+            if (
+                len(results) >= miniter
+                and (clock() - wall_begin) / 1e9 >= minwall
+            ):
+                break
+
+    return results
+
+
+def run_concurrency_bench(fn, title, prefix, total_size, count, thread_counts):
+    """Time fn() on increasing numbers of threads and report the scaling.
+
+    Every thread processes all inputs, so perfect scaling keeps the wall time
+    constant as threads are added. Scaling efficiency is the throughput
+    relative to the throughput of the smallest thread count multiplied by
+    the number of added threads.
+    """
+    name = "%s %s" % (prefix, title)
+    print(name)
+
+    base = None
+
+    for threads in thread_counts:
+        peak_rss_reset = reset_peak_rss()
+        results = concurrent_timer(fn, threads, **TIMER_SETTINGS)
+        rss = peak_rss()
+
+        walls = sorted(r[1] for r in results)
+        median = percentile(walls, 50)
+        rate = total_size * threads / median
+
+        if base is None:
+            base = rate / threads
+
+        efficiency = rate / (base * threads)
+        busy = percentile(sorted(r[0] / r[1] for r in results), 50)
+
+        print(
+            "%d threads: %.2f MB/s median; %.2fx; %.0f%% efficiency; "
+            "%.2f CPUs busy"
+            % (
+                threads,
+                rate / 1000000.0,
+                rate / base,
+                efficiency * 100.0,
+                busy,
+            )
+        )
+
+        record_result(
+            "%s %d threads" % (name, threads),
+            [r[1] for r in results],
+            total_size * threads,
+            count * threads,
+            rss,
+            peak_rss_reset,
+            cpu=min(r[0] for r in results),
+            threads=threads,
+            scaling_efficiency=efficiency,
+        )
+
+
+def bench_concurrency(
+    chunks,
+    zparams,
+    thread_counts,
+    compression=True,
+    decompression=True,
+    zlib_level=None,
+):
+    """Measure how APIs scale when called from multiple threads.
+
+    Discrete APIs process each chunk on its own. Streaming APIs, such as
+    ``stream_reader()``, ``read_to_iter()`` and ``stream_writer()``, process
+    all chunks as a single stream. Every thread uses its own compressor or
+    decompressor, as the benchmark functions create them.
+    """
+    total_size = sum(map(len, chunks))
+
+    print("GIL %s" % ("enabled" if gil_enabled() else "disabled"))
+
+    # Thread pools of APIs that use them would skew the results.
+    def benches(direction, zlib=False, mode="discrete"):
+        return [
+            fn
+            for fn in get_benches(mode, direction, zlib=zlib)
+            if not fn.threads_arg
+        ]
+
+    if compression:
+        for fn in benches("compress"):
+            run_concurrency_bench(
+                lambda: fn(chunks, zparams),
+                fn.title,
+                "concurrency compress discrete",
+                total_size,
+                len(chunks),
+                thread_counts,
+            )
+
+        for fn in benches("compress", mode="stream"):
+            run_concurrency_bench(
+                lambda: fn(chunks, zparams),
+                fn.title,
+                "concurrency compress stream",
+                total_size,
+                len(chunks),
+                thread_counts,
+            )
+
+        if zlib_level is not None:
+            for fn in benches("compress", zlib=True):
+                run_concurrency_bench(
+                    lambda: fn(chunks, {"zlib_level": zlib_level}),
+                    fn.title,
+                    "concurrency compress discrete zlib",
+                    total_size,
+                    len(chunks),
+                    thread_counts,
+                )
+
+    if decompression:
+        cctx = zstd.ZstdCompressor(compression_params=zparams)
+        frames = [cctx.compress(chunk) for chunk in chunks]
+
+        for fn in benches("decompress"):
+            if not zparams.write_content_size and fn.require_content_size:
+                continue
+
+            run_concurrency_bench(
+                lambda: fn(frames, {}),
+                fn.title,
+                "concurrency decompress discrete",
+                total_size,
+                len(frames),
+                thread_counts,
+            )
+
+        compressor = cctx.compressobj()
+        stream = [
+            compressor.compress(chunk)
+            + compressor.flush(zstd.COMPRESSOBJ_FLUSH_BLOCK)
+            for chunk in chunks
+        ]
+        stream.append(compressor.flush())
+
+        for fn in benches("decompress", mode="stream"):
+            run_concurrency_bench(
+                lambda: fn(stream, {}),
+                fn.title,
+                "concurrency decompress stream",
+                total_size,
+                len(stream),
+                thread_counts,
+            )
+
+        if zlib_level is not None:
+            frames = [zlib.compress(chunk, zlib_level) for chunk in chunks]
+
+            for fn in benches("decompress", zlib=True):
+                run_concurrency_bench(
+                    lambda: fn(frames),
+                    fn.title,
+                    "concurrency decompress discrete zlib",
+                    total_size,
+                    len(frames),
+                    thread_counts,
+                )
+
+
+def metadata(args):
+    info = {
+        "backend": zstd.backend,
+        "python_zstandard_version": zstd.__version__,
+        "zstd_version": zstd.ZSTD_VERSION,
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "argv": sys.argv[1:],
+        "time": time.time(),
+        "warmup": args.warmup,
+        "gil_enabled": gil_enabled(),
+    }
+
+    if hasattr(os, "sched_getaffinity"):
+        info["cpu_affinity"] = sorted(os.sched_getaffinity(0))
+
+    return info
+
+
+def write_json(path, args):
+    with open(path, "w") as fh:
+        json.dump(
+            {"metadata": metadata(args), "results": RESULTS}, fh, indent=2
+        )
+        fh.write("\n")
+
+
+BACKENDS = ("cext", "cffi", "rust")
+
+
+def strip_args(argv, names):
+    """Remove options taking a value from a list of arguments."""
+    result = []
+    skip = False
+
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg in names:
+            skip = True
+        elif not arg.startswith(tuple("%s=" % name for name in names)):
+            result.append(arg)
+
+    return result
+
+
+def run_backend_matrix(backends, argv, slow_ratio=2.0):
+    """Run benchmarks against multiple backends and compare their throughput.
+
+    Each backend is benchmarked in its own process, selected with
+    ``PYTHON_ZSTANDARD_IMPORT_POLICY``, so backends can't influence each
+    other's measurements. Backends that can't be imported are skipped.
+
+    Returns a dict mapping backend names to their JSON results.
+    """
+    documents = {}
+
+    with tempfile.TemporaryDirectory() as td:
+        for backend in backends:
+            env = dict(os.environ)
+            env["PYTHON_ZSTANDARD_IMPORT_POLICY"] = backend
+
+            probe = subprocess.run(
+                [sys.executable, "-c", "import zstandard"],
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            if probe.returncode:
+                print("%s backend not available; skipping" % backend)
+                continue
+
+            print("running benchmarks with %s backend" % backend)
+            sys.stdout.flush()
+
+            path = os.path.join(td, "%s.json" % backend)
+            subprocess.run(
+                [sys.executable, os.path.abspath(__file__)]
+                + argv
+                + ["--json", path],
+                env=env,
+                check=True,
+            )
+
+            with open(path, "r") as fh:
+                documents[backend] = json.load(fh)
+
+            print("")
+
+    print_backend_matrix(documents, slow_ratio=slow_ratio)
+
+    return documents
+
+
+def backend_ratios(documents):
+    """Obtain the throughput of each backend relative to the fastest.
+
+    Returns a list of ``(name, {backend: (mb_per_sec, ratio)})`` in the order
+    benchmarks ran.
+    """
+    names = []
+    rates = {}
+
+    for backend, document in documents.items():
+        for result in document["results"]:
+            if result["name"] not in rates:
+                names.append(result["name"])
+                rates[result["name"]] = {}
+
+            rates[result["name"]][backend] = result["mb_per_sec"]
+
+    ratios = []
+    for name in names:
+        fastest = max(rates[name].values())
+        ratios.append(
+            (
+                name,
+                {
+                    backend: (rate, rate / fastest)
+                    for backend, rate in rates[name].items()
+                },
+            )
+        )
+
+    return ratios
+
+
+def print_backend_matrix(documents, slow_ratio=2.0):
+    """Print the throughput of benchmarks for each backend.
+
+    Ratios are relative to the fastest backend for a benchmark. Backends
+    more than ``slow_ratio`` times slower than the fastest are flagged.
+    """
+    backends = list(documents)
+    ratios = backend_ratios(documents)
+    if not ratios:
+        return
+
+    width = max(len(name) for name, _ in ratios)
+
+    print(
+        "%s  %s"
+        % (
+            "benchmark".ljust(width),
+            "  ".join(("%s MB/s" % b).rjust(20) for b in backends),
+        )
+    )
+
+    for name, entries in ratios:
+        columns = []
+        for backend in backends:
+            if backend not in entries:
+                columns.append("n/a".rjust(20))
+                continue
+
+            rate, ratio = entries[backend]
+            columns.append(
+                "%10.2f %5.2fx %s"
+                % (rate, ratio, "SLOW" if ratio * slow_ratio < 1.0 else "    ")
+            )
+
+        print("%s  %s" % (name.ljust(width), "  ".join(columns)))
+
+
+def load_runs(paths):
+    """Load comma delimited JSON result files of repeated benchmark runs.
+
+    Returns the metadata of the first run and a dict of benchmark name to the
+    list of results of that benchmark in each run.
+    """
+    metadata = None
+    runs = {}
+
+    for path in paths.split(","):
+        with open(path, "r") as fh:
+            data = json.load(fh)
+
+        if metadata is None:
+            metadata = data["metadata"]
+
+        for result in data["results"]:
+            runs.setdefault(result["name"], []).append(result)
+
+    return metadata, runs
+
+
+def compare_results(base_paths, new_paths, alpha=0.05, threshold=0.05):
+    """Compare two sets of JSON result files and print differences.
+
+    ``base_paths`` and ``new_paths`` are comma delimited lists of result files
+    of repeated runs. A benchmark has regressed if the difference of its
+    timings is statistically significant at level ``alpha`` and its median
+    time grew by more than ``threshold``. Returns the number of regressions.
+
+    Significance is assessed on the medians of the runs, which accounts for
+    variance between processes. Samples taken within one process are
+    autocorrelated, so they can't be used instead. Without multiple runs on
+    both sides, changes beyond ``threshold`` are reported as possible and
+    aren't counted as regressions.
+    """
+    base_metadata, base_runs = load_runs(base_paths)
+    new_metadata, new_runs = load_runs(new_paths)
+
+    for key in ("backend", "zstd_version", "python_version", "machine"):
+        if base_metadata.get(key) != new_metadata.get(key):
+            print(
+                "warning: %s differs: %s vs %s"
+                % (key, base_metadata.get(key), new_metadata.get(key))
+            )
+
+    regressions = 0
+    repeated = all(len(r) > 1 for r in base_runs.values()) and all(
+        len(r) > 1 for r in new_runs.values()
     )
 
+    if not repeated:
+        print(
+            "warning: significance can't be assessed without multiple runs "
+            "per side"
+        )
+
+    for name, results in new_runs.items():
+        if name not in base_runs:
+            print("%s: not in %s" % (name, base_paths))
+            continue
+
+        old = base_runs.pop(name)
+
+        old_medians = sorted(r["wall"]["p50"] for r in old)
+        new_medians = sorted(r["wall"]["p50"] for r in results)
+
+        change = percentile(new_medians, 50) / percentile(old_medians, 50) - 1.0
+
+        if len(old) > 1 and len(results) > 1:
+            p = mann_whitney_u(old_medians, new_medians)
+        else:
+            p = None
+
+        if abs(change) <= threshold or (p is not None and p >= alpha):
+            status = "unchanged"
+        elif p is None:
+            status = "possible %s" % (
+                "regression" if change > 0 else "improvement"
+            )
+        elif change > 0:
+            status = "REGRESSION"
+            regressions += 1
+        else:
+            status = "improvement"
+
+        print(
+            "%s: %.2f -> %.2f MB/s (%+.1f%% time; p=%s; %d/%d runs) %s"
+            % (
+                name,
+                percentile(sorted(r["mb_per_sec"] for r in old), 50),
+                percentile(sorted(r["mb_per_sec"] for r in results), 50),
+                change * 100.0,
+                "n/a" if p is None else "%.3f" % p,
+                len(old),
+                len(results),
+                status,
+            )
+        )
+
+    for name in base_runs:
+        print("%s: not in %s" % (name, new_paths))
+
+    return regressions
+
 
 def bench_discrete_zlib_compression(chunks, opts):
     total_size = sum(map(len, chunks))
 
     for fn in get_benches("discrete", "compress", zlib=True):
-        results = timer(lambda: fn(chunks, opts))
-        format_results(results, fn.title, "compress discrete zlib", total_size)
+        run_bench(
+            lambda: fn(chunks, opts),
+            fn.title,
+            "compress discrete zlib",
+            total_size,
+            len(chunks),
+        )
 
 
 def bench_discrete_zlib_decompression(chunks, total_size):
     for fn in get_benches("discrete", "decompress", zlib=True):
-        results = timer(lambda: fn(chunks))
-        format_results(
-            results, fn.title, "decompress discrete zlib", total_size
+        run_bench(
+            lambda: fn(chunks),
+            fn.title,
+            "decompress discrete zlib",
+            total_size,
+            len(chunks),
         )
 
 
@@ -673,8 +1552,13 @@ def bench_discrete_compression(
                 b"".join(chunks), offsets.getvalue()
             )
 
-        results = timer(lambda: fn(chunks_arg, zparams, **kwargs))
-        format_results(results, fn.title, prefix, total_size)
+        run_bench(
+            lambda: fn(chunks_arg, zparams, **kwargs),
+            fn.title,
+            prefix,
+            total_size,
+            len(chunks),
+        )
 
 
 def bench_discrete_decompression(
@@ -724,44 +1608,74 @@ def bench_discrete_decompression(
                 s.pack(len(c)) for c in orig_chunks
             )
 
-        results = timer(lambda: fn(chunks_arg, dopts, **kwargs))
-        format_results(results, fn.title, prefix, total_size)
+        run_bench(
+            lambda: fn(chunks_arg, dopts, **kwargs),
+            fn.title,
+            prefix,
+            total_size,
+            len(compressed_chunks),
+        )
 
 
 def bench_stream_compression(chunks, zparams):
     total_size = sum(map(len, chunks))
 
     for fn in get_benches("stream", "compress"):
-        results = timer(lambda: fn(chunks, zparams))
-        format_results(results, fn.title, "compress stream", total_size)
+        run_bench(
+            lambda: fn(chunks, zparams),
+            fn.title,
+            "compress stream",
+            total_size,
+            len(chunks),
+        )
 
 
 def bench_stream_decompression(chunks, total_size):
     for fn in get_benches("stream", "decompress"):
-        results = timer(lambda: fn(chunks, {}))
-        format_results(results, fn.title, "decompress stream", total_size)
+        run_bench(
+            lambda: fn(chunks, {}),
+            fn.title,
+            "decompress stream",
+            total_size,
+            len(chunks),
+        )
 
 
 def bench_stream_zlib_compression(chunks, opts):
     total_size = sum(map(len, chunks))
 
     for fn in get_benches("stream", "compress", zlib=True):
-        results = timer(lambda: fn(chunks, opts))
-        format_results(results, fn.title, "compress stream zlib", total_size)
+        run_bench(
+            lambda: fn(chunks, opts),
+            fn.title,
+            "compress stream zlib",
+            total_size,
+            len(chunks),
+        )
 
 
 def bench_stream_zlib_decompression(chunks, total_size):
     for fn in get_benches("stream", "decompress", zlib=True):
-        results = timer(lambda: fn(chunks))
-        format_results(results, fn.title, "decompress stream zlib", total_size)
+        run_bench(
+            lambda: fn(chunks),
+            fn.title,
+            "decompress stream zlib",
+            total_size,
+            len(chunks),
+        )
 
 
 def bench_content_dict_compression(chunks, zparams):
     total_size = sum(map(len, chunks))
 
     for fn in get_benches("content-dict", "compress"):
-        results = timer(lambda: fn(chunks, zparams))
-        format_results(results, fn.title, "compress content dict", total_size)
+        run_bench(
+            lambda: fn(chunks, zparams),
+            fn.title,
+            "compress content dict",
+            total_size,
+            len(chunks),
+        )
 
 
 def bench_content_dict_decompression(chunks, total_size, zparams):
@@ -769,8 +1683,13 @@ def bench_content_dict_decompression(chunks, total_size, zparams):
         if not zparams.write_content_size and fn.require_content_size:
             continue
 
-        results = timer(lambda: fn(chunks, {}))
-        format_results(results, fn.title, "decompress content dict", total_size)
+        run_bench(
+            lambda: fn(chunks, {}),
+            fn.title,
+            "decompress content dict",
+            total_size,
+            len(chunks),
+        )
 
 
 if __name__ == "__main__":
@@ -802,6 +1721,18 @@ if __name__ == "__main__":
         action="store_true",
         help="Compress each input independently with a " "dictionary",
     )
+    group.add_argument(
+        "--latency",
+        action="store_true",
+        help="Measure the latency of individual one-shot calls on small "
+        "payloads",
+    )
+    group.add_argument(
+        "--concurrency",
+        action="store_true",
+        help="Run each discrete API from multiple threads at once and "
+        "measure how throughput scales",
+    )
 
     group = parser.add_argument_group("Benchmark Selection")
     group.add_argument(
@@ -900,12 +1831,166 @@ if __name__ == "__main__":
         help="Split inputs into chunks so they are at most this " "many bytes",
     )
 
-    parser.add_argument("path", metavar="PATH", nargs="+")
+    group.add_argument(
+        "--latency-sizes",
+        default=",".join(str(size) for size in LATENCY_SIZES),
+        help="Comma delimited payload sizes in bytes for --latency",
+    )
+    group.add_argument(
+        "--latency-count",
+        type=int,
+        default=1000,
+        help="Maximum number of payloads of each size for --latency",
+    )
+
+    group = parser.add_argument_group("Measurement")
+    group.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="Untimed iterations to run before timing each benchmark",
+    )
+    group.add_argument(
+        "--min-iterations",
+        type=int,
+        default=3,
+        help="Minimum number of timed iterations per benchmark",
+    )
+    group.add_argument(
+        "--min-time",
+        type=float,
+        default=3.0,
+        help="Minimum number of seconds to time each benchmark for",
+    )
+    group.add_argument(
+        "--cpu",
+        type=int,
+        action="append",
+        help="Pin the process to this CPU. Can be specified multiple times",
+    )
+    group.add_argument(
+        "--concurrency-threads",
+        default=",".join(str(threads) for threads in CONCURRENCY_THREADS),
+        help="Comma delimited thread counts for --concurrency",
+    )
+
+    group = parser.add_argument_group("Results")
+    group.add_argument(
+        "--json", metavar="PATH", help="Write results to a JSON file"
+    )
+    group.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASE", "NEW"),
+        help="Compare JSON result files instead of running benchmarks. BASE "
+        "and NEW are comma delimited lists of files of repeated runs. Exits "
+        "with status 1 if a regression is found",
+    )
+    group.add_argument(
+        "--alpha",
+        type=float,
+        default=0.05,
+        help="Significance level for comparing results",
+    )
+    group.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="Relative change of median time below which differences are "
+        "ignored when comparing results",
+    )
+
+    group = parser.add_argument_group("Backend Comparison")
+    group.add_argument(
+        "--backends",
+        help="Comma delimited list of backends to benchmark and compare, "
+        "each in its own process. Use 'all' for %s. Combine with "
+        "--split-input-size to measure per-call overhead on small inputs"
+        % ", ".join(BACKENDS),
+    )
+    group.add_argument(
+        "--slow-ratio",
+        type=float,
+        default=2.0,
+        help="Flag backends this many times slower than the fastest backend",
+    )
+
+    parser.add_argument("path", metavar="PATH", nargs="*")
 
     args = parser.parse_args()
 
+    if args.compare:
+        regressions = compare_results(
+            args.compare[0],
+            args.compare[1],
+            alpha=args.alpha,
+            threshold=args.threshold,
+        )
+        sys.exit(1 if regressions else 0)
+
+    if not args.path:
+        parser.error("the following arguments are required: PATH")
+
+    if args.backends:
+        if args.backends == "all":
+            backends = list(BACKENDS)
+        else:
+            backends = args.backends.split(",")
+
+        for backend in backends:
+            if backend not in BACKENDS:
+                parser.error("unknown backend: %s" % backend)
+
+        documents = run_backend_matrix(
+            backends,
+            strip_args(sys.argv[1:], ("--backends", "--json")),
+            slow_ratio=args.slow_ratio,
+        )
+
+        if args.json:
+            with open(args.json, "w") as fh:
+                json.dump(
+                    {
+                        "backends": documents,
+                        "ratios": {
+                            name: {
+                                backend: ratio
+                                for backend, (_, ratio) in entries.items()
+                            }
+                            for name, entries in backend_ratios(documents)
+                        },
+                    },
+                    fh,
+                    indent=2,
+                )
+                fh.write("\n")
+
+        sys.exit(0)
+
+    if args.cpu:
+        if not hasattr(os, "sched_setaffinity"):
+            parser.error("--cpu is not supported on this platform")
+
+        os.sched_setaffinity(0, args.cpu)
+
+    concurrency_threads = sorted(
+        set(int(threads) for threads in args.concurrency_threads.split(","))
+    )
+    if concurrency_threads[0] < 1:
+        parser.error("--concurrency-threads must be positive")
+
+    TIMER_SETTINGS["miniter"] = args.min_iterations
+    TIMER_SETTINGS["minwall"] = args.min_time
+    TIMER_SETTINGS["warmup"] = args.warmup
+
     # If no compression mode defined, assume discrete.
-    if not args.stream and not args.content_dict and not args.discrete_dict:
+    if (
+        not args.stream
+        and not args.content_dict
+        and not args.discrete_dict
+        and not args.latency
+        and not args.concurrency
+    ):
         args.discrete = True
 
     # It is easier to filter here than to pass arguments to multiple
@@ -1001,7 +2086,7 @@ if __name__ == "__main__":
         else:
             for chunk in chunks:
                 compressed = zctx.compress(chunk)
-                compressed_discrete.append(chunk)
+                compressed_discrete.append(compressed)
                 ratios.append(float(len(compressed)) / float(len(chunk)))
 
         compressed_size = sum(map(len, compressed_discrete))
@@ -1163,3 +2248,27 @@ if __name__ == "__main__":
             bench_content_dict_decompression(
                 compressed_content_dict, orig_size, zparams
             )
+
+    if args.latency:
+        bench_latency(
+            chunks,
+            zparams,
+            [int(size) for size in args.latency_sizes.split(",")],
+            args.latency_count,
+            compression=not args.no_compression,
+            decompression=not args.no_decompression,
+            zlib_level=args.zlib_level if args.zlib else None,
+        )
+
+    if args.concurrency:
+        bench_concurrency(
+            chunks,
+            zparams,
+            concurrency_threads,
+            compression=not args.no_compression,
+            decompression=not args.no_decompression,
+            zlib_level=args.zlib_level if args.zlib else None,
+        )
+
+    if args.json:
+        write_json(args.json, args)
@@ -36,7 +36,9 @@
 #include "decompressobj.c"
 #include "decompressor.c"
 #include "decompressoriterator.c"
+#include "dictregistry.c"
 #include "frameparams.c"
+#include "threadpool.c"
 
 PyObject *ZstdError;
 
@@ -44,6 +46,11 @@ static PyObject *estimate_decompression_context_size(PyObject *self) {
     return PyLong_FromSize_t(ZSTD_estimateDCtxSize());
 }
 
+/* Private. Lets Python code resolve thread counts like the C code does. */
+static PyObject *zstd_cpu_count(PyObject *self) {
+    return PyLong_FromLong(cpu_count());
+}
+
 static PyObject *frame_content_size(PyObject *self, PyObject *args,
                                     PyObject *kwargs) {
     static char *kwlist[] = {"source", NULL};
@@ -104,14 +111,19 @@ static PyObject *frame_header_size(PyObject *self, PyObject *args,
 static char zstd_doc[] = "Interface to zstandard";
 
 static PyMethodDef zstd_methods[] = {
+    {"_cpu_count", (PyCFunction)zstd_cpu_count, METH_NOARGS, NULL},
     {"estimate_decompression_context_size",
      (PyCFunction)estimate_decompression_context_size, METH_NOARGS, NULL},
     {"frame_content_size", (PyCFunction)frame_content_size,
      METH_VARARGS | METH_KEYWORDS, NULL},
     {"frame_header_size", (PyCFunction)frame_header_size,
      METH_VARARGS | METH_KEYWORDS, NULL},
+    {"frame_summary", (PyCFunction)frame_summary, METH_VARARGS | METH_KEYWORDS,
+     NULL},
     {"get_frame_parameters", (PyCFunction)get_frame_parameters,
      METH_VARARGS | METH_KEYWORDS, NULL},
+    {"scan_frames", (PyCFunction)frameparams_scan,
+     METH_VARARGS | METH_KEYWORDS, NULL},
     {"train_dictionary", (PyCFunction)train_dictionary,
      METH_VARARGS | METH_KEYWORDS, NULL},
     {NULL, NULL}};
@@ -131,7 +143,9 @@ void decompressobj_module_init(PyObject *mod);
 void decompressionreader_module_init(PyObject *mod);
 void decompressionwriter_module_init(PyObject *mod);
 void decompressoriterator_module_init(PyObject *mod);
+void dictregistry_module_init(PyObject *mod);
 void frameparams_module_init(PyObject *mod);
+void threadpool_module_init(PyObject *mod);
 
 void zstd_module_init(PyObject *m) {
     /* python-zstandard relies on unstable zstd C API features. This means
@@ -231,7 +245,9 @@ void zstd_module_init(PyObject *m) {
     decompressionreader_module_init(m);
     decompressionwriter_module_init(m);
     decompressoriterator_module_init(m);
+    dictregistry_module_init(m);
     frameparams_module_init(m);
+    threadpool_module_init(m);
 }
 
 #if defined(__GNUC__) && (__GNUC__ >= 4)
@@ -246,6 +262,15 @@ static struct PyModuleDef zstd_module = {PyModuleDef_HEAD_INIT, "backend_c",
 PYTHON_ZSTD_VISIBILITY PyMODINIT_FUNC PyInit_backend_c(void) {
     PyObject *m = PyModule_Create(&zstd_module);
     if (m) {
+#ifdef Py_GIL_DISABLED
+        /* The equivalent of the Py_mod_gil slot for single-phase init. State
+           shared between threads is guarded by context locks and critical
+           sections. */
+        if (PyUnstable_Module_SetGIL(m, Py_MOD_GIL_NOT_USED)) {
+            Py_DECREF(m);
+            return NULL;
+        }
+#endif
         zstd_module_init(m);
         if (PyErr_Occurred()) {
             Py_DECREF(m);
@@ -313,7 +338,7 @@ size_t roundpow2(size_t i) {
 int safe_pybytes_resize(PyObject **obj, Py_ssize_t size) {
     PyObject *tmp;
 
-    if ((*obj)->ob_refcnt == 1) {
+    if (Py_REFCNT(*obj) == 1) {
         return _PyBytes_Resize(obj, size);
     }
 
@@ -331,6 +356,92 @@ int safe_pybytes_resize(PyObject **obj, Py_ssize_t size) {
     return 0;
 }
 
+/**
+ * Obtain the buffer of the only argument of a METH_FASTCALL function.
+ *
+ * One-shot operations are frequently called with just a buffer, often a
+ * small one, where generic argument parsing is a significant part of the
+ * cost of the call. This handles that case directly.
+ *
+ * Returns 1 and fills view if there is exactly one positional argument
+ * that is a contiguous buffer. Otherwise returns 0 without an exception
+ * set and parse_fastcall_args() should be used.
+ */
+int fastcall_buffer_arg(PyObject *const *args, Py_ssize_t nargs,
+                        PyObject *kwnames, Py_buffer *view) {
+    if (1 != nargs || (kwnames && PyTuple_GET_SIZE(kwnames))) {
+        return 0;
+    }
+
+    if (PyObject_GetBuffer(args[0], view, PyBUF_SIMPLE)) {
+        /* Let the generic parser raise its usual error. */
+        PyErr_Clear();
+        return 0;
+    }
+
+    if (!PyBuffer_IsContiguous(view, 'C')) {
+        PyBuffer_Release(view);
+        return 0;
+    }
+
+    return 1;
+}
+
+/**
+ * Parse arguments of a METH_FASTCALL | METH_KEYWORDS function.
+ *
+ * Behaves like PyArg_ParseTupleAndKeywords(). Functions handle their most
+ * common calling convention directly and use this for everything else, so
+ * the cost of building an argument tuple and keywords dict is only paid by
+ * uncommon calls.
+ *
+ * Returns 0 on success.
+ */
+int parse_fastcall_args(PyObject *const *args, Py_ssize_t nargs,
+                        PyObject *kwnames, const char *format, char **kwlist,
+                        ...) {
+    PyObject *tuple;
+    PyObject *kwargs = NULL;
+    Py_ssize_t i;
+    va_list vargs;
+    int result = 1;
+
+    tuple = PyTuple_New(nargs);
+    if (!tuple) {
+        return 1;
+    }
+
+    for (i = 0; i < nargs; i++) {
+        Py_INCREF(args[i]);
+        PyTuple_SET_ITEM(tuple, i, args[i]);
+    }
+
+    if (kwnames && PyTuple_GET_SIZE(kwnames)) {
+        kwargs = PyDict_New();
+        if (!kwargs) {
+            goto finally;
+        }
+
+        for (i = 0; i < PyTuple_GET_SIZE(kwnames); i++) {
+            if (PyDict_SetItem(kwargs, PyTuple_GET_ITEM(kwnames, i),
+                               args[nargs + i])) {
+                goto finally;
+            }
+        }
+    }
+
+    va_start(vargs, kwlist);
+    result =
+        !PyArg_VaParseTupleAndKeywords(tuple, kwargs, format, kwlist, vargs);
+    va_end(vargs);
+
+finally:
+    Py_DECREF(tuple);
+    Py_XDECREF(kwargs);
+
+    return result;
+}
+
 // Set/raise an `io.UnsupportedOperation` exception.
 void set_io_unsupported_operation(void) {
     PyObject *iomod;
@@ -351,3 +462,88 @@ void set_io_unsupported_operation(void) {
     Py_DECREF(exc);
     Py_DECREF(iomod);
 }
+
+/* The owner of a lock is read without holding it. */
+#ifdef Py_GIL_DISABLED
+#define CONTEXT_LOCK_OWNER(lock)                                               \
+    _Py_atomic_load_uintptr_relaxed(&(lock)->owner)
+#define SET_CONTEXT_LOCK_OWNER(lock, value)                                    \
+    _Py_atomic_store_uintptr_relaxed(&(lock)->owner, value)
+#else
+#define CONTEXT_LOCK_OWNER(lock) ((lock)->owner)
+#define SET_CONTEXT_LOCK_OWNER(lock, value) ((lock)->owner = (value))
+#endif
+
+/**
+ * Prepare a zero-initialized ContextLock for use.
+ *
+ * Returns 0 on success.
+ */
+int context_lock_init(ContextLock *lock) {
+#if PY_VERSION_HEX < 0x030D0000
+    if (!lock->mutex) {
+        lock->mutex = PyThread_allocate_lock();
+        if (!lock->mutex) {
+            PyErr_SetString(PyExc_MemoryError, "unable to allocate lock");
+            return -1;
+        }
+    }
+#endif
+
+    return 0;
+}
+
+void context_lock_free(ContextLock *lock) {
+#if PY_VERSION_HEX < 0x030D0000
+    if (lock->mutex) {
+        PyThread_free_lock(lock->mutex);
+        lock->mutex = NULL;
+    }
+#endif
+}
+
+void context_lock_acquire(ContextLock *lock) {
+    uintptr_t thread = (uintptr_t)PyThread_get_thread_ident();
+
+    if (CONTEXT_LOCK_OWNER(lock) == thread) {
+        lock->count++;
+        return;
+    }
+
+#if PY_VERSION_HEX >= 0x030D0000
+    PyMutex_Lock(&lock->mutex);
+#else
+    /* Objects whose initialization failed don't have a lock. */
+    if (!lock->mutex) {
+        return;
+    }
+
+    if (!PyThread_acquire_lock(lock->mutex, NOWAIT_LOCK)) {
+        Py_BEGIN_ALLOW_THREADS PyThread_acquire_lock(lock->mutex, WAIT_LOCK);
+        Py_END_ALLOW_THREADS
+    }
+#endif
+
+    SET_CONTEXT_LOCK_OWNER(lock, thread);
+    lock->count = 1;
+}
+
+void context_lock_release(ContextLock *lock) {
+#if PY_VERSION_HEX < 0x030D0000
+    if (!lock->mutex) {
+        return;
+    }
+#endif
+
+    if (--lock->count) {
+        return;
+    }
+
+    SET_CONTEXT_LOCK_OWNER(lock, 0);
+
+#if PY_VERSION_HEX >= 0x030D0000
+    PyMutex_Unlock(&lock->mutex);
+#else
+    PyThread_release_lock(lock->mutex);
+#endif
+}
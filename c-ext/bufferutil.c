@@ -527,6 +527,380 @@ PyType_Spec ZstdBufferWithSegmentsCollectionSpec = {
 
 PyTypeObject *ZstdBufferWithSegmentsCollectionType;
 
+static void
+BufferWithSegmentsBuilder_dealloc(ZstdBufferWithSegmentsBuilder *self) {
+    PyMem_Free(self->data);
+    self->data = NULL;
+
+    PyMem_Free(self->segments);
+    self->segments = NULL;
+
+    PyObject_Del(self);
+}
+
+/*
+ * Ensure there is room for an additional number of bytes and segments.
+ *
+ * Capacity grows geometrically so a sequence of appends has amortized
+ * constant cost.
+ */
+static int
+BufferWithSegmentsBuilder_reserve(ZstdBufferWithSegmentsBuilder *self,
+                                  size_t extraSize, Py_ssize_t extraSegments) {
+    size_t neededSize;
+    Py_ssize_t neededSegments;
+
+    if (extraSize > (size_t)PY_SSIZE_T_MAX - self->dataSize) {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    neededSize = (size_t)self->dataSize + extraSize;
+
+    if (neededSize > self->dataCapacity) {
+        size_t newCapacity;
+        void *newData;
+
+        if (self->dataCapacity > (size_t)PY_SSIZE_T_MAX / 2) {
+            newCapacity = (size_t)PY_SSIZE_T_MAX;
+        }
+        else {
+            newCapacity = self->dataCapacity * 2;
+        }
+
+        if (newCapacity < neededSize) {
+            newCapacity = neededSize;
+        }
+
+        newData = PyMem_Realloc(self->data, newCapacity);
+        if (NULL == newData) {
+            PyErr_NoMemory();
+            return -1;
+        }
+
+        self->data = newData;
+        self->dataCapacity = newCapacity;
+    }
+
+    if (extraSegments > PY_SSIZE_T_MAX / (Py_ssize_t)sizeof(BufferSegment) -
+                            self->segmentCount) {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    neededSegments = self->segmentCount + extraSegments;
+
+    if (neededSegments > self->segmentsCapacity) {
+        Py_ssize_t newCapacity;
+        BufferSegment *newSegments;
+
+        if (self->segmentsCapacity >
+            PY_SSIZE_T_MAX / (Py_ssize_t)sizeof(BufferSegment) / 2) {
+            newCapacity = PY_SSIZE_T_MAX / (Py_ssize_t)sizeof(BufferSegment);
+        }
+        else {
+            newCapacity = self->segmentsCapacity * 2;
+        }
+
+        if (newCapacity < neededSegments) {
+            newCapacity = neededSegments;
+        }
+
+        newSegments = PyMem_Realloc(self->segments,
+                                    newCapacity * sizeof(BufferSegment));
+        if (NULL == newSegments) {
+            PyErr_NoMemory();
+            return -1;
+        }
+
+        self->segments = newSegments;
+        self->segmentsCapacity = newCapacity;
+    }
+
+    return 0;
+}
+
+/* Copy data into the builder as a new segment. Room must be reserved. */
+static void
+BufferWithSegmentsBuilder_push(ZstdBufferWithSegmentsBuilder *self,
+                               const void *data, size_t size) {
+    BufferSegment *segment = &self->segments[self->segmentCount];
+
+    if (size) {
+        memcpy((char *)self->data + self->dataSize, data, size);
+    }
+
+    segment->offset = self->dataSize;
+    segment->length = size;
+
+    self->dataSize += size;
+    self->segmentCount++;
+}
+
+static int
+BufferWithSegmentsBuilder_init(ZstdBufferWithSegmentsBuilder *self,
+                               PyObject *args, PyObject *kwargs) {
+    static char *kwlist[] = {"size_hint", "count_hint", NULL};
+
+    Py_ssize_t sizeHint = 0;
+    Py_ssize_t countHint = 0;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs,
+                                     "|nn:BufferWithSegmentsBuilder", kwlist,
+                                     &sizeHint, &countHint)) {
+        return -1;
+    }
+
+    if (sizeHint < 0 || countHint < 0) {
+        PyErr_SetString(PyExc_ValueError, "hints must be non-negative");
+        return -1;
+    }
+
+    PyMem_Free(self->data);
+    PyMem_Free(self->segments);
+    self->data = NULL;
+    self->dataSize = 0;
+    self->dataCapacity = 0;
+    self->segments = NULL;
+    self->segmentCount = 0;
+    self->segmentsCapacity = 0;
+
+    return BufferWithSegmentsBuilder_reserve(self, (size_t)sizeHint, countHint);
+}
+
+static Py_ssize_t
+BufferWithSegmentsBuilder_length(ZstdBufferWithSegmentsBuilder *self) {
+    return self->segmentCount;
+}
+
+static PyObject *
+BufferWithSegmentsBuilder_append(ZstdBufferWithSegmentsBuilder *self,
+                                 PyObject *args, PyObject *kwargs) {
+    static char *kwlist[] = {"data", NULL};
+
+    Py_buffer source;
+    PyObject *result = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*:append", kwlist,
+                                     &source)) {
+        return NULL;
+    }
+
+    if (BufferWithSegmentsBuilder_reserve(self, (size_t)source.len, 1)) {
+        goto finally;
+    }
+
+    BufferWithSegmentsBuilder_push(self, source.buf, (size_t)source.len);
+
+    Py_INCREF(Py_None);
+    result = Py_None;
+
+finally:
+    PyBuffer_Release(&source);
+
+    return result;
+}
+
+/* Copy all segments of a BufferWithSegments into the builder. */
+static int
+BufferWithSegmentsBuilder_extendBuffer(ZstdBufferWithSegmentsBuilder *self,
+                                       ZstdBufferWithSegments *buffer) {
+    Py_ssize_t i;
+    unsigned long long totalSize = 0;
+
+    for (i = 0; i < buffer->segmentCount; i++) {
+        totalSize += buffer->segments[i].length;
+    }
+
+    if (totalSize > PY_SSIZE_T_MAX) {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    if (BufferWithSegmentsBuilder_reserve(self, (size_t)totalSize,
+                                          buffer->segmentCount)) {
+        return -1;
+    }
+
+    for (i = 0; i < buffer->segmentCount; i++) {
+        BufferWithSegmentsBuilder_push(
+            self, (char *)buffer->data + buffer->segments[i].offset,
+            (size_t)buffer->segments[i].length);
+    }
+
+    return 0;
+}
+
+static PyObject *
+BufferWithSegmentsBuilder_extend(ZstdBufferWithSegmentsBuilder *self,
+                                 PyObject *args, PyObject *kwargs) {
+    static char *kwlist[] = {"data", NULL};
+
+    PyObject *data;
+    PyObject *iterator = NULL;
+    PyObject *item = NULL;
+    Py_buffer source;
+    Py_ssize_t i;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O:extend", kwlist,
+                                     &data)) {
+        return NULL;
+    }
+
+    /* Segmented buffers are copied segment by segment in a single pass. */
+    if (PyObject_TypeCheck(data, ZstdBufferWithSegmentsType)) {
+        if (BufferWithSegmentsBuilder_extendBuffer(
+                self, (ZstdBufferWithSegments *)data)) {
+            return NULL;
+        }
+
+        Py_RETURN_NONE;
+    }
+
+    if (PyObject_TypeCheck(data, ZstdBufferWithSegmentsCollectionType)) {
+        ZstdBufferWithSegmentsCollection *collection =
+            (ZstdBufferWithSegmentsCollection *)data;
+
+        for (i = 0; i < collection->bufferCount; i++) {
+            if (BufferWithSegmentsBuilder_extendBuffer(
+                    self, collection->buffers[i])) {
+                return NULL;
+            }
+        }
+
+        Py_RETURN_NONE;
+    }
+
+    iterator = PyObject_GetIter(data);
+    if (NULL == iterator) {
+        return NULL;
+    }
+
+    while ((item = PyIter_Next(iterator))) {
+        if (0 != PyObject_GetBuffer(item, &source, PyBUF_CONTIG_RO)) {
+            goto except;
+        }
+
+        if (BufferWithSegmentsBuilder_reserve(self, (size_t)source.len, 1)) {
+            PyBuffer_Release(&source);
+            goto except;
+        }
+
+        BufferWithSegmentsBuilder_push(self, source.buf, (size_t)source.len);
+        PyBuffer_Release(&source);
+        Py_CLEAR(item);
+    }
+
+    Py_DECREF(iterator);
+
+    if (PyErr_Occurred()) {
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+
+except:
+    Py_XDECREF(item);
+    Py_DECREF(iterator);
+
+    return NULL;
+}
+
+static ZstdBufferWithSegments *
+BufferWithSegmentsBuilder_finish(ZstdBufferWithSegmentsBuilder *self) {
+    ZstdBufferWithSegments *result;
+    void *data = self->data;
+    BufferSegment *segments = self->segments;
+
+    /* BufferWithSegments requires non-NULL pointers, even when empty. */
+    if (NULL == data) {
+        data = PyMem_Malloc(1);
+        if (NULL == data) {
+            return (ZstdBufferWithSegments *)PyErr_NoMemory();
+        }
+        self->data = data;
+        self->dataCapacity = 1;
+    }
+
+    if (NULL == segments) {
+        segments = PyMem_Malloc(sizeof(BufferSegment));
+        if (NULL == segments) {
+            return (ZstdBufferWithSegments *)PyErr_NoMemory();
+        }
+        self->segments = segments;
+        self->segmentsCapacity = 1;
+    }
+
+    /* Release unused capacity. Failure to shrink is harmless. */
+    if (self->dataSize && self->dataSize < self->dataCapacity) {
+        data = PyMem_Realloc(self->data, (size_t)self->dataSize);
+        if (data) {
+            self->data = data;
+            self->dataCapacity = (size_t)self->dataSize;
+        }
+    }
+
+    if (self->segmentCount && self->segmentCount < self->segmentsCapacity) {
+        segments = PyMem_Realloc(self->segments,
+                                 self->segmentCount * sizeof(BufferSegment));
+        if (segments) {
+            self->segments = segments;
+            self->segmentsCapacity = self->segmentCount;
+        }
+    }
+
+    result = BufferWithSegments_FromMemory(self->data, self->dataSize,
+                                           self->segments, self->segmentCount);
+    if (NULL == result) {
+        return NULL;
+    }
+
+    /* Memory is now owned by the result. Start over with an empty builder. */
+    self->data = NULL;
+    self->dataSize = 0;
+    self->dataCapacity = 0;
+    self->segments = NULL;
+    self->segmentCount = 0;
+    self->segmentsCapacity = 0;
+
+    return result;
+}
+
+static PyMethodDef BufferWithSegmentsBuilder_methods[] = {
+    {"append", (PyCFunction)BufferWithSegmentsBuilder_append,
+     METH_VARARGS | METH_KEYWORDS, PyDoc_STR("append a segment")},
+    {"extend", (PyCFunction)BufferWithSegmentsBuilder_extend,
+     METH_VARARGS | METH_KEYWORDS,
+     PyDoc_STR("append segments from an iterable or segmented buffer")},
+    {"finish", (PyCFunction)BufferWithSegmentsBuilder_finish, METH_NOARGS,
+     PyDoc_STR("obtain a BufferWithSegments from appended data")},
+    {NULL, NULL}};
+
+static PyMemberDef BufferWithSegmentsBuilder_members[] = {
+    {"size", T_ULONGLONG, offsetof(ZstdBufferWithSegmentsBuilder, dataSize),
+     READONLY, "total size of appended data in bytes"},
+    {NULL}};
+
+PyType_Slot ZstdBufferWithSegmentsBuilderSlots[] = {
+    {Py_tp_dealloc, BufferWithSegmentsBuilder_dealloc},
+    {Py_sq_length, BufferWithSegmentsBuilder_length},
+    {Py_tp_methods, BufferWithSegmentsBuilder_methods},
+    {Py_tp_members, BufferWithSegmentsBuilder_members},
+    {Py_tp_init, BufferWithSegmentsBuilder_init},
+    {Py_tp_new, PyType_GenericNew},
+    {0, NULL},
+};
+
+PyType_Spec ZstdBufferWithSegmentsBuilderSpec = {
+    "zstd.BufferWithSegmentsBuilder",
+    sizeof(ZstdBufferWithSegmentsBuilder),
+    0,
+    Py_TPFLAGS_DEFAULT,
+    ZstdBufferWithSegmentsBuilderSlots,
+};
+
+PyTypeObject *ZstdBufferWithSegmentsBuilderType;
+
 void bufferutil_module_init(PyObject *mod) {
     ZstdBufferWithSegmentsType =
         (PyTypeObject *)PyType_FromSpec(&ZstdBufferWithSegmentsSpec);
@@ -575,4 +949,14 @@ void bufferutil_module_init(PyObject *mod) {
     Py_INCREF(ZstdBufferWithSegmentsCollectionType);
     PyModule_AddObject(mod, "BufferWithSegmentsCollection",
                        (PyObject *)ZstdBufferWithSegmentsCollectionType);
+
+    ZstdBufferWithSegmentsBuilderType =
+        (PyTypeObject *)PyType_FromSpec(&ZstdBufferWithSegmentsBuilderSpec);
+    if (PyType_Ready(ZstdBufferWithSegmentsBuilderType) < 0) {
+        return;
+    }
+
+    Py_INCREF(ZstdBufferWithSegmentsBuilderType);
+    PyModule_AddObject(mod, "BufferWithSegmentsBuilder",
+                       (PyObject *)ZstdBufferWithSegmentsBuilderType);
 }
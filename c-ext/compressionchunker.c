@@ -22,8 +22,8 @@ static PyObject *ZstdCompressionChunkerIterator_iter(PyObject *self) {
     return self;
 }
 
-static PyObject *
-ZstdCompressionChunkerIterator_iternext(ZstdCompressionChunkerIterator *self) {
+static PyObject *ZstdCompressionChunkerIterator_iternext_impl(
+    ZstdCompressionChunkerIterator *self) {
     size_t zresult;
     PyObject *chunk;
     ZstdCompressionChunker *chunker = self->chunker;
@@ -135,6 +135,17 @@ ZstdCompressionChunkerIterator_iternext(ZstdCompressionChunkerIterator *self) {
     return chunk;
 }
 
+static PyObject *
+ZstdCompressionChunkerIterator_iternext(ZstdCompressionChunkerIterator *self) {
+    PyObject *result;
+
+    context_lock_acquire(&self->chunker->compressor->lock);
+    result = ZstdCompressionChunkerIterator_iternext_impl(self);
+    context_lock_release(&self->chunker->compressor->lock);
+
+    return result;
+}
+
 PyType_Slot ZstdCompressionChunkerIteratorSlots[] = {
     {Py_tp_dealloc, ZstdCompressionChunkerIterator_dealloc},
     {Py_tp_iter, ZstdCompressionChunkerIterator_iter},
@@ -166,8 +177,8 @@ static void ZstdCompressionChunker_dealloc(ZstdCompressionChunker *self) {
 }
 
 static ZstdCompressionChunkerIterator *
-ZstdCompressionChunker_compress(ZstdCompressionChunker *self, PyObject *args,
-                                PyObject *kwargs) {
+ZstdCompressionChunker_compress_impl(ZstdCompressionChunker *self,
+                                     PyObject *args, PyObject *kwargs) {
     static char *kwlist[] = {"data", NULL};
 
     ZstdCompressionChunkerIterator *result;
@@ -209,7 +220,19 @@ ZstdCompressionChunker_compress(ZstdCompressionChunker *self, PyObject *args,
 }
 
 static ZstdCompressionChunkerIterator *
-ZstdCompressionChunker_finish(ZstdCompressionChunker *self) {
+ZstdCompressionChunker_compress(ZstdCompressionChunker *self, PyObject *args,
+                                PyObject *kwargs) {
+    ZstdCompressionChunkerIterator *result;
+
+    context_lock_acquire(&self->compressor->lock);
+    result = ZstdCompressionChunker_compress_impl(self, args, kwargs);
+    context_lock_release(&self->compressor->lock);
+
+    return result;
+}
+
+static ZstdCompressionChunkerIterator *
+ZstdCompressionChunker_finish_impl(ZstdCompressionChunker *self) {
     ZstdCompressionChunkerIterator *result;
 
     if (self->finished) {
@@ -239,8 +262,19 @@ ZstdCompressionChunker_finish(ZstdCompressionChunker *self) {
 }
 
 static ZstdCompressionChunkerIterator *
-ZstdCompressionChunker_flush(ZstdCompressionChunker *self, PyObject *args,
-                             PyObject *kwargs) {
+ZstdCompressionChunker_finish(ZstdCompressionChunker *self) {
+    ZstdCompressionChunkerIterator *result;
+
+    context_lock_acquire(&self->compressor->lock);
+    result = ZstdCompressionChunker_finish_impl(self);
+    context_lock_release(&self->compressor->lock);
+
+    return result;
+}
+
+static ZstdCompressionChunkerIterator *
+ZstdCompressionChunker_flush_impl(ZstdCompressionChunker *self, PyObject *args,
+                                  PyObject *kwargs) {
     ZstdCompressionChunkerIterator *result;
 
     if (self->finished) {
@@ -269,6 +303,18 @@ ZstdCompressionChunker_flush(ZstdCompressionChunker *self, PyObject *args,
     return result;
 }
 
+static ZstdCompressionChunkerIterator *
+ZstdCompressionChunker_flush(ZstdCompressionChunker *self, PyObject *args,
+                             PyObject *kwargs) {
+    ZstdCompressionChunkerIterator *result;
+
+    context_lock_acquire(&self->compressor->lock);
+    result = ZstdCompressionChunker_flush_impl(self, args, kwargs);
+    context_lock_release(&self->compressor->lock);
+
+    return result;
+}
+
 static PyMethodDef ZstdCompressionChunker_methods[] = {
     {"compress", (PyCFunction)ZstdCompressionChunker_compress,
      METH_VARARGS | METH_KEYWORDS, PyDoc_STR("compress data")},
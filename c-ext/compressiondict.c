@@ -10,13 +10,311 @@
 
 extern PyObject *ZstdError;
 
+/*
+ * Incrementally assembles training samples into a single buffer.
+ *
+ * When a byte budget is set, a random subset of samples fitting the budget is
+ * retained. Each sample is assigned a random priority and the samples with
+ * the lowest priorities are kept, evicting the highest priority samples when
+ * the budget is exceeded. Evicted samples leave holes in the buffer, which are
+ * reclaimed by compacting it when it would otherwise grow.
+ */
+typedef struct {
+    unsigned long long priority;
+    size_t offset;
+    size_t size;
+    int live;
+} TrainingSample;
+
+typedef struct {
+    char *buffer;
+    size_t bufferSize;
+    size_t bufferCapacity;
+    TrainingSample *samples;
+    size_t samplesCount;
+    size_t samplesCapacity;
+    /* Max-heap of indices of live samples, ordered by priority. Only
+       maintained when a budget is set. */
+    size_t *heap;
+    size_t heapCount;
+    /* Total size of live samples. */
+    size_t liveSize;
+    /* Byte budget. 0 retains every sample. */
+    size_t maxSize;
+    unsigned long long rngState;
+} SampleCollector;
+
+static unsigned long long splitmix64(unsigned long long *state) {
+    unsigned long long z = (*state += 0x9E3779B97F4A7C15ULL);
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+    return z ^ (z >> 31);
+}
+
+static int heap_less(SampleCollector *c, size_t a, size_t b) {
+    return c->samples[c->heap[a]].priority < c->samples[c->heap[b]].priority;
+}
+
+static void heap_swap(SampleCollector *c, size_t a, size_t b) {
+    size_t tmp = c->heap[a];
+    c->heap[a] = c->heap[b];
+    c->heap[b] = tmp;
+}
+
+static void heap_sift_down(SampleCollector *c, size_t i) {
+    for (;;) {
+        size_t largest = i;
+        size_t left = 2 * i + 1;
+        size_t right = 2 * i + 2;
+
+        if (left < c->heapCount && heap_less(c, largest, left)) {
+            largest = left;
+        }
+        if (right < c->heapCount && heap_less(c, largest, right)) {
+            largest = right;
+        }
+        if (largest == i) {
+            return;
+        }
+
+        heap_swap(c, i, largest);
+        i = largest;
+    }
+}
+
+static void heap_push(SampleCollector *c, size_t index) {
+    size_t i = c->heapCount++;
+    c->heap[i] = index;
+
+    while (i && heap_less(c, (i - 1) / 2, i)) {
+        heap_swap(c, i, (i - 1) / 2);
+        i = (i - 1) / 2;
+    }
+}
+
+static void heap_pop(SampleCollector *c) {
+    c->heap[0] = c->heap[--c->heapCount];
+    heap_sift_down(c, 0);
+}
+
+/**
+ * Drop evicted samples, moving live samples to the front of the buffer.
+ */
+static void collector_compact(SampleCollector *c) {
+    size_t i;
+    size_t count = 0;
+    size_t offset = 0;
+
+    for (i = 0; i < c->samplesCount; i++) {
+        TrainingSample sample = c->samples[i];
+
+        if (!sample.live) {
+            continue;
+        }
+
+        memmove(c->buffer + offset, c->buffer + sample.offset, sample.size);
+        sample.offset = offset;
+        c->samples[count++] = sample;
+        offset += sample.size;
+    }
+
+    c->samplesCount = count;
+    c->bufferSize = offset;
+
+    if (c->heap) {
+        c->heapCount = count;
+        for (i = 0; i < count; i++) {
+            c->heap[i] = i;
+        }
+        for (i = count / 2; i > 0; i--) {
+            heap_sift_down(c, i - 1);
+        }
+    }
+}
+
+static int collector_add(SampleCollector *c, const char *data, size_t size) {
+    unsigned long long priority = 0;
+    TrainingSample *sample;
+
+    if (c->maxSize) {
+        if (size > c->maxSize) {
+            return 0;
+        }
+
+        priority = splitmix64(&c->rngState);
+
+        /* The sample would be the first to be evicted. */
+        if (c->liveSize + size > c->maxSize && c->heapCount &&
+            priority > c->samples[c->heap[0]].priority) {
+            return 0;
+        }
+    }
+
+    if (c->bufferSize + size > c->bufferCapacity) {
+        if (c->maxSize && c->bufferSize - c->liveSize >= c->liveSize) {
+            collector_compact(c);
+        }
+    }
+
+    if (c->bufferSize + size > c->bufferCapacity) {
+        size_t capacity = c->bufferCapacity ? c->bufferCapacity * 2 : 65536;
+        char *buffer;
+
+        if (capacity < c->bufferSize + size) {
+            capacity = c->bufferSize + size;
+        }
+
+        buffer = PyMem_Realloc(c->buffer, capacity);
+        if (!buffer) {
+            PyErr_NoMemory();
+            return -1;
+        }
+
+        c->buffer = buffer;
+        c->bufferCapacity = capacity;
+    }
+
+    if (c->samplesCount == c->samplesCapacity) {
+        if (c->maxSize && c->samplesCount - c->heapCount >= c->heapCount) {
+            collector_compact(c);
+        }
+    }
+
+    if (c->samplesCount == c->samplesCapacity) {
+        size_t capacity = c->samplesCapacity ? c->samplesCapacity * 2 : 1024;
+        TrainingSample *samples;
+
+        samples = PyMem_Realloc(c->samples, capacity * sizeof(TrainingSample));
+        if (!samples) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        c->samples = samples;
+
+        if (c->maxSize) {
+            size_t *heap = PyMem_Realloc(c->heap, capacity * sizeof(size_t));
+            if (!heap) {
+                PyErr_NoMemory();
+                return -1;
+            }
+            c->heap = heap;
+        }
+
+        c->samplesCapacity = capacity;
+    }
+
+    memcpy(c->buffer + c->bufferSize, data, size);
+
+    sample = &c->samples[c->samplesCount];
+    sample->priority = priority;
+    sample->offset = c->bufferSize;
+    sample->size = size;
+    sample->live = 1;
+
+    c->bufferSize += size;
+    c->liveSize += size;
+
+    if (c->maxSize) {
+        heap_push(c, c->samplesCount);
+    }
+
+    c->samplesCount++;
+
+    while (c->liveSize > c->maxSize && c->maxSize) {
+        TrainingSample *evicted = &c->samples[c->heap[0]];
+
+        evicted->live = 0;
+        c->liveSize -= evicted->size;
+        heap_pop(c);
+    }
+
+    return 0;
+}
+
+static void collector_free(SampleCollector *c) {
+    PyMem_Free(c->buffer);
+    PyMem_Free(c->samples);
+    PyMem_Free(c->heap);
+}
+
+/**
+ * Feed samples from a BufferWithSegments or an iterable of bytes.
+ */
+static int collector_add_samples(SampleCollector *c, PyObject *samples) {
+    PyObject *iter;
+    PyObject *item;
+    int result = 0;
+
+    if (PyObject_TypeCheck(samples, ZstdBufferWithSegmentsType)) {
+        ZstdBufferWithSegments *buffer = (ZstdBufferWithSegments *)samples;
+        Py_ssize_t i;
+
+        for (i = 0; i < buffer->segmentCount; i++) {
+            BufferSegment *segment = &buffer->segments[i];
+
+            if (collector_add(c, (char *)buffer->data + segment->offset,
+                              segment->length)) {
+                return -1;
+            }
+        }
+
+        return 0;
+    }
+
+    if (PyBytes_Check(samples) || PyUnicode_Check(samples)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "samples must be an iterable of bytes");
+        return -1;
+    }
+
+    iter = PyObject_GetIter(samples);
+    if (!iter) {
+        return -1;
+    }
+
+    while ((item = PyIter_Next(iter))) {
+        if (!PyBytes_Check(item)) {
+            PyErr_SetString(PyExc_ValueError, "samples must be bytes");
+            result = -1;
+        }
+        else {
+            result = collector_add(c, PyBytes_AS_STRING(item),
+                                   PyBytes_GET_SIZE(item));
+        }
+
+        Py_DECREF(item);
+
+        if (result) {
+            break;
+        }
+    }
+
+    Py_DECREF(iter);
+
+    if (!result && PyErr_Occurred()) {
+        result = -1;
+    }
+
+    return result;
+}
+
 ZstdCompressionDict *train_dictionary(PyObject *self, PyObject *args,
                                       PyObject *kwargs) {
-    static char *kwlist[] = {
-        "dict_size", "samples",     "k",     "d",
-        "f",         "split_point", "accel", "notifications",
-        "dict_id",   "level",       "steps", "threads",
-        NULL};
+    static char *kwlist[] = {"dict_size",
+                             "samples",
+                             "k",
+                             "d",
+                             "f",
+                             "split_point",
+                             "accel",
+                             "notifications",
+                             "dict_id",
+                             "level",
+                             "steps",
+                             "threads",
+                             "max_samples_size",
+                             "seed",
+                             NULL};
 
     size_t capacity;
     PyObject *samples;
@@ -30,22 +328,29 @@ ZstdCompressionDict *train_dictionary(PyObject *self, PyObject *args,
     int level = 0;
     unsigned steps = 0;
     int threads = 0;
+    Py_ssize_t maxSamplesSize = 0;
+    unsigned long long seed = 0;
     ZDICT_fastCover_params_t params;
-    Py_ssize_t samplesLen;
-    Py_ssize_t i;
-    size_t samplesSize = 0;
-    void *sampleBuffer = NULL;
+    SampleCollector collector;
     size_t *sampleSizes = NULL;
-    void *sampleOffset;
-    Py_ssize_t sampleSize;
+    size_t i;
     void *dict = NULL;
     size_t zresult;
     ZstdCompressionDict *result = NULL;
 
+    memset(&collector, 0, sizeof(collector));
+
     if (!PyArg_ParseTupleAndKeywords(
-            args, kwargs, "nO!|IIIdIIIiIi:train_dictionary", kwlist, &capacity,
-            &PyList_Type, &samples, &k, &d, &f, &splitPoint, &accel,
-            &notifications, &dictID, &level, &steps, &threads)) {
+            args, kwargs, "nO|IIIdIIIiIinK:train_dictionary", kwlist,
+            &capacity, &samples, &k, &d, &f, &splitPoint, &accel,
+            &notifications, &dictID, &level, &steps, &threads,
+            &maxSamplesSize, &seed)) {
+        return NULL;
+    }
+
+    if (maxSamplesSize < 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "max_samples_size must be non-negative");
         return NULL;
     }
 
@@ -73,37 +378,25 @@ ZstdCompressionDict *train_dictionary(PyObject *self, PyObject *args,
     params.zParams.dictID = dictID;
     params.zParams.notificationLevel = notifications;
 
-    /* Figure out total size of input samples. */
-    samplesLen = PyList_Size(samples);
-    for (i = 0; i < samplesLen; i++) {
-        PyObject *sampleItem = PyList_GET_ITEM(samples, i);
+    collector.maxSize = (size_t)maxSamplesSize;
+    collector.rngState = seed;
 
-        if (!PyBytes_Check(sampleItem)) {
-            PyErr_SetString(PyExc_ValueError, "samples must be bytes");
-            return NULL;
-        }
-        samplesSize += PyBytes_GET_SIZE(sampleItem);
+    if (collector_add_samples(&collector, samples)) {
+        goto finally;
     }
 
-    sampleBuffer = PyMem_Malloc(samplesSize);
-    if (!sampleBuffer) {
-        PyErr_NoMemory();
-        goto finally;
+    if (collector.maxSize) {
+        collector_compact(&collector);
     }
 
-    sampleSizes = PyMem_Malloc(samplesLen * sizeof(size_t));
+    sampleSizes = PyMem_Malloc((collector.samplesCount + 1) * sizeof(size_t));
     if (!sampleSizes) {
         PyErr_NoMemory();
         goto finally;
     }
 
-    sampleOffset = sampleBuffer;
-    for (i = 0; i < samplesLen; i++) {
-        PyObject *sampleItem = PyList_GET_ITEM(samples, i);
-        sampleSize = PyBytes_GET_SIZE(sampleItem);
-        sampleSizes[i] = sampleSize;
-        memcpy(sampleOffset, PyBytes_AS_STRING(sampleItem), sampleSize);
-        sampleOffset = (char *)sampleOffset + sampleSize;
+    for (i = 0; i < collector.samplesCount; i++) {
+        sampleSizes[i] = collector.samples[i].size;
     }
 
     dict = PyMem_Malloc(capacity);
@@ -113,8 +406,8 @@ ZstdCompressionDict *train_dictionary(PyObject *self, PyObject *args,
     }
 
     Py_BEGIN_ALLOW_THREADS zresult = ZDICT_optimizeTrainFromBuffer_fastCover(
-        dict, capacity, sampleBuffer, sampleSizes, (unsigned)samplesLen,
-        &params);
+        dict, capacity, collector.buffer, sampleSizes,
+        (unsigned)collector.samplesCount, &params);
     Py_END_ALLOW_THREADS
 
         if (ZDICT_isError(zresult)) {
@@ -135,50 +428,312 @@ ZstdCompressionDict *train_dictionary(PyObject *self, PyObject *args,
     result->dictType = ZSTD_dct_fullDict;
     result->d = params.d;
     result->k = params.k;
-    result->cdict = NULL;
     result->ddict = NULL;
+    compressiondict_init_cache(result);
 
 finally:
-    PyMem_Free(sampleBuffer);
+    collector_free(&collector);
     PyMem_Free(sampleSizes);
 
     return result;
 }
 
 int ensure_ddict(ZstdCompressionDict *dict) {
-    if (dict->ddict) {
+    ZSTD_DDict *ddict;
+    int digested;
+
+    Py_BEGIN_CRITICAL_SECTION(dict);
+    digested = dict->ddict != NULL;
+    Py_END_CRITICAL_SECTION();
+
+    if (digested) {
         return 0;
     }
 
-    Py_BEGIN_ALLOW_THREADS dict->ddict = ZSTD_createDDict_advanced(
+    Py_BEGIN_ALLOW_THREADS ddict = ZSTD_createDDict_advanced(
         dict->dictData, dict->dictSize, ZSTD_dlm_byRef, dict->dictType,
         ZSTD_defaultCMem);
-    Py_END_ALLOW_THREADS if (!dict->ddict) {
+    Py_END_ALLOW_THREADS if (!ddict) {
         PyErr_SetString(ZstdError, "could not create decompression dict");
         return 1;
     }
 
+    /* Another thread may have digested the dictionary in the meantime. Once
+       set, the DDict lives as long as the dictionary. */
+    Py_BEGIN_CRITICAL_SECTION(dict);
+    if (dict->ddict) {
+        ZSTD_freeDDict(ddict);
+    }
+    else {
+        dict->ddict = ddict;
+    }
+    Py_END_CRITICAL_SECTION();
+
     return 0;
 }
 
+void compressiondict_init_cache(ZstdCompressionDict *dict) {
+    dict->cdict = NULL;
+    dict->cdicts = NULL;
+    dict->cdictCacheSize = CDICT_CACHE_SIZE_DEFAULT;
+    dict->cdictHits = 0;
+    dict->cdictMisses = 0;
+    dict->cdictEvictions = 0;
+}
+
+static void free_cdict_capsule(PyObject *capsule) {
+    ZSTD_freeCDict(PyCapsule_GetPointer(capsule, NULL));
+}
+
+/**
+ * Obtain the key for compression parameters in the CDict cache.
+ */
+static PyObject *cdict_key(const ZSTD_compressionParameters *cparams) {
+    return Py_BuildValue("(IIIIIIi)", cparams->windowLog, cparams->chainLog,
+                         cparams->hashLog, cparams->searchLog,
+                         cparams->minMatch, cparams->targetLength,
+                         (int)cparams->strategy);
+}
+
+/**
+ * Move a CDict cache entry to the most recently used end.
+ */
+static int touch_cdict(ZstdCompressionDict *dict, PyObject *key,
+                       PyObject *capsule) {
+    int result;
+
+    Py_INCREF(capsule);
+    result = PyDict_DelItem(dict->cdicts, key) ||
+             PyDict_SetItem(dict->cdicts, key, capsule);
+    Py_DECREF(capsule);
+
+    return result ? -1 : 0;
+}
+
+/**
+ * Make a CDict the one used by compressors without a matching cache entry.
+ */
+static void set_default_cdict(ZstdCompressionDict *dict, PyObject *capsule) {
+    /* Compressors hold their own reference to the CDict they use, so
+       replacing or evicting it here doesn't free it from under them. */
+    Py_INCREF(capsule);
+    Py_XDECREF(dict->cdict);
+    dict->cdict = capsule;
+}
+
+/**
+ * Look up cached CDict for compression parameters and make it the default.
+ *
+ * Returns 1 if a CDict was found, 0 if not and -1 on error. Must be called
+ * in a critical section on the dictionary.
+ */
+static int find_cdict(ZstdCompressionDict *dict, PyObject *key) {
+    PyObject *capsule;
+
+    if (!dict->cdicts) {
+        dict->cdicts = PyDict_New();
+        if (!dict->cdicts) {
+            return -1;
+        }
+    }
+
+    capsule = PyDict_GetItemWithError(dict->cdicts, key);
+    if (!capsule) {
+        if (PyErr_Occurred()) {
+            return -1;
+        }
+
+        dict->cdictMisses++;
+        return 0;
+    }
+
+    dict->cdictHits++;
+
+    Py_INCREF(capsule);
+    if (touch_cdict(dict, key, capsule)) {
+        Py_DECREF(capsule);
+        return -1;
+    }
+
+    set_default_cdict(dict, capsule);
+    Py_DECREF(capsule);
+
+    return 1;
+}
+
+/**
+ * Add a newly created CDict to the cache and make it the default.
+ *
+ * Takes ownership of ``cdict``. Returns 0 on success and -1 on error. Must
+ * be called in a critical section on the dictionary.
+ */
+static int store_cdict(ZstdCompressionDict *dict, PyObject *key,
+                       ZSTD_CDict *cdict) {
+    PyObject *capsule;
+
+    /* Another thread may have digested the same parameters while the GIL was
+       released. */
+    capsule = PyDict_GetItemWithError(dict->cdicts, key);
+    if (capsule) {
+        ZSTD_freeCDict(cdict);
+        Py_INCREF(capsule);
+    }
+    else if (PyErr_Occurred()) {
+        ZSTD_freeCDict(cdict);
+        return -1;
+    }
+    else {
+        capsule = PyCapsule_New(cdict, NULL, free_cdict_capsule);
+        if (!capsule) {
+            ZSTD_freeCDict(cdict);
+            return -1;
+        }
+
+        if (PyDict_SetItem(dict->cdicts, key, capsule)) {
+            Py_DECREF(capsule);
+            return -1;
+        }
+    }
+
+    if (touch_cdict(dict, key, capsule)) {
+        Py_DECREF(capsule);
+        return -1;
+    }
+
+    while (PyDict_Size(dict->cdicts) > dict->cdictCacheSize) {
+        Py_ssize_t pos = 0;
+        PyObject *oldest;
+        PyObject *value;
+
+        if (!PyDict_Next(dict->cdicts, &pos, &oldest, &value)) {
+            break;
+        }
+
+        Py_INCREF(oldest);
+        if (PyDict_DelItem(dict->cdicts, oldest)) {
+            Py_DECREF(oldest);
+            Py_DECREF(capsule);
+            return -1;
+        }
+        Py_DECREF(oldest);
+
+        dict->cdictEvictions++;
+    }
+
+    set_default_cdict(dict, capsule);
+    Py_DECREF(capsule);
+
+    return 0;
+}
+
+/**
+ * Select the CDict for compression parameters. Must be called in a critical
+ * section on the dictionary.
+ */
+static PyObject *get_cdict(ZstdCompressionDict *dict,
+                           ZSTD_CCtx_params *params) {
+    ZSTD_compressionParameters cparams;
+    PyObject *key;
+    PyObject *capsule;
+    int level;
+    int value;
+
+    if (dict->cdicts && PyDict_Size(dict->cdicts)) {
+        ZSTD_CCtxParams_getParameter(params, ZSTD_c_compressionLevel, &level);
+        cparams = ZSTD_getCParams(level, 0, dict->dictSize);
+
+#define OVERRIDE_CPARAM(param, field)                                          \
+    ZSTD_CCtxParams_getParameter(params, param, &value);                       \
+    if (value) {                                                               \
+        cparams.field = value;                                                 \
+    }
+
+        OVERRIDE_CPARAM(ZSTD_c_windowLog, windowLog);
+        OVERRIDE_CPARAM(ZSTD_c_chainLog, chainLog);
+        OVERRIDE_CPARAM(ZSTD_c_hashLog, hashLog);
+        OVERRIDE_CPARAM(ZSTD_c_searchLog, searchLog);
+        OVERRIDE_CPARAM(ZSTD_c_minMatch, minMatch);
+        OVERRIDE_CPARAM(ZSTD_c_targetLength, targetLength);
+        OVERRIDE_CPARAM(ZSTD_c_strategy, strategy);
+
+#undef OVERRIDE_CPARAM
+
+        key = cdict_key(&cparams);
+        if (!key) {
+            return NULL;
+        }
+
+        capsule = PyDict_GetItemWithError(dict->cdicts, key);
+        if (capsule) {
+            dict->cdictHits++;
+            Py_INCREF(capsule);
+
+            if (touch_cdict(dict, key, capsule)) {
+                Py_CLEAR(capsule);
+            }
+
+            Py_DECREF(key);
+            return capsule;
+        }
+
+        Py_DECREF(key);
+
+        if (PyErr_Occurred()) {
+            return NULL;
+        }
+    }
+
+    Py_XINCREF(dict->cdict);
+    return dict->cdict;
+}
+
+/**
+ * Obtain the precomputed CDict a compressor should reference.
+ *
+ * A cached CDict matching the compressor's parameters is preferred. Otherwise
+ * the most recently precomputed CDict is used.
+ *
+ * Returns a new reference to a PyCapsule. Returns NULL without an exception
+ * set if the dictionary should be loaded into the compression context instead.
+ */
+PyObject *compressiondict_get_cdict(ZstdCompressionDict *dict,
+                                    ZSTD_CCtx_params *params) {
+    PyObject *result;
+
+    Py_BEGIN_CRITICAL_SECTION(dict);
+    result = get_cdict(dict, params);
+    Py_END_CRITICAL_SECTION();
+
+    return result;
+}
+
 static int ZstdCompressionDict_init(ZstdCompressionDict *self, PyObject *args,
                                     PyObject *kwargs) {
-    static char *kwlist[] = {"data", "dict_type", NULL};
+    static char *kwlist[] = {"data", "dict_type", "cdict_cache_size", NULL};
 
     int result = -1;
     Py_buffer source;
     unsigned dictType = ZSTD_dct_auto;
+    Py_ssize_t cdictCacheSize = CDICT_CACHE_SIZE_DEFAULT;
 
     self->dictData = NULL;
     self->dictSize = 0;
-    self->cdict = NULL;
     self->ddict = NULL;
+    compressiondict_init_cache(self);
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*|I:ZstdCompressionDict",
-                                     kwlist, &source, &dictType)) {
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*|I$n:ZstdCompressionDict",
+                                     kwlist, &source, &dictType,
+                                     &cdictCacheSize)) {
         return -1;
     }
 
+    if (cdictCacheSize < 1) {
+        PyErr_SetString(PyExc_ValueError, "cdict_cache_size must be positive");
+        goto finally;
+    }
+
+    self->cdictCacheSize = cdictCacheSize;
+
     if (dictType != ZSTD_dct_auto && dictType != ZSTD_dct_rawContent &&
         dictType != ZSTD_dct_fullDict) {
         PyErr_Format(
@@ -207,10 +762,8 @@ finally:
 }
 
 static void ZstdCompressionDict_dealloc(ZstdCompressionDict *self) {
-    if (self->cdict) {
-        ZSTD_freeCDict(self->cdict);
-        self->cdict = NULL;
-    }
+    Py_CLEAR(self->cdict);
+    Py_CLEAR(self->cdicts);
 
     if (self->ddict) {
         ZSTD_freeDDict(self->ddict);
@@ -233,7 +786,10 @@ ZstdCompressionDict_precompute_compress(ZstdCompressionDict *self,
     int level = 0;
     ZstdCompressionParametersObject *compressionParams = NULL;
     ZSTD_compressionParameters cParams;
-    size_t zresult;
+    ZSTD_CDict *cdict;
+    PyObject *key;
+    int found;
+    PyObject *result = NULL;
 
     if (!PyArg_ParseTupleAndKeywords(
             args, kwargs, "|iO!:precompute_compress", kwlist, &level,
@@ -253,16 +809,6 @@ ZstdCompressionDict_precompute_compress(ZstdCompressionDict *self,
         return NULL;
     }
 
-    if (self->cdict) {
-        zresult = ZSTD_freeCDict(self->cdict);
-        self->cdict = NULL;
-        if (ZSTD_isError(zresult)) {
-            PyErr_Format(ZstdError, "unable to free CDict: %s",
-                         ZSTD_getErrorName(zresult));
-            return NULL;
-        }
-    }
-
     if (level) {
         cParams = ZSTD_getCParams(level, 0, self->dictSize);
     }
@@ -272,17 +818,70 @@ ZstdCompressionDict_precompute_compress(ZstdCompressionDict *self,
         }
     }
 
-    assert(!self->cdict);
-    self->cdict = ZSTD_createCDict_advanced(self->dictData, self->dictSize,
-                                            ZSTD_dlm_byRef, self->dictType,
-                                            cParams, ZSTD_defaultCMem);
-
-    if (!self->cdict) {
-        PyErr_SetString(ZstdError, "unable to precompute dictionary");
+    key = cdict_key(&cParams);
+    if (!key) {
         return NULL;
     }
 
-    Py_RETURN_NONE;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    found = find_cdict(self, key);
+    Py_END_CRITICAL_SECTION();
+
+    if (found < 0) {
+        goto finally;
+    }
+    else if (!found) {
+        Py_BEGIN_ALLOW_THREADS cdict = ZSTD_createCDict_advanced(
+            self->dictData, self->dictSize, ZSTD_dlm_byRef, self->dictType,
+            cParams, ZSTD_defaultCMem);
+        Py_END_ALLOW_THREADS if (!cdict) {
+            PyErr_SetString(ZstdError, "unable to precompute dictionary");
+            goto finally;
+        }
+
+        Py_BEGIN_CRITICAL_SECTION(self);
+        found = store_cdict(self, key, cdict) ? -1 : 1;
+        Py_END_CRITICAL_SECTION();
+
+        if (found < 0) {
+            goto finally;
+        }
+    }
+
+    result = Py_None;
+    Py_INCREF(result);
+
+finally:
+    Py_DECREF(key);
+
+    return result;
+}
+
+static PyObject *ZstdCompressionDict_cdict_stats(ZstdCompressionDict *self) {
+    Py_ssize_t pos = 0;
+    PyObject *key;
+    PyObject *value;
+    size_t memory = 0;
+    Py_ssize_t cached = 0;
+    unsigned long long hits, misses, evictions;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    if (self->cdicts) {
+        while (PyDict_Next(self->cdicts, &pos, &key, &value)) {
+            memory += ZSTD_sizeof_CDict(PyCapsule_GetPointer(value, NULL));
+        }
+
+        cached = PyDict_Size(self->cdicts);
+    }
+
+    hits = self->cdictHits;
+    misses = self->cdictMisses;
+    evictions = self->cdictEvictions;
+    Py_END_CRITICAL_SECTION();
+
+    return Py_BuildValue("{s:K,s:K,s:K,s:n,s:n}", "hits", hits, "misses",
+                         misses, "evictions", evictions, "cached", cached,
+                         "memory", (Py_ssize_t)memory);
 }
 
 static PyObject *ZstdCompressionDict_dict_id(ZstdCompressionDict *self) {
@@ -304,11 +903,20 @@ static PyMethodDef ZstdCompressionDict_methods[] = {
     {"precompute_compress",
      (PyCFunction)ZstdCompressionDict_precompute_compress,
      METH_VARARGS | METH_KEYWORDS, NULL},
+    {"cdict_stats", (PyCFunction)ZstdCompressionDict_cdict_stats, METH_NOARGS,
+     PyDoc_STR("cdict_stats() -- obtain precomputed dictionary cache "
+               "statistics")},
     {NULL, NULL}};
 
 static PyMemberDef ZstdCompressionDict_members[] = {
     {"k", T_UINT, offsetof(ZstdCompressionDict, k), READONLY, "segment size"},
     {"d", T_UINT, offsetof(ZstdCompressionDict, d), READONLY, "dmer size"},
+    {"cdict_cache_size", T_PYSSIZET,
+     offsetof(ZstdCompressionDict, cdictCacheSize), READONLY,
+     "maximum number of precomputed dictionaries to retain"},
+    /* Private. Lets Python code copy a dictionary faithfully. */
+    {"_dict_type", T_UINT, offsetof(ZstdCompressionDict, dictType), READONLY,
+     NULL},
     {NULL}};
 
 static Py_ssize_t ZstdCompressionDict_length(ZstdCompressionDict *self) {
@@ -222,8 +222,8 @@ int compress_input(ZstdCompressionReader *self, ZSTD_outBuffer *output) {
     }
 }
 
-static PyObject *compressionreader_read(ZstdCompressionReader *self,
-                                        PyObject *args, PyObject *kwargs) {
+static PyObject *compressionreader_read_impl(ZstdCompressionReader *self,
+                                             PyObject *args, PyObject *kwargs) {
     static char *kwlist[] = {"size", NULL};
 
     Py_ssize_t size = -1;
@@ -309,10 +309,11 @@ readinput:
     /* Else EOF */
     oldPos = self->output.pos;
 
-    zresult = ZSTD_compressStream2(self->compressor->cctx, &self->output,
-                                   &self->input, ZSTD_e_end);
+    Py_BEGIN_ALLOW_THREADS zresult = ZSTD_compressStream2(
+        self->compressor->cctx, &self->output, &self->input, ZSTD_e_end);
+    Py_END_ALLOW_THREADS
 
-    self->bytesCompressed += self->output.pos - oldPos;
+        self->bytesCompressed += self->output.pos - oldPos;
 
     if (ZSTD_isError(zresult)) {
         PyErr_Format(ZstdError, "error ending compression stream: %s",
@@ -337,8 +338,28 @@ readinput:
     return result;
 }
 
-static PyObject *compressionreader_read1(ZstdCompressionReader *self,
-                                         PyObject *args, PyObject *kwargs) {
+static PyObject *compressionreader_read(ZstdCompressionReader *self,
+                                        PyObject *args, PyObject *kwargs) {
+    ZstdCompressor *compressor = self->compressor;
+    PyObject *result;
+
+    /* __exit__() releases the compressor. Let the implementation raise. */
+    if (!compressor) {
+        return compressionreader_read_impl(self, args, kwargs);
+    }
+
+    Py_INCREF(compressor);
+    context_lock_acquire(&compressor->lock);
+    result = compressionreader_read_impl(self, args, kwargs);
+    context_lock_release(&compressor->lock);
+    Py_DECREF(compressor);
+
+    return result;
+}
+
+static PyObject *compressionreader_read1_impl(ZstdCompressionReader *self,
+                                              PyObject *args,
+                                              PyObject *kwargs) {
     static char *kwlist[] = {"size", NULL};
 
     Py_ssize_t size = -1;
@@ -441,10 +462,11 @@ static PyObject *compressionreader_read1(ZstdCompressionReader *self,
     /* EOF */
     oldPos = output.pos;
 
-    zresult = ZSTD_compressStream2(self->compressor->cctx, &output,
-                                   &self->input, ZSTD_e_end);
+    Py_BEGIN_ALLOW_THREADS zresult = ZSTD_compressStream2(
+        self->compressor->cctx, &output, &self->input, ZSTD_e_end);
+    Py_END_ALLOW_THREADS
 
-    self->bytesCompressed += output.pos - oldPos;
+        self->bytesCompressed += output.pos - oldPos;
 
     if (ZSTD_isError(zresult)) {
         PyErr_Format(ZstdError, "error ending compression stream: %s",
@@ -468,6 +490,25 @@ finally:
     return result;
 }
 
+static PyObject *compressionreader_read1(ZstdCompressionReader *self,
+                                         PyObject *args, PyObject *kwargs) {
+    ZstdCompressor *compressor = self->compressor;
+    PyObject *result;
+
+    /* __exit__() releases the compressor. Let the implementation raise. */
+    if (!compressor) {
+        return compressionreader_read1_impl(self, args, kwargs);
+    }
+
+    Py_INCREF(compressor);
+    context_lock_acquire(&compressor->lock);
+    result = compressionreader_read1_impl(self, args, kwargs);
+    context_lock_release(&compressor->lock);
+    Py_DECREF(compressor);
+
+    return result;
+}
+
 static PyObject *compressionreader_readall(PyObject *self) {
     PyObject *chunks = NULL;
     PyObject *empty = NULL;
@@ -518,8 +559,8 @@ static PyObject *compressionreader_readall(PyObject *self) {
     return result;
 }
 
-static PyObject *compressionreader_readinto(ZstdCompressionReader *self,
-                                            PyObject *args) {
+static PyObject *compressionreader_readinto_impl(ZstdCompressionReader *self,
+                                                 PyObject *args) {
     Py_buffer dest;
     ZSTD_outBuffer output;
     int readResult, compressResult;
@@ -590,10 +631,11 @@ static PyObject *compressionreader_readinto(ZstdCompressionReader *self,
     /* EOF */
     oldPos = output.pos;
 
-    zresult = ZSTD_compressStream2(self->compressor->cctx, &output,
-                                   &self->input, ZSTD_e_end);
+    Py_BEGIN_ALLOW_THREADS zresult = ZSTD_compressStream2(
+        self->compressor->cctx, &output, &self->input, ZSTD_e_end);
+    Py_END_ALLOW_THREADS
 
-    self->bytesCompressed += self->output.pos - oldPos;
+        self->bytesCompressed += output.pos - oldPos;
 
     if (ZSTD_isError(zresult)) {
         PyErr_Format(ZstdError, "error ending compression stream: %s",
@@ -615,8 +657,27 @@ finally:
     return result;
 }
 
-static PyObject *compressionreader_readinto1(ZstdCompressionReader *self,
-                                             PyObject *args) {
+static PyObject *compressionreader_readinto(ZstdCompressionReader *self,
+                                            PyObject *args) {
+    ZstdCompressor *compressor = self->compressor;
+    PyObject *result;
+
+    /* __exit__() releases the compressor. Let the implementation raise. */
+    if (!compressor) {
+        return compressionreader_readinto_impl(self, args);
+    }
+
+    Py_INCREF(compressor);
+    context_lock_acquire(&compressor->lock);
+    result = compressionreader_readinto_impl(self, args);
+    context_lock_release(&compressor->lock);
+    Py_DECREF(compressor);
+
+    return result;
+}
+
+static PyObject *compressionreader_readinto1_impl(ZstdCompressionReader *self,
+                                                  PyObject *args) {
     Py_buffer dest;
     PyObject *result = NULL;
     ZSTD_outBuffer output;
@@ -700,10 +761,11 @@ static PyObject *compressionreader_readinto1(ZstdCompressionReader *self,
     /* EOF */
     oldPos = output.pos;
 
-    zresult = ZSTD_compressStream2(self->compressor->cctx, &output,
-                                   &self->input, ZSTD_e_end);
+    Py_BEGIN_ALLOW_THREADS zresult = ZSTD_compressStream2(
+        self->compressor->cctx, &output, &self->input, ZSTD_e_end);
+    Py_END_ALLOW_THREADS
 
-    self->bytesCompressed += self->output.pos - oldPos;
+        self->bytesCompressed += output.pos - oldPos;
 
     if (ZSTD_isError(zresult)) {
         PyErr_Format(ZstdError, "error ending compression stream: %s",
@@ -725,6 +787,25 @@ finally:
     return result;
 }
 
+static PyObject *compressionreader_readinto1(ZstdCompressionReader *self,
+                                             PyObject *args) {
+    ZstdCompressor *compressor = self->compressor;
+    PyObject *result;
+
+    /* __exit__() releases the compressor. Let the implementation raise. */
+    if (!compressor) {
+        return compressionreader_readinto1_impl(self, args);
+    }
+
+    Py_INCREF(compressor);
+    context_lock_acquire(&compressor->lock);
+    result = compressionreader_readinto1_impl(self, args);
+    context_lock_release(&compressor->lock);
+    Py_DECREF(compressor);
+
+    return result;
+}
+
 static PyObject *compressionreader_iter(PyObject *self) {
     set_io_unsupported_operation();
     return NULL;
@@ -60,12 +60,24 @@ static PyObject *ZstdCompressionWriter_exit(ZstdCompressionWriter *self,
 }
 
 static PyObject *
-ZstdCompressionWriter_memory_size(ZstdCompressionWriter *self) {
+ZstdCompressionWriter_memory_size_impl(ZstdCompressionWriter *self) {
     return PyLong_FromSize_t(ZSTD_sizeof_CCtx(self->compressor->cctx));
 }
 
-static PyObject *ZstdCompressionWriter_write(ZstdCompressionWriter *self,
-                                             PyObject *args, PyObject *kwargs) {
+static PyObject *
+ZstdCompressionWriter_memory_size(ZstdCompressionWriter *self) {
+    PyObject *result;
+
+    context_lock_acquire(&self->compressor->lock);
+    result = ZstdCompressionWriter_memory_size_impl(self);
+    context_lock_release(&self->compressor->lock);
+
+    return result;
+}
+
+static PyObject *ZstdCompressionWriter_write_impl(ZstdCompressionWriter *self,
+                                                  PyObject *args,
+                                                  PyObject *kwargs) {
     static char *kwlist[] = {"data", NULL};
 
     PyObject *result = NULL;
@@ -91,6 +103,10 @@ static PyObject *ZstdCompressionWriter_write(ZstdCompressionWriter *self,
     input.size = source.len;
     input.pos = 0;
 
+    if (source.len) {
+        self->frameStarted = 1;
+    }
+
     while (input.pos < (size_t)source.len) {
         Py_BEGIN_ALLOW_THREADS zresult = ZSTD_compressStream2(
             self->compressor->cctx, &self->output, &input, ZSTD_e_continue);
@@ -128,8 +144,20 @@ finally:
     return result;
 }
 
-static PyObject *ZstdCompressionWriter_flush(ZstdCompressionWriter *self,
+static PyObject *ZstdCompressionWriter_write(ZstdCompressionWriter *self,
                                              PyObject *args, PyObject *kwargs) {
+    PyObject *result;
+
+    context_lock_acquire(&self->compressor->lock);
+    result = ZstdCompressionWriter_write_impl(self, args, kwargs);
+    context_lock_release(&self->compressor->lock);
+
+    return result;
+}
+
+static PyObject *ZstdCompressionWriter_flush_impl(ZstdCompressionWriter *self,
+                                                  PyObject *args,
+                                                  PyObject *kwargs) {
     static char *kwlist[] = {"flush_mode", NULL};
 
     size_t zresult;
@@ -197,6 +225,10 @@ static PyObject *ZstdCompressionWriter_flush(ZstdCompressionWriter *self,
         }
     }
 
+    if (flush == ZSTD_e_end) {
+        self->frameStarted = 0;
+    }
+
     if (!self->closing && PyObject_HasAttrString(self->writer, "flush")) {
         res = PyObject_CallMethod(self->writer, "flush", NULL);
         if (NULL == res) {
@@ -208,7 +240,108 @@ static PyObject *ZstdCompressionWriter_flush(ZstdCompressionWriter *self,
     return PyLong_FromSsize_t(totalWrite);
 }
 
-static PyObject *ZstdCompressionWriter_close(ZstdCompressionWriter *self) {
+static PyObject *ZstdCompressionWriter_flush(ZstdCompressionWriter *self,
+                                             PyObject *args, PyObject *kwargs) {
+    PyObject *result;
+
+    context_lock_acquire(&self->compressor->lock);
+    result = ZstdCompressionWriter_flush_impl(self, args, kwargs);
+    context_lock_release(&self->compressor->lock);
+
+    return result;
+}
+
+static PyObject *
+ZstdCompressionWriter_write_skippable_frame_impl(ZstdCompressionWriter *self,
+                                                 PyObject *args,
+                                                 PyObject *kwargs) {
+    static char *kwlist[] = {"data", "magic_variant", NULL};
+
+    Py_buffer source;
+    unsigned magicVariant = 0;
+    PyObject *frame = NULL;
+    PyObject *res;
+    PyObject *result = NULL;
+    Py_ssize_t totalWrite = 0;
+    size_t zresult;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*|I:write_skippable_frame",
+                                     kwlist, &source, &magicVariant)) {
+        return NULL;
+    }
+
+    if (self->closed) {
+        PyErr_SetString(PyExc_ValueError, "stream is closed");
+        goto finally;
+    }
+
+    if (magicVariant > 15) {
+        PyErr_SetString(PyExc_ValueError,
+                        "magic_variant must be between 0 and 15");
+        goto finally;
+    }
+
+    /* Skippable frames can only appear between frames. */
+    if (self->frameStarted) {
+        res = PyObject_CallMethod((PyObject *)self, "flush", "I", 1);
+        if (NULL == res) {
+            goto finally;
+        }
+
+        totalWrite = PyLong_AsSsize_t(res);
+        Py_DECREF(res);
+        if (totalWrite == -1 && PyErr_Occurred()) {
+            goto finally;
+        }
+    }
+
+    frame =
+        PyBytes_FromStringAndSize(NULL, source.len + ZSTD_SKIPPABLEHEADERSIZE);
+    if (NULL == frame) {
+        goto finally;
+    }
+
+    zresult = ZSTD_writeSkippableFrame(PyBytes_AS_STRING(frame),
+                                       PyBytes_GET_SIZE(frame), source.buf,
+                                       source.len, magicVariant);
+    if (ZSTD_isError(zresult)) {
+        PyErr_Format(ZstdError, "cannot write skippable frame: %s",
+                     ZSTD_getErrorName(zresult));
+        goto finally;
+    }
+
+    res = PyObject_CallMethod(self->writer, "write", "O", frame);
+    if (NULL == res) {
+        goto finally;
+    }
+    Py_DECREF(res);
+
+    totalWrite += zresult;
+    self->bytesCompressed += zresult;
+
+    result = PyLong_FromSsize_t(totalWrite);
+
+finally:
+    Py_XDECREF(frame);
+    PyBuffer_Release(&source);
+
+    return result;
+}
+
+static PyObject *
+ZstdCompressionWriter_write_skippable_frame(ZstdCompressionWriter *self,
+                                            PyObject *args, PyObject *kwargs) {
+    PyObject *result;
+
+    context_lock_acquire(&self->compressor->lock);
+    result = ZstdCompressionWriter_write_skippable_frame_impl(self, args,
+                                                              kwargs);
+    context_lock_release(&self->compressor->lock);
+
+    return result;
+}
+
+static PyObject *ZstdCompressionWriter_close_impl(ZstdCompressionWriter *self) {
     PyObject *result;
 
     if (self->closed) {
@@ -232,6 +365,16 @@ static PyObject *ZstdCompressionWriter_close(ZstdCompressionWriter *self) {
     Py_RETURN_NONE;
 }
 
+static PyObject *ZstdCompressionWriter_close(ZstdCompressionWriter *self) {
+    PyObject *result;
+
+    context_lock_acquire(&self->compressor->lock);
+    result = ZstdCompressionWriter_close_impl(self);
+    context_lock_release(&self->compressor->lock);
+
+    return result;
+}
+
 static PyObject *ZstdCompressionWriter_fileno(ZstdCompressionWriter *self) {
     if (PyObject_HasAttrString(self->writer, "fileno")) {
         return PyObject_CallMethod(self->writer, "fileno", NULL);
@@ -313,6 +456,9 @@ static PyMethodDef ZstdCompressionWriter_methods[] = {
      PyDoc_STR("Flush data and finish a zstd frame")},
     {"tell", (PyCFunction)ZstdCompressionWriter_tell, METH_NOARGS,
      PyDoc_STR("Returns current number of bytes compressed")},
+    {"write_skippable_frame",
+     (PyCFunction)ZstdCompressionWriter_write_skippable_frame,
+     METH_VARARGS | METH_KEYWORDS, PyDoc_STR("Write a skippable frame")},
     {NULL, NULL}};
 
 static PyMemberDef ZstdCompressionWriter_members[] = {
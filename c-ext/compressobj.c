@@ -19,8 +19,9 @@ static void ZstdCompressionObj_dealloc(ZstdCompressionObj *self) {
     PyObject_Del(self);
 }
 
-static PyObject *ZstdCompressionObj_compress(ZstdCompressionObj *self,
-                                             PyObject *args, PyObject *kwargs) {
+static PyObject *ZstdCompressionObj_compress_impl(ZstdCompressionObj *self,
+                                                  PyObject *args,
+                                                  PyObject *kwargs) {
     static char *kwlist[] = {"data", NULL};
 
     Py_buffer source;
@@ -91,8 +92,20 @@ finally:
     return result;
 }
 
-static PyObject *ZstdCompressionObj_flush(ZstdCompressionObj *self,
-                                          PyObject *args, PyObject *kwargs) {
+static PyObject *ZstdCompressionObj_compress(ZstdCompressionObj *self,
+                                             PyObject *args, PyObject *kwargs) {
+    PyObject *result;
+
+    context_lock_acquire(&self->compressor->lock);
+    result = ZstdCompressionObj_compress_impl(self, args, kwargs);
+    context_lock_release(&self->compressor->lock);
+
+    return result;
+}
+
+static PyObject *ZstdCompressionObj_flush_impl(ZstdCompressionObj *self,
+                                               PyObject *args,
+                                               PyObject *kwargs) {
     static char *kwlist[] = {"flush_mode", NULL};
 
     int flushMode = compressorobj_flush_finish;
@@ -187,6 +200,17 @@ static PyObject *ZstdCompressionObj_flush(ZstdCompressionObj *self,
     }
 }
 
+static PyObject *ZstdCompressionObj_flush(ZstdCompressionObj *self,
+                                          PyObject *args, PyObject *kwargs) {
+    PyObject *result;
+
+    context_lock_acquire(&self->compressor->lock);
+    result = ZstdCompressionObj_flush_impl(self, args, kwargs);
+    context_lock_release(&self->compressor->lock);
+
+    return result;
+}
+
 static PyMethodDef ZstdCompressionObj_methods[] = {
     {"compress", (PyCFunction)ZstdCompressionObj_compress,
      METH_VARARGS | METH_KEYWORDS, PyDoc_STR("compress data")},
@@ -25,10 +25,27 @@ int setup_cctx(ZstdCompressor *compressor) {
         return 1;
     }
 
+    if (compressor->threadPool) {
+        zresult = ZSTD_CCtx_refThreadPool(compressor->cctx,
+                                          compressor->threadPool->pool);
+        if (ZSTD_isError(zresult)) {
+            PyErr_Format(ZstdError, "could not set thread pool: %s",
+                         ZSTD_getErrorName(zresult));
+            return 1;
+        }
+    }
+
     if (compressor->dict) {
-        if (compressor->dict->cdict) {
-            zresult =
-                ZSTD_CCtx_refCDict(compressor->cctx, compressor->dict->cdict);
+        Py_CLEAR(compressor->cdict);
+        compressor->cdict =
+            compressiondict_get_cdict(compressor->dict, compressor->params);
+        if (!compressor->cdict && PyErr_Occurred()) {
+            return 1;
+        }
+
+        if (compressor->cdict) {
+            zresult = ZSTD_CCtx_refCDict(
+                compressor->cctx, PyCapsule_GetPointer(compressor->cdict, NULL));
         }
         else {
             zresult = ZSTD_CCtx_loadDictionary_advanced(
@@ -46,6 +63,32 @@ int setup_cctx(ZstdCompressor *compressor) {
     return 0;
 }
 
+/**
+ * Set the source size hint used by the next operation.
+ *
+ * A sizeHint of 0 restores the hint the compressor was constructed with.
+ * Must be called after the context is reset.
+ */
+static int set_size_hint(ZstdCompressor *compressor, int sizeHint) {
+    size_t zresult;
+
+    if (sizeHint < 0) {
+        PyErr_SetString(PyExc_ValueError, "size_hint must be non-negative");
+        return 1;
+    }
+
+    zresult = ZSTD_CCtx_setParameter(compressor->cctx, ZSTD_c_srcSizeHint,
+                                     sizeHint ? sizeHint
+                                              : compressor->sizeHint);
+    if (ZSTD_isError(zresult)) {
+        PyErr_Format(ZstdError, "error setting source size hint: %s",
+                     ZSTD_getErrorName(zresult));
+        return 1;
+    }
+
+    return 0;
+}
+
 static PyObject *frame_progression(ZSTD_CCtx *cctx) {
     PyObject *result = NULL;
     PyObject *value;
@@ -94,6 +137,8 @@ static int ZstdCompressor_init(ZstdCompressor *self, PyObject *args,
                              "write_content_size",
                              "write_dict_id",
                              "threads",
+                             "thread_pool",
+                             "size_hint",
                              NULL};
 
     int level = 3;
@@ -103,11 +148,23 @@ static int ZstdCompressor_init(ZstdCompressor *self, PyObject *args,
     PyObject *writeContentSize = NULL;
     PyObject *writeDictID = NULL;
     int threads = 0;
+    PyObject *threadPool = NULL;
+    int sizeHint = 0;
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|iOOOOOi:ZstdCompressor",
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|iOOOOOiOi:ZstdCompressor",
                                      kwlist, &level, &dict, &params,
                                      &writeChecksum, &writeContentSize,
-                                     &writeDictID, &threads)) {
+                                     &writeDictID, &threads, &threadPool,
+                                     &sizeHint)) {
+        return -1;
+    }
+
+    if (context_lock_init(&self->lock)) {
+        return -1;
+    }
+
+    if (sizeHint < 0) {
+        PyErr_SetString(PyExc_ValueError, "size_hint must be non-negative");
         return -1;
     }
 
@@ -146,6 +203,23 @@ static int ZstdCompressor_init(ZstdCompressor *self, PyObject *args,
         }
     }
 
+    if (threadPool) {
+        if (threadPool == Py_None) {
+            threadPool = NULL;
+        }
+        else if (!PyObject_IsInstance(threadPool,
+                                      (PyObject *)ZstdThreadPoolType)) {
+            PyErr_Format(PyExc_TypeError,
+                         "thread_pool must be zstd.ZstdThreadPool");
+            return -1;
+        }
+    }
+
+    /* Use all the threads in a shared pool unless told otherwise. */
+    if (threadPool && !params && !threads) {
+        threads = ((ZstdThreadPool *)threadPool)->threads;
+    }
+
     if (writeChecksum == Py_None) {
         writeChecksum = NULL;
     }
@@ -233,11 +307,24 @@ static int ZstdCompressor_init(ZstdCompressor *self, PyObject *args,
         }
     }
 
+    if (sizeHint) {
+        if (set_parameter(self->params, ZSTD_c_srcSizeHint, sizeHint)) {
+            return -1;
+        }
+    }
+
+    self->sizeHint = sizeHint;
+
     if (dict) {
         self->dict = (ZstdCompressionDict *)dict;
         Py_INCREF(dict);
     }
 
+    if (threadPool) {
+        self->threadPool = (ZstdThreadPool *)threadPool;
+        Py_INCREF(threadPool);
+    }
+
     if (setup_cctx(self)) {
         return -1;
     }
@@ -256,13 +343,44 @@ static void ZstdCompressor_dealloc(ZstdCompressor *self) {
         self->params = NULL;
     }
 
+#ifdef HAVE_ZSTD_POOL_APIS
+    if (self->multiPool) {
+        POOL_free(self->multiPool);
+        self->multiPool = NULL;
+    }
+#endif
+
+    if (self->multiCCtxs) {
+        Py_ssize_t i;
+
+        for (i = 0; i < self->multiCCtxsSize; i++) {
+            ZSTD_freeCCtx(self->multiCCtxs[i]);
+        }
+
+        PyMem_Free(self->multiCCtxs);
+        self->multiCCtxs = NULL;
+    }
+
+    Py_XDECREF(self->cdict);
     Py_XDECREF(self->dict);
+    Py_XDECREF(self->threadPool);
+    context_lock_free(&self->lock);
     PyObject_Del(self);
 }
 
-static PyObject *ZstdCompressor_memory_size(ZstdCompressor *self) {
+static PyObject *ZstdCompressor_memory_size_impl(ZstdCompressor *self) {
     if (self->cctx) {
-        return PyLong_FromSize_t(ZSTD_sizeof_CCtx(self->cctx));
+        size_t size = ZSTD_sizeof_CCtx(self->cctx);
+        Py_ssize_t i;
+
+        /* Worker contexts retained by multi_compress_to_buffer(). */
+        for (i = 0; i < self->multiCCtxsSize; i++) {
+            if (self->multiCCtxs[i]) {
+                size += ZSTD_sizeof_CCtx(self->multiCCtxs[i]);
+            }
+        }
+
+        return PyLong_FromSize_t(size);
     }
     else {
         PyErr_SetString(
@@ -271,12 +389,33 @@ static PyObject *ZstdCompressor_memory_size(ZstdCompressor *self) {
     }
 }
 
-static PyObject *ZstdCompressor_frame_progression(ZstdCompressor *self) {
+static PyObject *ZstdCompressor_memory_size(ZstdCompressor *self) {
+    PyObject *result;
+
+    context_lock_acquire(&self->lock);
+    result = ZstdCompressor_memory_size_impl(self);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
+static PyObject *ZstdCompressor_frame_progression_impl(ZstdCompressor *self) {
     return frame_progression(self->cctx);
 }
 
-static PyObject *ZstdCompressor_copy_stream(ZstdCompressor *self,
-                                            PyObject *args, PyObject *kwargs) {
+static PyObject *ZstdCompressor_frame_progression(ZstdCompressor *self) {
+    PyObject *result;
+
+    context_lock_acquire(&self->lock);
+    result = ZstdCompressor_frame_progression_impl(self);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
+static PyObject *ZstdCompressor_copy_stream_impl(ZstdCompressor *self,
+                                                 PyObject *args,
+                                                 PyObject *kwargs) {
     static char *kwlist[] = {"ifh",       "ofh",        "size",
                              "read_size", "write_size", NULL};
 
@@ -318,6 +457,10 @@ static PyObject *ZstdCompressor_copy_stream(ZstdCompressor *self,
 
     ZSTD_CCtx_reset(self->cctx, ZSTD_reset_session_only);
 
+    if (set_size_hint(self, 0)) {
+        return NULL;
+    }
+
     zresult = ZSTD_CCtx_setPledgedSrcSize(self->cctx, sourceSize);
     if (ZSTD_isError(zresult)) {
         PyErr_Format(ZstdError, "error setting source size: %s",
@@ -436,9 +579,20 @@ finally:
     return res;
 }
 
-static ZstdCompressionReader *ZstdCompressor_stream_reader(ZstdCompressor *self,
-                                                           PyObject *args,
-                                                           PyObject *kwargs) {
+static PyObject *ZstdCompressor_copy_stream(ZstdCompressor *self,
+                                            PyObject *args, PyObject *kwargs) {
+    PyObject *result;
+
+    context_lock_acquire(&self->lock);
+    result = ZstdCompressor_copy_stream_impl(self, args, kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
+static ZstdCompressionReader *
+ZstdCompressor_stream_reader_impl(ZstdCompressor *self, PyObject *args,
+                                  PyObject *kwargs) {
     static char *kwlist[] = {"source", "size", "read_size", "closefd", NULL};
 
     PyObject *source;
@@ -488,6 +642,10 @@ static ZstdCompressionReader *ZstdCompressor_stream_reader(ZstdCompressor *self,
 
     ZSTD_CCtx_reset(self->cctx, ZSTD_reset_session_only);
 
+    if (set_size_hint(self, 0)) {
+        goto except;
+    }
+
     zresult = ZSTD_CCtx_setPledgedSrcSize(self->cctx, sourceSize);
     if (ZSTD_isError(zresult)) {
         PyErr_Format(ZstdError, "error setting source source: %s",
@@ -506,8 +664,22 @@ except:
     return NULL;
 }
 
-static PyObject *ZstdCompressor_compress(ZstdCompressor *self, PyObject *args,
-                                         PyObject *kwargs) {
+static ZstdCompressionReader *ZstdCompressor_stream_reader(ZstdCompressor *self,
+                                                           PyObject *args,
+                                                           PyObject *kwargs) {
+    ZstdCompressionReader *result;
+
+    context_lock_acquire(&self->lock);
+    result = ZstdCompressor_stream_reader_impl(self, args, kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
+static PyObject *ZstdCompressor_compress_impl(ZstdCompressor *self,
+                                              PyObject *const *args,
+                                              Py_ssize_t nargs,
+                                              PyObject *kwnames) {
     static char *kwlist[] = {"data", NULL};
 
     Py_buffer source;
@@ -517,8 +689,9 @@ static PyObject *ZstdCompressor_compress(ZstdCompressor *self, PyObject *args,
     ZSTD_outBuffer outBuffer;
     ZSTD_inBuffer inBuffer;
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*|O:compress", kwlist,
-                                     &source)) {
+    if (!fastcall_buffer_arg(args, nargs, kwnames, &source) &&
+        parse_fastcall_args(args, nargs, kwnames, "y*:compress", kwlist,
+                            &source)) {
         return NULL;
     }
 
@@ -542,7 +715,7 @@ static PyObject *ZstdCompressor_compress(ZstdCompressor *self, PyObject *args,
     inBuffer.size = source.len;
     inBuffer.pos = 0;
 
-    outBuffer.dst = PyBytes_AsString(output);
+    outBuffer.dst = PyBytes_AS_STRING(output);
     outBuffer.size = destSize;
     outBuffer.pos = 0;
 
@@ -573,23 +746,113 @@ finally:
     return output;
 }
 
-static ZstdCompressionObj *ZstdCompressor_compressobj(ZstdCompressor *self,
-                                                      PyObject *args,
-                                                      PyObject *kwargs) {
-    static char *kwlist[] = {"size", NULL};
+static PyObject *ZstdCompressor_compress(ZstdCompressor *self,
+                                         PyObject *const *args,
+                                         Py_ssize_t nargs, PyObject *kwnames) {
+    PyObject *result;
+
+    context_lock_acquire(&self->lock);
+    result = ZstdCompressor_compress_impl(self, args, nargs, kwnames);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
+static PyObject *ZstdCompressor_compress_into_impl(ZstdCompressor *self,
+                                                   PyObject *args,
+                                                   PyObject *kwargs) {
+    static char *kwlist[] = {"data", "out", NULL};
+
+    Py_buffer source;
+    Py_buffer dest;
+    PyObject *result = NULL;
+    size_t zresult;
+    ZSTD_outBuffer outBuffer;
+    ZSTD_inBuffer inBuffer;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*w*:compress_into",
+                                     kwlist, &source, &dest)) {
+        return NULL;
+    }
+
+    ZSTD_CCtx_reset(self->cctx, ZSTD_reset_session_only);
+
+    zresult = ZSTD_CCtx_setPledgedSrcSize(self->cctx, source.len);
+    if (ZSTD_isError(zresult)) {
+        PyErr_Format(ZstdError, "error setting source size: %s",
+                     ZSTD_getErrorName(zresult));
+        goto finally;
+    }
+
+    inBuffer.src = source.buf;
+    inBuffer.size = source.len;
+    inBuffer.pos = 0;
+
+    outBuffer.dst = dest.buf;
+    outBuffer.size = dest.len;
+    outBuffer.pos = 0;
+
+    Py_BEGIN_ALLOW_THREADS zresult =
+        ZSTD_compressStream2(self->cctx, &outBuffer, &inBuffer, ZSTD_e_end);
+    Py_END_ALLOW_THREADS
+
+        if (ZSTD_isError(zresult)) {
+        PyErr_Format(ZstdError, "cannot compress: %s",
+                     ZSTD_getErrorName(zresult));
+        goto finally;
+    }
+    else if (zresult) {
+        /* Don't leave a partial frame behind for the next operation. */
+        ZSTD_CCtx_reset(self->cctx, ZSTD_reset_session_only);
+        PyErr_Format(ZstdError,
+                     "output buffer too small: compressed data exceeds %zd "
+                     "bytes",
+                     dest.len);
+        goto finally;
+    }
+
+    result = PyLong_FromSize_t(outBuffer.pos);
+
+finally:
+    PyBuffer_Release(&source);
+    PyBuffer_Release(&dest);
+    return result;
+}
+
+static PyObject *ZstdCompressor_compress_into(ZstdCompressor *self,
+                                              PyObject *args,
+                                              PyObject *kwargs) {
+    PyObject *result;
+
+    context_lock_acquire(&self->lock);
+    result = ZstdCompressor_compress_into_impl(self, args, kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
+static ZstdCompressionObj *ZstdCompressor_compressobj_impl(ZstdCompressor *self,
+                                                           PyObject *args,
+                                                           PyObject *kwargs) {
+    static char *kwlist[] = {"size", "size_hint", NULL};
 
     unsigned long long inSize = ZSTD_CONTENTSIZE_UNKNOWN;
+    int sizeHint = 0;
     size_t outSize = ZSTD_CStreamOutSize();
     ZstdCompressionObj *result = NULL;
     size_t zresult;
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|K:compressobj", kwlist,
-                                     &inSize)) {
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|Ki:compressobj", kwlist,
+                                     &inSize, &sizeHint)) {
         return NULL;
     }
 
     ZSTD_CCtx_reset(self->cctx, ZSTD_reset_session_only);
 
+    if (set_size_hint(self, sizeHint)) {
+        return NULL;
+    }
+
     zresult = ZSTD_CCtx_setPledgedSrcSize(self->cctx, inSize);
     if (ZSTD_isError(zresult)) {
         PyErr_Format(ZstdError, "error setting source size: %s",
@@ -616,9 +879,21 @@ static ZstdCompressionObj *ZstdCompressor_compressobj(ZstdCompressor *self,
     return result;
 }
 
-static ZstdCompressorIterator *ZstdCompressor_read_to_iter(ZstdCompressor *self,
-                                                           PyObject *args,
-                                                           PyObject *kwargs) {
+static ZstdCompressionObj *ZstdCompressor_compressobj(ZstdCompressor *self,
+                                                      PyObject *args,
+                                                      PyObject *kwargs) {
+    ZstdCompressionObj *result;
+
+    context_lock_acquire(&self->lock);
+    result = ZstdCompressor_compressobj_impl(self, args, kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
+static ZstdCompressorIterator *
+ZstdCompressor_read_to_iter_impl(ZstdCompressor *self, PyObject *args,
+                                 PyObject *kwargs) {
     static char *kwlist[] = {"reader", "size", "read_size", "write_size", NULL};
 
     PyObject *reader;
@@ -658,6 +933,10 @@ static ZstdCompressorIterator *ZstdCompressor_read_to_iter(ZstdCompressor *self,
 
     ZSTD_CCtx_reset(self->cctx, ZSTD_reset_session_only);
 
+    if (set_size_hint(self, 0)) {
+        goto except;
+    }
+
     zresult = ZSTD_CCtx_setPledgedSrcSize(self->cctx, sourceSize);
     if (ZSTD_isError(zresult)) {
         PyErr_Format(ZstdError, "error setting source size: %s",
@@ -687,11 +966,24 @@ finally:
     return result;
 }
 
-static ZstdCompressionWriter *ZstdCompressor_stream_writer(ZstdCompressor *self,
+static ZstdCompressorIterator *ZstdCompressor_read_to_iter(ZstdCompressor *self,
                                                            PyObject *args,
                                                            PyObject *kwargs) {
-    static char *kwlist[] = {
-        "writer", "size", "write_size", "write_return_read", "closefd", NULL};
+    ZstdCompressorIterator *result;
+
+    context_lock_acquire(&self->lock);
+    result = ZstdCompressor_read_to_iter_impl(self, args, kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
+static ZstdCompressionWriter *
+ZstdCompressor_stream_writer_impl(ZstdCompressor *self, PyObject *args,
+                                  PyObject *kwargs) {
+    static char *kwlist[] = {"writer",  "size",      "write_size",
+                             "write_return_read", "closefd", "size_hint",
+                             NULL};
 
     PyObject *writer;
     ZstdCompressionWriter *result;
@@ -700,10 +992,11 @@ static ZstdCompressionWriter *ZstdCompressor_stream_writer(ZstdCompressor *self,
     size_t outSize = ZSTD_CStreamOutSize();
     PyObject *writeReturnRead = NULL;
     PyObject *closefd = NULL;
+    int sizeHint = 0;
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|KkOO:stream_writer",
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|KkOOi:stream_writer",
                                      kwlist, &writer, &sourceSize, &outSize,
-                                     &writeReturnRead, &closefd)) {
+                                     &writeReturnRead, &closefd, &sizeHint)) {
         return NULL;
     }
 
@@ -715,6 +1008,10 @@ static ZstdCompressionWriter *ZstdCompressor_stream_writer(ZstdCompressor *self,
 
     ZSTD_CCtx_reset(self->cctx, ZSTD_reset_session_only);
 
+    if (set_size_hint(self, sizeHint)) {
+        return NULL;
+    }
+
     zresult = ZSTD_CCtx_setPledgedSrcSize(self->cctx, sourceSize);
     if (ZSTD_isError(zresult)) {
         PyErr_Format(ZstdError, "error setting source size: %s",
@@ -749,6 +1046,7 @@ static ZstdCompressionWriter *ZstdCompressor_stream_writer(ZstdCompressor *self,
 
     result->outSize = outSize;
     result->bytesCompressed = 0;
+    result->frameStarted = 0;
     result->writeReturnRead =
         writeReturnRead ? PyObject_IsTrue(writeReturnRead) : 1;
     result->closefd = closefd ? PyObject_IsTrue(closefd) : 1;
@@ -756,22 +1054,40 @@ static ZstdCompressionWriter *ZstdCompressor_stream_writer(ZstdCompressor *self,
     return result;
 }
 
-static ZstdCompressionChunker *
-ZstdCompressor_chunker(ZstdCompressor *self, PyObject *args, PyObject *kwargs) {
-    static char *kwlist[] = {"size", "chunk_size", NULL};
+static ZstdCompressionWriter *ZstdCompressor_stream_writer(ZstdCompressor *self,
+                                                           PyObject *args,
+                                                           PyObject *kwargs) {
+    ZstdCompressionWriter *result;
+
+    context_lock_acquire(&self->lock);
+    result = ZstdCompressor_stream_writer_impl(self, args, kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
+static ZstdCompressionChunker *ZstdCompressor_chunker_impl(ZstdCompressor *self,
+                                                           PyObject *args,
+                                                           PyObject *kwargs) {
+    static char *kwlist[] = {"size", "chunk_size", "size_hint", NULL};
 
     unsigned long long sourceSize = ZSTD_CONTENTSIZE_UNKNOWN;
     size_t chunkSize = ZSTD_CStreamOutSize();
+    int sizeHint = 0;
     ZstdCompressionChunker *chunker;
     size_t zresult;
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|Kk:chunker", kwlist,
-                                     &sourceSize, &chunkSize)) {
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|Kki:chunker", kwlist,
+                                     &sourceSize, &chunkSize, &sizeHint)) {
         return NULL;
     }
 
     ZSTD_CCtx_reset(self->cctx, ZSTD_reset_session_only);
 
+    if (set_size_hint(self, sizeHint)) {
+        return NULL;
+    }
+
     zresult = ZSTD_CCtx_setPledgedSrcSize(self->cctx, sourceSize);
     if (ZSTD_isError(zresult)) {
         PyErr_Format(ZstdError, "error setting source size: %s",
@@ -802,6 +1118,18 @@ ZstdCompressor_chunker(ZstdCompressor *self, PyObject *args, PyObject *kwargs) {
     return chunker;
 }
 
+static ZstdCompressionChunker *ZstdCompressor_chunker(ZstdCompressor *self,
+                                                      PyObject *args,
+                                                      PyObject *kwargs) {
+    ZstdCompressionChunker *result;
+
+    context_lock_acquire(&self->lock);
+    result = ZstdCompressor_chunker_impl(self, args, kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
 typedef struct {
     void *sourceData;
     size_t sourceSize;
@@ -1080,6 +1408,178 @@ static void compress_worker(CompressorWorkerState *state) {
    as these are private APIs. */
 #ifdef HAVE_ZSTD_POOL_APIS
 
+/*
+ * Cost model used to pick the number of workers for multi_compress_to_buffer.
+ *
+ * Dispatching work to another thread has a fixed cost on the order of tens of
+ * microseconds. For batches of small inputs, that cost can exceed the cost of
+ * compressing everything on the calling thread. So we estimate how long
+ * compressing the batch will take and only add a worker for every
+ * MULTI_COMPRESS_MIN_WORKER_USEC of estimated work.
+ *
+ * The throughput estimates are deliberately conservative single core numbers.
+ * They don't need to be accurate: they just need to be in the right order of
+ * magnitude to avoid spawning threads for trivial amounts of work.
+ */
+#define MULTI_COMPRESS_MIN_WORKER_USEC 200
+#define MULTI_COMPRESS_ITEM_OVERHEAD_USEC 1
+
+static unsigned long long compress_bytes_per_usec(int level) {
+    if (level < 1) {
+        return 600;
+    }
+    else if (level <= 2) {
+        return 300;
+    }
+    else if (level <= 4) {
+        return 150;
+    }
+    else if (level <= 9) {
+        return 50;
+    }
+    else if (level <= 15) {
+        return 15;
+    }
+    else {
+        return 3;
+    }
+}
+
+static Py_ssize_t multi_compress_thread_count(ZstdCompressor *compressor,
+                                              DataSources *sources,
+                                              Py_ssize_t threadCount) {
+    int level = 0;
+    unsigned long long costUsec;
+    unsigned long long maxWorkers;
+
+    /* More threads than inputs makes no sense. */
+    if (sources->sourcesSize < threadCount) {
+        threadCount = sources->sourcesSize;
+    }
+
+    if (threadCount < 2) {
+        return 1;
+    }
+
+    if (ZSTD_isError(ZSTD_CCtxParams_getParameter(
+            compressor->params, ZSTD_c_compressionLevel, &level)) ||
+        0 == level) {
+        level = ZSTD_CLEVEL_DEFAULT;
+    }
+
+    costUsec = sources->totalSourceSize / compress_bytes_per_usec(level) +
+               sources->sourcesSize * MULTI_COMPRESS_ITEM_OVERHEAD_USEC;
+
+    maxWorkers = costUsec / MULTI_COMPRESS_MIN_WORKER_USEC;
+
+    if (maxWorkers < 1) {
+        return 1;
+    }
+
+    return maxWorkers < (unsigned long long)threadCount ? (Py_ssize_t)maxWorkers
+                                                        : threadCount;
+}
+
+/*
+ * Ensure the compressor has enough persistent worker contexts and threads
+ * for a multi_compress_to_buffer() operation using threadCount workers.
+ *
+ * Contexts and threads are retained between calls so repeated batch
+ * operations don't pay context allocation and thread startup costs.
+ */
+static int ensure_multi_workers(ZstdCompressor *compressor,
+                                Py_ssize_t threadCount) {
+    Py_ssize_t i;
+    size_t zresult;
+
+    if (compressor->multiCCtxsSize < threadCount) {
+        ZSTD_CCtx **cctxs = PyMem_Realloc(compressor->multiCCtxs,
+                                          threadCount * sizeof(ZSTD_CCtx *));
+        if (NULL == cctxs) {
+            PyErr_NoMemory();
+            return 1;
+        }
+
+        for (i = compressor->multiCCtxsSize; i < threadCount; i++) {
+            cctxs[i] = NULL;
+        }
+
+        compressor->multiCCtxs = cctxs;
+        compressor->multiCCtxsSize = threadCount;
+    }
+
+    for (i = 0; i < threadCount; i++) {
+        ZSTD_CCtx *cctx = compressor->multiCCtxs[i];
+
+        if (NULL == cctx) {
+            cctx = ZSTD_createCCtx();
+            if (NULL == cctx) {
+                PyErr_NoMemory();
+                return 1;
+            }
+
+            compressor->multiCCtxs[i] = cctx;
+        }
+        else {
+            ZSTD_CCtx_reset(cctx, ZSTD_reset_session_and_parameters);
+        }
+
+        zresult =
+            ZSTD_CCtx_setParametersUsingCCtxParams(cctx, compressor->params);
+        if (ZSTD_isError(zresult)) {
+            PyErr_Format(ZstdError, "could not set compression parameters: %s",
+                         ZSTD_getErrorName(zresult));
+            return 1;
+        }
+
+        if (compressor->dict) {
+            if (compressor->cdict) {
+                zresult = ZSTD_CCtx_refCDict(
+                    cctx, PyCapsule_GetPointer(compressor->cdict, NULL));
+            }
+            else {
+                zresult = ZSTD_CCtx_loadDictionary_advanced(
+                    cctx, compressor->dict->dictData,
+                    compressor->dict->dictSize, ZSTD_dlm_byRef,
+                    compressor->dict->dictType);
+            }
+
+            if (ZSTD_isError(zresult)) {
+                PyErr_Format(ZstdError,
+                             "could not load compression dictionary: %s",
+                             ZSTD_getErrorName(zresult));
+                return 1;
+            }
+        }
+    }
+
+    if (threadCount > 1) {
+        if (NULL == compressor->multiPool) {
+            compressor->multiPool = POOL_create(threadCount, 1);
+            if (NULL == compressor->multiPool) {
+                PyErr_SetString(ZstdError,
+                                "could not initialize zstd thread pool");
+                return 1;
+            }
+
+            compressor->multiPoolSize = threadCount;
+            compressor->multiStats.threadsStarted += threadCount;
+        }
+        else if (compressor->multiPoolSize < (size_t)threadCount) {
+            if (POOL_resize(compressor->multiPool, threadCount)) {
+                PyErr_SetString(ZstdError, "could not resize zstd thread pool");
+                return 1;
+            }
+
+            compressor->multiStats.threadsStarted +=
+                threadCount - compressor->multiPoolSize;
+            compressor->multiPoolSize = threadCount;
+        }
+    }
+
+    return 0;
+}
+
 ZstdBufferWithSegmentsCollection *
 compress_from_datasources(ZstdCompressor *compressor, DataSources *sources,
                           Py_ssize_t threadCount) {
@@ -1101,12 +1601,15 @@ compress_from_datasources(ZstdCompressor *compressor, DataSources *sources,
     assert(sources->totalSourceSize > 0);
     assert(threadCount >= 1);
 
-    /* More threads than inputs makes no sense. */
-    threadCount =
-        sources->sourcesSize < threadCount ? sources->sourcesSize : threadCount;
+    threadCount = multi_compress_thread_count(compressor, sources, threadCount);
 
-    /* TODO lower thread count when input size is too small and threads would
-    add overhead. */
+    compressor->multiStats.lastThreads = threadCount;
+    if (threadCount > 1) {
+        compressor->multiStats.multiThreadedCalls++;
+    }
+    else {
+        compressor->multiStats.singleThreadedCalls++;
+    }
 
     workerStates = PyMem_Malloc(threadCount * sizeof(CompressorWorkerState));
     if (NULL == workerStates) {
@@ -1116,53 +1619,18 @@ compress_from_datasources(ZstdCompressor *compressor, DataSources *sources,
 
     memset(workerStates, 0, threadCount * sizeof(CompressorWorkerState));
 
+    if (ensure_multi_workers(compressor, threadCount)) {
+        goto finally;
+    }
+
     if (threadCount > 1) {
-        pool = POOL_create(threadCount, 1);
-        if (NULL == pool) {
-            PyErr_SetString(ZstdError, "could not initialize zstd thread pool");
-            goto finally;
-        }
+        pool = compressor->multiPool;
     }
 
     bytesPerWorker = sources->totalSourceSize / threadCount;
 
     for (i = 0; i < threadCount; i++) {
-        size_t zresult;
-
-        workerStates[i].cctx = ZSTD_createCCtx();
-        if (!workerStates[i].cctx) {
-            PyErr_NoMemory();
-            goto finally;
-        }
-
-        zresult = ZSTD_CCtx_setParametersUsingCCtxParams(workerStates[i].cctx,
-                                                         compressor->params);
-        if (ZSTD_isError(zresult)) {
-            PyErr_Format(ZstdError, "could not set compression parameters: %s",
-                         ZSTD_getErrorName(zresult));
-            goto finally;
-        }
-
-        if (compressor->dict) {
-            if (compressor->dict->cdict) {
-                zresult = ZSTD_CCtx_refCDict(workerStates[i].cctx,
-                                             compressor->dict->cdict);
-            }
-            else {
-                zresult = ZSTD_CCtx_loadDictionary_advanced(
-                    workerStates[i].cctx, compressor->dict->dictData,
-                    compressor->dict->dictSize, ZSTD_dlm_byRef,
-                    compressor->dict->dictType);
-            }
-
-            if (ZSTD_isError(zresult)) {
-                PyErr_Format(ZstdError,
-                             "could not load compression dictionary: %s",
-                             ZSTD_getErrorName(zresult));
-                goto finally;
-            }
-        }
-
+        workerStates[i].cctx = compressor->multiCCtxs[i];
         workerStates[i].sources = sources->sources;
         workerStates[i].sourcesSize = sources->sourcesSize;
     }
@@ -1216,8 +1684,7 @@ compress_from_datasources(ZstdCompressor *compressor, DataSources *sources,
     }
 
     if (threadCount > 1) {
-        POOL_free(pool);
-        pool = NULL;
+        POOL_joinJobs(pool);
     }
 
     Py_END_ALLOW_THREADS
@@ -1303,19 +1770,13 @@ compress_from_datasources(ZstdCompressor *compressor, DataSources *sources,
 finally:
     Py_CLEAR(segmentsArg);
 
-    if (pool) {
-        POOL_free(pool);
-    }
-
     if (workerStates) {
         Py_ssize_t j;
 
         for (i = 0; i < threadCount; i++) {
             CompressorWorkerState state = workerStates[i];
 
-            if (state.cctx) {
-                ZSTD_freeCCtx(state.cctx);
-            }
+            /* Contexts are owned by the compressor and reused. */
 
             /* malloc() is used in worker thread. */
 
@@ -1338,8 +1799,8 @@ finally:
 
 #ifdef HAVE_ZSTD_POOL_APIS
 static ZstdBufferWithSegmentsCollection *
-ZstdCompressor_multi_compress_to_buffer(ZstdCompressor *self, PyObject *args,
-                                        PyObject *kwargs) {
+ZstdCompressor_multi_compress_to_buffer_impl(ZstdCompressor *self,
+                                             PyObject *args, PyObject *kwargs) {
     static char *kwlist[] = {"data", "threads", NULL};
 
     PyObject *data;
@@ -1501,12 +1962,52 @@ finally:
 
     return result;
 }
+
+static ZstdBufferWithSegmentsCollection *
+ZstdCompressor_multi_compress_to_buffer(ZstdCompressor *self, PyObject *args,
+                                        PyObject *kwargs) {
+    ZstdBufferWithSegmentsCollection *result;
+
+    context_lock_acquire(&self->lock);
+    result = ZstdCompressor_multi_compress_to_buffer_impl(self, args, kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+#endif
+
+static PyObject *
+ZstdCompressor_multi_compress_stats_impl(ZstdCompressor *self) {
+    size_t poolThreads = 0;
+
+#ifdef HAVE_ZSTD_POOL_APIS
+    poolThreads = self->multiPoolSize;
 #endif
 
+    return Py_BuildValue(
+        "{s:K,s:K,s:K,s:n,s:n}", "single_threaded_calls",
+        self->multiStats.singleThreadedCalls, "multi_threaded_calls",
+        self->multiStats.multiThreadedCalls, "threads_started",
+        self->multiStats.threadsStarted, "last_threads",
+        self->multiStats.lastThreads, "pool_threads", (Py_ssize_t)poolThreads);
+}
+
+static PyObject *ZstdCompressor_multi_compress_stats(ZstdCompressor *self) {
+    PyObject *result;
+
+    context_lock_acquire(&self->lock);
+    result = ZstdCompressor_multi_compress_stats_impl(self);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
 static PyMethodDef ZstdCompressor_methods[] = {
     {"chunker", (PyCFunction)ZstdCompressor_chunker,
      METH_VARARGS | METH_KEYWORDS, NULL},
     {"compress", (PyCFunction)ZstdCompressor_compress,
+     METH_FASTCALL | METH_KEYWORDS, NULL},
+    {"compress_into", (PyCFunction)ZstdCompressor_compress_into,
      METH_VARARGS | METH_KEYWORDS, NULL},
     {"compressobj", (PyCFunction)ZstdCompressor_compressobj,
      METH_VARARGS | METH_KEYWORDS, NULL},
@@ -1523,6 +2024,8 @@ static PyMethodDef ZstdCompressor_methods[] = {
      (PyCFunction)ZstdCompressor_multi_compress_to_buffer,
      METH_VARARGS | METH_KEYWORDS, NULL},
 #endif
+    {"multi_compress_stats", (PyCFunction)ZstdCompressor_multi_compress_stats,
+     METH_NOARGS, NULL},
     {"memory_size", (PyCFunction)ZstdCompressor_memory_size, METH_NOARGS, NULL},
     {"frame_progression", (PyCFunction)ZstdCompressor_frame_progression,
      METH_NOARGS, NULL},
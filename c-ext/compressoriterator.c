@@ -35,7 +35,8 @@ static PyObject *ZstdCompressorIterator_iter(PyObject *self) {
     return self;
 }
 
-static PyObject *ZstdCompressorIterator_iternext(ZstdCompressorIterator *self) {
+static PyObject *
+ZstdCompressorIterator_iternext_impl(ZstdCompressorIterator *self) {
     size_t zresult;
     PyObject *readResult = NULL;
     PyObject *chunk;
@@ -126,9 +127,12 @@ feedcompressor:
         self->input.size = 0;
         self->input.pos = 0;
 
-        zresult = ZSTD_compressStream2(self->compressor->cctx, &self->output,
-                                       &self->input, ZSTD_e_end);
-        if (ZSTD_isError(zresult)) {
+        Py_BEGIN_ALLOW_THREADS zresult =
+            ZSTD_compressStream2(self->compressor->cctx, &self->output,
+                                 &self->input, ZSTD_e_end);
+        Py_END_ALLOW_THREADS
+
+            if (ZSTD_isError(zresult)) {
             PyErr_Format(ZstdError, "error ending compression stream: %s",
                          ZSTD_getErrorName(zresult));
             return NULL;
@@ -185,6 +189,16 @@ feedcompressor:
     return chunk;
 }
 
+static PyObject *ZstdCompressorIterator_iternext(ZstdCompressorIterator *self) {
+    PyObject *result;
+
+    context_lock_acquire(&self->compressor->lock);
+    result = ZstdCompressorIterator_iternext_impl(self);
+    context_lock_release(&self->compressor->lock);
+
+    return result;
+}
+
 PyType_Slot ZstdCompressorIteratorSlots[] = {
     {Py_tp_dealloc, ZstdCompressorIterator_dealloc},
     {Py_tp_iter, ZstdCompressorIterator_iter},
@@ -215,8 +215,9 @@ int decompress_input(ZstdDecompressionReader *self, ZSTD_outBuffer *output) {
     return 0;
 }
 
-static PyObject *decompressionreader_read(ZstdDecompressionReader *self,
-                                          PyObject *args, PyObject *kwargs) {
+static PyObject *decompressionreader_read_impl(ZstdDecompressionReader *self,
+                                               PyObject *args,
+                                               PyObject *kwargs) {
     static char *kwlist[] = {"size", NULL};
 
     Py_ssize_t size = -1;
@@ -314,8 +315,28 @@ readinput:
     return result;
 }
 
-static PyObject *decompressionreader_read1(ZstdDecompressionReader *self,
-                                           PyObject *args, PyObject *kwargs) {
+static PyObject *decompressionreader_read(ZstdDecompressionReader *self,
+                                          PyObject *args, PyObject *kwargs) {
+    ZstdDecompressor *decompressor = self->decompressor;
+    PyObject *result;
+
+    /* __exit__() releases the decompressor. Let the implementation raise. */
+    if (!decompressor) {
+        return decompressionreader_read_impl(self, args, kwargs);
+    }
+
+    Py_INCREF(decompressor);
+    context_lock_acquire(&decompressor->lock);
+    result = decompressionreader_read_impl(self, args, kwargs);
+    context_lock_release(&decompressor->lock);
+    Py_DECREF(decompressor);
+
+    return result;
+}
+
+static PyObject *decompressionreader_read1_impl(ZstdDecompressionReader *self,
+                                                PyObject *args,
+                                                PyObject *kwargs) {
     static char *kwlist[] = {"size", NULL};
 
     Py_ssize_t size = -1;
@@ -404,8 +425,28 @@ static PyObject *decompressionreader_read1(ZstdDecompressionReader *self,
     return result;
 }
 
-static PyObject *decompressionreader_readinto(ZstdDecompressionReader *self,
-                                              PyObject *args) {
+static PyObject *decompressionreader_read1(ZstdDecompressionReader *self,
+                                           PyObject *args, PyObject *kwargs) {
+    ZstdDecompressor *decompressor = self->decompressor;
+    PyObject *result;
+
+    /* __exit__() releases the decompressor. Let the implementation raise. */
+    if (!decompressor) {
+        return decompressionreader_read1_impl(self, args, kwargs);
+    }
+
+    Py_INCREF(decompressor);
+    context_lock_acquire(&decompressor->lock);
+    result = decompressionreader_read1_impl(self, args, kwargs);
+    context_lock_release(&decompressor->lock);
+    Py_DECREF(decompressor);
+
+    return result;
+}
+
+static PyObject *
+decompressionreader_readinto_impl(ZstdDecompressionReader *self,
+                                  PyObject *args) {
     Py_buffer dest;
     ZSTD_outBuffer output;
     int decompressResult, readResult;
@@ -473,8 +514,28 @@ finally:
     return result;
 }
 
-static PyObject *decompressionreader_readinto1(ZstdDecompressionReader *self,
-                                               PyObject *args) {
+static PyObject *decompressionreader_readinto(ZstdDecompressionReader *self,
+                                              PyObject *args) {
+    ZstdDecompressor *decompressor = self->decompressor;
+    PyObject *result;
+
+    /* __exit__() releases the decompressor. Let the implementation raise. */
+    if (!decompressor) {
+        return decompressionreader_readinto_impl(self, args);
+    }
+
+    Py_INCREF(decompressor);
+    context_lock_acquire(&decompressor->lock);
+    result = decompressionreader_readinto_impl(self, args);
+    context_lock_release(&decompressor->lock);
+    Py_DECREF(decompressor);
+
+    return result;
+}
+
+static PyObject *
+decompressionreader_readinto1_impl(ZstdDecompressionReader *self,
+                                   PyObject *args) {
     Py_buffer dest;
     ZSTD_outBuffer output;
     PyObject *result = NULL;
@@ -535,6 +596,25 @@ finally:
     return result;
 }
 
+static PyObject *decompressionreader_readinto1(ZstdDecompressionReader *self,
+                                               PyObject *args) {
+    ZstdDecompressor *decompressor = self->decompressor;
+    PyObject *result;
+
+    /* __exit__() releases the decompressor. Let the implementation raise. */
+    if (!decompressor) {
+        return decompressionreader_readinto1_impl(self, args);
+    }
+
+    Py_INCREF(decompressor);
+    context_lock_acquire(&decompressor->lock);
+    result = decompressionreader_readinto1_impl(self, args);
+    context_lock_release(&decompressor->lock);
+    Py_DECREF(decompressor);
+
+    return result;
+}
+
 static PyObject *decompressionreader_readall(PyObject *self) {
     PyObject *chunks = NULL;
     PyObject *empty = NULL;
@@ -597,8 +677,8 @@ static PyObject *decompressionreader_readlines(PyObject *self, PyObject *args,
     return NULL;
 }
 
-static PyObject *decompressionreader_seek(ZstdDecompressionReader *self,
-                                          PyObject *args) {
+static PyObject *decompressionreader_seek_impl(ZstdDecompressionReader *self,
+                                               PyObject *args) {
     Py_ssize_t pos;
     int whence = 0;
     unsigned long long readAmount = 0;
@@ -674,6 +754,25 @@ static PyObject *decompressionreader_seek(ZstdDecompressionReader *self,
     return PyLong_FromUnsignedLongLong(self->bytesDecompressed);
 }
 
+static PyObject *decompressionreader_seek(ZstdDecompressionReader *self,
+                                          PyObject *args) {
+    ZstdDecompressor *decompressor = self->decompressor;
+    PyObject *result;
+
+    /* __exit__() releases the decompressor. Let the implementation raise. */
+    if (!decompressor) {
+        return decompressionreader_seek_impl(self, args);
+    }
+
+    Py_INCREF(decompressor);
+    context_lock_acquire(&decompressor->lock);
+    result = decompressionreader_seek_impl(self, args);
+    context_lock_release(&decompressor->lock);
+    Py_DECREF(decompressor);
+
+    return result;
+}
+
 static PyObject *decompressionreader_tell(ZstdDecompressionReader *self) {
     /* TODO should this raise OSError since stream isn't seekable? */
     return PyLong_FromUnsignedLongLong(self->bytesDecompressed);
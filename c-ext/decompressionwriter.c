@@ -46,13 +46,24 @@ static PyObject *ZstdDecompressionWriter_exit(ZstdDecompressionWriter *self,
 }
 
 static PyObject *
-ZstdDecompressionWriter_memory_size(ZstdDecompressionWriter *self) {
+ZstdDecompressionWriter_memory_size_impl(ZstdDecompressionWriter *self) {
     return PyLong_FromSize_t(ZSTD_sizeof_DCtx(self->decompressor->dctx));
 }
 
-static PyObject *ZstdDecompressionWriter_write(ZstdDecompressionWriter *self,
-                                               PyObject *args,
-                                               PyObject *kwargs) {
+static PyObject *
+ZstdDecompressionWriter_memory_size(ZstdDecompressionWriter *self) {
+    PyObject *result;
+
+    context_lock_acquire(&self->decompressor->lock);
+    result = ZstdDecompressionWriter_memory_size_impl(self);
+    context_lock_release(&self->decompressor->lock);
+
+    return result;
+}
+
+static PyObject *
+ZstdDecompressionWriter_write_impl(ZstdDecompressionWriter *self,
+                                   PyObject *args, PyObject *kwargs) {
     static char *kwlist[] = {"data", NULL};
 
     PyObject *result = NULL;
@@ -123,7 +134,20 @@ finally:
     return result;
 }
 
-static PyObject *ZstdDecompressionWriter_close(ZstdDecompressionWriter *self) {
+static PyObject *ZstdDecompressionWriter_write(ZstdDecompressionWriter *self,
+                                               PyObject *args,
+                                               PyObject *kwargs) {
+    PyObject *result;
+
+    context_lock_acquire(&self->decompressor->lock);
+    result = ZstdDecompressionWriter_write_impl(self, args, kwargs);
+    context_lock_release(&self->decompressor->lock);
+
+    return result;
+}
+
+static PyObject *
+ZstdDecompressionWriter_close_impl(ZstdDecompressionWriter *self) {
     PyObject *result;
 
     if (self->closed) {
@@ -147,6 +171,16 @@ static PyObject *ZstdDecompressionWriter_close(ZstdDecompressionWriter *self) {
     Py_RETURN_NONE;
 }
 
+static PyObject *ZstdDecompressionWriter_close(ZstdDecompressionWriter *self) {
+    PyObject *result;
+
+    context_lock_acquire(&self->decompressor->lock);
+    result = ZstdDecompressionWriter_close_impl(self);
+    context_lock_release(&self->decompressor->lock);
+
+    return result;
+}
+
 static PyObject *ZstdDecompressionWriter_fileno(ZstdDecompressionWriter *self) {
     if (PyObject_HasAttrString(self->writer, "fileno")) {
         return PyObject_CallMethod(self->writer, "fileno", NULL);
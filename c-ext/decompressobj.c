@@ -17,8 +17,9 @@ static void DecompressionObj_dealloc(ZstdDecompressionObj *self) {
     PyObject_Del(self);
 }
 
-static PyObject *DecompressionObj_decompress(ZstdDecompressionObj *self,
-                                             PyObject *args, PyObject *kwargs) {
+static PyObject *DecompressionObj_decompress_impl(ZstdDecompressionObj *self,
+                                                  PyObject *args,
+                                                  PyObject *kwargs) {
     static char *kwlist[] = {"data", NULL};
 
     Py_buffer source;
@@ -129,6 +130,17 @@ finally:
     return result;
 }
 
+static PyObject *DecompressionObj_decompress(ZstdDecompressionObj *self,
+                                             PyObject *args, PyObject *kwargs) {
+    PyObject *result;
+
+    context_lock_acquire(&self->decompressor->lock);
+    result = DecompressionObj_decompress_impl(self, args, kwargs);
+    context_lock_release(&self->decompressor->lock);
+
+    return result;
+}
+
 static PyObject *DecompressionObj_flush(ZstdDecompressionObj *self,
                                         PyObject *args, PyObject *kwargs) {
     static char *kwlist[] = {"length", NULL};
@@ -145,13 +157,21 @@ static PyObject *DecompressionObj_flush(ZstdDecompressionObj *self,
 
 static PyObject *DecompressionObj_unused_data(PyObject *self, void *unused) {
     ZstdDecompressionObj *slf = (ZstdDecompressionObj *)(self);
+    PyObject *result;
+
+    /* decompress() may replace unused_data concurrently. */
+    context_lock_acquire(&slf->decompressor->lock);
 
     if (slf->unused_data) {
         Py_INCREF(slf->unused_data);
-        return slf->unused_data;
+        result = slf->unused_data;
     } else {
-        return PyBytes_FromString("");
+        result = PyBytes_FromString("");
     }
+
+    context_lock_release(&slf->decompressor->lock);
+
+    return result;
 }
 
 static PyObject *DecompressionObj_unconsumed_tail(PyObject *self, void *unused) {
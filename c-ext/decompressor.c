@@ -10,6 +10,33 @@
 
 extern PyObject *ZstdError;
 
+/**
+ * Reference a digested registry dictionary from the decompression context.
+ *
+ * The dictionary is retained for as long as the context may use it.
+ */
+static int reference_registry_dict(ZstdDecompressor *decompressor,
+                                   PyObject *key, ZstdCompressionDict *dict) {
+    size_t zresult;
+
+    if (PyDict_GetItemWithError(decompressor->registryDicts, key) ==
+        (PyObject *)dict) {
+        return 0;
+    }
+    else if (PyErr_Occurred()) {
+        return 1;
+    }
+
+    zresult = ZSTD_DCtx_refDDict(decompressor->dctx, dict->ddict);
+    if (ZSTD_isError(zresult)) {
+        PyErr_Format(ZstdError, "unable to reference prepared dictionary: %s",
+                     ZSTD_getErrorName(zresult));
+        return 1;
+    }
+
+    return PyDict_SetItem(decompressor->registryDicts, key, (PyObject *)dict);
+}
+
 /**
  * Ensure the ZSTD_DCtx on a decompressor is initiated and ready for a new
  * operation.
@@ -17,27 +44,51 @@ extern PyObject *ZstdError;
 int ensure_dctx(ZstdDecompressor *decompressor, int loadDict) {
     size_t zresult;
 
+    /* Dictionaries referenced by the context can't be released individually.
+       Start over with a fresh context once too many have accumulated. */
+    if (decompressor->registry &&
+        PyDict_Size(decompressor->registryDicts) >
+            2 * decompressor->registry->maxCached) {
+        ZSTD_DCtx *dctx = ZSTD_createDCtx();
+        if (!dctx) {
+            PyErr_NoMemory();
+            return 1;
+        }
+
+        ZSTD_freeDCtx(decompressor->dctx);
+        decompressor->dctx = dctx;
+        PyDict_Clear(decompressor->registryDicts);
+        decompressor->registryVersion = 0;
+        decompressor->paramsApplied = 0;
+    }
+
     ZSTD_DCtx_reset(decompressor->dctx, ZSTD_reset_session_only);
 
-    if (decompressor->maxWindowSize) {
-        zresult = ZSTD_DCtx_setMaxWindowSize(decompressor->dctx,
-                                             decompressor->maxWindowSize);
+    /* Parameters and the referenced dictionary survive session resets.
+       Skip reapplying them on every operation. */
+    if (!decompressor->paramsApplied) {
+        if (decompressor->maxWindowSize) {
+            zresult = ZSTD_DCtx_setMaxWindowSize(decompressor->dctx,
+                                                 decompressor->maxWindowSize);
+            if (ZSTD_isError(zresult)) {
+                PyErr_Format(ZstdError, "unable to set max window size: %s",
+                             ZSTD_getErrorName(zresult));
+                return 1;
+            }
+        }
+
+        zresult = ZSTD_DCtx_setParameter(decompressor->dctx, ZSTD_d_format,
+                                         decompressor->format);
         if (ZSTD_isError(zresult)) {
-            PyErr_Format(ZstdError, "unable to set max window size: %s",
+            PyErr_Format(ZstdError, "unable to set decoding format: %s",
                          ZSTD_getErrorName(zresult));
             return 1;
         }
-    }
 
-    zresult = ZSTD_DCtx_setParameter(decompressor->dctx, ZSTD_d_format,
-                                     decompressor->format);
-    if (ZSTD_isError(zresult)) {
-        PyErr_Format(ZstdError, "unable to set decoding format: %s",
-                     ZSTD_getErrorName(zresult));
-        return 1;
+        decompressor->paramsApplied = 1;
     }
 
-    if (loadDict && decompressor->dict) {
+    if (loadDict && decompressor->dict && !decompressor->dictApplied) {
         if (ensure_ddict(decompressor->dict)) {
             return 1;
         }
@@ -50,6 +101,108 @@ int ensure_dctx(ZstdDecompressor *decompressor, int loadDict) {
                          ZSTD_getErrorName(zresult));
             return 1;
         }
+
+        decompressor->dictApplied = 1;
+    }
+
+    if (loadDict && decompressor->registry) {
+        PyObject *cached = NULL;
+        unsigned long long version;
+
+        zresult = ZSTD_DCtx_setParameter(decompressor->dctx,
+                                         ZSTD_d_refMultipleDDicts,
+                                         ZSTD_rmd_refMultipleDDicts);
+        if (ZSTD_isError(zresult)) {
+            PyErr_Format(ZstdError,
+                         "unable to enable multiple dictionaries: %s",
+                         ZSTD_getErrorName(zresult));
+            return 1;
+        }
+
+        /* Reference everything currently cached by the registry so streaming
+           operations can use it. */
+        Py_BEGIN_CRITICAL_SECTION(decompressor->registry);
+        version = decompressor->registry->version;
+        if (version != decompressor->registryVersion) {
+            cached = PyDict_Copy(decompressor->registry->cache);
+        }
+        Py_END_CRITICAL_SECTION();
+
+        if (version != decompressor->registryVersion) {
+            Py_ssize_t pos = 0;
+            PyObject *key;
+            PyObject *value;
+
+            if (!cached) {
+                return 1;
+            }
+
+            while (PyDict_Next(cached, &pos, &key, &value)) {
+                if (reference_registry_dict(decompressor, key,
+                                            (ZstdCompressionDict *)value)) {
+                    Py_DECREF(cached);
+                    return 1;
+                }
+            }
+
+            Py_DECREF(cached);
+            decompressor->registryVersion = version;
+        }
+    }
+
+    return 0;
+}
+
+/**
+ * Reference the registry dictionaries needed by the frames in a buffer.
+ *
+ * If allFrames is false, only the first frame is examined.
+ */
+static int select_frame_dicts(ZstdDecompressor *decompressor, const char *data,
+                              size_t size, int allFrames) {
+    while (size) {
+        unsigned dictId = ZSTD_getDictID_fromFrame(data, size);
+
+        if (dictId) {
+            PyObject *key;
+            ZstdCompressionDict *dict;
+            int result;
+
+            dict = dictregistry_get(decompressor->registry, dictId);
+            if (!dict) {
+                if (PyErr_Occurred()) {
+                    return 1;
+                }
+            }
+            else {
+                key = PyLong_FromUnsignedLong(dictId);
+                if (!key) {
+                    Py_DECREF(dict);
+                    return 1;
+                }
+
+                result = reference_registry_dict(decompressor, key, dict);
+                Py_DECREF(key);
+                Py_DECREF(dict);
+                if (result) {
+                    return 1;
+                }
+            }
+        }
+
+        if (!allFrames) {
+            break;
+        }
+
+        {
+            size_t frameSize = ZSTD_findFrameCompressedSize(data, size);
+            if (ZSTD_isError(frameSize)) {
+                break;
+            }
+
+            data += frameSize;
+            size -= frameSize;
+        }
     }
 
     return 0;
@@ -57,17 +210,41 @@ int ensure_dctx(ZstdDecompressor *decompressor, int loadDict) {
 
 static int Decompressor_init(ZstdDecompressor *self, PyObject *args,
                              PyObject *kwargs) {
-    static char *kwlist[] = {"dict_data", "max_window_size", "format", NULL};
+    static char *kwlist[] = {"dict_data", "max_window_size", "format",
+                             "dict_registry", NULL};
 
     PyObject *dict = NULL;
     Py_ssize_t maxWindowSize = 0;
     ZSTD_format_e format = ZSTD_f_zstd1;
+    PyObject *registry = NULL;
 
     self->dctx = NULL;
     self->dict = NULL;
+    self->registry = NULL;
+    self->registryDicts = NULL;
+    self->registryVersion = 0;
+    self->paramsApplied = 0;
+    self->dictApplied = 0;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|OnIO:ZstdDecompressor",
+                                     kwlist, &dict, &maxWindowSize, &format,
+                                     &registry)) {
+        return -1;
+    }
+
+    if (context_lock_init(&self->lock)) {
+        return -1;
+    }
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|OnI:ZstdDecompressor",
-                                     kwlist, &dict, &maxWindowSize, &format)) {
+    if (registry == Py_None) {
+        registry = NULL;
+    }
+
+    if (registry &&
+        !PyObject_IsInstance(registry,
+                             (PyObject *)ZstdDictionaryRegistryType)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "dict_registry must be zstd.ZstdDictionaryRegistry");
         return -1;
     }
 
@@ -97,6 +274,22 @@ static int Decompressor_init(ZstdDecompressor *self, PyObject *args,
         Py_INCREF(dict);
     }
 
+    if (registry) {
+        if (dict) {
+            PyErr_SetString(PyExc_ValueError,
+                            "cannot use both dict_data and dict_registry");
+            goto except;
+        }
+
+        self->registryDicts = PyDict_New();
+        if (!self->registryDicts) {
+            goto except;
+        }
+
+        self->registry = (ZstdDictionaryRegistry *)registry;
+        Py_INCREF(registry);
+    }
+
     if (ensure_dctx(self, 1)) {
         goto except;
     }
@@ -105,6 +298,8 @@ static int Decompressor_init(ZstdDecompressor *self, PyObject *args,
 
 except:
     Py_CLEAR(self->dict);
+    Py_CLEAR(self->registry);
+    Py_CLEAR(self->registryDicts);
 
     if (self->dctx) {
         ZSTD_freeDCtx(self->dctx);
@@ -116,16 +311,20 @@ except:
 
 static void Decompressor_dealloc(ZstdDecompressor *self) {
     Py_CLEAR(self->dict);
+    Py_CLEAR(self->registry);
 
     if (self->dctx) {
         ZSTD_freeDCtx(self->dctx);
         self->dctx = NULL;
     }
 
+    Py_CLEAR(self->registryDicts);
+    context_lock_free(&self->lock);
+
     PyObject_Del(self);
 }
 
-static PyObject *Decompressor_memory_size(ZstdDecompressor *self) {
+static PyObject *Decompressor_memory_size_impl(ZstdDecompressor *self) {
     if (self->dctx) {
         return PyLong_FromSize_t(ZSTD_sizeof_DCtx(self->dctx));
     }
@@ -137,8 +336,19 @@ static PyObject *Decompressor_memory_size(ZstdDecompressor *self) {
     }
 }
 
-static PyObject *Decompressor_copy_stream(ZstdDecompressor *self,
-                                          PyObject *args, PyObject *kwargs) {
+static PyObject *Decompressor_memory_size(ZstdDecompressor *self) {
+    PyObject *result;
+
+    context_lock_acquire(&self->lock);
+    result = Decompressor_memory_size_impl(self);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
+static PyObject *Decompressor_copy_stream_impl(ZstdDecompressor *self,
+                                               PyObject *args,
+                                               PyObject *kwargs) {
     static char *kwlist[] = {"ifh", "ofh", "read_size", "write_size", NULL};
 
     PyObject *source;
@@ -260,8 +470,286 @@ finally:
     return res;
 }
 
-PyObject *Decompressor_decompress(ZstdDecompressor *self, PyObject *args,
-                                  PyObject *kwargs) {
+static PyObject *Decompressor_copy_stream(ZstdDecompressor *self,
+                                          PyObject *args, PyObject *kwargs) {
+    PyObject *result;
+
+    context_lock_acquire(&self->lock);
+    result = Decompressor_copy_stream_impl(self, args, kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
+/*
+ * Assumed compression ratio when estimating the decompressed size of frames
+ * that don't record their content size.
+ */
+#define DECOMPRESS_ESTIMATED_RATIO 4
+
+/*
+ * Estimate the decompressed size of a frame that doesn't record it.
+ *
+ * Assumes a typical compression ratio, capped by the most the frame's blocks
+ * can decompress to. The estimate only sizes the initial output allocation.
+ */
+static size_t estimate_content_size(const char *data, size_t frameSize) {
+    unsigned long long bound = ZSTD_decompressBound(data, frameSize);
+    size_t estimate;
+
+    if (frameSize > PY_SSIZE_T_MAX / DECOMPRESS_ESTIMATED_RATIO) {
+        estimate = PY_SSIZE_T_MAX;
+    }
+    else {
+        estimate = frameSize * DECOMPRESS_ESTIMATED_RATIO;
+    }
+
+    if (estimate < ZSTD_DStreamOutSize()) {
+        estimate = ZSTD_DStreamOutSize();
+    }
+
+    if (ZSTD_CONTENTSIZE_ERROR != bound && bound < estimate) {
+        estimate = (size_t)bound;
+    }
+
+    return estimate;
+}
+
+/*
+ * Find the extent of the run of complete frames at the beginning of input.
+ *
+ * On return, ``framesSize`` holds the number of input bytes occupied by
+ * frames, ``contentSize`` holds the sum of content sizes of frames that record
+ * it and ``unknownCount`` holds the number of frames that don't.
+ * ``estimatedSize`` holds ``contentSize`` plus the estimated content size of
+ * the latter. Scanning stops at data that isn't the start of a frame.
+ *
+ * Returns non-0 with an exception set if a frame is truncated or if the
+ * content size can't be represented on this platform.
+ */
+static int scan_frames(const char *data, size_t dataSize, size_t *framesSize,
+                       size_t *contentSize, size_t *estimatedSize,
+                       Py_ssize_t *unknownCount) {
+    size_t offset = 0;
+
+    *contentSize = 0;
+    *estimatedSize = 0;
+    *unknownCount = 0;
+
+    while (offset < dataSize) {
+        unsigned long long frameContentSize =
+            ZSTD_getFrameContentSize(data + offset, dataSize - offset);
+        size_t frameSize;
+
+        if (ZSTD_CONTENTSIZE_ERROR == frameContentSize) {
+            break;
+        }
+
+        frameSize =
+            ZSTD_findFrameCompressedSize(data + offset, dataSize - offset);
+        if (ZSTD_isError(frameSize)) {
+            PyErr_SetString(
+                ZstdError,
+                "decompression error: did not decompress full frame");
+            return 1;
+        }
+
+        if (ZSTD_CONTENTSIZE_UNKNOWN == frameContentSize) {
+            size_t estimate = estimate_content_size(data + offset, frameSize);
+
+            if (estimate > PY_SSIZE_T_MAX - *estimatedSize) {
+                *estimatedSize = PY_SSIZE_T_MAX;
+            }
+            else {
+                *estimatedSize += estimate;
+            }
+
+            (*unknownCount)++;
+        }
+        else if (frameContentSize > PY_SSIZE_T_MAX - *contentSize) {
+            PyErr_SetString(
+                ZstdError, "frame is too large to decompress on this platform");
+            return 1;
+        }
+        else {
+            *contentSize += (size_t)frameContentSize;
+        }
+
+        offset += frameSize;
+    }
+
+    if (*contentSize > PY_SSIZE_T_MAX - *estimatedSize) {
+        *estimatedSize = PY_SSIZE_T_MAX;
+    }
+    else {
+        *estimatedSize += *contentSize;
+    }
+
+    *framesSize = offset;
+
+    return 0;
+}
+
+/*
+ * Decompress all input into a bytes object that grows as needed.
+ *
+ * ``initialSize`` is the size of the initial allocation. It is doubled
+ * whenever the output fills up, up to ``maxOutputSize`` if non-0. Output
+ * is resized to fit at the end.
+ *
+ * If the input sizes the output correctly, decompression happens in a single
+ * pass without the GIL.
+ */
+static PyObject *decompress_growable(ZstdDecompressor *self,
+                                     ZSTD_inBuffer *inBuffer,
+                                     size_t initialSize,
+                                     size_t maxOutputSize) {
+    PyObject *result;
+    ZSTD_outBuffer outBuffer;
+    size_t zresult;
+
+    if (maxOutputSize && initialSize > maxOutputSize) {
+        initialSize = maxOutputSize;
+    }
+
+    if (initialSize > PY_SSIZE_T_MAX) {
+        initialSize = PY_SSIZE_T_MAX;
+    }
+
+    result = PyBytes_FromStringAndSize(NULL, (Py_ssize_t)initialSize);
+    if (!result) {
+        return NULL;
+    }
+
+    outBuffer.dst = PyBytes_AS_STRING(result);
+    outBuffer.size = initialSize;
+    outBuffer.pos = 0;
+
+    while (1) {
+        size_t newSize;
+
+        /* Frame boundaries return 0. Keep going while there is input and
+           either room for output or a new frame to start. */
+        Py_BEGIN_ALLOW_THREADS do {
+            zresult = ZSTD_decompressStream(self->dctx, &outBuffer, inBuffer);
+        } while (!ZSTD_isError(zresult) && inBuffer->pos < inBuffer->size &&
+                 (outBuffer.pos < outBuffer.size || 0 == zresult));
+        Py_END_ALLOW_THREADS
+
+            if (ZSTD_isError(zresult)) {
+            PyErr_Format(ZstdError, "decompression error: %s",
+                         ZSTD_getErrorName(zresult));
+            goto except;
+        }
+
+        if (0 == zresult && inBuffer->pos == inBuffer->size) {
+            break;
+        }
+
+        if (outBuffer.pos < outBuffer.size) {
+            PyErr_SetString(
+                ZstdError,
+                "decompression error: did not decompress full frame");
+            goto except;
+        }
+
+        if (maxOutputSize && outBuffer.size >= maxOutputSize) {
+            PyErr_Format(ZstdError,
+                         "decompression error: decompressed data exceeds "
+                         "max_output_size of %zu bytes",
+                         maxOutputSize);
+            goto except;
+        }
+
+        if (outBuffer.size >= PY_SSIZE_T_MAX / 2) {
+            newSize = PY_SSIZE_T_MAX;
+        }
+        else {
+            newSize = outBuffer.size ? outBuffer.size * 2
+                                     : ZSTD_DStreamOutSize();
+        }
+
+        if (maxOutputSize && newSize > maxOutputSize) {
+            newSize = maxOutputSize;
+        }
+
+        if (newSize <= outBuffer.size) {
+            PyErr_NoMemory();
+            goto except;
+        }
+
+        if (safe_pybytes_resize(&result, (Py_ssize_t)newSize)) {
+            goto except;
+        }
+
+        outBuffer.dst = PyBytes_AS_STRING(result);
+        outBuffer.size = newSize;
+    }
+
+    if (outBuffer.pos < outBuffer.size) {
+        if (safe_pybytes_resize(&result, (Py_ssize_t)outBuffer.pos)) {
+            goto except;
+        }
+    }
+
+    return result;
+
+except:
+    Py_XDECREF(result);
+
+    return NULL;
+}
+
+/*
+ * Decompress every frame in the input into a single output allocation.
+ */
+static PyObject *decompress_frames(ZstdDecompressor *self, Py_buffer *source,
+                                   size_t maxOutputSize, int allowExtraData) {
+    size_t framesSize;
+    size_t contentSize;
+    size_t estimatedSize;
+    Py_ssize_t unknownCount;
+    ZSTD_inBuffer inBuffer;
+
+    if (scan_frames(source->buf, source->len, &framesSize, &contentSize,
+                    &estimatedSize, &unknownCount)) {
+        return NULL;
+    }
+
+    if (0 == framesSize) {
+        PyErr_SetString(ZstdError,
+                        "error determining content size from frame header");
+        return NULL;
+    }
+
+    if (!allowExtraData && framesSize < (size_t)source->len) {
+        PyErr_Format(ZstdError,
+                     "compressed input contains %zu bytes of unused data, "
+                     "which is disallowed",
+                     (size_t)source->len - framesSize);
+        return NULL;
+    }
+
+    inBuffer.src = source->buf;
+    inBuffer.size = framesSize;
+    inBuffer.pos = 0;
+
+    /* All frames record their content size: the output is exact. */
+    if (0 == unknownCount) {
+        if (0 == contentSize) {
+            return PyBytes_FromStringAndSize("", 0);
+        }
+
+        return decompress_growable(self, &inBuffer, contentSize, 0);
+    }
+
+    return decompress_growable(self, &inBuffer, estimatedSize, maxOutputSize);
+}
+
+static PyObject *Decompressor_decompress_impl(ZstdDecompressor *self,
+                                              PyObject *const *args,
+                                              Py_ssize_t nargs,
+                                              PyObject *kwnames) {
     static char *kwlist[] = {
         "data",
         "max_output_size",
@@ -282,20 +770,28 @@ PyObject *Decompressor_decompress(ZstdDecompressor *self, PyObject *args,
     ZSTD_outBuffer outBuffer;
     ZSTD_inBuffer inBuffer;
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*|nOO:decompress", kwlist,
-                                     &source, &maxOutputSize, &readAcrossFrames,
-                                     &allowExtraData)) {
+    if (!fastcall_buffer_arg(args, nargs, kwnames, &source) &&
+        parse_fastcall_args(args, nargs, kwnames, "y*|nOO:decompress", kwlist,
+                            &source, &maxOutputSize, &readAcrossFrames,
+                            &allowExtraData)) {
         return NULL;
     }
 
-    if (readAcrossFrames ? PyObject_IsTrue(readAcrossFrames) : 0) {
-        PyErr_SetString(ZstdError,
-            "ZstdDecompressor.read_across_frames=True is not yet implemented"
-        );
+    if (ensure_dctx(self, 1)) {
         goto finally;
     }
 
-    if (ensure_dctx(self, 1)) {
+    if (self->registry &&
+        select_frame_dicts(
+            self, source.buf, source.len,
+            readAcrossFrames ? PyObject_IsTrue(readAcrossFrames) : 0)) {
+        goto finally;
+    }
+
+    if (readAcrossFrames ? PyObject_IsTrue(readAcrossFrames) : 0) {
+        result = decompress_frames(
+            self, &source, maxOutputSize > 0 ? (size_t)maxOutputSize : 0,
+            allowExtraData ? PyObject_IsTrue(allowExtraData) : 1);
         goto finally;
     }
 
@@ -311,17 +807,42 @@ PyObject *Decompressor_decompress(ZstdDecompressor *self, PyObject *args,
         result = PyBytes_FromStringAndSize("", 0);
         goto finally;
     }
-    /* Missing content size in frame header. */
+    /* Missing content size in frame header. Grow output from an estimate,
+       up to max_output_size. */
     if (ZSTD_CONTENTSIZE_UNKNOWN == decompressedSize) {
-        if (0 == maxOutputSize) {
+        size_t frameSize;
+
+        if (maxOutputSize <= 0) {
             PyErr_SetString(ZstdError,
                             "could not determine content size in frame header");
             goto finally;
         }
 
-        result = PyBytes_FromStringAndSize(NULL, maxOutputSize);
-        destCapacity = maxOutputSize;
-        decompressedSize = 0;
+        frameSize = ZSTD_findFrameCompressedSize(source.buf, source.len);
+        if (ZSTD_isError(frameSize)) {
+            PyErr_SetString(
+                ZstdError,
+                "decompression error: did not decompress full frame");
+            goto finally;
+        }
+
+        if ((allowExtraData ? PyObject_IsTrue(allowExtraData) : 1) == 0 &&
+            frameSize < (size_t)source.len) {
+            PyErr_Format(ZstdError,
+                         "compressed input contains %zu bytes of unused data, "
+                         "which is disallowed",
+                         (size_t)source.len - frameSize);
+            goto finally;
+        }
+
+        inBuffer.src = source.buf;
+        inBuffer.size = frameSize;
+        inBuffer.pos = 0;
+
+        result = decompress_growable(
+            self, &inBuffer, estimate_content_size(source.buf, frameSize),
+            (size_t)maxOutputSize);
+        goto finally;
     }
     /* Size is recorded in frame header. */
     else {
@@ -340,7 +861,7 @@ PyObject *Decompressor_decompress(ZstdDecompressor *self, PyObject *args,
         goto finally;
     }
 
-    outBuffer.dst = PyBytes_AsString(result);
+    outBuffer.dst = PyBytes_AS_STRING(result);
     outBuffer.size = destCapacity;
     outBuffer.pos = 0;
 
@@ -394,9 +915,133 @@ finally:
     return result;
 }
 
-static ZstdDecompressionObj *Decompressor_decompressobj(ZstdDecompressor *self,
-                                                        PyObject *args,
-                                                        PyObject *kwargs) {
+static PyObject *Decompressor_decompress(ZstdDecompressor *self,
+                                         PyObject *const *args,
+                                         Py_ssize_t nargs, PyObject *kwnames) {
+    PyObject *result;
+
+    context_lock_acquire(&self->lock);
+    result = Decompressor_decompress_impl(self, args, nargs, kwnames);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
+static PyObject *Decompressor_decompress_into_impl(ZstdDecompressor *self,
+                                                   PyObject *args,
+                                                   PyObject *kwargs) {
+    static char *kwlist[] = {"data", "out", "allow_extra_data", NULL};
+
+    Py_buffer source;
+    Py_buffer dest;
+    PyObject *allowExtraData = NULL;
+    unsigned long long decompressedSize;
+    PyObject *result = NULL;
+    size_t zresult;
+    ZSTD_outBuffer outBuffer;
+    ZSTD_inBuffer inBuffer;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*w*|O:decompress_into",
+                                     kwlist, &source, &dest,
+                                     &allowExtraData)) {
+        return NULL;
+    }
+
+    if (ensure_dctx(self, 1)) {
+        goto finally;
+    }
+
+    if (self->registry &&
+        select_frame_dicts(self, source.buf, source.len, 0)) {
+        goto finally;
+    }
+
+    decompressedSize = ZSTD_getFrameContentSize(source.buf, source.len);
+
+    if (ZSTD_CONTENTSIZE_ERROR == decompressedSize) {
+        PyErr_SetString(ZstdError,
+                        "error determining content size from frame header");
+        goto finally;
+    }
+    else if (ZSTD_CONTENTSIZE_UNKNOWN != decompressedSize &&
+             decompressedSize > (unsigned long long)dest.len) {
+        PyErr_Format(ZstdError,
+                     "output buffer too small: frame content size %llu "
+                     "exceeds %zd bytes",
+                     decompressedSize, dest.len);
+        goto finally;
+    }
+
+    outBuffer.dst = dest.buf;
+    outBuffer.size = dest.len;
+    outBuffer.pos = 0;
+
+    inBuffer.src = source.buf;
+    inBuffer.size = source.len;
+    inBuffer.pos = 0;
+
+    Py_BEGIN_ALLOW_THREADS zresult =
+        ZSTD_decompressStream(self->dctx, &outBuffer, &inBuffer);
+    Py_END_ALLOW_THREADS
+
+        if (ZSTD_isError(zresult)) {
+        PyErr_Format(ZstdError, "decompression error: %s",
+                     ZSTD_getErrorName(zresult));
+        goto finally;
+    }
+    else if (zresult) {
+        if (outBuffer.pos == outBuffer.size) {
+            PyErr_Format(ZstdError,
+                         "output buffer too small: decompressed data exceeds "
+                         "%zd bytes",
+                         dest.len);
+        }
+        else {
+            PyErr_SetString(ZstdError,
+                            "decompression error: did not decompress full frame");
+        }
+        goto finally;
+    }
+    else if (ZSTD_CONTENTSIZE_UNKNOWN != decompressedSize &&
+             outBuffer.pos != decompressedSize) {
+        PyErr_Format(
+            ZstdError,
+            "decompression error: decompressed %zu bytes; expected %llu",
+            outBuffer.pos, decompressedSize);
+        goto finally;
+    }
+    else if ((allowExtraData ? PyObject_IsTrue(allowExtraData) : 1) == 0 &&
+             inBuffer.pos < inBuffer.size) {
+        PyErr_Format(ZstdError,
+                     "compressed input contains %zu bytes of unused data, "
+                     "which is disallowed",
+                     inBuffer.size - inBuffer.pos);
+        goto finally;
+    }
+
+    result = PyLong_FromSize_t(outBuffer.pos);
+
+finally:
+    PyBuffer_Release(&source);
+    PyBuffer_Release(&dest);
+    return result;
+}
+
+static PyObject *Decompressor_decompress_into(ZstdDecompressor *self,
+                                              PyObject *args,
+                                              PyObject *kwargs) {
+    PyObject *result;
+
+    context_lock_acquire(&self->lock);
+    result = Decompressor_decompress_into_impl(self, args, kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
+static ZstdDecompressionObj *
+Decompressor_decompressobj_impl(ZstdDecompressor *self, PyObject *args,
+                                PyObject *kwargs) {
     static char *kwlist[] = {"write_size", "read_across_frames", NULL};
 
     ZstdDecompressionObj *result = NULL;
@@ -433,9 +1078,21 @@ static ZstdDecompressionObj *Decompressor_decompressobj(ZstdDecompressor *self,
     return result;
 }
 
+static ZstdDecompressionObj *Decompressor_decompressobj(ZstdDecompressor *self,
+                                                        PyObject *args,
+                                                        PyObject *kwargs) {
+    ZstdDecompressionObj *result;
+
+    context_lock_acquire(&self->lock);
+    result = Decompressor_decompressobj_impl(self, args, kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
 static ZstdDecompressorIterator *
-Decompressor_read_to_iter(ZstdDecompressor *self, PyObject *args,
-                          PyObject *kwargs) {
+Decompressor_read_to_iter_impl(ZstdDecompressor *self, PyObject *args,
+                               PyObject *kwargs) {
     static char *kwlist[] = {"reader", "read_size", "write_size", "skip_bytes",
                              NULL};
 
@@ -506,9 +1163,21 @@ finally:
     return result;
 }
 
+static ZstdDecompressorIterator *
+Decompressor_read_to_iter(ZstdDecompressor *self, PyObject *args,
+                          PyObject *kwargs) {
+    ZstdDecompressorIterator *result;
+
+    context_lock_acquire(&self->lock);
+    result = Decompressor_read_to_iter_impl(self, args, kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
 static ZstdDecompressionReader *
-Decompressor_stream_reader(ZstdDecompressor *self, PyObject *args,
-                           PyObject *kwargs) {
+Decompressor_stream_reader_impl(ZstdDecompressor *self, PyObject *args,
+                                PyObject *kwargs) {
     static char *kwlist[] = {"source", "read_size", "read_across_frames",
                              "closefd", NULL};
 
@@ -565,9 +1234,21 @@ Decompressor_stream_reader(ZstdDecompressor *self, PyObject *args,
     return result;
 }
 
-static ZstdDecompressionWriter *
-Decompressor_stream_writer(ZstdDecompressor *self, PyObject *args,
+static ZstdDecompressionReader *
+Decompressor_stream_reader(ZstdDecompressor *self, PyObject *args,
                            PyObject *kwargs) {
+    ZstdDecompressionReader *result;
+
+    context_lock_acquire(&self->lock);
+    result = Decompressor_stream_reader_impl(self, args, kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
+static ZstdDecompressionWriter *
+Decompressor_stream_writer_impl(ZstdDecompressor *self, PyObject *args,
+                                PyObject *kwargs) {
     static char *kwlist[] = {"writer", "write_size", "write_return_read",
                              "closefd", NULL};
 
@@ -617,9 +1298,22 @@ Decompressor_stream_writer(ZstdDecompressor *self, PyObject *args,
     return result;
 }
 
+static ZstdDecompressionWriter *
+Decompressor_stream_writer(ZstdDecompressor *self, PyObject *args,
+                           PyObject *kwargs) {
+    ZstdDecompressionWriter *result;
+
+    context_lock_acquire(&self->lock);
+    result = Decompressor_stream_writer_impl(self, args, kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
 static PyObject *
-Decompressor_decompress_content_dict_chain(ZstdDecompressor *self,
-                                           PyObject *args, PyObject *kwargs) {
+Decompressor_decompress_content_dict_chain_impl(ZstdDecompressor *self,
+                                                PyObject *args,
+                                                PyObject *kwargs) {
     static char *kwlist[] = {"frames", NULL};
 
     PyObject *chunks;
@@ -700,6 +1394,9 @@ Decompressor_decompress_content_dict_chain(ZstdDecompressor *self,
         goto finally;
     }
 
+    /* The prefixes referenced below replace any referenced dictionary. */
+    self->dictApplied = 0;
+
     buffer1Size = (size_t)frameHeader.frameContentSize;
     buffer1 = PyMem_Malloc(buffer1Size);
     if (!buffer1) {
@@ -889,6 +1586,19 @@ finally:
     return result;
 }
 
+static PyObject *
+Decompressor_decompress_content_dict_chain(ZstdDecompressor *self,
+                                           PyObject *args, PyObject *kwargs) {
+    PyObject *result;
+
+    context_lock_acquire(&self->lock);
+    result = Decompressor_decompress_content_dict_chain_impl(self, args,
+                                                             kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
+
 typedef struct {
     void *sourceData;
     size_t sourceSize;
@@ -1182,6 +1892,44 @@ static void decompress_worker(DecompressorWorkerState *state) {
 #endif
 
 #ifdef HAVE_ZSTD_POOL_APIS
+/*
+ * Cost model used to pick the number of workers for
+ * multi_decompress_to_buffer, like the one of multi_compress_to_buffer. A
+ * worker is only added for every MULTI_DECOMPRESS_MIN_WORKER_USEC of
+ * estimated work. Decompression speed barely depends on settings, so a single
+ * conservative estimate of compressed input consumed per microsecond is used.
+ */
+#define MULTI_DECOMPRESS_MIN_WORKER_USEC 200
+#define MULTI_DECOMPRESS_ITEM_OVERHEAD_USEC 1
+#define MULTI_DECOMPRESS_BYTES_PER_USEC 300
+
+static Py_ssize_t multi_decompress_thread_count(FrameSources *frames,
+                                                Py_ssize_t threadCount) {
+    unsigned long long costUsec;
+    unsigned long long maxWorkers;
+
+    /* More threads than inputs makes no sense. */
+    if (frames->framesSize < threadCount) {
+        threadCount = frames->framesSize;
+    }
+
+    if (threadCount < 2) {
+        return 1;
+    }
+
+    costUsec = frames->compressedSize / MULTI_DECOMPRESS_BYTES_PER_USEC +
+               frames->framesSize * MULTI_DECOMPRESS_ITEM_OVERHEAD_USEC;
+
+    maxWorkers = costUsec / MULTI_DECOMPRESS_MIN_WORKER_USEC;
+
+    if (maxWorkers < 1) {
+        return 1;
+    }
+
+    return maxWorkers < (unsigned long long)threadCount ? (Py_ssize_t)maxWorkers
+                                                        : threadCount;
+}
+
 ZstdBufferWithSegmentsCollection *
 decompress_from_framesources(ZstdDecompressor *decompressor,
                              FrameSources *frames, Py_ssize_t threadCount) {
@@ -1199,16 +1947,12 @@ decompress_from_framesources(ZstdDecompressor *decompressor,
     POOL_ctx *pool = NULL;
     DecompressorWorkerState *workerStates = NULL;
     unsigned long long bytesPerWorker;
+    PyObject *registryDicts = NULL;
 
     /* Caller should normalize 0 and negative values to 1 or larger. */
     assert(threadCount >= 1);
 
-    /* More threads than inputs makes no sense under any conditions. */
-    threadCount =
-        frames->framesSize < threadCount ? frames->framesSize : threadCount;
-
-    /* TODO lower thread count if input size is too small and threads would just
-       add overhead. */
+    threadCount = multi_decompress_thread_count(frames, threadCount);
 
     if (decompressor->dict) {
         if (ensure_ddict(decompressor->dict)) {
@@ -1216,6 +1960,48 @@ decompress_from_framesources(ZstdDecompressor *decompressor,
         }
     }
 
+    /* Collect the registry dictionaries needed by the frames. Workers use
+       their own contexts, so these are held for the duration of the call. */
+    if (decompressor->registry) {
+        registryDicts = PyDict_New();
+        if (!registryDicts) {
+            return NULL;
+        }
+
+        for (i = 0; i < frames->framesSize; i++) {
+            unsigned dictId = ZSTD_getDictID_fromFrame(
+                framePointers[i].sourceData, framePointers[i].sourceSize);
+            ZstdCompressionDict *dict;
+            PyObject *key;
+            int setResult;
+
+            if (!dictId) {
+                continue;
+            }
+
+            dict = dictregistry_get(decompressor->registry, dictId);
+            if (!dict) {
+                if (PyErr_Occurred()) {
+                    goto finally;
+                }
+                continue;
+            }
+
+            key = PyLong_FromUnsignedLong(dictId);
+            if (!key) {
+                Py_DECREF(dict);
+                goto finally;
+            }
+
+            setResult = PyDict_SetItem(registryDicts, key, (PyObject *)dict);
+            Py_DECREF(key);
+            Py_DECREF(dict);
+            if (setResult) {
+                goto finally;
+            }
+        }
+    }
+
     /* If threadCount==1, we don't start a thread pool. But we do leverage the
        same API for dispatching work. */
     workerStates = PyMem_Malloc(threadCount * sizeof(DecompressorWorkerState));
@@ -1262,6 +2048,33 @@ decompress_from_framesources(ZstdDecompressor *decompressor,
             }
         }
 
+        if (registryDicts) {
+            Py_ssize_t pos = 0;
+            PyObject *key;
+            PyObject *value;
+
+            zresult = ZSTD_DCtx_setParameter(workerStates[i].dctx,
+                                             ZSTD_d_refMultipleDDicts,
+                                             ZSTD_rmd_refMultipleDDicts);
+            if (ZSTD_isError(zresult)) {
+                PyErr_Format(ZstdError,
+                             "unable to enable multiple dictionaries: %s",
+                             ZSTD_getErrorName(zresult));
+                goto finally;
+            }
+
+            while (PyDict_Next(registryDicts, &pos, &key, &value)) {
+                zresult = ZSTD_DCtx_refDDict(
+                    workerStates[i].dctx, ((ZstdCompressionDict *)value)->ddict);
+                if (ZSTD_isError(zresult)) {
+                    PyErr_Format(ZstdError,
+                                 "unable to reference prepared dictionary: %s",
+                                 ZSTD_getErrorName(zresult));
+                    goto finally;
+                }
+            }
+        }
+
         workerStates[i].framePointers = framePointers;
         workerStates[i].requireOutputSizes = 1;
     }
@@ -1450,6 +2263,7 @@ finally:
     }
 
     POOL_free(pool);
+    Py_XDECREF(registryDicts);
 
     return result;
 }
@@ -1457,8 +2271,8 @@ finally:
 
 #ifdef HAVE_ZSTD_POOL_APIS
 static ZstdBufferWithSegmentsCollection *
-Decompressor_multi_decompress_to_buffer(ZstdDecompressor *self, PyObject *args,
-                                        PyObject *kwargs) {
+Decompressor_multi_decompress_to_buffer_impl(ZstdDecompressor *self,
+                                             PyObject *args, PyObject *kwargs) {
     static char *kwlist[] = {"frames", "decompressed_sizes", "threads", NULL};
 
     PyObject *frames;
@@ -1708,12 +2522,26 @@ finally:
 
     return result;
 }
+
+static ZstdBufferWithSegmentsCollection *
+Decompressor_multi_decompress_to_buffer(ZstdDecompressor *self, PyObject *args,
+                                        PyObject *kwargs) {
+    ZstdBufferWithSegmentsCollection *result;
+
+    context_lock_acquire(&self->lock);
+    result = Decompressor_multi_decompress_to_buffer_impl(self, args, kwargs);
+    context_lock_release(&self->lock);
+
+    return result;
+}
 #endif
 
 static PyMethodDef Decompressor_methods[] = {
     {"copy_stream", (PyCFunction)Decompressor_copy_stream,
      METH_VARARGS | METH_KEYWORDS, NULL},
     {"decompress", (PyCFunction)Decompressor_decompress,
+     METH_FASTCALL | METH_KEYWORDS, NULL},
+    {"decompress_into", (PyCFunction)Decompressor_decompress_into,
      METH_VARARGS | METH_KEYWORDS, NULL},
     {"decompressobj", (PyCFunction)Decompressor_decompressobj,
      METH_VARARGS | METH_KEYWORDS, NULL},
@@ -99,7 +99,7 @@ read_decompressor_iterator(ZstdDecompressorIterator *self) {
 }
 
 static PyObject *
-ZstdDecompressorIterator_iternext(ZstdDecompressorIterator *self) {
+ZstdDecompressorIterator_iternext_impl(ZstdDecompressorIterator *self) {
     PyObject *readResult = NULL;
     char *readBuffer;
     Py_ssize_t readSize;
@@ -201,6 +201,17 @@ read_from_source:
     return NULL;
 }
 
+static PyObject *
+ZstdDecompressorIterator_iternext(ZstdDecompressorIterator *self) {
+    PyObject *result;
+
+    context_lock_acquire(&self->decompressor->lock);
+    result = ZstdDecompressorIterator_iternext_impl(self);
+    context_lock_release(&self->decompressor->lock);
+
+    return result;
+}
+
 PyType_Slot ZstdDecompressorIteratorSlots[] = {
     {Py_tp_dealloc, ZstdDecompressorIterator_dealloc},
     {Py_tp_iter, ZstdDecompressorIterator_iter},
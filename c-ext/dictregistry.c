@@ -0,0 +1,408 @@
+/**
+ * Copyright (c) 2024-present, Gregory Szorc
+ * All rights reserved.
+ *
+ * This software may be modified and distributed under the terms
+ * of the BSD license. See the LICENSE file for details.
+ */
+
+#include "python-zstandard.h"
+
+extern PyObject *ZstdError;
+
+static int ZstdDictionaryRegistry_init(ZstdDictionaryRegistry *self,
+                                       PyObject *args, PyObject *kwargs) {
+    static char *kwlist[] = {"max_cached", NULL};
+
+    Py_ssize_t maxCached = 64;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|n:ZstdDictionaryRegistry",
+                                     kwlist, &maxCached)) {
+        return -1;
+    }
+
+    if (maxCached < 1) {
+        PyErr_SetString(PyExc_ValueError, "max_cached must be positive");
+        return -1;
+    }
+
+    Py_CLEAR(self->dicts);
+    Py_CLEAR(self->cache);
+
+    self->dicts = PyDict_New();
+    if (!self->dicts) {
+        return -1;
+    }
+
+    self->cache = PyDict_New();
+    if (!self->cache) {
+        return -1;
+    }
+
+    self->maxCached = maxCached;
+    self->hits = 0;
+    self->misses = 0;
+    self->evictions = 0;
+    self->version = 1;
+
+    return 0;
+}
+
+static void ZstdDictionaryRegistry_dealloc(ZstdDictionaryRegistry *self) {
+    Py_CLEAR(self->dicts);
+    Py_CLEAR(self->cache);
+
+    PyObject_Del(self);
+}
+
+/**
+ * Create a registry owned copy of a dictionary with its DDict prepared.
+ */
+static ZstdCompressionDict *digest_dict(ZstdCompressionDict *source) {
+    ZstdCompressionDict *result;
+
+    result = PyObject_New(ZstdCompressionDict, ZstdCompressionDictType);
+    if (!result) {
+        return NULL;
+    }
+
+    result->dictData = NULL;
+    result->dictSize = 0;
+    result->dictType = source->dictType;
+    result->k = source->k;
+    result->d = source->d;
+    result->ddict = NULL;
+    compressiondict_init_cache(result);
+
+    result->dictData = PyMem_Malloc(source->dictSize);
+    if (!result->dictData) {
+        Py_DECREF(result);
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+    memcpy(result->dictData, source->dictData, source->dictSize);
+    result->dictSize = source->dictSize;
+
+    if (ensure_ddict(result)) {
+        Py_DECREF(result);
+        return NULL;
+    }
+
+    return result;
+}
+
+/**
+ * Look up the digested dictionary for a dictionary ID.
+ *
+ * Returns a new reference on a cache hit. Otherwise returns NULL and stores
+ * a new reference to the registered dictionary in ``source``, which is NULL
+ * if there is none or an error occurred. Must be called in a critical
+ * section on the registry.
+ */
+static ZstdCompressionDict *find_digested(ZstdDictionaryRegistry *registry,
+                                          PyObject *key, PyObject **source) {
+    ZstdCompressionDict *result;
+
+    *source = NULL;
+
+    result = (ZstdCompressionDict *)PyDict_GetItemWithError(registry->cache,
+                                                            key);
+    if (result) {
+        registry->hits++;
+        Py_INCREF(result);
+
+        /* Move to the most recently used end. */
+        if (PyDict_DelItem(registry->cache, key) ||
+            PyDict_SetItem(registry->cache, key, (PyObject *)result)) {
+            Py_CLEAR(result);
+        }
+
+        return result;
+    }
+    else if (PyErr_Occurred()) {
+        return NULL;
+    }
+
+    *source = PyDict_GetItemWithError(registry->dicts, key);
+    if (*source) {
+        registry->misses++;
+        Py_INCREF(*source);
+    }
+
+    return NULL;
+}
+
+/**
+ * Add a digested dictionary to the cache.
+ *
+ * Returns a new reference to the digested dictionary to use. This is the
+ * one cached by another thread if it won the race to digest ``source``. Must
+ * be called in a critical section on the registry.
+ */
+static ZstdCompressionDict *store_digested(ZstdDictionaryRegistry *registry,
+                                           PyObject *key, PyObject *source,
+                                           ZstdCompressionDict *digested) {
+    ZstdCompressionDict *result;
+    PyObject *current;
+
+    result = (ZstdCompressionDict *)PyDict_GetItemWithError(registry->cache,
+                                                            key);
+    if (result) {
+        Py_INCREF(result);
+        return result;
+    }
+    else if (PyErr_Occurred()) {
+        return NULL;
+    }
+
+    /* Don't cache the digest if the dictionary was removed or replaced while
+       it was being digested. */
+    current = PyDict_GetItemWithError(registry->dicts, key);
+    if (current != source) {
+        if (PyErr_Occurred()) {
+            return NULL;
+        }
+
+        Py_INCREF(digested);
+        return digested;
+    }
+
+    if (PyDict_SetItem(registry->cache, key, (PyObject *)digested)) {
+        return NULL;
+    }
+
+    registry->version++;
+
+    while (PyDict_Size(registry->cache) > registry->maxCached) {
+        Py_ssize_t pos = 0;
+        PyObject *oldest;
+        PyObject *value;
+
+        if (!PyDict_Next(registry->cache, &pos, &oldest, &value)) {
+            break;
+        }
+
+        Py_INCREF(oldest);
+        if (PyDict_DelItem(registry->cache, oldest)) {
+            Py_DECREF(oldest);
+            return NULL;
+        }
+        Py_DECREF(oldest);
+
+        registry->evictions++;
+    }
+
+    Py_INCREF(digested);
+    return digested;
+}
+
+/**
+ * Obtain the digested dictionary for a dictionary ID.
+ *
+ * Returns a new reference. Returns NULL without an exception set if no
+ * dictionary is registered under the ID.
+ */
+ZstdCompressionDict *dictregistry_get(ZstdDictionaryRegistry *registry,
+                                      unsigned dictId) {
+    PyObject *key;
+    PyObject *source;
+    ZstdCompressionDict *digested;
+    ZstdCompressionDict *result = NULL;
+
+    key = PyLong_FromUnsignedLong(dictId);
+    if (!key) {
+        return NULL;
+    }
+
+    Py_BEGIN_CRITICAL_SECTION(registry);
+    result = find_digested(registry, key, &source);
+    Py_END_CRITICAL_SECTION();
+
+    if (result || !source) {
+        goto finally;
+    }
+
+    /* The GIL is released while digesting. Our reference keeps the source
+       alive if it is removed concurrently. */
+    digested = digest_dict((ZstdCompressionDict *)source);
+    if (!digested) {
+        goto finally;
+    }
+
+    Py_BEGIN_CRITICAL_SECTION(registry);
+    result = store_digested(registry, key, source, digested);
+    Py_END_CRITICAL_SECTION();
+
+    Py_DECREF(digested);
+
+finally:
+    Py_XDECREF(source);
+    Py_DECREF(key);
+
+    return result;
+}
+
+/**
+ * Drop the digest of a dictionary. Must be called in a critical section on
+ * the registry.
+ */
+static int uncache(ZstdDictionaryRegistry *registry, PyObject *key) {
+    int cached = PyDict_Contains(registry->cache, key);
+
+    if (cached < 0) {
+        return -1;
+    }
+    else if (cached) {
+        if (PyDict_DelItem(registry->cache, key)) {
+            return -1;
+        }
+        registry->version++;
+    }
+
+    return 0;
+}
+
+static PyObject *ZstdDictionaryRegistry_add(ZstdDictionaryRegistry *self,
+                                            PyObject *args, PyObject *kwargs) {
+    static char *kwlist[] = {"dict_data", NULL};
+
+    ZstdCompressionDict *dict;
+    unsigned dictId;
+    PyObject *key;
+    PyObject *result = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!:add", kwlist,
+                                     ZstdCompressionDictType, &dict)) {
+        return NULL;
+    }
+
+    dictId = ZDICT_getDictID(dict->dictData, dict->dictSize);
+    if (!dictId) {
+        PyErr_SetString(PyExc_ValueError,
+                        "dictionary does not have a dictionary ID");
+        return NULL;
+    }
+
+    key = PyLong_FromUnsignedLong(dictId);
+    if (!key) {
+        return NULL;
+    }
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    if (!PyDict_SetItem(self->dicts, key, (PyObject *)dict) &&
+        !uncache(self, key)) {
+        Py_INCREF(Py_None);
+        result = Py_None;
+    }
+    Py_END_CRITICAL_SECTION();
+
+    Py_DECREF(key);
+
+    return result;
+}
+
+static PyObject *ZstdDictionaryRegistry_remove(ZstdDictionaryRegistry *self,
+                                               PyObject *args,
+                                               PyObject *kwargs) {
+    static char *kwlist[] = {"dict_id", NULL};
+
+    PyObject *key;
+    PyObject *result = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!:remove", kwlist,
+                                     &PyLong_Type, &key)) {
+        return NULL;
+    }
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    if (!PyDict_DelItem(self->dicts, key) && !uncache(self, key)) {
+        Py_INCREF(Py_None);
+        result = Py_None;
+    }
+    Py_END_CRITICAL_SECTION();
+
+    return result;
+}
+
+static PyObject *ZstdDictionaryRegistry_stats(ZstdDictionaryRegistry *self) {
+    Py_ssize_t pos = 0;
+    PyObject *key;
+    PyObject *value;
+    size_t memory = 0;
+    Py_ssize_t cached;
+    unsigned long long hits, misses, evictions;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    while (PyDict_Next(self->cache, &pos, &key, &value)) {
+        memory += ZSTD_sizeof_DDict(((ZstdCompressionDict *)value)->ddict);
+    }
+
+    cached = PyDict_Size(self->cache);
+    hits = self->hits;
+    misses = self->misses;
+    evictions = self->evictions;
+    Py_END_CRITICAL_SECTION();
+
+    return Py_BuildValue("{s:K,s:K,s:K,s:n,s:n}", "hits", hits, "misses",
+                         misses, "evictions", evictions, "cached", cached,
+                         "memory", (Py_ssize_t)memory);
+}
+
+static Py_ssize_t ZstdDictionaryRegistry_length(ZstdDictionaryRegistry *self) {
+    return PyDict_Size(self->dicts);
+}
+
+static int ZstdDictionaryRegistry_contains(ZstdDictionaryRegistry *self,
+                                           PyObject *key) {
+    return PyDict_Contains(self->dicts, key);
+}
+
+static PyMethodDef ZstdDictionaryRegistry_methods[] = {
+    {"add", (PyCFunction)ZstdDictionaryRegistry_add,
+     METH_VARARGS | METH_KEYWORDS,
+     PyDoc_STR("add(dict_data) -- register a dictionary by its ID")},
+    {"remove", (PyCFunction)ZstdDictionaryRegistry_remove,
+     METH_VARARGS | METH_KEYWORDS,
+     PyDoc_STR("remove(dict_id) -- unregister a dictionary")},
+    {"stats", (PyCFunction)ZstdDictionaryRegistry_stats, METH_NOARGS,
+     PyDoc_STR("stats() -- obtain cache statistics")},
+    {NULL, NULL}};
+
+static PyMemberDef ZstdDictionaryRegistry_members[] = {
+    {"max_cached", T_PYSSIZET, offsetof(ZstdDictionaryRegistry, maxCached),
+     READONLY, "maximum number of digested dictionaries to retain"},
+    {NULL}};
+
+PyType_Slot ZstdDictionaryRegistrySlots[] = {
+    {Py_tp_dealloc, ZstdDictionaryRegistry_dealloc},
+    {Py_tp_methods, ZstdDictionaryRegistry_methods},
+    {Py_tp_members, ZstdDictionaryRegistry_members},
+    {Py_sq_length, ZstdDictionaryRegistry_length},
+    {Py_sq_contains, ZstdDictionaryRegistry_contains},
+    {Py_tp_init, ZstdDictionaryRegistry_init},
+    {Py_tp_new, PyType_GenericNew},
+    {0, NULL},
+};
+
+PyType_Spec ZstdDictionaryRegistrySpec = {
+    "zstd.ZstdDictionaryRegistry",
+    sizeof(ZstdDictionaryRegistry),
+    0,
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
+    ZstdDictionaryRegistrySlots,
+};
+
+PyTypeObject *ZstdDictionaryRegistryType;
+
+void dictregistry_module_init(PyObject *mod) {
+    ZstdDictionaryRegistryType =
+        (PyTypeObject *)PyType_FromSpec(&ZstdDictionaryRegistrySpec);
+    if (PyType_Ready(ZstdDictionaryRegistryType) < 0) {
+        return;
+    }
+
+    Py_INCREF((PyObject *)ZstdDictionaryRegistryType);
+    PyModule_AddObject(mod, "ZstdDictionaryRegistry",
+                       (PyObject *)ZstdDictionaryRegistryType);
+}
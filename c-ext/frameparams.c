@@ -10,6 +10,32 @@
 
 extern PyObject *ZstdError;
 
+/**
+ * Parse the frame header at the beginning of source.
+ *
+ * Returns 0 on success or -1 with an exception set.
+ */
+static int read_frame_header(Py_buffer *source, ZSTD_frameHeader *header) {
+    size_t zresult;
+
+    zresult = ZSTD_getFrameHeader(header, source->buf, source->len);
+
+    if (ZSTD_isError(zresult)) {
+        PyErr_Format(ZstdError, "cannot get frame parameters: %s",
+                     ZSTD_getErrorName(zresult));
+        return -1;
+    }
+
+    if (zresult) {
+        PyErr_Format(ZstdError,
+                     "not enough data for frame parameters; need %zu bytes",
+                     zresult);
+        return -1;
+    }
+
+    return 0;
+}
+
 FrameParametersObject *get_frame_parameters(PyObject *self, PyObject *args,
                                             PyObject *kwargs) {
     static char *kwlist[] = {"data", NULL};
@@ -17,25 +43,13 @@ FrameParametersObject *get_frame_parameters(PyObject *self, PyObject *args,
     Py_buffer source;
     ZSTD_frameHeader header;
     FrameParametersObject *result = NULL;
-    size_t zresult;
 
     if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*:get_frame_parameters",
                                      kwlist, &source)) {
         return NULL;
     }
 
-    zresult = ZSTD_getFrameHeader(&header, source.buf, source.len);
-
-    if (ZSTD_isError(zresult)) {
-        PyErr_Format(ZstdError, "cannot get frame parameters: %s",
-                     ZSTD_getErrorName(zresult));
-        goto finally;
-    }
-
-    if (zresult) {
-        PyErr_Format(ZstdError,
-                     "not enough data for frame parameters; need %zu bytes",
-                     zresult);
+    if (read_frame_header(&source, &header)) {
         goto finally;
     }
 
@@ -54,6 +68,240 @@ finally:
     return result;
 }
 
+PyObject *frame_summary(PyObject *self, PyObject *args, PyObject *kwargs) {
+    static char *kwlist[] = {"data", NULL};
+
+    Py_buffer source;
+    ZSTD_frameHeader header;
+    PyObject *result = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*:frame_summary", kwlist,
+                                     &source)) {
+        return NULL;
+    }
+
+    if (read_frame_header(&source, &header)) {
+        goto finally;
+    }
+
+    result = Py_BuildValue("KKIN", header.frameContentSize, header.windowSize,
+                           header.dictID,
+                           PyBool_FromLong(header.checksumFlag));
+
+finally:
+    PyBuffer_Release(&source);
+    return result;
+}
+
+typedef struct {
+    unsigned long long offset;
+    unsigned long long compressedSize;
+    unsigned long long contentSize;
+    unsigned long long windowSize;
+    unsigned dictID;
+    unsigned char hasChecksum;
+    unsigned char skippable;
+} ScannedFrame;
+
+typedef struct {
+    ScannedFrame *frames;
+    size_t count;
+    size_t capacity;
+    /* Set if scanning failed. */
+    size_t zresult;
+    unsigned long long errorOffset;
+    int noMemory;
+} FrameScan;
+
+/**
+ * Record the frames in data[start:end]. Called without the GIL held.
+ */
+static int scan_range(FrameScan *scan, const char *data,
+                      unsigned long long start, unsigned long long end) {
+    unsigned long long offset = start;
+
+    while (offset < end) {
+        ZSTD_frameHeader header;
+        ScannedFrame *frame;
+        size_t frameSize;
+        size_t zresult;
+
+        frameSize = ZSTD_findFrameCompressedSize(data + offset, end - offset);
+        if (ZSTD_isError(frameSize)) {
+            scan->zresult = frameSize;
+            scan->errorOffset = offset;
+            return -1;
+        }
+
+        zresult = ZSTD_getFrameHeader(&header, data + offset, end - offset);
+        if (ZSTD_isError(zresult)) {
+            scan->zresult = zresult;
+            scan->errorOffset = offset;
+            return -1;
+        }
+
+        if (scan->count == scan->capacity) {
+            size_t capacity = scan->capacity ? scan->capacity * 2 : 256;
+            ScannedFrame *frames =
+                PyMem_RawRealloc(scan->frames, capacity * sizeof(ScannedFrame));
+            if (!frames) {
+                scan->noMemory = 1;
+                return -1;
+            }
+
+            scan->frames = frames;
+            scan->capacity = capacity;
+        }
+
+        frame = &scan->frames[scan->count++];
+        frame->offset = offset;
+        frame->compressedSize = frameSize;
+        frame->contentSize = header.frameContentSize;
+
+        if (header.frameType == ZSTD_skippableFrame) {
+            frame->windowSize = 0;
+            frame->dictID = 0;
+            frame->hasChecksum = 0;
+            frame->skippable = 1;
+        }
+        else {
+            frame->windowSize = header.windowSize;
+            frame->dictID = header.dictID;
+            frame->hasChecksum = header.checksumFlag ? 1 : 0;
+            frame->skippable = 0;
+        }
+
+        offset += frameSize;
+    }
+
+    return 0;
+}
+
+/**
+ * Convert bytes holding packed values to a memoryview of the given format.
+ *
+ * Steals a reference to bytes.
+ */
+static PyObject *column_view(PyObject *bytes, const char *format) {
+    PyObject *view;
+    PyObject *result;
+
+    view = PyMemoryView_FromObject(bytes);
+    Py_DECREF(bytes);
+    if (!view) {
+        return NULL;
+    }
+
+    result = PyObject_CallMethod(view, "cast", "s", format);
+    Py_DECREF(view);
+
+    return result;
+}
+
+PyObject *frameparams_scan(PyObject *self, PyObject *args, PyObject *kwargs) {
+    static char *kwlist[] = {"data", NULL};
+
+    PyObject *data;
+    Py_buffer source;
+    ZstdBufferWithSegments *segments = NULL;
+    FrameScan scan;
+    PyObject *result = NULL;
+    PyObject *bytes;
+    PyObject *column;
+    int failed = 0;
+    size_t i;
+
+    memset(&source, 0, sizeof(source));
+    memset(&scan, 0, sizeof(scan));
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O:scan_frames", kwlist,
+                                     &data)) {
+        return NULL;
+    }
+
+    if (PyObject_TypeCheck(data, ZstdBufferWithSegmentsType)) {
+        segments = (ZstdBufferWithSegments *)data;
+    }
+    else if (PyObject_GetBuffer(data, &source, PyBUF_CONTIG_RO)) {
+        return NULL;
+    }
+
+    Py_BEGIN_ALLOW_THREADS if (segments) {
+        Py_ssize_t segment;
+
+        for (segment = 0; segment < segments->segmentCount; segment++) {
+            BufferSegment *s = &segments->segments[segment];
+
+            if (scan_range(&scan, segments->data, s->offset,
+                           s->offset + s->length)) {
+                failed = 1;
+                break;
+            }
+        }
+    }
+    else {
+        failed = scan_range(&scan, source.buf, 0, source.len);
+    }
+    Py_END_ALLOW_THREADS
+
+        if (failed) {
+        if (scan.noMemory) {
+            PyErr_NoMemory();
+        }
+        else {
+            PyErr_Format(ZstdError, "error scanning frame at offset %llu: %s",
+                         scan.errorOffset, ZSTD_getErrorName(scan.zresult));
+        }
+        goto finally;
+    }
+
+    result = PyDict_New();
+    if (!result) {
+        goto finally;
+    }
+
+#define ADD_COLUMN(name, type, format, field)                                  \
+    bytes = PyBytes_FromStringAndSize(NULL, scan.count * sizeof(type));        \
+    if (!bytes) {                                                              \
+        goto except;                                                           \
+    }                                                                          \
+    for (i = 0; i < scan.count; i++) {                                         \
+        ((type *)PyBytes_AS_STRING(bytes))[i] = scan.frames[i].field;          \
+    }                                                                          \
+    column = column_view(bytes, format);                                       \
+    if (!column) {                                                             \
+        goto except;                                                           \
+    }                                                                          \
+    if (PyDict_SetItemString(result, name, column)) {                          \
+        Py_DECREF(column);                                                     \
+        goto except;                                                           \
+    }                                                                          \
+    Py_DECREF(column);
+
+    ADD_COLUMN("offset", unsigned long long, "Q", offset);
+    ADD_COLUMN("compressed_size", unsigned long long, "Q", compressedSize);
+    ADD_COLUMN("content_size", unsigned long long, "Q", contentSize);
+    ADD_COLUMN("dict_id", unsigned int, "I", dictID);
+    ADD_COLUMN("has_checksum", unsigned char, "B", hasChecksum);
+    ADD_COLUMN("window_size", unsigned long long, "Q", windowSize);
+    ADD_COLUMN("skippable", unsigned char, "B", skippable);
+
+#undef ADD_COLUMN
+
+    goto finally;
+
+except:
+    Py_CLEAR(result);
+
+finally:
+    PyMem_RawFree(scan.frames);
+    if (!segments) {
+        PyBuffer_Release(&source);
+    }
+
+    return result;
+}
+
 static void FrameParameters_dealloc(PyObject *self) {
     PyObject_Del(self);
 }
@@ -33,6 +33,36 @@
    and debian/changelog as well */
 #define PYTHON_ZSTANDARD_VERSION "0.24.0.dev0"
 
+/* Default number of precomputed compression dictionaries to retain. */
+#define CDICT_CACHE_SIZE_DEFAULT 4
+
+/* Critical sections serialize access to the state of an object on
+   free-threaded builds. Before Python 3.13, the GIL does this. */
+#ifndef Py_BEGIN_CRITICAL_SECTION
+#define Py_BEGIN_CRITICAL_SECTION(op) {
+#define Py_END_CRITICAL_SECTION() }
+#endif
+
+/*
+   Lock serializing operations on a (de)compression context.
+
+   Contexts are used with the GIL released, which also suspends critical
+   sections, so neither protects them. The lock is recursive so an operation
+   can call methods that take the lock again. Waiting for the lock releases
+   the GIL.
+*/
+typedef struct {
+#if PY_VERSION_HEX >= 0x030D0000
+    PyMutex mutex;
+#else
+    PyThread_type_lock mutex;
+#endif
+    /* Identifier of the thread holding the lock. 0 if not held. */
+    uintptr_t owner;
+    /* Number of times the owning thread acquired the lock. */
+    Py_ssize_t count;
+} ContextLock;
+
 typedef enum {
     compressorobj_flush_finish,
     compressorobj_flush_block,
@@ -52,7 +82,9 @@ extern PyTypeObject *ZstdCompressionParametersType;
 /*
    Represents a FrameParameters type.
 
-   This type is basically a wrapper around ZSTD_frameParams.
+   This type is basically a wrapper around ZSTD_frameParams. Only the fields
+   exposed to Python are stored. The CFFI and Rust backends store the same
+   fields.
 */
 typedef struct {
     PyObject_HEAD unsigned long long frameContentSize;
@@ -82,13 +114,79 @@ typedef struct {
     /* d parameter for cover dictionaries. Only populated by train_cover_dict().
      */
     unsigned d;
-    /* Digested dictionary, suitable for reuse. */
-    ZSTD_CDict *cdict;
+    /* Most recently precomputed compression dictionary. PyCapsule wrapping a
+       ZSTD_CDict. NULL if precompute_compress() hasn't been called. */
+    PyObject *cdict;
+    /* Cache of precomputed compression dictionaries. Maps a tuple of
+       compression parameters to a PyCapsule wrapping a ZSTD_CDict. Ordered
+       from least to most recently used. Created on first use. */
+    PyObject *cdicts;
+    /* Maximum number of entries in cdicts. */
+    Py_ssize_t cdictCacheSize;
+    unsigned long long cdictHits;
+    unsigned long long cdictMisses;
+    unsigned long long cdictEvictions;
     ZSTD_DDict *ddict;
 } ZstdCompressionDict;
 
 extern PyTypeObject *ZstdCompressionDictType;
 
+/*
+   Represents a ZstdThreadPool type.
+
+   Wraps a ZSTD_threadPool that can be shared by multiple compressors.
+*/
+typedef struct {
+    PyObject_HEAD
+
+        /* Thread pool. Owned by self. */
+        ZSTD_threadPool *pool;
+    /* Number of threads in the pool. */
+    unsigned int threads;
+} ZstdThreadPool;
+
+extern PyTypeObject *ZstdThreadPoolType;
+
+/*
+   Represents a ZstdDictionaryRegistry type.
+
+   Holds dictionaries keyed by dictionary ID and a bounded, least recently
+   used cache of their digested forms.
+*/
+typedef struct {
+    PyObject_HEAD
+
+        /* dict_id -> ZstdCompressionDict registered by the caller. */
+        PyObject *dicts;
+    /* dict_id -> digested ZstdCompressionDict owned by the registry. Ordered
+       from least to most recently used. */
+    PyObject *cache;
+    /* Maximum number of digested dictionaries to retain. */
+    Py_ssize_t maxCached;
+    unsigned long long hits;
+    unsigned long long misses;
+    unsigned long long evictions;
+    /* Incremented whenever a digested dictionary enters or leaves the
+       cache. */
+    unsigned long long version;
+} ZstdDictionaryRegistry;
+
+extern PyTypeObject *ZstdDictionaryRegistryType;
+
+/*
+   Counters describing how multi_compress_to_buffer() performed work.
+*/
+typedef struct {
+    /* Calls that compressed everything on the calling thread. */
+    unsigned long long singleThreadedCalls;
+    /* Calls that dispatched work to worker threads. */
+    unsigned long long multiThreadedCalls;
+    /* Total number of worker threads started. */
+    unsigned long long threadsStarted;
+    /* Number of workers used by the most recent call. */
+    Py_ssize_t lastThreads;
+} MultiCompressStats;
+
 /*
    Represents a ZstdCompressor type.
 */
@@ -100,10 +198,31 @@ typedef struct {
     /* Pointer to compression dictionary to use. NULL if not using dictionary
        compression. */
     ZstdCompressionDict *dict;
+    /* Precomputed compression dictionary referenced by the compression
+       contexts. PyCapsule wrapping a ZSTD_CDict. NULL if the dictionary
+       is loaded into each context instead. */
+    PyObject *cdict;
     /* Compression context to use. Populated during object construction. */
     ZSTD_CCtx *cctx;
+    /* Serializes operations using cctx and the state below. */
+    ContextLock lock;
     /* Compression parameters in use. */
     ZSTD_CCtx_params *params;
+    /* Expected size of inputs whose size isn't known. 0 if unset. */
+    int sizeHint;
+    /* Thread pool shared with other compressors. NULL if each operation
+       should use a private pool. */
+    ZstdThreadPool *threadPool;
+#ifdef HAVE_ZSTD_POOL_APIS
+    /* Worker threads used by multi_compress_to_buffer(). Persist between
+       calls. */
+    POOL_ctx *multiPool;
+    size_t multiPoolSize;
+#endif
+    /* Compression contexts used by multi_compress_to_buffer() workers. */
+    ZSTD_CCtx **multiCCtxs;
+    Py_ssize_t multiCCtxsSize;
+    MultiCompressStats multiStats;
 } ZstdCompressor;
 
 extern PyTypeObject *ZstdCompressorType;
@@ -131,6 +250,8 @@ typedef struct {
     int writeReturnRead;
     int closefd;
     unsigned long long bytesCompressed;
+    /* Whether data was written since the current frame started. */
+    int frameStarted;
 } ZstdCompressionWriter;
 
 extern PyTypeObject *ZstdCompressionWriterType;
@@ -208,9 +329,23 @@ typedef struct {
     PyObject_HEAD
 
         ZSTD_DCtx *dctx;
+    /* Serializes operations using dctx and the state below. */
+    ContextLock lock;
     ZstdCompressionDict *dict;
+    /* Registry to select dictionaries from by frame dictionary ID. */
+    ZstdDictionaryRegistry *registry;
+    /* dict_id -> digested ZstdCompressionDict referenced by dctx. Keeps
+       every DDict known to dctx alive. */
+    PyObject *registryDicts;
+    /* Registry version registryDicts was last synchronized with. */
+    unsigned long long registryVersion;
     size_t maxWindowSize;
     ZSTD_format_e format;
+    /* Whether maxWindowSize and format have been applied to dctx. They
+       survive session resets, so only need to be applied once. */
+    int paramsApplied;
+    /* Whether dict is referenced by dctx. */
+    int dictApplied;
 } ZstdDecompressor;
 
 extern PyTypeObject *ZstdDecompressorType;
@@ -369,6 +504,25 @@ typedef struct {
 
 extern PyTypeObject *ZstdBufferWithSegmentsCollectionType;
 
+/**
+ * Incrementally constructs a BufferWithSegments.
+ *
+ * Data and segments are held in growable arrays. When finished, ownership
+ * of both arrays is transferred to a new BufferWithSegments without copying.
+ */
+typedef struct {
+    PyObject_HEAD
+
+        void *data;
+    unsigned long long dataSize;
+    size_t dataCapacity;
+    BufferSegment *segments;
+    Py_ssize_t segmentCount;
+    Py_ssize_t segmentsCapacity;
+} ZstdBufferWithSegmentsBuilder;
+
+extern PyTypeObject *ZstdBufferWithSegmentsBuilderType;
+
 int set_parameter(ZSTD_CCtx_params *params, ZSTD_cParameter param, int value);
 int set_parameters(ZSTD_CCtx_params *params,
                    ZstdCompressionParametersObject *obj);
@@ -376,8 +530,15 @@ int to_cparams(ZstdCompressionParametersObject *params,
                ZSTD_compressionParameters *cparams);
 FrameParametersObject *get_frame_parameters(PyObject *self, PyObject *args,
                                             PyObject *kwargs);
+PyObject *frame_summary(PyObject *self, PyObject *args, PyObject *kwargs);
 int ensure_ddict(ZstdCompressionDict *dict);
+void compressiondict_init_cache(ZstdCompressionDict *dict);
+PyObject *compressiondict_get_cdict(ZstdCompressionDict *dict,
+                                    ZSTD_CCtx_params *params);
 int ensure_dctx(ZstdDecompressor *decompressor, int loadDict);
+ZstdCompressionDict *dictregistry_get(ZstdDictionaryRegistry *registry,
+                                      unsigned dictId);
+PyObject *frameparams_scan(PyObject *self, PyObject *args, PyObject *kwargs);
 ZstdCompressionDict *train_dictionary(PyObject *self, PyObject *args,
                                       PyObject *kwargs);
 ZstdBufferWithSegments *
@@ -388,6 +549,15 @@ BufferWithSegmentsCollection_length(ZstdBufferWithSegmentsCollection *);
 int cpu_count(void);
 size_t roundpow2(size_t);
 int safe_pybytes_resize(PyObject **obj, Py_ssize_t size);
+int fastcall_buffer_arg(PyObject *const *args, Py_ssize_t nargs,
+                        PyObject *kwnames, Py_buffer *view);
+int parse_fastcall_args(PyObject *const *args, Py_ssize_t nargs,
+                        PyObject *kwnames, const char *format, char **kwlist,
+                        ...);
 void set_io_unsupported_operation(void);
+int context_lock_init(ContextLock *lock);
+void context_lock_free(ContextLock *lock);
+void context_lock_acquire(ContextLock *lock);
+void context_lock_release(ContextLock *lock);
 
 #endif
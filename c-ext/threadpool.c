@@ -0,0 +1,88 @@
+/**
+ * Copyright (c) 2024-present, Gregory Szorc
+ * All rights reserved.
+ *
+ * This software may be modified and distributed under the terms
+ * of the BSD license. See the LICENSE file for details.
+ */
+
+#include "python-zstandard.h"
+
+extern PyObject *ZstdError;
+
+static int ZstdThreadPool_init(ZstdThreadPool *self, PyObject *args,
+                               PyObject *kwargs) {
+    static char *kwlist[] = {"threads", NULL};
+
+    int threads = -1;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|i:ZstdThreadPool", kwlist,
+                                     &threads)) {
+        return -1;
+    }
+
+    if (threads < 0) {
+        threads = cpu_count();
+    }
+
+    if (threads < 1) {
+        threads = 1;
+    }
+
+    if (self->pool) {
+        ZSTD_freeThreadPool(self->pool);
+        self->pool = NULL;
+    }
+
+    self->pool = ZSTD_createThreadPool((size_t)threads);
+    if (!self->pool) {
+        PyErr_SetString(ZstdError, "unable to create thread pool");
+        return -1;
+    }
+
+    self->threads = threads;
+
+    return 0;
+}
+
+static void ZstdThreadPool_dealloc(ZstdThreadPool *self) {
+    if (self->pool) {
+        ZSTD_freeThreadPool(self->pool);
+        self->pool = NULL;
+    }
+
+    PyObject_Del(self);
+}
+
+static PyMemberDef ZstdThreadPool_members[] = {
+    {"threads", T_UINT, offsetof(ZstdThreadPool, threads), READONLY,
+     "number of threads in the pool"},
+    {NULL}};
+
+PyType_Slot ZstdThreadPoolSlots[] = {
+    {Py_tp_dealloc, ZstdThreadPool_dealloc},
+    {Py_tp_members, ZstdThreadPool_members},
+    {Py_tp_init, ZstdThreadPool_init},
+    {Py_tp_new, PyType_GenericNew},
+    {0, NULL},
+};
+
+PyType_Spec ZstdThreadPoolSpec = {
+    "zstd.ZstdThreadPool",
+    sizeof(ZstdThreadPool),
+    0,
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
+    ZstdThreadPoolSlots,
+};
+
+PyTypeObject *ZstdThreadPoolType;
+
+void threadpool_module_init(PyObject *mod) {
+    ZstdThreadPoolType = (PyTypeObject *)PyType_FromSpec(&ZstdThreadPoolSpec);
+    if (PyType_Ready(ZstdThreadPoolType) < 0) {
+        return;
+    }
+
+    Py_INCREF((PyObject *)ZstdThreadPoolType);
+    PyModule_AddObject(mod, "ZstdThreadPool", (PyObject *)ZstdThreadPoolType);
+}
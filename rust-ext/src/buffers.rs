@@ -11,7 +11,7 @@ use {
         exceptions::{PyIndexError, PyTypeError, PyValueError},
         ffi::Py_buffer,
         prelude::*,
-        types::{PyBytes, PyTuple},
+        types::{PyByteArray, PyBytes, PyTuple},
     },
 };
 
@@ -24,10 +24,9 @@ pub(crate) struct BufferSegment {
 
 #[pyclass(module = "zstandard.backend_rust", name = "BufferSegment")]
 pub struct ZstdBufferSegment {
-    /// The object backing storage. For reference counting.
-    _parent: PyObject,
-    /// PyBuffer into parent object.
-    buffer: PyBuffer<u8>,
+    /// The buffer holding the segment. Its buffer into the backing storage
+    /// is shared by all segments rather than acquiring one per segment.
+    parent: Py<ZstdBufferWithSegments>,
     /// Offset of segment within data.
     offset: usize,
     /// Length of segment within data.
@@ -35,9 +34,14 @@ pub struct ZstdBufferSegment {
 }
 
 impl ZstdBufferSegment {
-    pub fn as_slice(&self) -> &[u8] {
+    pub fn as_slice<'p>(&self, py: Python<'p>) -> &'p [u8] {
+        let parent = self.parent.borrow(py);
+
         unsafe {
-            std::slice::from_raw_parts(self.buffer.buf_ptr().add(self.offset) as *const _, self.len)
+            std::slice::from_raw_parts(
+                parent.buffer.buf_ptr().add(self.offset) as *const _,
+                self.len,
+            )
         }
     }
 }
@@ -51,7 +55,7 @@ impl ZstdBufferSegment {
 
     // PyBufferProtocol.
     fn bf_getbuffer(slf: PyRefMut<Self>, view: PyObject, flags: i32) -> PyResult<()> {
-        let slice = slf.as_slice();
+        let slice = slf.as_slice(slf.py());
 
         if unsafe {
             pyo3::ffi::PyBuffer_FillInfo(
@@ -81,7 +85,7 @@ impl ZstdBufferSegment {
     }
 
     fn tobytes<'p>(&self, py: Python<'p>) -> PyResult<Bound<'p, PyBytes>> {
-        Ok(PyBytes::new_bound(py, self.as_slice()))
+        Ok(PyBytes::new_bound(py, self.as_slice(py)))
     }
 }
 
@@ -121,7 +125,8 @@ impl ZstdBufferSegments {
 
 #[pyclass(module = "zstandard.backend_rust", name = "BufferWithSegments")]
 pub struct ZstdBufferWithSegments {
-    source: PyObject,
+    /// The object backing storage. For reference counting.
+    _source: PyObject,
     pub(crate) buffer: PyBuffer<u8>,
     pub(crate) segments: Vec<BufferSegment>,
 }
@@ -153,8 +158,8 @@ impl ZstdBufferWithSegments {
         self.segments.len()
     }
 
-    fn __getitem__(&self, key: isize) -> PyResult<ZstdBufferSegment> {
-        let py = unsafe { Python::assume_gil_acquired() };
+    fn __getitem__(slf: &Bound<'_, Self>, key: isize) -> PyResult<ZstdBufferSegment> {
+        let this = slf.borrow();
 
         if key < 0 {
             return Err(PyIndexError::new_err("offset must be non-negative"));
@@ -162,18 +167,17 @@ impl ZstdBufferWithSegments {
 
         let key = key as usize;
 
-        if key >= self.segments.len() {
+        if key >= this.segments.len() {
             return Err(PyIndexError::new_err(format!(
                 "offset must be less than {}",
-                self.segments.len()
+                this.segments.len()
             )));
         }
 
-        let segment = &self.segments[key];
+        let segment = &this.segments[key];
 
         Ok(ZstdBufferSegment {
-            _parent: self.source.clone_ref(py),
-            buffer: PyBuffer::get_bound(self.source.downcast_bound(py)?)?,
+            parent: slf.clone().unbind(),
             offset: segment.offset as _,
             len: segment.length as _,
         })
@@ -236,7 +240,7 @@ impl ZstdBufferWithSegments {
         }
 
         Ok(Self {
-            source: data.into_py(py),
+            _source: data.into_py(py),
             buffer: data_buffer,
             segments,
         })
@@ -302,7 +306,7 @@ impl ZstdBufferWithSegmentsCollection {
 
                 let item = segment.downcast_bound::<ZstdBufferWithSegments>(py)?;
 
-                return item.borrow().__getitem__((key - offset) as isize);
+                return ZstdBufferWithSegments::__getitem__(item, (key - offset) as isize);
             }
         }
 
@@ -361,11 +365,136 @@ impl ZstdBufferWithSegmentsCollection {
     }
 }
 
+#[pyclass(module = "zstandard.backend_rust", name = "BufferWithSegmentsBuilder")]
+pub struct ZstdBufferWithSegmentsBuilder {
+    /// Accumulated data.
+    ///
+    /// Pre-sized from the size hint and filled in place. bytearray
+    /// over-allocates when grown, giving amortized growth beyond the hint. It
+    /// is handed to the final `BufferWithSegments` as its backing object.
+    data: Py<PyByteArray>,
+    /// Number of bytes of `data` in use.
+    size: usize,
+    segments: Vec<BufferSegment>,
+}
+
+impl ZstdBufferWithSegmentsBuilder {
+    fn push(&mut self, py: Python, chunk: &[u8]) -> PyResult<()> {
+        let data = self.data.bind(py);
+        let offset = self.size;
+        let end = offset + chunk.len();
+
+        if end > data.len() {
+            data.resize(end)?;
+        }
+        unsafe {
+            data.as_bytes_mut()[offset..end].copy_from_slice(chunk);
+        }
+        self.size = end;
+
+        self.segments.push(BufferSegment {
+            offset: offset as _,
+            length: chunk.len() as _,
+        });
+
+        Ok(())
+    }
+
+    fn extend_buffer(&mut self, py: Python, buffer: &ZstdBufferWithSegments) -> PyResult<()> {
+        self.segments.reserve(buffer.segments.len());
+
+        for i in 0..buffer.segments.len() {
+            self.push(py, buffer.get_segment_slice(py, i))?;
+        }
+
+        Ok(())
+    }
+}
+
+#[pymethods]
+impl ZstdBufferWithSegmentsBuilder {
+    #[new]
+    #[pyo3(signature = (size_hint=0, count_hint=0))]
+    fn new(py: Python, size_hint: isize, count_hint: isize) -> PyResult<Self> {
+        if size_hint < 0 || count_hint < 0 {
+            return Err(PyValueError::new_err("hints must be non-negative"));
+        }
+
+        let data = PyByteArray::new_bound(py, &[]);
+        data.resize(size_hint as usize)?;
+
+        Ok(Self {
+            data: data.unbind(),
+            size: 0,
+            segments: Vec::with_capacity(count_hint as usize),
+        })
+    }
+
+    fn __len__(&self) -> usize {
+        self.segments.len()
+    }
+
+    #[getter]
+    fn size(&self) -> usize {
+        self.size
+    }
+
+    fn append(&mut self, py: Python, data: PyBuffer<u8>) -> PyResult<()> {
+        let chunk: &[u8] =
+            unsafe { std::slice::from_raw_parts(data.buf_ptr() as *const _, data.len_bytes()) };
+
+        self.push(py, chunk)
+    }
+
+    fn extend(&mut self, py: Python, data: &Bound<'_, PyAny>) -> PyResult<()> {
+        if let Ok(buffer) = data.downcast::<ZstdBufferWithSegments>() {
+            return self.extend_buffer(py, &buffer.borrow());
+        }
+
+        if let Ok(collection) = data.downcast::<ZstdBufferWithSegmentsCollection>() {
+            for buffer in &collection.borrow().buffers {
+                let buffer = buffer.downcast_bound::<ZstdBufferWithSegments>(py)?;
+                self.extend_buffer(py, &buffer.borrow())?;
+            }
+
+            return Ok(());
+        }
+
+        for item in data.iter()? {
+            let buffer = PyBuffer::<u8>::get_bound(&item?)?;
+            let chunk: &[u8] = unsafe {
+                std::slice::from_raw_parts(buffer.buf_ptr() as *const _, buffer.len_bytes())
+            };
+
+            self.push(py, chunk)?;
+        }
+
+        Ok(())
+    }
+
+    fn finish(&mut self, py: Python) -> PyResult<ZstdBufferWithSegments> {
+        // Drop unused pre-sized storage.
+        self.data.bind(py).resize(self.size)?;
+        self.size = 0;
+
+        // Exporting a buffer pins the bytearray, so the data isn't copied.
+        let buffer = PyBuffer::get_bound(self.data.bind(py).as_any())?;
+        let data = std::mem::replace(&mut self.data, PyByteArray::new_bound(py, &[]).unbind());
+
+        Ok(ZstdBufferWithSegments {
+            _source: data.into_py(py),
+            buffer,
+            segments: std::mem::take(&mut self.segments),
+        })
+    }
+}
+
 pub(crate) fn init_module(module: &Bound<'_, PyModule>) -> PyResult<()> {
     module.add_class::<ZstdBufferSegment>()?;
     module.add_class::<ZstdBufferSegments>()?;
     module.add_class::<ZstdBufferWithSegments>()?;
     module.add_class::<ZstdBufferWithSegmentsCollection>()?;
+    module.add_class::<ZstdBufferWithSegmentsBuilder>()?;
 
     Ok(())
 }
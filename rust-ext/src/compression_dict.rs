@@ -6,19 +6,72 @@
 
 use {
     crate::{
-        compression_parameters::{get_cctx_parameter, int_to_strategy, ZstdCompressionParameters},
+        buffers::ZstdBufferWithSegments,
+        compression_parameters::{
+            get_cctx_parameter, int_to_strategy, CCtxParams, ZstdCompressionParameters,
+        },
         zstd_safe::{train_dictionary_fastcover, CCtx, CDict, DCtx, DDict},
         ZstdError,
     },
     pyo3::{
         buffer::PyBuffer,
-        exceptions::PyValueError,
+        exceptions::{PyTypeError, PyValueError},
         prelude::*,
-        types::{PyBytes, PyList},
+        types::{PyBytes, PyDict, PyString},
         wrap_pyfunction,
     },
+    std::{
+        collections::{BinaryHeap, VecDeque},
+        sync::{Arc, Mutex},
+    },
 };
 
+/// Default number of precomputed compression dictionaries to retain.
+const CDICT_CACHE_SIZE_DEFAULT: usize = 4;
+
+/// Compression parameters a precomputed dictionary is keyed on.
+type CDictKey = (u32, u32, u32, u32, u32, u32, i32);
+
+fn cdict_key(params: &zstd_sys::ZSTD_compressionParameters) -> CDictKey {
+    (
+        params.windowLog,
+        params.chainLog,
+        params.hashLog,
+        params.searchLog,
+        params.minMatch,
+        params.targetLength,
+        params.strategy as i32,
+    )
+}
+
+#[derive(Default)]
+struct CDictCache {
+    /// Most recently precomputed dictionary.
+    current: Option<Arc<CDict<'static>>>,
+    /// Precomputed dictionaries, from least to most recently used.
+    entries: VecDeque<(CDictKey, Arc<CDict<'static>>)>,
+    hits: u64,
+    misses: u64,
+    evictions: u64,
+}
+
+impl CDictCache {
+    /// Remove an entry so it can be reinserted as the most recently used.
+    fn take(&mut self, key: &CDictKey) -> Option<Arc<CDict<'static>>> {
+        let index = self.entries.iter().position(|(k, _)| k == key)?;
+
+        self.entries.remove(index).map(|(_, cdict)| cdict)
+    }
+
+    fn get(&mut self, key: CDictKey) -> Option<Arc<CDict<'static>>> {
+        let cdict = self.take(&key)?;
+        self.entries.push_back((key, cdict.clone()));
+        self.hits += 1;
+
+        Some(cdict)
+    }
+}
+
 #[pyclass(module = "zstandard.backend_rust")]
 pub struct ZstdCompressionDict {
     /// Internal format of dictionary data.
@@ -37,16 +90,68 @@ pub struct ZstdCompressionDict {
     /// Owned by us.
     data: Vec<u8>,
 
-    /// Precomputed compression dictionary.
-    cdict: Option<CDict<'static>>,
+    /// Maximum number of precomputed compression dictionaries to retain.
+    #[pyo3(get)]
+    cdict_cache_size: usize,
+
+    /// Precomputed compression dictionaries.
+    cdicts: Mutex<CDictCache>,
 
     /// Precomputed decompression dictionary.
     ddict: Option<DDict<'static>>,
 }
 
 impl ZstdCompressionDict {
-    pub(crate) fn load_into_cctx(&self, cctx: &CCtx) -> PyResult<()> {
-        if let Some(cdict) = &self.cdict {
+    /// Obtain the precomputed dictionary a compressor should use.
+    ///
+    /// A cached dictionary matching the compressor's parameters is preferred.
+    /// Otherwise the most recently precomputed dictionary is used.
+    fn select_cdict(&self, params: &CCtxParams) -> PyResult<Option<Arc<CDict<'static>>>> {
+        let mut cache = self.cdicts.lock().unwrap();
+
+        if cache.entries.is_empty() {
+            return Ok(cache.current.clone());
+        }
+
+        let level = params.get_parameter(zstd_sys::ZSTD_cParameter::ZSTD_c_compressionLevel)?;
+        let mut cparams = unsafe { zstd_sys::ZSTD_getCParams(level, 0, self.data.len()) };
+
+        let window_log = params.get_parameter(zstd_sys::ZSTD_cParameter::ZSTD_c_windowLog)?;
+        if window_log != 0 {
+            cparams.windowLog = window_log as u32;
+        }
+        let chain_log = params.get_parameter(zstd_sys::ZSTD_cParameter::ZSTD_c_chainLog)?;
+        if chain_log != 0 {
+            cparams.chainLog = chain_log as u32;
+        }
+        let hash_log = params.get_parameter(zstd_sys::ZSTD_cParameter::ZSTD_c_hashLog)?;
+        if hash_log != 0 {
+            cparams.hashLog = hash_log as u32;
+        }
+        let search_log = params.get_parameter(zstd_sys::ZSTD_cParameter::ZSTD_c_searchLog)?;
+        if search_log != 0 {
+            cparams.searchLog = search_log as u32;
+        }
+        let min_match = params.get_parameter(zstd_sys::ZSTD_cParameter::ZSTD_c_minMatch)?;
+        if min_match != 0 {
+            cparams.minMatch = min_match as u32;
+        }
+        let target_length = params.get_parameter(zstd_sys::ZSTD_cParameter::ZSTD_c_targetLength)?;
+        if target_length != 0 {
+            cparams.targetLength = target_length as u32;
+        }
+        let strategy = params.get_parameter(zstd_sys::ZSTD_cParameter::ZSTD_c_strategy)?;
+        if strategy != 0 {
+            cparams.strategy = int_to_strategy(strategy as u32)?;
+        }
+
+        Ok(cache
+            .get(cdict_key(&cparams))
+            .or_else(|| cache.current.clone()))
+    }
+
+    pub(crate) fn load_into_cctx(&self, cctx: &CCtx, params: &CCtxParams) -> PyResult<()> {
+        if let Some(cdict) = self.select_cdict(params)? {
             cctx.load_computed_dict(cdict)
         } else {
             cctx.load_dict_data(&self.data, self.content_type)
@@ -70,6 +175,11 @@ impl ZstdCompressionDict {
         Ok(())
     }
 
+    /// Digest the dictionary into a DDict that doesn't reference this instance.
+    pub(crate) fn to_owned_ddict(&self) -> PyResult<DDict<'static>> {
+        DDict::copy_from_data(&self.data, self.content_type).map_err(ZstdError::new_err)
+    }
+
     pub(crate) fn load_into_dctx(&mut self, dctx: &DCtx) -> PyResult<()> {
         self.ensure_ddict()?;
 
@@ -83,8 +193,13 @@ impl ZstdCompressionDict {
 #[pymethods]
 impl ZstdCompressionDict {
     #[new]
-    #[pyo3(signature = (buffer, dict_type = None))]
-    fn new(py: Python, buffer: PyBuffer<u8>, dict_type: Option<u32>) -> PyResult<Self> {
+    #[pyo3(signature = (buffer, dict_type = None, *, cdict_cache_size = CDICT_CACHE_SIZE_DEFAULT))]
+    fn new(
+        py: Python,
+        buffer: PyBuffer<u8>,
+        dict_type: Option<u32>,
+        cdict_cache_size: usize,
+    ) -> PyResult<Self> {
         let dict_type = if dict_type == Some(zstd_sys::ZSTD_dictContentType_e::ZSTD_dct_auto as u32)
         {
             Ok(zstd_sys::ZSTD_dictContentType_e::ZSTD_dct_auto)
@@ -101,6 +216,10 @@ impl ZstdCompressionDict {
             Ok(zstd_sys::ZSTD_dictContentType_e::ZSTD_dct_auto)
         }?;
 
+        if cdict_cache_size < 1 {
+            return Err(PyValueError::new_err("cdict_cache_size must be positive"));
+        }
+
         let dict_data = buffer.to_vec(py)?;
 
         Ok(ZstdCompressionDict {
@@ -108,7 +227,8 @@ impl ZstdCompressionDict {
             k: 0,
             d: 0,
             data: dict_data,
-            cdict: None,
+            cdict_cache_size,
+            cdicts: Mutex::new(CDictCache::default()),
             ddict: None,
         })
     }
@@ -121,7 +241,13 @@ impl ZstdCompressionDict {
         Ok(PyBytes::new_bound(py, &self.data))
     }
 
-    fn dict_id(&self) -> u32 {
+    /// Private. Lets Python code copy a dictionary faithfully.
+    #[getter(_dict_type)]
+    fn dict_type(&self) -> u32 {
+        self.content_type as u32
+    }
+
+    pub(crate) fn dict_id(&self) -> u32 {
         zstd_safe::get_dict_id(&self.data)
             .map(u32::from)
             .unwrap_or(0)
@@ -129,7 +255,7 @@ impl ZstdCompressionDict {
 
     #[pyo3(signature = (level=None, compression_params=None))]
     fn precompute_compress(
-        &mut self,
+        &self,
         py: Python,
         level: Option<i32>,
         compression_params: Option<Py<ZstdCompressionParameters>>,
@@ -177,13 +303,202 @@ impl ZstdCompressionDict {
             ));
         };
 
-        self.cdict = Some(
-            CDict::from_data(&self.data, self.content_type, params)
-                .map_err(|msg| ZstdError::new_err(msg))?,
-        );
+        let key = cdict_key(&params);
+
+        {
+            let mut cache = self.cdicts.lock().unwrap();
+
+            if let Some(cdict) = cache.get(key) {
+                cache.current = Some(cdict);
+                return Ok(());
+            }
+
+            cache.misses += 1;
+        }
+
+        let data = &self.data;
+        let content_type = self.content_type;
+
+        let cdict = py
+            .allow_threads(|| CDict::from_data(data, content_type, params))
+            .map_err(|msg| ZstdError::new_err(msg))?;
+
+        let mut cache = self.cdicts.lock().unwrap();
+
+        // Another thread may have digested the same parameters.
+        let cdict = cache.take(&key).unwrap_or_else(|| Arc::new(cdict));
+        cache.entries.push_back((key, cdict.clone()));
+        cache.current = Some(cdict);
+
+        while cache.entries.len() > self.cdict_cache_size {
+            cache.entries.pop_front();
+            cache.evictions += 1;
+        }
 
         Ok(())
     }
+
+    fn cdict_stats<'p>(&self, py: Python<'p>) -> PyResult<Bound<'p, PyDict>> {
+        let cache = self.cdicts.lock().unwrap();
+
+        let result = PyDict::new_bound(py);
+        result.set_item("hits", cache.hits)?;
+        result.set_item("misses", cache.misses)?;
+        result.set_item("evictions", cache.evictions)?;
+        result.set_item("cached", cache.entries.len())?;
+        result.set_item(
+            "memory",
+            cache
+                .entries
+                .iter()
+                .map(|(_, cdict)| cdict.memory_size())
+                .sum::<usize>(),
+        )?;
+
+        Ok(result)
+    }
+}
+
+fn splitmix64(state: &mut u64) -> u64 {
+    *state = state.wrapping_add(0x9E3779B97F4A7C15);
+    let mut z = *state;
+    z = (z ^ (z >> 30)).wrapping_mul(0xBF58476D1CE4E5B9);
+    z = (z ^ (z >> 27)).wrapping_mul(0x94D049BB133111EB);
+    z ^ (z >> 31)
+}
+
+/// A training sample within `SampleCollector::buffer`.
+#[derive(Clone, Copy)]
+struct TrainingSample {
+    priority: u64,
+    offset: usize,
+    size: usize,
+    live: bool,
+}
+
+/// Assembles training samples into a single buffer.
+///
+/// When a byte budget is set, each sample is assigned a random priority and
+/// the samples with the lowest priorities fitting the budget are retained.
+/// Evicted samples leave holes in the buffer, which are reclaimed by
+/// compacting it when it would otherwise grow.
+struct SampleCollector {
+    buffer: Vec<u8>,
+    samples: Vec<TrainingSample>,
+    /// Priorities and indices of live samples. Only maintained when a budget
+    /// is set.
+    heap: BinaryHeap<(u64, usize)>,
+    /// Total size of live samples.
+    live_size: usize,
+    max_size: usize,
+    rng_state: u64,
+}
+
+impl SampleCollector {
+    fn new(max_size: usize, seed: u64) -> Self {
+        Self {
+            buffer: vec![],
+            samples: vec![],
+            heap: BinaryHeap::new(),
+            live_size: 0,
+            max_size,
+            rng_state: seed,
+        }
+    }
+
+    /// Drop evicted samples, moving live samples to the front of the buffer.
+    fn compact(&mut self) {
+        let mut offset = 0;
+        let mut count = 0;
+
+        for i in 0..self.samples.len() {
+            let sample = self.samples[i];
+
+            if !sample.live {
+                continue;
+            }
+
+            self.buffer
+                .copy_within(sample.offset..sample.offset + sample.size, offset);
+            self.samples[count] = TrainingSample { offset, ..sample };
+            count += 1;
+            offset += sample.size;
+        }
+
+        self.samples.truncate(count);
+        self.buffer.truncate(offset);
+
+        if self.max_size != 0 {
+            self.heap = self
+                .samples
+                .iter()
+                .enumerate()
+                .map(|(i, sample)| (sample.priority, i))
+                .collect();
+        }
+    }
+
+    fn add(&mut self, sample: &[u8]) {
+        let mut priority = 0;
+
+        if self.max_size != 0 {
+            if sample.len() > self.max_size {
+                return;
+            }
+
+            priority = splitmix64(&mut self.rng_state);
+
+            // The sample would be the first to be evicted.
+            if self.live_size + sample.len() > self.max_size {
+                if let Some((highest, _)) = self.heap.peek() {
+                    if priority > *highest {
+                        return;
+                    }
+                }
+            }
+
+            if self.buffer.len() + sample.len() > self.buffer.capacity()
+                && self.buffer.len() - self.live_size >= self.live_size
+            {
+                self.compact();
+            }
+
+            if self.samples.len() == self.samples.capacity()
+                && self.samples.len() - self.heap.len() >= self.heap.len()
+            {
+                self.compact();
+            }
+
+            self.heap.push((priority, self.samples.len()));
+        }
+
+        self.samples.push(TrainingSample {
+            priority,
+            offset: self.buffer.len(),
+            size: sample.len(),
+            live: true,
+        });
+        self.buffer.extend_from_slice(sample);
+        self.live_size += sample.len();
+
+        while self.max_size != 0 && self.live_size > self.max_size {
+            if let Some((_, index)) = self.heap.pop() {
+                let evicted = &mut self.samples[index];
+                evicted.live = false;
+                self.live_size -= evicted.size;
+            }
+        }
+    }
+
+    fn finish(mut self) -> (Vec<u8>, Vec<usize>) {
+        if self.max_size != 0 {
+            self.compact();
+        }
+
+        let sizes = self.samples.iter().map(|sample| sample.size).collect();
+
+        (self.buffer, sizes)
+    }
 }
 
 #[pyfunction]
@@ -200,10 +515,13 @@ impl ZstdCompressionDict {
     level=0,
     steps=0,
     threads=0,
+    max_samples_size=0,
+    seed=0,
 ))]
 fn train_dictionary(
+    py: Python,
     dict_size: usize,
-    samples: &Bound<'_, PyList>,
+    samples: &Bound<'_, PyAny>,
     k: u32,
     d: u32,
     f: u32,
@@ -214,7 +532,15 @@ fn train_dictionary(
     level: i32,
     steps: u32,
     threads: i32,
+    max_samples_size: isize,
+    seed: u64,
 ) -> PyResult<ZstdCompressionDict> {
+    if max_samples_size < 0 {
+        return Err(PyValueError::new_err(
+            "max_samples_size must be non-negative",
+        ));
+    }
+
     let threads = if threads < 0 {
         num_cpus::get() as u32
     } else {
@@ -249,28 +575,29 @@ fn train_dictionary(
         },
     };
 
-    let mut samples_len = 0;
+    let mut collector = SampleCollector::new(max_samples_size as usize, seed);
 
-    // Figure out total size of input samples. A side-effect is all elements are
-    // validated to be PyBytes.
-    for sample in samples.iter() {
-        let bytes = sample
-            .downcast::<PyBytes>()
-            .or_else(|_| Err(PyValueError::new_err("samples must be bytes")))?;
+    if let Ok(buffer) = samples.downcast::<ZstdBufferWithSegments>() {
+        let buffer = buffer.borrow();
 
-        samples_len += bytes.as_bytes().len();
-    }
-
-    let mut samples_buffer: Vec<u8> = Vec::with_capacity(samples_len);
-    let mut sample_sizes: Vec<libc::size_t> = Vec::with_capacity(samples.len());
+        for i in 0..buffer.segments.len() {
+            collector.add(buffer.get_segment_slice(py, i));
+        }
+    } else if samples.is_instance_of::<PyBytes>() || samples.is_instance_of::<PyString>() {
+        return Err(PyTypeError::new_err("samples must be an iterable of bytes"));
+    } else {
+        for sample in samples.iter()? {
+            let sample = sample?;
+            let bytes = sample
+                .downcast::<PyBytes>()
+                .or_else(|_| Err(PyValueError::new_err("samples must be bytes")))?;
 
-    for sample in samples.iter() {
-        let bytes = sample.downcast::<PyBytes>()?;
-        let data = bytes.as_bytes();
-        sample_sizes.push(data.len());
-        samples_buffer.extend_from_slice(data);
+            collector.add(bytes.as_bytes());
+        }
     }
 
+    let (samples_buffer, sample_sizes) = collector.finish();
+
     let mut dict_data: Vec<u8> = Vec::with_capacity(dict_size);
 
     train_dictionary_fastcover(&mut dict_data, &samples_buffer, &sample_sizes, &params)
@@ -281,7 +608,8 @@ fn train_dictionary(
         k: params.k,
         d: params.d,
         data: dict_data,
-        cdict: None,
+        cdict_cache_size: CDICT_CACHE_SIZE_DEFAULT,
+        cdicts: Mutex::new(CDictCache::default()),
         ddict: None,
     })
 }
@@ -57,6 +57,22 @@ impl<'a> CCtxParams<'a> {
         }
     }
 
+    pub fn get_parameter(&self, param: zstd_sys::ZSTD_cParameter) -> PyResult<c_int> {
+        let mut value: c_int = 0;
+
+        let zresult =
+            unsafe { zstd_sys::ZSTD_CCtxParams_getParameter(self.0, param, &mut value as *mut _) };
+
+        if unsafe { zstd_sys::ZSTD_isError(zresult) } != 0 {
+            return Err(ZstdError::new_err(format!(
+                "unable to retrieve parameter: {}",
+                zstd_safe::get_error_name(zresult)
+            )));
+        }
+
+        Ok(value)
+    }
+
     fn apply_compression_parameter(
         &self,
         py: Python,
@@ -28,6 +28,8 @@ pub struct ZstdCompressionWriter {
     closing: bool,
     closed: bool,
     bytes_compressed: usize,
+    /// Whether data was written since the current frame started.
+    frame_started: bool,
     dest_buffer: Vec<u8>,
 }
 
@@ -53,6 +55,7 @@ impl ZstdCompressionWriter {
             closing: false,
             closed: false,
             bytes_compressed: 0,
+            frame_started: false,
             dest_buffer: Vec::with_capacity(write_size),
         })
     }
@@ -238,6 +241,10 @@ impl ZstdCompressionWriter {
             pos: 0,
         };
 
+        if in_buffer.size > 0 {
+            self.frame_started = true;
+        }
+
         while in_buffer.pos < in_buffer.size {
             self.cctx
                 .compress_into_vec(
@@ -309,6 +316,10 @@ impl ZstdCompressionWriter {
             }
         }
 
+        if flush_mode == FLUSH_FRAME {
+            self.frame_started = false;
+        }
+
         if let Ok(flush) = self.writer.getattr(py, "flush") {
             if !self.closing {
                 flush.call0(py)?;
@@ -318,6 +329,62 @@ impl ZstdCompressionWriter {
         Ok(total_write)
     }
 
+    #[pyo3(signature = (data, magic_variant=0))]
+    fn write_skippable_frame(
+        &mut self,
+        py: Python,
+        data: PyBuffer<u8>,
+        magic_variant: u32,
+    ) -> PyResult<usize> {
+        if self.closed {
+            return Err(PyValueError::new_err("stream is closed"));
+        }
+
+        if magic_variant > 15 {
+            return Err(PyValueError::new_err(
+                "magic_variant must be between 0 and 15",
+            ));
+        }
+
+        let mut total_write = 0;
+
+        // Skippable frames can only appear between frames.
+        if self.frame_started {
+            total_write += self.flush(py, FLUSH_FRAME)?;
+        }
+
+        let mut frame: Vec<u8> =
+            Vec::with_capacity(data.len_bytes() + zstd_sys::ZSTD_SKIPPABLEHEADERSIZE as usize);
+
+        let zresult = unsafe {
+            zstd_sys::ZSTD_writeSkippableFrame(
+                frame.as_mut_ptr() as *mut _,
+                frame.capacity(),
+                data.buf_ptr(),
+                data.len_bytes(),
+                magic_variant,
+            )
+        };
+        if unsafe { zstd_sys::ZSTD_isError(zresult) } != 0 {
+            return Err(ZstdError::new_err(format!(
+                "cannot write skippable frame: {}",
+                zstd_safe::get_error_name(zresult)
+            )));
+        }
+
+        unsafe {
+            frame.set_len(zresult);
+        }
+
+        self.writer
+            .call_method1(py, "write", (PyBytes::new_bound(py, &frame),))?;
+
+        total_write += zresult;
+        self.bytes_compressed += zresult;
+
+        Ok(total_write)
+    }
+
     fn tell(&self) -> usize {
         self.bytes_compressed
     }
@@ -14,11 +14,17 @@ use {
         compression_writer::ZstdCompressionWriter,
         compressionobj::ZstdCompressionObj,
         compressor_iterator::ZstdCompressorIterator,
-        compressor_multi::multi_compress_to_buffer,
+        compressor_multi::{multi_compress_to_buffer, MultiCompressState},
+        thread_pool::ZstdThreadPool,
         zstd_safe::CCtx,
         ZstdError,
     },
-    pyo3::{buffer::PyBuffer, exceptions::PyValueError, prelude::*, types::PyBytes},
+    pyo3::{
+        buffer::PyBuffer,
+        exceptions::{PyTypeError, PyValueError},
+        prelude::*,
+        types::{PyBytes, PyDict},
+    },
     std::sync::Arc,
 };
 
@@ -28,20 +34,62 @@ struct ZstdCompressor {
     dict: Option<Py<ZstdCompressionDict>>,
     params: CCtxParams<'static>,
     cctx: Arc<CCtx<'static>>,
+    thread_pool: Option<Py<ZstdThreadPool>>,
+    multi_state: std::sync::Mutex<MultiCompressState>,
+    /// Expected size of inputs whose size isn't known. 0 if unset.
+    size_hint: i32,
 }
 
 impl ZstdCompressor {
     pub(crate) fn setup_cctx(&self, py: Python) -> PyResult<()> {
+        if let Some(pool) = &self.thread_pool {
+            self.cctx
+                .ref_thread_pool(&pool.borrow(py).pool)
+                .or_else(|msg| {
+                    Err(ZstdError::new_err(format!(
+                        "could not set thread pool: {}",
+                        msg
+                    )))
+                })?;
+        }
+
         self.cctx
             .set_parameters(&self.params)
             .or_else(|msg| Err(ZstdError::new_err(msg)))?;
 
         if let Some(dict) = &self.dict {
-            dict.borrow(py).load_into_cctx(&self.cctx)?;
+            dict.borrow(py).load_into_cctx(&self.cctx, &self.params)?;
         }
 
         Ok(())
     }
+
+    /// Set the source size hint used by the next operation.
+    ///
+    /// A hint of 0 restores the hint the compressor was constructed with.
+    /// Must be called after the context is reset.
+    fn set_size_hint(&self, size_hint: i32) -> PyResult<()> {
+        if size_hint < 0 {
+            return Err(PyValueError::new_err("size_hint must be non-negative"));
+        }
+
+        // ZSTD_c_srcSizeHint.
+        self.cctx
+            .set_parameter(
+                zstd_sys::ZSTD_cParameter::ZSTD_c_experimentalParam7,
+                if size_hint != 0 {
+                    size_hint
+                } else {
+                    self.size_hint
+                },
+            )
+            .or_else(|msg| {
+                Err(ZstdError::new_err(format!(
+                    "error setting source size hint: {}",
+                    msg
+                )))
+            })
+    }
 }
 
 #[pymethods]
@@ -55,6 +103,8 @@ impl ZstdCompressor {
         write_content_size=None,
         write_dict_id=None,
         threads=0,
+        thread_pool=None,
+        size_hint=0,
     ))]
     fn new(
         py: Python,
@@ -65,6 +115,8 @@ impl ZstdCompressor {
         write_content_size: Option<bool>,
         write_dict_id: Option<bool>,
         threads: i32,
+        thread_pool: Option<Py<ZstdThreadPool>>,
+        size_hint: i32,
     ) -> PyResult<Self> {
         if level > zstd_safe::max_c_level() {
             return Err(PyValueError::new_err(format!(
@@ -73,12 +125,24 @@ impl ZstdCompressor {
             )));
         }
 
+        if size_hint < 0 {
+            return Err(PyValueError::new_err("size_hint must be non-negative"));
+        }
+
         let threads = if threads < 0 {
             num_cpus::get() as i32
         } else {
             threads
         };
 
+        // Use all the threads in a shared pool unless told otherwise.
+        let threads = match &thread_pool {
+            Some(pool) if threads == 0 && compression_params.is_none() => {
+                pool.borrow(py).threads as i32
+            }
+            _ => threads,
+        };
+
         let cctx = Arc::new(CCtx::new().or_else(|msg| Err(PyErr::new::<ZstdError, _>(msg)))?);
         let params = CCtxParams::create()?;
 
@@ -134,11 +198,22 @@ impl ZstdCompressor {
             }
         }
 
+        if size_hint != 0 {
+            // ZSTD_c_srcSizeHint.
+            params.set_parameter(
+                zstd_sys::ZSTD_cParameter::ZSTD_c_experimentalParam7,
+                size_hint,
+            )?;
+        }
+
         let compressor = ZstdCompressor {
             _threads: threads,
             dict: dict_data,
             params,
             cctx,
+            thread_pool,
+            multi_state: std::sync::Mutex::new(MultiCompressState::default()),
+            size_hint,
         };
 
         compressor.setup_cctx(py)?;
@@ -174,13 +249,38 @@ impl ZstdCompressor {
         Ok(PyBytes::new_bound(py, &data))
     }
 
-    #[pyo3(signature = (size=None, chunk_size=None))]
+    fn compress_into(&self, py: Python, data: PyBuffer<u8>, out: PyBuffer<u8>) -> PyResult<usize> {
+        if out.readonly() {
+            return Err(PyTypeError::new_err("out must be a writable buffer"));
+        }
+
+        let source: &[u8] =
+            unsafe { std::slice::from_raw_parts(data.buf_ptr() as *const _, data.len_bytes()) };
+        let dest: &mut [u8] =
+            unsafe { std::slice::from_raw_parts_mut(out.buf_ptr() as *mut _, out.len_bytes()) };
+        let dest_size = dest.len();
+
+        let cctx = &self.cctx;
+
+        py.allow_threads(|| cctx.compress_into_slice(source, dest))
+            .map_err(|msg| ZstdError::new_err(format!("cannot compress: {}", msg)))?
+            .ok_or_else(|| {
+                ZstdError::new_err(format!(
+                    "output buffer too small: compressed data exceeds {} bytes",
+                    dest_size
+                ))
+            })
+    }
+
+    #[pyo3(signature = (size=None, chunk_size=None, size_hint=0))]
     fn chunker(
         &self,
         size: Option<u64>,
         chunk_size: Option<usize>,
+        size_hint: i32,
     ) -> PyResult<ZstdCompressionChunker> {
         self.cctx.reset();
+        self.set_size_hint(size_hint)?;
 
         let size = size.unwrap_or(zstd_safe::CONTENTSIZE_UNKNOWN);
         let chunk_size = chunk_size.unwrap_or_else(|| zstd_safe::CCtx::out_size());
@@ -195,9 +295,10 @@ impl ZstdCompressor {
         ZstdCompressionChunker::new(self.cctx.clone(), chunk_size)
     }
 
-    #[pyo3(signature = (size=None))]
-    fn compressobj(&self, size: Option<u64>) -> PyResult<ZstdCompressionObj> {
+    #[pyo3(signature = (size=None, size_hint=0))]
+    fn compressobj(&self, size: Option<u64>, size_hint: i32) -> PyResult<ZstdCompressionObj> {
         self.cctx.reset();
+        self.set_size_hint(size_hint)?;
 
         let size = if let Some(size) = size {
             size
@@ -246,6 +347,7 @@ impl ZstdCompressor {
         }
 
         self.cctx.reset();
+        self.set_size_hint(0)?;
         self.cctx
             .set_pledged_source_size(source_size)
             .or_else(|msg| {
@@ -339,7 +441,18 @@ impl ZstdCompressor {
         data: &Bound<'_, PyAny>,
         threads: isize,
     ) -> PyResult<ZstdBufferWithSegmentsCollection> {
-        multi_compress_to_buffer(py, &self.params, &self.dict, data, threads)
+        multi_compress_to_buffer(
+            py,
+            &self.params,
+            &self.dict,
+            &self.multi_state,
+            data,
+            threads,
+        )
+    }
+
+    fn multi_compress_stats<'p>(&self, py: Python<'p>) -> PyResult<Bound<'p, PyDict>> {
+        self.multi_state.lock().unwrap().stats(py)
     }
 
     #[pyo3(signature = (reader, size=None, read_size=None, write_size=None))]
@@ -356,6 +469,7 @@ impl ZstdCompressor {
         let write_size = write_size.unwrap_or_else(|| zstd_safe::CCtx::in_size());
 
         self.cctx.reset();
+        self.set_size_hint(0)?;
 
         ZstdCompressorIterator::new(py, self.cctx.clone(), reader, size, read_size, write_size)
     }
@@ -373,11 +487,12 @@ impl ZstdCompressor {
         let read_size = read_size.unwrap_or_else(|| zstd_safe::CCtx::in_size());
 
         self.cctx.reset();
+        self.set_size_hint(0)?;
 
         ZstdCompressionReader::new(py, self.cctx.clone(), source, size, read_size, closefd)
     }
 
-    #[pyo3(signature = (writer, size=None, write_size=None, write_return_read=true, closefd=true))]
+    #[pyo3(signature = (writer, size=None, write_size=None, write_return_read=true, closefd=true, size_hint=0))]
     fn stream_writer(
         &self,
         py: Python,
@@ -386,6 +501,7 @@ impl ZstdCompressor {
         write_size: Option<usize>,
         write_return_read: bool,
         closefd: bool,
+        size_hint: i32,
     ) -> PyResult<ZstdCompressionWriter> {
         if !writer.hasattr("write")? {
             return Err(PyValueError::new_err(
@@ -394,6 +510,7 @@ impl ZstdCompressor {
         }
 
         self.cctx.reset();
+        self.set_size_hint(size_hint)?;
 
         let size = size.unwrap_or(zstd_sys::ZSTD_CONTENTSIZE_UNKNOWN as _);
         let write_size = write_size.unwrap_or_else(|| unsafe { zstd_sys::ZSTD_CStreamOutSize() });
@@ -16,11 +16,97 @@ use {
         buffer::PyBuffer,
         exceptions::{PyTypeError, PyValueError},
         prelude::*,
-        types::{PyBytes, PyList, PyTuple},
+        types::{PyBytes, PyDict, PyList, PyTuple},
     },
     rayon::prelude::*,
+    std::sync::Mutex,
 };
 
+// Cost model used to pick the number of workers. Dispatching work to another
+// thread has a fixed cost. For batches of small inputs, that cost can exceed
+// the cost of compressing everything on the calling thread. So we estimate how
+// long compressing the batch will take and only add a worker for every
+// MULTI_COMPRESS_MIN_WORKER_USEC of estimated work.
+const MULTI_COMPRESS_MIN_WORKER_USEC: usize = 200;
+const MULTI_COMPRESS_ITEM_OVERHEAD_USEC: usize = 1;
+
+/// Conservative single core compression throughput in bytes per microsecond.
+fn compress_bytes_per_usec(level: i32) -> usize {
+    match level {
+        i32::MIN..=0 => 600,
+        1..=2 => 300,
+        3..=4 => 150,
+        5..=9 => 50,
+        10..=15 => 15,
+        _ => 3,
+    }
+}
+
+fn multi_compress_thread_count(
+    params: &CCtxParams,
+    sources: &[DataSource],
+    total_source_size: usize,
+    thread_count: usize,
+) -> PyResult<usize> {
+    // More threads than inputs makes no sense.
+    let thread_count = std::cmp::min(thread_count, sources.len());
+
+    if thread_count < 2 {
+        return Ok(1);
+    }
+
+    let level = match params.get_parameter(zstd_sys::ZSTD_cParameter::ZSTD_c_compressionLevel)? {
+        0 => zstd_sys::ZSTD_CLEVEL_DEFAULT as i32,
+        level => level,
+    };
+
+    let cost_usec = total_source_size / compress_bytes_per_usec(level)
+        + sources.len() * MULTI_COMPRESS_ITEM_OVERHEAD_USEC;
+
+    Ok((cost_usec / MULTI_COMPRESS_MIN_WORKER_USEC).clamp(1, thread_count))
+}
+
+/// Worker threads and counters retained between multi_compress_to_buffer() calls.
+#[derive(Default)]
+pub struct MultiCompressState {
+    pool: Option<rayon::ThreadPool>,
+    pool_threads: usize,
+    single_threaded_calls: u64,
+    multi_threaded_calls: u64,
+    threads_started: u64,
+    last_threads: usize,
+}
+
+impl MultiCompressState {
+    fn ensure_pool(&mut self, thread_count: usize) -> PyResult<&rayon::ThreadPool> {
+        if self.pool_threads < thread_count {
+            let pool = rayon::ThreadPoolBuilder::new()
+                .num_threads(thread_count)
+                .build()
+                .map_err(|err| {
+                    ZstdError::new_err(format!("error initializing thread pool: {}", err))
+                })?;
+
+            self.threads_started += (thread_count - self.pool_threads) as u64;
+            self.pool = Some(pool);
+            self.pool_threads = thread_count;
+        }
+
+        Ok(self.pool.as_ref().unwrap())
+    }
+
+    pub fn stats<'p>(&self, py: Python<'p>) -> PyResult<Bound<'p, PyDict>> {
+        let stats = PyDict::new_bound(py);
+        stats.set_item("single_threaded_calls", self.single_threaded_calls)?;
+        stats.set_item("multi_threaded_calls", self.multi_threaded_calls)?;
+        stats.set_item("threads_started", self.threads_started)?;
+        stats.set_item("last_threads", self.last_threads)?;
+        stats.set_item("pool_threads", self.pool_threads)?;
+
+        Ok(stats)
+    }
+}
+
 struct DataSource<'a> {
     data: &'a [u8],
 }
@@ -29,6 +115,7 @@ pub fn multi_compress_to_buffer(
     py: Python,
     params: &CCtxParams,
     dict: &Option<Py<ZstdCompressionDict>>,
+    state: &Mutex<MultiCompressState>,
     data: &Bound<'_, PyAny>,
     threads: isize,
 ) -> PyResult<ZstdBufferWithSegmentsCollection> {
@@ -96,7 +183,9 @@ pub fn multi_compress_to_buffer(
         return Err(PyValueError::new_err("source elements are empty"));
     }
 
-    compress_from_datasources(py, params, dict, sources, threads)
+    let threads = multi_compress_thread_count(params, &sources, total_source_size, threads)?;
+
+    compress_from_datasources(py, params, dict, state, sources, threads)
 }
 
 /// Holds results of an individual compression operation.
@@ -110,15 +199,10 @@ fn compress_from_datasources(
     py: Python,
     params: &CCtxParams,
     dict: &Option<Py<ZstdCompressionDict>>,
+    state: &Mutex<MultiCompressState>,
     sources: Vec<DataSource>,
     thread_count: usize,
 ) -> PyResult<ZstdBufferWithSegmentsCollection> {
-    // More threads than inputs makes no sense.
-    let thread_count = std::cmp::min(thread_count, sources.len());
-
-    // TODO lower thread count when input size is too small and threads
-    // would add overhead.
-
     let mut cctxs = Vec::with_capacity(thread_count);
     let results = std::sync::Mutex::new(Vec::with_capacity(sources.len()));
 
@@ -133,42 +217,64 @@ fn compress_from_datasources(
         })?;
 
         if let Some(dict) = dict {
-            dict.borrow(py).load_into_cctx(&cctx)?;
+            dict.borrow(py).load_into_cctx(&cctx, params)?;
         }
 
         cctxs.push(cctx);
     }
 
-    let pool = rayon::ThreadPoolBuilder::new()
-        .num_threads(thread_count)
-        .build()
-        .map_err(|err| ZstdError::new_err(format!("error initializing thread pool: {}", err)))?;
+    let compress_source = |cctx: &CCtx, index: usize, source: &DataSource| {
+        let mut result = WorkerResult {
+            source_offset: index,
+            error: None,
+            data: None,
+        };
+
+        match cctx.compress(source.data) {
+            Ok(chunk) => {
+                result.data = Some(chunk);
+            }
+            Err(msg) => {
+                result.error = Some(msg);
+            }
+        }
+
+        // TODO we can do better than a shared lock.
+        results.lock().unwrap().push(result);
+    };
 
-    pool.install(|| {
-        sources.par_iter().enumerate().for_each(|(index, source)| {
-            let thread_index = pool.current_thread_index().unwrap();
+    let mut state = state.lock().unwrap();
+    state.last_threads = thread_count;
 
-            let cctx = &cctxs[thread_index];
+    if thread_count > 1 {
+        state.multi_threaded_calls += 1;
 
-            let mut result = WorkerResult {
-                source_offset: index,
-                error: None,
-                data: None,
-            };
+        let pool = state.ensure_pool(thread_count)?;
 
-            match cctx.compress(source.data) {
-                Ok(chunk) => {
-                    result.data = Some(chunk);
-                }
-                Err(msg) => {
-                    result.error = Some(msg);
-                }
-            }
+        // The pool may have more threads than we want to use. So split the
+        // work into thread_count chunks and give each chunk its own context.
+        let chunk_size = (sources.len() + thread_count - 1) / thread_count;
 
-            // TODO we can do better than a shared lock.
-            results.lock().unwrap().push(result);
+        pool.install(|| {
+            sources
+                .par_chunks(chunk_size)
+                .zip(cctxs.par_iter())
+                .enumerate()
+                .for_each(|(chunk_index, (chunk, cctx))| {
+                    for (i, source) in chunk.iter().enumerate() {
+                        compress_source(cctx, chunk_index * chunk_size + i, source);
+                    }
+                });
         });
-    });
+    } else {
+        state.single_threaded_calls += 1;
+
+        for (index, source) in sources.iter().enumerate() {
+            compress_source(&cctxs[0], index, source);
+        }
+    }
+
+    drop(state);
 
     // Need to sort results by their input order or else results aren't
     // deterministic.
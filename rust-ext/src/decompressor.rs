@@ -10,24 +10,110 @@ use {
         decompression_reader::ZstdDecompressionReader,
         decompression_writer::ZstdDecompressionWriter, decompressionobj::ZstdDecompressionObj,
         decompressor_iterator::ZstdDecompressorIterator,
-        decompressor_multi::multi_decompress_to_buffer, exceptions::ZstdError, zstd_safe::DCtx,
+        decompressor_multi::multi_decompress_to_buffer,
+        dictionary_registry::ZstdDictionaryRegistry, exceptions::ZstdError, zstd_safe::DCtx,
     },
     pyo3::{
         buffer::PyBuffer,
-        exceptions::{PyMemoryError, PyValueError},
+        exceptions::{PyMemoryError, PyTypeError, PyValueError},
         prelude::*,
         types::{PyBytes, PyList},
         wrap_pyfunction,
     },
-    std::sync::Arc,
+    std::sync::{
+        atomic::{AtomicU64, Ordering},
+        Arc,
+    },
 };
 
+/// Assumed compression ratio when estimating the decompressed size of frames
+/// that don't record their content size.
+const DECOMPRESS_ESTIMATED_RATIO: usize = 4;
+
+/// Estimate the decompressed size of a frame that doesn't record it.
+///
+/// Assumes a typical compression ratio, capped by the most the frame's blocks
+/// can decompress to. The estimate only sizes the initial output allocation.
+fn estimate_content_size(frame: &[u8]) -> usize {
+    let estimate = frame
+        .len()
+        .saturating_mul(DECOMPRESS_ESTIMATED_RATIO)
+        .max(zstd_safe::DCtx::out_size());
+
+    let bound = unsafe { zstd_sys::ZSTD_decompressBound(frame.as_ptr() as *const _, frame.len()) };
+
+    if bound != zstd_sys::ZSTD_CONTENTSIZE_ERROR as _ && bound < estimate as u64 {
+        bound as usize
+    } else {
+        estimate
+    }
+}
+
+/// Find the extent of the run of complete frames at the start of input.
+///
+/// Returns the number of input bytes occupied by frames, the sum of content
+/// sizes of frames recording it, the number of frames that don't, and the
+/// estimated total content size of all frames. Scanning stops at data that
+/// isn't the start of a frame.
+fn scan_frames(data: &[u8]) -> PyResult<(usize, usize, usize, usize)> {
+    let mut offset = 0;
+    let mut content_size: usize = 0;
+    let mut unknown_count = 0;
+    let mut estimated_size: usize = 0;
+
+    while offset < data.len() {
+        let remaining = &data[offset..];
+
+        let frame_content_size = unsafe {
+            zstd_sys::ZSTD_getFrameContentSize(remaining.as_ptr() as *const _, remaining.len())
+        };
+        if frame_content_size == zstd_sys::ZSTD_CONTENTSIZE_ERROR as _ {
+            break;
+        }
+
+        let frame_size = unsafe {
+            zstd_sys::ZSTD_findFrameCompressedSize(remaining.as_ptr() as *const _, remaining.len())
+        };
+        if unsafe { zstd_sys::ZSTD_isError(frame_size) } != 0 {
+            return Err(ZstdError::new_err(
+                "decompression error: did not decompress full frame",
+            ));
+        }
+
+        if frame_content_size == zstd_sys::ZSTD_CONTENTSIZE_UNKNOWN as _ {
+            unknown_count += 1;
+            estimated_size =
+                estimated_size.saturating_add(estimate_content_size(&remaining[..frame_size]));
+        } else {
+            content_size = usize::try_from(frame_content_size)
+                .ok()
+                .and_then(|size| content_size.checked_add(size))
+                .filter(|size| *size <= isize::MAX as usize)
+                .ok_or_else(|| {
+                    ZstdError::new_err("frame is too large to decompress on this platform")
+                })?;
+        }
+
+        offset += frame_size;
+    }
+
+    Ok((
+        offset,
+        content_size,
+        unknown_count,
+        estimated_size.saturating_add(content_size),
+    ))
+}
+
 #[pyclass(module = "zstandard.backend_rust")]
 struct ZstdDecompressor {
     dict_data: Option<Py<ZstdCompressionDict>>,
     max_window_size: usize,
     format: zstd_sys::ZSTD_format_e,
     dctx: Arc<DCtx<'static>>,
+    dict_registry: Option<Py<ZstdDictionaryRegistry>>,
+    /// Registry version the context's dictionaries were last synchronized with.
+    registry_version: AtomicU64,
 }
 
 impl ZstdDecompressor {
@@ -54,19 +140,270 @@ impl ZstdDecompressor {
             }
         }
 
+        if let Some(registry) = &self.dict_registry {
+            if load_dict {
+                // Reference everything currently cached by the registry so
+                // streaming operations can use it.
+                let (version, cached) = registry.borrow(py).cached();
+
+                if version != self.registry_version.load(Ordering::Relaxed) {
+                    for (dict_id, ddict) in cached {
+                        self.dctx.ref_frame_dict(dict_id, &ddict).map_err(|msg| {
+                            ZstdError::new_err(format!(
+                                "unable to reference prepared dictionary: {}",
+                                msg
+                            ))
+                        })?;
+                    }
+
+                    self.registry_version.store(version, Ordering::Relaxed);
+                }
+            }
+        }
+
+        Ok(())
+    }
+
+    /// Replace the context once it references too many registry dictionaries.
+    ///
+    /// Dictionaries referenced by a context can't be released individually.
+    /// Streaming objects share the context, so it is only replaced when
+    /// nothing else uses it.
+    fn refresh_dctx(&mut self, py: Python) -> PyResult<()> {
+        if let Some(registry) = &self.dict_registry {
+            if self.dctx.frame_dict_count() > 2 * registry.borrow(py).max_cached()
+                && Arc::strong_count(&self.dctx) == 1
+            {
+                self.dctx = Arc::new(DCtx::new().map_err(|_| PyMemoryError::new_err(()))?);
+                self.registry_version.store(0, Ordering::Relaxed);
+            }
+        }
+
         Ok(())
     }
+
+    /// Reference the registry dictionaries needed by the frames in a buffer.
+    ///
+    /// If `all_frames` is false, only the first frame is examined.
+    fn select_frame_dicts(&self, py: Python, data: &[u8], all_frames: bool) -> PyResult<()> {
+        let registry = match &self.dict_registry {
+            Some(registry) => registry.borrow(py),
+            None => return Ok(()),
+        };
+
+        let mut offset = 0;
+
+        while offset < data.len() {
+            let remaining = &data[offset..];
+
+            let dict_id = unsafe {
+                zstd_sys::ZSTD_getDictID_fromFrame(remaining.as_ptr() as *const _, remaining.len())
+            };
+
+            if dict_id != 0 {
+                if let Some(ddict) = registry.get(py, dict_id)? {
+                    self.dctx.ref_frame_dict(dict_id, &ddict).map_err(|msg| {
+                        ZstdError::new_err(format!(
+                            "unable to reference prepared dictionary: {}",
+                            msg
+                        ))
+                    })?;
+                }
+            }
+
+            if !all_frames {
+                break;
+            }
+
+            let frame_size = unsafe {
+                zstd_sys::ZSTD_findFrameCompressedSize(
+                    remaining.as_ptr() as *const _,
+                    remaining.len(),
+                )
+            };
+            if unsafe { zstd_sys::ZSTD_isError(frame_size) } != 0 {
+                break;
+            }
+
+            offset += frame_size;
+        }
+
+        Ok(())
+    }
+
+    /// Decompress all input into an output buffer that grows as needed.
+    ///
+    /// The buffer starts at `initial_size` and doubles whenever it fills up,
+    /// up to `max_output_size` if non-0.
+    fn decompress_growable<'p>(
+        &self,
+        py: Python<'p>,
+        in_buffer: &mut zstd_sys::ZSTD_inBuffer,
+        initial_size: usize,
+        max_output_size: usize,
+    ) -> PyResult<Bound<'p, PyBytes>> {
+        let initial_size = if max_output_size != 0 {
+            initial_size.min(max_output_size)
+        } else {
+            initial_size
+        };
+
+        let mut dest_buffer: Vec<u8> = Vec::new();
+        dest_buffer
+            .try_reserve_exact(initial_size)
+            .map_err(|_| PyMemoryError::new_err(()))?;
+
+        loop {
+            let mut zresult;
+
+            // Frame boundaries return 0. Keep going while there is input and
+            // either room for output or a new frame to start.
+            loop {
+                zresult = self
+                    .dctx
+                    .decompress_into_vec(&mut dest_buffer, in_buffer)
+                    .map_err(|msg| ZstdError::new_err(format!("decompression error: {}", msg)))?;
+
+                if in_buffer.pos == in_buffer.size
+                    || (zresult != 0 && dest_buffer.len() == dest_buffer.capacity())
+                {
+                    break;
+                }
+            }
+
+            if zresult == 0 && in_buffer.pos == in_buffer.size {
+                break;
+            }
+
+            if dest_buffer.len() < dest_buffer.capacity() {
+                return Err(ZstdError::new_err(
+                    "decompression error: did not decompress full frame",
+                ));
+            }
+
+            if max_output_size != 0 && dest_buffer.capacity() >= max_output_size {
+                return Err(ZstdError::new_err(format!(
+                    "decompression error: decompressed data exceeds max_output_size of {} bytes",
+                    max_output_size
+                )));
+            }
+
+            let mut additional = dest_buffer.capacity().max(zstd_safe::DCtx::out_size());
+            if max_output_size != 0 {
+                additional = additional.min(max_output_size - dest_buffer.capacity());
+            }
+
+            dest_buffer
+                .try_reserve_exact(additional)
+                .map_err(|_| PyMemoryError::new_err(()))?;
+        }
+
+        // TODO avoid memory copy
+        Ok(PyBytes::new_bound(py, &dest_buffer))
+    }
+
+    /// Decompress a single frame that doesn't record its content size.
+    fn decompress_unknown_size<'p>(
+        &self,
+        py: Python<'p>,
+        buffer: &PyBuffer<u8>,
+        max_output_size: usize,
+        allow_extra_data: bool,
+    ) -> PyResult<Bound<'p, PyBytes>> {
+        let data: &[u8] =
+            unsafe { std::slice::from_raw_parts(buffer.buf_ptr() as *const _, buffer.len_bytes()) };
+
+        let frame_size = unsafe {
+            zstd_sys::ZSTD_findFrameCompressedSize(data.as_ptr() as *const _, data.len())
+        };
+        if unsafe { zstd_sys::ZSTD_isError(frame_size) } != 0 {
+            return Err(ZstdError::new_err(
+                "decompression error: did not decompress full frame",
+            ));
+        }
+
+        if !allow_extra_data && frame_size < data.len() {
+            return Err(ZstdError::new_err(format!(
+                "compressed input contains {} bytes of unused data, which is disallowed",
+                data.len() - frame_size
+            )));
+        }
+
+        let mut in_buffer = zstd_sys::ZSTD_inBuffer {
+            src: data.as_ptr() as *const _,
+            size: frame_size,
+            pos: 0,
+        };
+
+        self.decompress_growable(
+            py,
+            &mut in_buffer,
+            estimate_content_size(&data[..frame_size]),
+            max_output_size,
+        )
+    }
+
+    /// Decompress every frame in the input into a single output buffer.
+    fn decompress_frames<'p>(
+        &self,
+        py: Python<'p>,
+        buffer: &PyBuffer<u8>,
+        max_output_size: usize,
+        allow_extra_data: bool,
+    ) -> PyResult<Bound<'p, PyBytes>> {
+        let data: &[u8] =
+            unsafe { std::slice::from_raw_parts(buffer.buf_ptr() as *const _, buffer.len_bytes()) };
+
+        let (frames_size, content_size, unknown_count, estimated_size) = scan_frames(data)?;
+
+        if frames_size == 0 {
+            return Err(ZstdError::new_err(
+                "error determining content size from frame header",
+            ));
+        }
+
+        if !allow_extra_data && frames_size < data.len() {
+            return Err(ZstdError::new_err(format!(
+                "compressed input contains {} bytes of unused data, which is disallowed",
+                data.len() - frames_size
+            )));
+        }
+
+        let mut in_buffer = zstd_sys::ZSTD_inBuffer {
+            src: data.as_ptr() as *const _,
+            size: frames_size,
+            pos: 0,
+        };
+
+        // All frames record their content size: the output is exact.
+        if unknown_count == 0 {
+            if content_size == 0 {
+                return Ok(PyBytes::new_bound(py, &[]));
+            }
+
+            return self.decompress_growable(py, &mut in_buffer, content_size, 0);
+        }
+
+        self.decompress_growable(py, &mut in_buffer, estimated_size, max_output_size)
+    }
 }
 
 #[pymethods]
 impl ZstdDecompressor {
     #[new]
-    #[pyo3(signature = (dict_data=None, max_window_size=0, format=0))]
+    #[pyo3(signature = (dict_data=None, max_window_size=0, format=0, dict_registry=None))]
     fn new(
         dict_data: Option<Py<ZstdCompressionDict>>,
         max_window_size: usize,
         format: u32,
+        dict_registry: Option<Py<ZstdDictionaryRegistry>>,
     ) -> PyResult<Self> {
+        if dict_data.is_some() && dict_registry.is_some() {
+            return Err(PyValueError::new_err(
+                "cannot use both dict_data and dict_registry",
+            ));
+        }
+
         let format = if format == zstd_sys::ZSTD_format_e::ZSTD_f_zstd1 as _ {
             zstd_sys::ZSTD_format_e::ZSTD_f_zstd1
         } else if format == zstd_sys::ZSTD_format_e::ZSTD_f_zstd1_magicless as _ {
@@ -82,6 +419,8 @@ impl ZstdDecompressor {
             max_window_size,
             format,
             dctx,
+            dict_registry,
+            registry_version: AtomicU64::new(0),
         })
     }
 
@@ -168,17 +507,34 @@ impl ZstdDecompressor {
         read_across_frames: bool,
         allow_extra_data: bool,
     ) -> PyResult<Bound<'p, PyBytes>> {
-        if read_across_frames {
-            return Err(ZstdError::new_err(
-                "ZstdDecompressor.read_across_frames=True is not yet implemented",
-            ));
+        self.refresh_dctx(py)?;
+        self.setup_dctx(py, true)?;
+
+        if self.dict_registry.is_some() {
+            let data = unsafe {
+                std::slice::from_raw_parts(buffer.buf_ptr() as *const u8, buffer.len_bytes())
+            };
+            self.select_frame_dicts(py, data, read_across_frames)?;
         }
 
-        self.setup_dctx(py, true)?;
+        if read_across_frames {
+            return self.decompress_frames(py, &buffer, max_output_size, allow_extra_data);
+        }
 
         let output_size =
             unsafe { zstd_sys::ZSTD_getFrameContentSize(buffer.buf_ptr(), buffer.len_bytes()) };
 
+        if output_size == zstd_sys::ZSTD_CONTENTSIZE_UNKNOWN as _ {
+            if max_output_size == 0 {
+                return Err(ZstdError::new_err(
+                    "could not determine content size in frame header",
+                ));
+            }
+
+            // Grow output from an estimate, up to max_output_size.
+            return self.decompress_unknown_size(py, &buffer, max_output_size, allow_extra_data);
+        }
+
         let (output_buffer_size, output_size) =
             if output_size == zstd_sys::ZSTD_CONTENTSIZE_ERROR as _ {
                 return Err(ZstdError::new_err(
@@ -186,14 +542,6 @@ impl ZstdDecompressor {
                 ));
             } else if output_size == 0 {
                 return Ok(PyBytes::new_bound(py, &[]));
-            } else if output_size == zstd_sys::ZSTD_CONTENTSIZE_UNKNOWN as _ {
-                if max_output_size == 0 {
-                    return Err(ZstdError::new_err(
-                        "could not determine content size in frame header",
-                    ));
-                }
-
-                (max_output_size, 0)
             } else {
                 (output_size as _, output_size)
             };
@@ -234,6 +582,90 @@ impl ZstdDecompressor {
         }
     }
 
+    #[pyo3(signature = (data, out, allow_extra_data=true))]
+    fn decompress_into(
+        &mut self,
+        py: Python,
+        data: PyBuffer<u8>,
+        out: PyBuffer<u8>,
+        allow_extra_data: bool,
+    ) -> PyResult<usize> {
+        if out.readonly() {
+            return Err(PyTypeError::new_err("out must be a writable buffer"));
+        }
+
+        self.refresh_dctx(py)?;
+        self.setup_dctx(py, true)?;
+
+        if self.dict_registry.is_some() {
+            let source = unsafe {
+                std::slice::from_raw_parts(data.buf_ptr() as *const u8, data.len_bytes())
+            };
+            self.select_frame_dicts(py, source, false)?;
+        }
+
+        let output_size =
+            unsafe { zstd_sys::ZSTD_getFrameContentSize(data.buf_ptr(), data.len_bytes()) };
+
+        let output_size = if output_size == zstd_sys::ZSTD_CONTENTSIZE_ERROR as _ {
+            return Err(ZstdError::new_err(
+                "error determining content size from frame header",
+            ));
+        } else if output_size == zstd_sys::ZSTD_CONTENTSIZE_UNKNOWN as _ {
+            0
+        } else if output_size > out.len_bytes() as _ {
+            return Err(ZstdError::new_err(format!(
+                "output buffer too small: frame content size {} exceeds {} bytes",
+                output_size,
+                out.len_bytes()
+            )));
+        } else {
+            output_size
+        };
+
+        let mut out_buffer = zstd_sys::ZSTD_outBuffer {
+            dst: out.buf_ptr(),
+            size: out.len_bytes(),
+            pos: 0,
+        };
+
+        let mut in_buffer = zstd_sys::ZSTD_inBuffer {
+            src: data.buf_ptr(),
+            size: data.len_bytes(),
+            pos: 0,
+        };
+
+        let zresult = self
+            .dctx
+            .decompress_buffers(&mut out_buffer, &mut in_buffer)
+            .map_err(|msg| ZstdError::new_err(format!("decompression error: {}", msg)))?;
+
+        if zresult != 0 {
+            if out_buffer.pos == out_buffer.size {
+                Err(ZstdError::new_err(format!(
+                    "output buffer too small: decompressed data exceeds {} bytes",
+                    out_buffer.size
+                )))
+            } else {
+                Err(ZstdError::new_err(
+                    "decompression error: did not decompress full frame",
+                ))
+            }
+        } else if output_size != 0 && out_buffer.pos != output_size as _ {
+            Err(ZstdError::new_err(format!(
+                "decompression error: decompressed {} bytes; expected {}",
+                out_buffer.pos, output_size
+            )))
+        } else if !allow_extra_data && in_buffer.pos < in_buffer.size {
+            Err(ZstdError::new_err(format!(
+                "compressed input contains {} bytes of unused data, which is disallowed",
+                in_buffer.size - in_buffer.pos
+            )))
+        } else {
+            Ok(out_buffer.pos)
+        }
+    }
+
     fn decompress_content_dict_chain<'p>(
         &self,
         py: Python<'p>,
@@ -409,6 +841,7 @@ impl ZstdDecompressor {
         multi_decompress_to_buffer(
             py,
             self.dict_data.as_ref(),
+            self.dict_registry.as_ref(),
             frames,
             decompressed_sizes,
             threads,
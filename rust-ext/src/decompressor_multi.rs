@@ -8,6 +8,7 @@ use {
     crate::{
         buffers::{BufferSegment, ZstdBufferWithSegments, ZstdBufferWithSegmentsCollection},
         compression_dict::ZstdCompressionDict,
+        dictionary_registry::ZstdDictionaryRegistry,
         exceptions::ZstdError,
         zstd_safe::DCtx,
     },
@@ -20,14 +21,39 @@ use {
     rayon::prelude::*,
 };
 
+// Cost model used to pick the number of workers, like the one of
+// multi_compress_to_buffer(). A worker is only added for every
+// MULTI_DECOMPRESS_MIN_WORKER_USEC of estimated work. Decompression speed
+// barely depends on settings, so a single conservative estimate of compressed
+// input consumed per microsecond is used.
+const MULTI_DECOMPRESS_MIN_WORKER_USEC: usize = 200;
+const MULTI_DECOMPRESS_ITEM_OVERHEAD_USEC: usize = 1;
+const MULTI_DECOMPRESS_BYTES_PER_USEC: usize = 300;
+
 struct DataSource<'a> {
     data: &'a [u8],
     decompressed_size: usize,
 }
 
+fn multi_decompress_thread_count(sources: &[DataSource], thread_count: usize) -> usize {
+    // More threads than inputs makes no sense.
+    let thread_count = std::cmp::min(thread_count, sources.len());
+
+    if thread_count < 2 {
+        return 1;
+    }
+
+    let total_size: usize = sources.iter().map(|source| source.data.len()).sum();
+    let cost_usec = total_size / MULTI_DECOMPRESS_BYTES_PER_USEC
+        + sources.len() * MULTI_DECOMPRESS_ITEM_OVERHEAD_USEC;
+
+    (cost_usec / MULTI_DECOMPRESS_MIN_WORKER_USEC).clamp(1, thread_count)
+}
+
 pub fn multi_decompress_to_buffer(
     py: Python,
     dict_data: Option<&Py<ZstdCompressionDict>>,
+    dict_registry: Option<&Py<ZstdDictionaryRegistry>>,
     frames: &Bound<'_, PyAny>,
     decompressed_sizes: Option<&Bound<'_, PyAny>>,
     threads: isize,
@@ -129,7 +155,7 @@ pub fn multi_decompress_to_buffer(
         ));
     }
 
-    decompress_from_datasources(py, dict_data, sources, threads)
+    decompress_from_datasources(py, dict_data, dict_registry, sources, threads)
 }
 
 #[derive(Debug, PartialEq)]
@@ -149,14 +175,33 @@ struct WorkerResult {
 fn decompress_from_datasources(
     py: Python,
     dict_data: Option<&Py<ZstdCompressionDict>>,
+    dict_registry: Option<&Py<ZstdDictionaryRegistry>>,
     sources: Vec<DataSource>,
     thread_count: usize,
 ) -> PyResult<ZstdBufferWithSegmentsCollection> {
-    // More threads than inputs makes no sense.
-    let thread_count = std::cmp::min(thread_count, sources.len());
+    // Resolve the registry dictionaries the frames need.
+    let mut registry_dicts = std::collections::HashMap::new();
 
-    // TODO lower thread count when input size is too small and threads
-    // would add overhead.
+    if let Some(registry) = dict_registry {
+        let registry = registry.borrow(py);
+
+        for source in &sources {
+            let dict_id = unsafe {
+                zstd_sys::ZSTD_getDictID_fromFrame(
+                    source.data.as_ptr() as *const _,
+                    source.data.len(),
+                )
+            };
+
+            if dict_id != 0 && !registry_dicts.contains_key(&dict_id) {
+                if let Some(ddict) = registry.get(py, dict_id)? {
+                    registry_dicts.insert(dict_id, ddict);
+                }
+            }
+        }
+    }
+
+    let thread_count = multi_decompress_thread_count(&sources, thread_count);
 
     let mut dctxs = Vec::with_capacity(thread_count);
     let results = std::sync::Mutex::new(Vec::with_capacity(sources.len()));
@@ -171,6 +216,12 @@ fn decompress_from_datasources(
             dict_data.borrow_mut(py).load_into_dctx(&dctx)?;
         }
 
+        for (dict_id, ddict) in &registry_dicts {
+            dctx.ref_frame_dict(*dict_id, ddict).map_err(|msg| {
+                ZstdError::new_err(format!("unable to reference prepared dictionary: {}", msg))
+            })?;
+        }
+
         dctxs.push(dctx);
     }
 
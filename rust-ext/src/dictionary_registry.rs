@@ -0,0 +1,184 @@
+// Copyright (c) 2024-present, Gregory Szorc
+// All rights reserved.
+//
+// This software may be modified and distributed under the terms
+// of the BSD license. See the LICENSE file for details.
+
+use {
+    crate::{compression_dict::ZstdCompressionDict, zstd_safe::DDict},
+    pyo3::{
+        exceptions::{PyKeyError, PyValueError},
+        prelude::*,
+        types::PyDict,
+    },
+    std::{
+        collections::{HashMap, VecDeque},
+        sync::{Arc, Mutex},
+    },
+};
+
+struct RegistryState {
+    /// Dictionaries registered by the caller, keyed by dictionary ID.
+    dicts: HashMap<u32, Py<ZstdCompressionDict>>,
+    /// Digested dictionaries, from least to most recently used.
+    cache: VecDeque<(u32, Arc<DDict<'static>>)>,
+    hits: u64,
+    misses: u64,
+    evictions: u64,
+    /// Incremented whenever a digested dictionary enters or leaves the cache.
+    version: u64,
+}
+
+impl RegistryState {
+    fn uncache(&mut self, dict_id: u32) {
+        if let Some(index) = self.cache.iter().position(|(id, _)| *id == dict_id) {
+            self.cache.remove(index);
+            self.version += 1;
+        }
+    }
+}
+
+#[pyclass(module = "zstandard.backend_rust")]
+pub struct ZstdDictionaryRegistry {
+    /// Maximum number of digested dictionaries to retain.
+    #[pyo3(get)]
+    max_cached: usize,
+
+    state: Mutex<RegistryState>,
+}
+
+impl ZstdDictionaryRegistry {
+    pub(crate) fn max_cached(&self) -> usize {
+        self.max_cached
+    }
+
+    /// Obtain the digested dictionary for a dictionary ID.
+    ///
+    /// Returns `None` if no dictionary is registered under the ID.
+    pub(crate) fn get(&self, py: Python, dict_id: u32) -> PyResult<Option<Arc<DDict<'static>>>> {
+        let mut state = self.state.lock().unwrap();
+
+        if let Some(index) = state.cache.iter().position(|(id, _)| *id == dict_id) {
+            state.hits += 1;
+
+            // Move to the most recently used end.
+            let entry = state.cache.remove(index).unwrap();
+            let ddict = entry.1.clone();
+            state.cache.push_back(entry);
+
+            return Ok(Some(ddict));
+        }
+
+        let source = match state.dicts.get(&dict_id) {
+            Some(source) => source.clone_ref(py),
+            None => return Ok(None),
+        };
+
+        state.misses += 1;
+
+        let ddict = Arc::new(source.try_borrow(py)?.to_owned_ddict()?);
+
+        state.cache.push_back((dict_id, ddict.clone()));
+        state.version += 1;
+
+        while state.cache.len() > self.max_cached {
+            state.cache.pop_front();
+            state.evictions += 1;
+        }
+
+        Ok(Some(ddict))
+    }
+
+    /// Obtain the cache version and the currently cached dictionaries.
+    pub(crate) fn cached(&self) -> (u64, Vec<(u32, Arc<DDict<'static>>)>) {
+        let state = self.state.lock().unwrap();
+
+        (state.version, state.cache.iter().cloned().collect())
+    }
+}
+
+#[pymethods]
+impl ZstdDictionaryRegistry {
+    #[new]
+    #[pyo3(signature = (max_cached=64))]
+    fn new(max_cached: isize) -> PyResult<Self> {
+        if max_cached < 1 {
+            return Err(PyValueError::new_err("max_cached must be positive"));
+        }
+
+        Ok(Self {
+            max_cached: max_cached as usize,
+            state: Mutex::new(RegistryState {
+                dicts: HashMap::new(),
+                cache: VecDeque::new(),
+                hits: 0,
+                misses: 0,
+                evictions: 0,
+                version: 1,
+            }),
+        })
+    }
+
+    fn __len__(&self) -> usize {
+        self.state.lock().unwrap().dicts.len()
+    }
+
+    fn __contains__(&self, dict_id: &Bound<'_, PyAny>) -> bool {
+        match dict_id.extract::<u32>() {
+            Ok(dict_id) => self.state.lock().unwrap().dicts.contains_key(&dict_id),
+            Err(_) => false,
+        }
+    }
+
+    fn add(&self, dict_data: &Bound<'_, ZstdCompressionDict>) -> PyResult<()> {
+        let dict_id = dict_data.borrow().dict_id();
+        if dict_id == 0 {
+            return Err(PyValueError::new_err(
+                "dictionary does not have a dictionary ID",
+            ));
+        }
+
+        let mut state = self.state.lock().unwrap();
+        state.dicts.insert(dict_id, dict_data.clone().unbind());
+        state.uncache(dict_id);
+
+        Ok(())
+    }
+
+    fn remove(&self, dict_id: u32) -> PyResult<()> {
+        let mut state = self.state.lock().unwrap();
+
+        if state.dicts.remove(&dict_id).is_none() {
+            return Err(PyKeyError::new_err(dict_id));
+        }
+        state.uncache(dict_id);
+
+        Ok(())
+    }
+
+    fn stats<'p>(&self, py: Python<'p>) -> PyResult<Bound<'p, PyDict>> {
+        let state = self.state.lock().unwrap();
+
+        let result = PyDict::new_bound(py);
+        result.set_item("hits", state.hits)?;
+        result.set_item("misses", state.misses)?;
+        result.set_item("evictions", state.evictions)?;
+        result.set_item("cached", state.cache.len())?;
+        result.set_item(
+            "memory",
+            state
+                .cache
+                .iter()
+                .map(|(_, ddict)| ddict.memory_size())
+                .sum::<usize>(),
+        )?;
+
+        Ok(result)
+    }
+}
+
+pub(crate) fn init_module(module: &Bound<'_, PyModule>) -> PyResult<()> {
+    module.add_class::<ZstdDictionaryRegistry>()?;
+
+    Ok(())
+}
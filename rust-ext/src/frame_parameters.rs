@@ -5,38 +5,57 @@
 // of the BSD license. See the LICENSE file for details.
 
 use {
-    crate::ZstdError,
-    pyo3::{buffer::PyBuffer, prelude::*, wrap_pyfunction},
+    crate::{buffers::ZstdBufferWithSegments, ZstdError},
+    pyo3::{
+        buffer::PyBuffer,
+        prelude::*,
+        types::{PyBytes, PyDict},
+        wrap_pyfunction,
+    },
 };
 
+/// Parameters of a frame.
+///
+/// Only the fields exposed to Python are stored, matching the C backend.
 #[pyclass(module = "zstandard.backend_rust")]
 struct FrameParameters {
-    header: zstd_sys::ZSTD_frameHeader,
+    content_size: libc::c_ulonglong,
+    window_size: libc::c_ulonglong,
+    dict_id: libc::c_uint,
+    has_checksum: bool,
+}
+
+impl From<&zstd_sys::ZSTD_frameHeader> for FrameParameters {
+    fn from(header: &zstd_sys::ZSTD_frameHeader) -> Self {
+        Self {
+            content_size: header.frameContentSize,
+            window_size: header.windowSize,
+            dict_id: header.dictID,
+            has_checksum: header.checksumFlag != 0,
+        }
+    }
 }
 
 #[pymethods]
 impl FrameParameters {
     #[getter]
     fn content_size(&self) -> PyResult<libc::c_ulonglong> {
-        Ok(self.header.frameContentSize)
+        Ok(self.content_size)
     }
 
     #[getter]
     fn window_size(&self) -> PyResult<libc::c_ulonglong> {
-        Ok(self.header.windowSize)
+        Ok(self.window_size)
     }
 
     #[getter]
     fn dict_id(&self) -> PyResult<libc::c_uint> {
-        Ok(self.header.dictID)
+        Ok(self.dict_id)
     }
 
     #[getter]
     fn has_checksum(&self) -> PyResult<bool> {
-        Ok(match self.header.checksumFlag {
-            0 => false,
-            _ => true,
-        })
+        Ok(self.has_checksum)
     }
 }
 
@@ -66,8 +85,7 @@ fn frame_header_size(data: PyBuffer<u8>) -> PyResult<usize> {
     Ok(zresult)
 }
 
-#[pyfunction]
-fn get_frame_parameters(py: Python, buffer: PyBuffer<u8>) -> PyResult<Py<FrameParameters>> {
+fn read_frame_header(buffer: &PyBuffer<u8>) -> PyResult<zstd_sys::ZSTD_frameHeader> {
     let raw_data = unsafe {
         std::slice::from_raw_parts::<u8>(buffer.buf_ptr() as *const _, buffer.len_bytes())
     };
@@ -98,15 +116,185 @@ fn get_frame_parameters(py: Python, buffer: PyBuffer<u8>) -> PyResult<Py<FramePa
             zresult
         )))
     } else {
-        Py::new(py, FrameParameters { header })
+        Ok(header)
     }
 }
 
+#[pyfunction]
+fn get_frame_parameters(py: Python, buffer: PyBuffer<u8>) -> PyResult<Py<FrameParameters>> {
+    let header = read_frame_header(&buffer)?;
+
+    Py::new(py, FrameParameters::from(&header))
+}
+
+#[pyfunction]
+fn frame_summary(
+    buffer: PyBuffer<u8>,
+) -> PyResult<(libc::c_ulonglong, libc::c_ulonglong, libc::c_uint, bool)> {
+    let header = read_frame_header(&buffer)?;
+
+    Ok((
+        header.frameContentSize,
+        header.windowSize,
+        header.dictID,
+        header.checksumFlag != 0,
+    ))
+}
+
+/// Columns of frame metadata produced by `scan_frames()`.
+#[derive(Default)]
+struct FrameIndex {
+    offset: Vec<u64>,
+    compressed_size: Vec<u64>,
+    content_size: Vec<u64>,
+    dict_id: Vec<u32>,
+    has_checksum: Vec<u8>,
+    window_size: Vec<u64>,
+    skippable: Vec<u8>,
+}
+
+impl FrameIndex {
+    /// Record the frames in `data[start..end]`.
+    ///
+    /// On failure, returns the offset of the bad frame and the zstd error code.
+    fn scan(&mut self, data: &[u8], start: usize, end: usize) -> Result<(), (usize, usize)> {
+        let mut offset = start;
+
+        while offset < end {
+            let source = &data[offset..end];
+
+            let frame_size = unsafe {
+                zstd_sys::ZSTD_findFrameCompressedSize(source.as_ptr() as *const _, source.len())
+            };
+            if unsafe { zstd_sys::ZSTD_isError(frame_size) } != 0 {
+                return Err((offset, frame_size));
+            }
+
+            let mut header = zstd_sys::ZSTD_frameHeader {
+                frameContentSize: 0,
+                windowSize: 0,
+                blockSizeMax: 0,
+                frameType: zstd_sys::ZSTD_frameType_e::ZSTD_frame,
+                headerSize: 0,
+                dictID: 0,
+                checksumFlag: 0,
+                _reserved1: 0,
+                _reserved2: 0,
+            };
+            let zresult = unsafe {
+                zstd_sys::ZSTD_getFrameHeader(
+                    &mut header,
+                    source.as_ptr() as *const _,
+                    source.len(),
+                )
+            };
+            if unsafe { zstd_sys::ZSTD_isError(zresult) } != 0 {
+                return Err((offset, zresult));
+            }
+
+            self.offset.push(offset as u64);
+            self.compressed_size.push(frame_size as u64);
+            self.content_size.push(header.frameContentSize);
+
+            if matches!(
+                header.frameType,
+                zstd_sys::ZSTD_frameType_e::ZSTD_skippableFrame
+            ) {
+                self.dict_id.push(0);
+                self.has_checksum.push(0);
+                self.window_size.push(0);
+                self.skippable.push(1);
+            } else {
+                self.dict_id.push(header.dictID);
+                self.has_checksum
+                    .push(if header.checksumFlag != 0 { 1 } else { 0 });
+                self.window_size.push(header.windowSize);
+                self.skippable.push(0);
+            }
+
+            offset += frame_size;
+        }
+
+        Ok(())
+    }
+}
+
+/// Convert a column to a `memoryview` of the given struct format.
+fn column_view<'p, T>(py: Python<'p>, values: &[T], format: &str) -> PyResult<Bound<'p, PyAny>> {
+    let data = unsafe {
+        std::slice::from_raw_parts(
+            values.as_ptr() as *const u8,
+            values.len() * std::mem::size_of::<T>(),
+        )
+    };
+
+    let memoryview = py.import_bound("builtins")?.getattr("memoryview")?;
+
+    memoryview
+        .call1((PyBytes::new_bound(py, data),))?
+        .call_method1("cast", (format,))
+}
+
+#[pyfunction]
+fn scan_frames<'p>(py: Python<'p>, data: &Bound<'p, PyAny>) -> PyResult<Bound<'p, PyDict>> {
+    let mut index = FrameIndex::default();
+
+    let result = if let Ok(buffer) = data.downcast::<ZstdBufferWithSegments>() {
+        let buffer = buffer.borrow();
+        let source: &[u8] = unsafe {
+            std::slice::from_raw_parts(
+                buffer.buffer.buf_ptr() as *const _,
+                buffer.buffer.len_bytes(),
+            )
+        };
+        let segments = &buffer.segments;
+
+        py.allow_threads(|| -> Result<(), (usize, usize)> {
+            for segment in segments {
+                let start = segment.offset as usize;
+                index.scan(source, start, start + segment.length as usize)?;
+            }
+
+            Ok(())
+        })
+    } else {
+        let buffer = PyBuffer::<u8>::get_bound(data)?;
+        let source: &[u8] =
+            unsafe { std::slice::from_raw_parts(buffer.buf_ptr() as *const _, buffer.len_bytes()) };
+
+        py.allow_threads(|| index.scan(source, 0, source.len()))
+    };
+
+    if let Err((offset, zresult)) = result {
+        return Err(ZstdError::new_err(format!(
+            "error scanning frame at offset {}: {}",
+            offset,
+            zstd_safe::get_error_name(zresult)
+        )));
+    }
+
+    let columns = PyDict::new_bound(py);
+    columns.set_item("offset", column_view(py, &index.offset, "Q")?)?;
+    columns.set_item(
+        "compressed_size",
+        column_view(py, &index.compressed_size, "Q")?,
+    )?;
+    columns.set_item("content_size", column_view(py, &index.content_size, "Q")?)?;
+    columns.set_item("dict_id", column_view(py, &index.dict_id, "I")?)?;
+    columns.set_item("has_checksum", column_view(py, &index.has_checksum, "B")?)?;
+    columns.set_item("window_size", column_view(py, &index.window_size, "Q")?)?;
+    columns.set_item("skippable", column_view(py, &index.skippable, "B")?)?;
+
+    Ok(columns)
+}
+
 pub(crate) fn init_module(module: &Bound<'_, PyModule>) -> PyResult<()> {
     module.add_class::<FrameParameters>()?;
     module.add_function(wrap_pyfunction!(frame_content_size, module)?)?;
     module.add_function(wrap_pyfunction!(frame_header_size, module)?)?;
+    module.add_function(wrap_pyfunction!(frame_summary, module)?)?;
     module.add_function(wrap_pyfunction!(get_frame_parameters, module)?)?;
+    module.add_function(wrap_pyfunction!(scan_frames, module)?)?;
 
     Ok(())
 }
@@ -23,9 +23,11 @@ mod decompressionobj;
 mod decompressor;
 mod decompressor_iterator;
 mod decompressor_multi;
+mod dictionary_registry;
 mod exceptions;
 mod frame_parameters;
 mod stream;
+mod thread_pool;
 mod zstd_safe;
 
 use exceptions::ZstdError;
@@ -34,6 +36,12 @@ use exceptions::ZstdError;
 // and debian/changelog as well.
 const VERSION: &'static str = "0.24.0.dev0";
 
+/// Private. Lets Python code resolve thread counts like the Rust code does.
+#[pyfunction]
+fn _cpu_count() -> usize {
+    num_cpus::get()
+}
+
 #[pymodule]
 fn backend_rust(py: Python, module: &Bound<'_, PyModule>) -> PyResult<()> {
     let features = PySet::new_bound(
@@ -45,6 +53,7 @@ fn backend_rust(py: Python, module: &Bound<'_, PyModule>) -> PyResult<()> {
         ],
     )?;
     module.add("backend_features", features)?;
+    module.add_function(wrap_pyfunction!(_cpu_count, module)?)?;
 
     crate::buffers::init_module(module)?;
     crate::compression_dict::init_module(module)?;
@@ -52,8 +61,10 @@ fn backend_rust(py: Python, module: &Bound<'_, PyModule>) -> PyResult<()> {
     crate::compressor::init_module(module)?;
     crate::constants::init_module(py, module)?;
     crate::decompressor::init_module(module)?;
+    crate::dictionary_registry::init_module(module)?;
     crate::exceptions::init_module(py, module)?;
     crate::frame_parameters::init_module(module)?;
+    crate::thread_pool::init_module(module)?;
 
     Ok(())
 }
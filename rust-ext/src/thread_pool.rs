@@ -0,0 +1,43 @@
+// Copyright (c) 2024-present, Gregory Szorc
+// All rights reserved.
+//
+// This software may be modified and distributed under the terms
+// of the BSD license. See the LICENSE file for details.
+
+use {
+    crate::{zstd_safe::ThreadPool, ZstdError},
+    pyo3::prelude::*,
+};
+
+#[pyclass(module = "zstandard.backend_rust")]
+pub struct ZstdThreadPool {
+    pub(crate) pool: ThreadPool,
+
+    /// Number of threads in the pool.
+    #[pyo3(get)]
+    pub(crate) threads: u32,
+}
+
+#[pymethods]
+impl ZstdThreadPool {
+    #[new]
+    #[pyo3(signature = (threads=-1))]
+    fn new(threads: i32) -> PyResult<Self> {
+        let threads = if threads < 0 {
+            num_cpus::get() as u32
+        } else {
+            threads as u32
+        }
+        .max(1);
+
+        let pool = ThreadPool::new(threads as usize).map_err(ZstdError::new_err)?;
+
+        Ok(Self { pool, threads })
+    }
+}
+
+pub(crate) fn init_module(module: &Bound<'_, PyModule>) -> PyResult<()> {
+    module.add_class::<ZstdThreadPool>()?;
+
+    Ok(())
+}
@@ -4,7 +4,14 @@
 // This software may be modified and distributed under the terms
 // of the BSD license. See the LICENSE file for details.
 
-use {crate::compression_parameters::CCtxParams, std::marker::PhantomData};
+use {
+    crate::compression_parameters::CCtxParams,
+    std::{
+        collections::HashMap,
+        marker::PhantomData,
+        sync::{Arc, Mutex},
+    },
+};
 
 /// Safe wrapper for ZSTD_CDict instances.
 pub struct CDict<'a> {
@@ -42,6 +49,10 @@ impl<'a> CDict<'a> {
             })
         }
     }
+
+    pub fn memory_size(&self) -> usize {
+        unsafe { zstd_sys::ZSTD_sizeof_CDict(self.ptr) }
+    }
 }
 
 impl<'a> Drop for CDict<'a> {
@@ -101,9 +112,71 @@ impl<'a> DDict<'a> {
             })
         }
     }
+
+    /// Create an instance holding its own copy of dictionary data.
+    pub fn copy_from_data(
+        data: &[u8],
+        content_type: zstd_sys::ZSTD_dictContentType_e,
+    ) -> Result<DDict<'static>, &'static str> {
+        let ptr = unsafe {
+            zstd_sys::ZSTD_createDDict_advanced(
+                data.as_ptr() as *const _,
+                data.len(),
+                zstd_sys::ZSTD_dictLoadMethod_e::ZSTD_dlm_byCopy,
+                content_type,
+                zstd_sys::ZSTD_customMem {
+                    customAlloc: None,
+                    customFree: None,
+                    opaque: std::ptr::null_mut(),
+                },
+            )
+        };
+        if ptr.is_null() {
+            Err("could not create decompression dict")
+        } else {
+            Ok(DDict {
+                ptr,
+                _phantom: PhantomData,
+            })
+        }
+    }
+
+    pub fn memory_size(&self) -> usize {
+        unsafe { zstd_sys::ZSTD_sizeof_DDict(self.ptr) }
+    }
+}
+
+/// Safe wrapper for ZSTD_threadPool instances.
+pub struct ThreadPool(*mut zstd_sys::ZSTD_threadPool);
+
+impl ThreadPool {
+    pub fn new(threads: usize) -> Result<Self, &'static str> {
+        let pool = unsafe { zstd_sys::ZSTD_createThreadPool(threads) };
+        if pool.is_null() {
+            return Err("unable to create thread pool");
+        }
+
+        Ok(Self(pool))
+    }
+}
+
+impl Drop for ThreadPool {
+    fn drop(&mut self) {
+        unsafe {
+            zstd_sys::ZSTD_freeThreadPool(self.0);
+        }
+    }
 }
 
-pub struct CCtx<'a>(*mut zstd_sys::ZSTD_CCtx, PhantomData<&'a ()>);
+unsafe impl Send for ThreadPool {}
+unsafe impl Sync for ThreadPool {}
+
+pub struct CCtx<'a>(
+    *mut zstd_sys::ZSTD_CCtx,
+    PhantomData<&'a ()>,
+    /// Precomputed dictionary referenced by the context.
+    Mutex<Option<Arc<CDict<'static>>>>,
+);
 
 impl<'a> Drop for CCtx<'a> {
     fn drop(&mut self) {
@@ -123,7 +196,7 @@ impl<'a> CCtx<'a> {
             return Err("could not allocate ZSTD_CCtx instance");
         }
 
-        Ok(Self(cctx, PhantomData))
+        Ok(Self(cctx, PhantomData, Mutex::new(None)))
     }
 
     pub fn cctx(&self) -> *mut zstd_sys::ZSTD_CCtx {
@@ -154,6 +227,19 @@ impl<'a> CCtx<'a> {
         }
     }
 
+    pub fn set_parameter(
+        &self,
+        param: zstd_sys::ZSTD_cParameter,
+        value: i32,
+    ) -> Result<(), &'static str> {
+        let zresult = unsafe { zstd_sys::ZSTD_CCtx_setParameter(self.0, param, value) };
+        if unsafe { zstd_sys::ZSTD_isError(zresult) } != 0 {
+            Err(zstd_safe::get_error_name(zresult))
+        } else {
+            Ok(())
+        }
+    }
+
     pub fn set_pledged_source_size(&self, size: u64) -> Result<(), &'static str> {
         let zresult = unsafe { zstd_sys::ZSTD_CCtx_setPledgedSrcSize(self.0, size) };
         if unsafe { zstd_sys::ZSTD_isError(zresult) } != 0 {
@@ -163,11 +249,24 @@ impl<'a> CCtx<'a> {
         }
     }
 
-    pub fn load_computed_dict<'b: 'a>(&'a self, cdict: &'b CDict) -> Result<(), &'static str> {
+    pub fn ref_thread_pool(&self, pool: &ThreadPool) -> Result<(), &'static str> {
+        let zresult = unsafe { zstd_sys::ZSTD_CCtx_refThreadPool(self.0, pool.0) };
+        if unsafe { zstd_sys::ZSTD_isError(zresult) } != 0 {
+            Err(zstd_safe::get_error_name(zresult))
+        } else {
+            Ok(())
+        }
+    }
+
+    pub fn load_computed_dict(&self, cdict: Arc<CDict<'static>>) -> Result<(), &'static str> {
         let zresult = unsafe { zstd_sys::ZSTD_CCtx_refCDict(self.0, cdict.ptr) };
         if unsafe { zstd_sys::ZSTD_isError(zresult) } != 0 {
             Err(zstd_safe::get_error_name(zresult))
         } else {
+            // The context only references the CDict. Retain it so it outlives
+            // eviction from the dictionary's cache.
+            *self.2.lock().unwrap() = Some(cdict);
+
             Ok(())
         }
     }
@@ -240,6 +339,45 @@ impl<'a> CCtx<'a> {
         }
     }
 
+    /// Compress data as a single frame into a caller-provided slice.
+    ///
+    /// Returns the number of bytes written or `None` if the frame doesn't fit.
+    pub fn compress_into_slice(
+        &self,
+        source: &[u8],
+        dest: &mut [u8],
+    ) -> Result<Option<usize>, &'static str> {
+        self.reset();
+
+        self.set_pledged_source_size(source.len() as _)?;
+
+        let mut in_buffer = zstd_sys::ZSTD_inBuffer {
+            src: source.as_ptr() as *const _,
+            size: source.len(),
+            pos: 0,
+        };
+
+        let mut out_buffer = zstd_sys::ZSTD_outBuffer {
+            dst: dest.as_mut_ptr() as *mut _,
+            size: dest.len(),
+            pos: 0,
+        };
+
+        let zresult = self.compress_buffers(
+            &mut out_buffer,
+            &mut in_buffer,
+            zstd_sys::ZSTD_EndDirective::ZSTD_e_end,
+        )?;
+
+        if zresult > 0 {
+            // Don't leave a partial frame behind for the next operation.
+            self.reset();
+            Ok(None)
+        } else {
+            Ok(Some(out_buffer.pos))
+        }
+    }
+
     /// Compress input data as part of a stream.
     ///
     /// Returns a tuple of the emitted compressed data, a slice of unconsumed input,
@@ -334,7 +472,15 @@ impl<'a> CCtx<'a> {
     }
 }
 
-pub struct DCtx<'a>(*mut zstd_sys::ZSTD_DCtx, PhantomData<&'a ()>);
+pub struct DCtx<'a>(
+    *mut zstd_sys::ZSTD_DCtx,
+    PhantomData<&'a ()>,
+    /// Dictionaries referenced by `ref_frame_dict()`, keyed by dictionary ID.
+    ///
+    /// zstd provides no way to release them individually, so they live as
+    /// long as the context.
+    Mutex<HashMap<u32, Arc<DDict<'static>>>>,
+);
 
 impl<'a> Drop for DCtx<'a> {
     fn drop(&mut self) {
@@ -354,7 +500,7 @@ impl<'a> DCtx<'a> {
             return Err("could not allocate ZSTD_DCtx instance");
         }
 
-        Ok(Self(dctx, PhantomData))
+        Ok(Self(dctx, PhantomData, Mutex::new(HashMap::new())))
     }
 
     pub fn dctx(&self) -> *mut zstd_sys::ZSTD_DCtx {
@@ -406,6 +552,46 @@ impl<'a> DCtx<'a> {
         }
     }
 
+    /// Reference a dictionary to be selected when a frame requests its ID.
+    pub fn ref_frame_dict(
+        &self,
+        dict_id: u32,
+        dict: &Arc<DDict<'static>>,
+    ) -> Result<(), &'static str> {
+        let mut dicts = self.2.lock().unwrap();
+
+        if let Some(existing) = dicts.get(&dict_id) {
+            if Arc::ptr_eq(existing, dict) {
+                return Ok(());
+            }
+        }
+
+        let zresult = unsafe {
+            zstd_sys::ZSTD_DCtx_setParameter(
+                self.0,
+                zstd_sys::ZSTD_dParameter::ZSTD_d_experimentalParam4,
+                zstd_sys::ZSTD_refMultipleDDicts_e::ZSTD_rmd_refMultipleDDicts as _,
+            )
+        };
+        if unsafe { zstd_sys::ZSTD_isError(zresult) } != 0 {
+            return Err(zstd_safe::get_error_name(zresult));
+        }
+
+        let zresult = unsafe { zstd_sys::ZSTD_DCtx_refDDict(self.0, dict.ptr) };
+        if unsafe { zstd_sys::ZSTD_isError(zresult) } != 0 {
+            return Err(zstd_safe::get_error_name(zresult));
+        }
+
+        dicts.insert(dict_id, dict.clone());
+
+        Ok(())
+    }
+
+    /// Number of dictionaries referenced by `ref_frame_dict()`.
+    pub fn frame_dict_count(&self) -> usize {
+        self.2.lock().unwrap().len()
+    }
+
     pub fn decompress_buffers(
         &self,
         out_buffer: &mut zstd_sys::ZSTD_outBuffer,
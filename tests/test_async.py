@@ -0,0 +1,240 @@
+import asyncio
+import concurrent.futures
+import unittest
+
+import zstandard as zstd
+
+
+class CountingExecutor(concurrent.futures.ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+class MockStreamWriter(object):
+    def __init__(self):
+        self.data = bytearray()
+        self.drain_count = 0
+        self.closed = False
+        self.wait_closed_called = False
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        self.drain_count += 1
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        self.wait_closed_called = True
+
+
+def make_reader(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class TestAsyncCompressionWriter(unittest.IsolatedAsyncioTestCase):
+    def test_invalid_writer(self):
+        with self.assertRaisesRegex(ValueError, "write\\(\\) and drain\\(\\)"):
+            zstd.AsyncZstdCompressionWriter(object())
+
+    async def test_roundtrip(self):
+        dest = MockStreamWriter()
+
+        async with zstd.AsyncZstdCompressionWriter(dest) as writer:
+            self.assertEqual(await writer.write(b"foo" * 1024), 3072)
+            self.assertEqual(await writer.write(b"bar" * 1024), 3072)
+
+        self.assertTrue(writer.closed)
+        self.assertTrue(dest.closed)
+        self.assertTrue(dest.wait_closed_called)
+        self.assertGreater(dest.drain_count, 0)
+        self.assertEqual(writer.tell(), len(dest.data))
+
+        dctx = zstd.ZstdDecompressor()
+        self.assertEqual(
+            dctx.decompress(bytes(dest.data), max_output_size=6144),
+            b"foo" * 1024 + b"bar" * 1024,
+        )
+
+        with self.assertRaisesRegex(ValueError, "stream is closed"):
+            await writer.write(b"foo")
+
+    async def test_size(self):
+        dest = MockStreamWriter()
+
+        writer = zstd.AsyncZstdCompressionWriter(dest, size=6, closefd=False)
+        await writer.write(b"foobar")
+        await writer.close()
+
+        self.assertFalse(dest.closed)
+        params = zstd.get_frame_parameters(bytes(dest.data))
+        self.assertEqual(params.content_size, 6)
+
+    async def test_flush(self):
+        dest = MockStreamWriter()
+        writer = zstd.AsyncZstdCompressionWriter(dest)
+
+        await writer.write(b"foo")
+        self.assertGreater(await writer.flush(), 0)
+
+        dobj = zstd.ZstdDecompressor().decompressobj()
+        self.assertEqual(dobj.decompress(bytes(dest.data)), b"foo")
+
+        await writer.write(b"bar")
+        await writer.flush(zstd.FLUSH_FRAME)
+        await writer.write(b"baz")
+        await writer.close()
+
+        dctx = zstd.ZstdDecompressor()
+        frames = list(
+            dctx.read_to_iter(bytes(dest.data), read_size=len(dest.data))
+        )
+        self.assertEqual(b"".join(frames), b"foobar")
+
+        reader = dctx.stream_reader(bytes(dest.data), read_across_frames=True)
+        self.assertEqual(reader.read(), b"foobarbaz")
+
+        with self.assertRaisesRegex(ValueError, "unknown flush_mode"):
+            await zstd.AsyncZstdCompressionWriter(dest).flush(42)
+
+    async def test_write_skippable_frame(self):
+        dest = MockStreamWriter()
+
+        async with zstd.AsyncZstdCompressionWriter(dest) as writer:
+            self.assertEqual(await writer.write_skippable_frame(b"meta0"), 13)
+            await writer.write(b"foo")
+            await writer.write_skippable_frame(b"meta1", magic_variant=3)
+            await writer.write(b"bar")
+
+            with self.assertRaisesRegex(
+                ValueError, "magic_variant must be between 0 and 15"
+            ):
+                await writer.write_skippable_frame(b"", magic_variant=-1)
+
+        self.assertEqual(writer.tell(), len(dest.data))
+        self.assertEqual(
+            list(zstd.iter_frames(bytes(dest.data))),
+            [(0, b"meta0"), (None, b"foo"), (3, b"meta1"), (None, b"bar")],
+        )
+
+    async def test_executor_threshold(self):
+        executor = CountingExecutor()
+        dest = MockStreamWriter()
+
+        try:
+            writer = zstd.AsyncZstdCompressionWriter(
+                dest, executor=executor, executor_threshold=1024
+            )
+
+            await writer.write(b"x" * 1023)
+            self.assertEqual(executor.submitted, 0)
+
+            await writer.write(b"x" * 1024)
+            self.assertEqual(executor.submitted, 1)
+
+            # Flushing buffered input is also offloaded.
+            await writer.close()
+            self.assertEqual(executor.submitted, 2)
+        finally:
+            executor.shutdown()
+
+        self.assertEqual(
+            zstd.ZstdDecompressor().decompress(
+                bytes(dest.data), max_output_size=2047
+            ),
+            b"x" * 2047,
+        )
+
+
+class TestAsyncDecompressionReader(unittest.IsolatedAsyncioTestCase):
+    def test_invalid_reader(self):
+        with self.assertRaisesRegex(ValueError, "read\\(\\) method"):
+            zstd.AsyncZstdDecompressionReader(object())
+
+    async def test_read(self):
+        source = b"foobar" * 8192
+        frame = zstd.ZstdCompressor().compress(source)
+
+        reader = zstd.AsyncZstdDecompressionReader(
+            make_reader(frame), read_size=16
+        )
+
+        chunks = []
+        while True:
+            chunk = await reader.read(1000)
+            if not chunk:
+                break
+
+            self.assertLessEqual(len(chunk), 1000)
+            chunks.append(chunk)
+
+        self.assertEqual(b"".join(chunks), source)
+        self.assertEqual(reader.tell(), len(source))
+
+        with self.assertRaisesRegex(ValueError, "cannot read negative"):
+            await reader.read(-2)
+
+        reader.close()
+        with self.assertRaisesRegex(ValueError, "stream is closed"):
+            await reader.read()
+
+    async def test_readall(self):
+        source = b"foobar" * 8192
+        frame = zstd.ZstdCompressor().compress(source)
+
+        async with zstd.AsyncZstdDecompressionReader(
+            make_reader(frame)
+        ) as reader:
+            self.assertEqual(await reader.read(0), b"")
+            self.assertEqual(await reader.read(), source)
+            self.assertEqual(await reader.read(), b"")
+
+    async def test_iter(self):
+        source = b"foobar" * 65536
+        frame = zstd.ZstdCompressor().compress(source)
+
+        reader = zstd.AsyncZstdDecompressionReader(make_reader(frame))
+        chunks = [chunk async for chunk in reader]
+
+        self.assertEqual(b"".join(chunks), source)
+
+    async def test_read_across_frames(self):
+        cctx = zstd.ZstdCompressor()
+        data = cctx.compress(b"foo") + cctx.compress(b"bar")
+
+        reader = zstd.AsyncZstdDecompressionReader(make_reader(data))
+        self.assertEqual(await reader.readall(), b"foo")
+
+        reader = zstd.AsyncZstdDecompressionReader(
+            make_reader(data), read_across_frames=True
+        )
+        self.assertEqual(await reader.readall(), b"foobar")
+
+    async def test_executor(self):
+        # A tiny input can expand to a large output, so it is still
+        # decompressed on the executor.
+        source = b"x" * 1048576
+        frame = zstd.ZstdCompressor().compress(source)
+        self.assertLess(len(frame), 128)
+        executor = CountingExecutor()
+
+        try:
+            reader = zstd.AsyncZstdDecompressionReader(
+                make_reader(frame),
+                read_size=len(frame),
+                executor=executor,
+            )
+            self.assertEqual(await reader.readall(), source)
+            self.assertEqual(executor.submitted, 1)
+        finally:
+            executor.shutdown()
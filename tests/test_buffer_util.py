@@ -1,10 +1,15 @@
 import struct
+import sys
 import unittest
 
 import zstandard as zstd
 
 ss = struct.Struct("=QQ")
 
+# The CFFI backend implements the buffer protocol with __buffer__, which
+# Python only honors starting with 3.12 (PEP 688).
+HAVE_BUFFER_PROTOCOL = zstd.backend != "cffi" or sys.version_info >= (3, 12)
+
 
 @unittest.skipUnless(
     "buffer_types" in zstd.backend_features, "buffer types not available"
@@ -64,6 +69,43 @@ class TestBufferWithSegments(unittest.TestCase):
         self.assertEqual(b[1].tobytes(), b"foox")
         self.assertEqual(b[2].tobytes(), b"fooxy")
 
+    def test_memoryview(self):
+        b = zstd.BufferWithSegments(
+            b"foofooxfooxy",
+            b"".join([ss.pack(0, 3), ss.pack(3, 4), ss.pack(7, 5)]),
+        )
+
+        if not HAVE_BUFFER_PROTOCOL:
+            for o in (b, b[1], b.segments()):
+                with self.assertRaises(TypeError):
+                    memoryview(o)
+
+            return
+
+        self.assertEqual(memoryview(b).tobytes(), b"foofooxfooxy")
+        self.assertEqual(memoryview(b[1]).tobytes(), b"foox")
+        self.assertEqual(
+            memoryview(b.segments()).tobytes(),
+            b"".join([ss.pack(0, 3), ss.pack(3, 4), ss.pack(7, 5)]),
+        )
+
+        view = memoryview(b[1])
+        self.assertTrue(view.readonly)
+        self.assertEqual(len(view), 4)
+
+    def test_segment_outlives_buffer(self):
+        b = zstd.BufferWithSegments(bytearray(b"foobar"), ss.pack(3, 3))
+        segment = b[0]
+        del b
+
+        self.assertEqual(segment.tobytes(), b"bar")
+
+    def test_segment_no_dict(self):
+        b = zstd.BufferWithSegments(b"foo", ss.pack(0, 3))
+
+        with self.assertRaises(AttributeError):
+            b[0].__dict__
+
 
 @unittest.skipUnless(
     "buffer_types" in zstd.backend_features, "buffer types not available"
@@ -128,3 +170,121 @@ class TestBufferWithSegmentsCollection(unittest.TestCase):
         self.assertEqual(c[0].tobytes(), b"foo")
         self.assertEqual(c[1].tobytes(), b"bar")
         self.assertEqual(c[2].tobytes(), b"baz")
+
+
+@unittest.skipUnless(
+    "buffer_types" in zstd.backend_features, "buffer types not available"
+)
+class TestBufferWithSegmentsBuilder(unittest.TestCase):
+    def test_arguments(self):
+        with self.assertRaisesRegex(ValueError, "hints must be non-negative"):
+            zstd.BufferWithSegmentsBuilder(size_hint=-1)
+
+        b = zstd.BufferWithSegmentsBuilder()
+
+        with self.assertRaises(TypeError):
+            b.append(None)
+
+        with self.assertRaises(TypeError):
+            b.extend(None)
+
+        with self.assertRaises(TypeError):
+            b.extend([b"foo", None])
+
+    def test_empty(self):
+        b = zstd.BufferWithSegmentsBuilder()
+        self.assertEqual(len(b), 0)
+        self.assertEqual(b.size, 0)
+
+        buffer = b.finish()
+        self.assertIsInstance(buffer, zstd.BufferWithSegments)
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(buffer.size, 0)
+        self.assertEqual(buffer.tobytes(), b"")
+
+    def test_append(self):
+        b = zstd.BufferWithSegmentsBuilder(size_hint=4, count_hint=1)
+        b.append(b"foo")
+        b.append(bytearray(b""))
+        b.append(memoryview(b"barbaz"))
+
+        self.assertEqual(len(b), 3)
+        self.assertEqual(b.size, 9)
+
+        buffer = b.finish()
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.size, 9)
+        self.assertEqual(buffer.tobytes(), b"foobarbaz")
+        self.assertEqual(buffer[0].tobytes(), b"foo")
+        self.assertEqual(buffer[1].tobytes(), b"")
+        self.assertEqual(buffer[2].offset, 3)
+        self.assertEqual(buffer[2].tobytes(), b"barbaz")
+
+        # The builder is reset and can be reused.
+        self.assertEqual(len(b), 0)
+        self.assertEqual(b.size, 0)
+        b.append(b"qux")
+        self.assertEqual(b.finish().tobytes(), b"qux")
+        self.assertEqual(buffer.tobytes(), b"foobarbaz")
+
+    def test_unused_hints(self):
+        b = zstd.BufferWithSegmentsBuilder(size_hint=1024, count_hint=16)
+        self.assertEqual(len(b), 0)
+        self.assertEqual(b.size, 0)
+
+        b.append(b"foo")
+        b.extend([b"bar"])
+
+        self.assertEqual(len(b), 2)
+        self.assertEqual(b.size, 6)
+
+        buffer = b.finish()
+        self.assertEqual(len(buffer), 2)
+        self.assertEqual(buffer.size, 6)
+        self.assertEqual(buffer.tobytes(), b"foobar")
+        self.assertEqual(buffer[1].offset, 3)
+
+    def test_extend(self):
+        b = zstd.BufferWithSegmentsBuilder()
+        b.extend([b"foo", bytearray(b"bar")])
+        b.extend(x for x in [b"baz"])
+        b.extend(
+            zstd.BufferWithSegments(
+                b"xxonetwo", b"".join([ss.pack(2, 3), ss.pack(5, 3)])
+            )
+        )
+        b.extend(
+            zstd.BufferWithSegmentsCollection(
+                zstd.BufferWithSegments(b"a", ss.pack(0, 1)),
+                zstd.BufferWithSegments(b"bc", ss.pack(0, 2)),
+            )
+        )
+
+        buffer = b.finish()
+        self.assertEqual(
+            [buffer[i].tobytes() for i in range(len(buffer))],
+            [b"foo", b"bar", b"baz", b"one", b"two", b"a", b"bc"],
+        )
+        self.assertEqual(buffer.tobytes(), b"foobarbazonetwoabc")
+
+    def test_many(self):
+        b = zstd.BufferWithSegmentsBuilder()
+        items = [b"x" * (i % 37) for i in range(5000)]
+        for item in items:
+            b.append(item)
+
+        buffer = b.finish()
+        self.assertEqual(len(buffer), len(items))
+        self.assertEqual(buffer.size, sum(map(len, items)))
+        self.assertEqual(buffer[4999].tobytes(), items[4999])
+
+    def test_multi_compress(self):
+        cctx = zstd.ZstdCompressor()
+        b = zstd.BufferWithSegmentsBuilder()
+        b.extend([b"foo" * 64, b"bar" * 64])
+
+        result = cctx.multi_compress_to_buffer(b.finish())
+        self.assertEqual(len(result), 2)
+
+        dctx = zstd.ZstdDecompressor()
+        self.assertEqual(dctx.decompress(result[1].tobytes()), b"bar" * 64)
@@ -0,0 +1,138 @@
+import os
+import pathlib
+import tempfile
+import unittest
+
+import zstandard as zstd
+
+
+class TestCompressFile(unittest.TestCase):
+    def test_roundtrip(self):
+        source = b"".join(b"line %d\n" % i for i in range(100000))
+
+        with tempfile.TemporaryDirectory() as td:
+            src = os.path.join(td, "src")
+            compressed = os.path.join(td, "src.zst")
+            dst = os.path.join(td, "dst")
+
+            with open(src, "wb") as fh:
+                fh.write(source)
+
+            read, written = zstd.compress_file(src, compressed, write_size=4096)
+            self.assertEqual(read, len(source))
+            self.assertEqual(written, os.path.getsize(compressed))
+
+            with open(compressed, "rb") as fh:
+                frame = fh.read()
+
+            params = zstd.get_frame_parameters(frame)
+            self.assertEqual(params.content_size, len(source))
+            self.assertEqual(zstd.ZstdDecompressor().decompress(frame), source)
+
+            read, written = zstd.decompress_file(
+                pathlib.Path(compressed), pathlib.Path(dst)
+            )
+            self.assertEqual(read, len(frame))
+            self.assertEqual(written, len(source))
+
+            with open(dst, "rb") as fh:
+                self.assertEqual(fh.read(), source)
+
+    def test_empty(self):
+        with tempfile.TemporaryDirectory() as td:
+            src = os.path.join(td, "src")
+            compressed = os.path.join(td, "src.zst")
+            dst = os.path.join(td, "dst")
+
+            with open(src, "wb"):
+                pass
+
+            zstd.compress_file(src, compressed)
+
+            with open(compressed, "rb") as fh:
+                self.assertEqual(fh.read(), zstd.ZstdCompressor().compress(b""))
+
+            self.assertEqual(zstd.decompress_file(compressed, dst), (9, 0))
+            self.assertEqual(os.path.getsize(dst), 0)
+
+            with open(compressed, "wb"):
+                pass
+
+            self.assertEqual(zstd.decompress_file(compressed, dst), (0, 0))
+
+    def test_custom_contexts(self):
+        samples = [b"foo%dbar" % i * 16 for i in range(1024)]
+        d = zstd.train_dictionary(8192, samples)
+
+        with tempfile.TemporaryDirectory() as td:
+            src = os.path.join(td, "src")
+            compressed = os.path.join(td, "src.zst")
+            dst = os.path.join(td, "dst")
+
+            with open(src, "wb") as fh:
+                fh.write(samples[0])
+
+            cctx = zstd.ZstdCompressor(dict_data=d, write_checksum=True)
+            zstd.compress_file(src, compressed, cctx=cctx)
+
+            with open(compressed, "rb") as fh:
+                params = zstd.get_frame_parameters(fh.read())
+
+            self.assertEqual(params.dict_id, d.dict_id())
+            self.assertTrue(params.has_checksum)
+
+            dctx = zstd.ZstdDecompressor(dict_data=d)
+            zstd.decompress_file(compressed, dst, dctx=dctx)
+
+            with open(dst, "rb") as fh:
+                self.assertEqual(fh.read(), samples[0])
+
+    def test_multiple_frames(self):
+        cctx = zstd.ZstdCompressor()
+
+        with tempfile.TemporaryDirectory() as td:
+            compressed = os.path.join(td, "src.zst")
+            dst = os.path.join(td, "dst")
+
+            with open(compressed, "wb") as fh:
+                fh.write(cctx.compress(b"foo"))
+                fh.write(cctx.compress(b"bar"))
+
+            zstd.decompress_file(compressed, dst)
+
+            with open(dst, "rb") as fh:
+                self.assertEqual(fh.read(), b"foobar")
+
+    def test_same_file(self):
+        source = b"foo" * 1024
+
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "src")
+            link = os.path.join(td, "link")
+
+            with open(path, "wb") as fh:
+                fh.write(source)
+
+            os.link(path, link)
+
+            for fn in (zstd.compress_file, zstd.decompress_file):
+                for dst in (path, link):
+                    with self.assertRaisesRegex(
+                        ValueError, "source and destination are the same file"
+                    ):
+                        fn(path, dst)
+
+            with open(path, "rb") as fh:
+                self.assertEqual(fh.read(), source)
+
+    def test_missing_source(self):
+        with tempfile.TemporaryDirectory() as td:
+            with self.assertRaises(FileNotFoundError):
+                zstd.compress_file(
+                    os.path.join(td, "missing"), os.path.join(td, "dst")
+                )
+
+            with self.assertRaises(FileNotFoundError):
+                zstd.decompress_file(
+                    os.path.join(td, "missing"), os.path.join(td, "dst")
+                )
@@ -11,3 +11,24 @@ class TestCompressor(unittest.TestCase):
     def test_memory_size(self):
         cctx = zstd.ZstdCompressor(level=1)
         self.assertGreater(cctx.memory_size(), 100)
+
+    def test_size_hint(self):
+        with self.assertRaisesRegex(
+            ValueError, "size_hint must be non-negative"
+        ):
+            zstd.ZstdCompressor(size_hint=-1)
+
+        cctx = zstd.ZstdCompressor(level=19)
+        hinted = zstd.ZstdCompressor(level=19, size_hint=1000)
+
+        for c in (cctx, hinted):
+            cobj = c.compressobj()
+            cobj.compress(b"foo" * 64)
+            cobj.flush()
+
+        self.assertLess(hinted.memory_size(), cctx.memory_size())
+
+        # The hint doesn't affect inputs of known size.
+        self.assertEqual(
+            hinted.compress(b"foo" * 64), cctx.compress(b"foo" * 64)
+        )
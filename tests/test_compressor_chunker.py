@@ -191,3 +191,21 @@ class TestCompressor_chunker(unittest.TestCase):
             zstd.ZstdError, r"cannot call finish\(\) after compression finished"
         ):
             list(chunker.finish())
+
+    def test_size_hint(self):
+        cctx = zstd.ZstdCompressor(level=19)
+
+        with self.assertRaisesRegex(
+            ValueError, "size_hint must be non-negative"
+        ):
+            cctx.chunker(size_hint=-1)
+
+        chunker = cctx.chunker(size_hint=1000)
+        frame = b"".join(chunker.compress(b"foo" * 64))
+        frame += b"".join(chunker.finish())
+
+        self.assertEqual(zstd.get_frame_parameters(frame).window_size, 1024)
+        self.assertEqual(
+            zstd.ZstdDecompressor().decompress(frame, max_output_size=192),
+            b"foo" * 64,
+        )
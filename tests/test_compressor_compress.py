@@ -45,6 +45,27 @@ class TestCompressor_compress(unittest.TestCase):
         for source in sources:
             self.assertEqual(cctx.compress(source), expected)
 
+    def test_argument_forms(self):
+        cctx = zstd.ZstdCompressor(level=1, write_content_size=False)
+        expected = b"\x28\xb5\x2f\xfd\x00\x00\x19\x00\x00\x66\x6f\x6f"
+
+        self.assertEqual(cctx.compress(data=b"foo"), expected)
+
+        with self.assertRaises(TypeError):
+            cctx.compress("foo")
+
+        with self.assertRaises(TypeError):
+            cctx.compress(b"foo", b"bar")
+
+        with self.assertRaises(TypeError):
+            cctx.compress(source=b"foo")
+
+        with self.assertRaises(TypeError):
+            cctx.compress()
+
+        # Failed calls don't affect later ones.
+        self.assertEqual(cctx.compress(b"foo"), expected)
+
     def test_compress_large(self):
         chunks = []
         for i in range(255):
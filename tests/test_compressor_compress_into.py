@@ -0,0 +1,61 @@
+import mmap
+import unittest
+
+import zstandard as zstd
+
+
+class TestCompressor_compress_into(unittest.TestCase):
+    def test_invalid_arguments(self):
+        cctx = zstd.ZstdCompressor()
+
+        with self.assertRaises(TypeError):
+            cctx.compress_into(b"foo")
+
+        with self.assertRaises(TypeError):
+            cctx.compress_into(b"foo", b"readonly buffer")
+
+        with self.assertRaises(TypeError):
+            cctx.compress_into("foo", bytearray(32))
+
+    def test_matches_compress(self):
+        cctx = zstd.ZstdCompressor(write_checksum=True)
+        source = b"foobar" * 1024
+
+        out = bytearray(len(source) + len(source) // 256 + 64)
+        size = cctx.compress_into(source, out)
+
+        self.assertEqual(bytes(out[:size]), cctx.compress(source))
+
+    def test_empty(self):
+        cctx = zstd.ZstdCompressor()
+
+        out = bytearray(32)
+        size = cctx.compress_into(b"", out)
+        self.assertEqual(bytes(out[:size]), cctx.compress(b""))
+
+    def test_output_types(self):
+        cctx = zstd.ZstdCompressor()
+        source = b"foo" * 256
+        expected = cctx.compress(source)
+
+        out = bytearray(1024)
+        size = cctx.compress_into(source, memoryview(out)[10:])
+        self.assertEqual(bytes(out[10 : 10 + size]), expected)
+
+        with mmap.mmap(-1, 1024) as m:
+            size = cctx.compress_into(source, m)
+            self.assertEqual(m[:size], expected)
+
+    def test_output_too_small(self):
+        cctx = zstd.ZstdCompressor()
+        source = b"".join(b"%d" % i for i in range(10000))
+        expected = cctx.compress(source)
+
+        out = bytearray(len(expected) - 1)
+        with self.assertRaisesRegex(zstd.ZstdError, "output buffer too small"):
+            cctx.compress_into(source, out)
+
+        # The compressor is usable afterwards.
+        out = bytearray(len(expected))
+        self.assertEqual(cctx.compress_into(source, out), len(expected))
+        self.assertEqual(bytes(out), expected)
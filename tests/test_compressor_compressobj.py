@@ -185,3 +185,38 @@ class TestCompressor_compressobj(unittest.TestCase):
         # Try another operation on the compressor.
         cctx.compressobj(size=4)
         cctx.compress(b"foobar")
+
+    def test_size_hint(self):
+        cctx = zstd.ZstdCompressor(level=19)
+
+        with self.assertRaisesRegex(
+            ValueError, "size_hint must be non-negative"
+        ):
+            cctx.compressobj(size_hint=-1)
+
+        cobj = cctx.compressobj(size_hint=1000)
+        frame = cobj.compress(b"foo" * 64) + cobj.flush()
+        params = zstd.get_frame_parameters(frame)
+        self.assertEqual(params.content_size, zstd.CONTENTSIZE_UNKNOWN)
+        self.assertEqual(params.window_size, 1024)
+        self.assertEqual(
+            zstd.ZstdDecompressor().decompress(frame, max_output_size=192),
+            b"foo" * 64,
+        )
+
+        # The hint only applies to a single operation.
+        cobj = cctx.compressobj()
+        frame = cobj.compress(b"foo" * 64) + cobj.flush()
+        self.assertEqual(zstd.get_frame_parameters(frame).window_size, 8388608)
+
+        # Hints given to the compressor are used by default and can be
+        # overridden.
+        cctx = zstd.ZstdCompressor(level=19, size_hint=1000)
+
+        cobj = cctx.compressobj()
+        frame = cobj.compress(b"foo" * 64) + cobj.flush()
+        self.assertEqual(zstd.get_frame_parameters(frame).window_size, 1024)
+
+        cobj = cctx.compressobj(size_hint=100000)
+        frame = cobj.compress(b"foo" * 64) + cobj.flush()
+        self.assertEqual(zstd.get_frame_parameters(frame).window_size, 131072)
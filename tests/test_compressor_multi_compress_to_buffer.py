@@ -129,3 +129,76 @@ class TestCompressor_multi_compress_to_buffer(unittest.TestCase):
                 self.assertEqual(result[i].tobytes(), reference[0])
             else:
                 self.assertEqual(result[i].tobytes(), reference[1])
+
+    def test_small_batch_single_thread(self):
+        cctx = zstd.ZstdCompressor()
+
+        stats = cctx.multi_compress_stats()
+        self.assertEqual(stats["single_threaded_calls"], 0)
+        self.assertEqual(stats["multi_threaded_calls"], 0)
+        self.assertEqual(stats["pool_threads"], 0)
+
+        result = cctx.multi_compress_to_buffer([b"foo", b"bar"], threads=4)
+        self.assertEqual(len(result), 2)
+
+        stats = cctx.multi_compress_stats()
+        self.assertEqual(stats["single_threaded_calls"], 1)
+        self.assertEqual(stats["multi_threaded_calls"], 0)
+        self.assertEqual(stats["threads_started"], 0)
+        self.assertEqual(stats["last_threads"], 1)
+        self.assertEqual(stats["pool_threads"], 0)
+
+    def test_large_batch_reuses_threads(self):
+        cctx = zstd.ZstdCompressor()
+        dctx = zstd.ZstdDecompressor()
+
+        frames = [struct.pack(">I", i) * 16384 for i in range(64)]
+
+        result = cctx.multi_compress_to_buffer(frames, threads=2)
+        self.assertEqual(len(result), len(frames))
+        for i, frame in enumerate(frames):
+            self.assertEqual(dctx.decompress(result[i].tobytes()), frame)
+
+        stats = cctx.multi_compress_stats()
+        self.assertEqual(stats["multi_threaded_calls"], 1)
+        self.assertEqual(stats["last_threads"], 2)
+        self.assertEqual(stats["threads_started"], 2)
+        self.assertEqual(stats["pool_threads"], 2)
+
+        result = cctx.multi_compress_to_buffer(frames, threads=2)
+        self.assertEqual(len(result), len(frames))
+
+        stats = cctx.multi_compress_stats()
+        self.assertEqual(stats["multi_threaded_calls"], 2)
+        self.assertEqual(stats["threads_started"], 2)
+
+        # Small batches still run inline once threads exist.
+        cctx.multi_compress_to_buffer([b"foo"], threads=2)
+        stats = cctx.multi_compress_stats()
+        self.assertEqual(stats["single_threaded_calls"], 1)
+        self.assertEqual(stats["last_threads"], 1)
+        self.assertEqual(stats["pool_threads"], 2)
+
+    def test_growing_pool(self):
+        cctx = zstd.ZstdCompressor()
+
+        frames = [struct.pack(">I", i) * 16384 for i in range(64)]
+        initial_size = cctx.memory_size()
+
+        cctx.multi_compress_to_buffer(frames, threads=2)
+        self.assertGreater(cctx.memory_size(), initial_size)
+        two_size = cctx.memory_size()
+
+        cctx.multi_compress_to_buffer(frames, threads=4)
+        self.assertGreater(cctx.memory_size(), two_size)
+
+        stats = cctx.multi_compress_stats()
+        self.assertEqual(stats["last_threads"], 4)
+        self.assertEqual(stats["pool_threads"], 4)
+
+        # The C backend grows its pool in place. The CFFI backend replaces
+        # its executor, starting every thread of the new one.
+        if zstd.backend == "cext":
+            self.assertEqual(stats["threads_started"], 4)
+        else:
+            self.assertEqual(stats["threads_started"], 6)
@@ -204,6 +204,7 @@ class TestCompressor_stream_reader(unittest.TestCase):
         reader = cctx.stream_reader(b"foo")
         self.assertEqual(reader.readinto(b), len(foo))
         self.assertEqual(b[0 : len(foo)], foo)
+        self.assertEqual(reader.tell(), len(foo))
         self.assertEqual(reader.readinto(b), 0)
         self.assertEqual(b[0 : len(foo)], foo)
 
@@ -237,6 +238,7 @@ class TestCompressor_stream_reader(unittest.TestCase):
         self.assertEqual(reader.readinto1(b), len(foo))
         self.assertEqual(b[0 : len(foo)], foo)
         self.assertEqual(source._read_count, 2)
+        self.assertEqual(reader.tell(), len(foo))
 
         # readinto1() with small reads.
         b = bytearray(1024)
@@ -466,6 +466,38 @@ class TestCompressor_stream_writer(unittest.TestCase):
 
         self.assertGreater(size, 100000)
 
+    def test_size_hint(self):
+        cctx = zstd.ZstdCompressor(level=19)
+
+        with self.assertRaisesRegex(
+            ValueError, "size_hint must be non-negative"
+        ):
+            cctx.stream_writer(io.BytesIO(), size_hint=-1)
+
+        sizes = []
+        frames = []
+
+        for size_hint in (1000, 0):
+            dest = io.BytesIO()
+            with cctx.stream_writer(
+                dest, closefd=False, size_hint=size_hint
+            ) as compressor:
+                compressor.write(b"foo" * 64)
+                sizes.append(compressor.memory_size())
+
+            frames.append(dest.getvalue())
+
+        self.assertLess(sizes[0], sizes[1])
+        self.assertEqual(zstd.get_frame_parameters(frames[0]).window_size, 1024)
+        self.assertEqual(
+            zstd.get_frame_parameters(frames[1]).window_size, 8388608
+        )
+
+        dctx = zstd.ZstdDecompressor()
+        self.assertEqual(
+            dctx.decompress(frames[0], max_output_size=192), b"foo" * 64
+        )
+
     def test_write_size(self):
         cctx = zstd.ZstdCompressor(level=3)
         dest = CustomBytesIO()
@@ -570,6 +602,61 @@ class TestCompressor_stream_writer(unittest.TestCase):
                 compressor.write(b"foo" * (i + 1))
                 self.assertEqual(compressor.tell(), dest.tell())
 
+    def test_write_skippable_frame(self):
+        dest = NonClosingBytesIO()
+        cctx = zstd.ZstdCompressor()
+
+        with cctx.stream_writer(dest) as compressor:
+            # Nothing written yet, so no frame is ended.
+            self.assertEqual(compressor.write_skippable_frame(b"meta0"), 13)
+            self.assertEqual(
+                dest.getvalue(), b"\x50\x2a\x4d\x18\x05\x00\x00\x00meta0"
+            )
+
+            compressor.write(b"foo" * 64)
+            self.assertGreater(
+                compressor.write_skippable_frame(b"meta1", magic_variant=15),
+                13,
+            )
+            compressor.write(b"bar" * 64)
+
+            self.assertEqual(compressor.tell(), len(dest.getvalue()))
+
+        data = dest.getvalue()
+
+        index = zstd.scan_frames(data)
+        self.assertEqual(index["skippable"].tolist(), [1, 0, 1, 0])
+
+        self.assertEqual(
+            list(zstd.iter_frames(data)),
+            [
+                (0, b"meta0"),
+                (None, b"foo" * 64),
+                (15, b"meta1"),
+                (None, b"bar" * 64),
+            ],
+        )
+
+        dctx = zstd.ZstdDecompressor()
+        self.assertEqual(
+            dctx.decompress(data, read_across_frames=True),
+            b"foo" * 64 + b"bar" * 64,
+        )
+
+    def test_write_skippable_frame_errors(self):
+        cctx = zstd.ZstdCompressor()
+        compressor = cctx.stream_writer(io.BytesIO())
+
+        with self.assertRaisesRegex(
+            ValueError, "magic_variant must be between 0 and 15"
+        ):
+            compressor.write_skippable_frame(b"foo", magic_variant=16)
+
+        compressor.close()
+
+        with self.assertRaisesRegex(ValueError, "stream is closed"):
+            compressor.write_skippable_frame(b"foo")
+
     def test_bad_size(self):
         cctx = zstd.ZstdCompressor()
 
@@ -0,0 +1,150 @@
+import functools
+import threading
+import unittest
+
+import zstandard as zstd
+
+
+class TestContextPool(unittest.TestCase):
+    def test_invalid_arguments(self):
+        with self.assertRaisesRegex(TypeError, "factory must be callable"):
+            zstd.ZstdContextPool(None)
+
+        with self.assertRaisesRegex(ValueError, "max_idle must not be"):
+            zstd.ZstdContextPool(zstd.ZstdCompressor, max_idle=-1)
+
+    def test_reuse(self):
+        pool = zstd.ZstdContextPool(zstd.ZstdCompressor, max_idle=2)
+        self.assertEqual(pool.max_idle, 2)
+
+        with pool.checkout() as cctx:
+            self.assertIsInstance(cctx, zstd.ZstdCompressor)
+            first = cctx
+
+        with pool.checkout() as cctx:
+            self.assertIs(cctx, first)
+
+        self.assertEqual(
+            pool.stats(),
+            {
+                "created": 1,
+                "checkouts": 2,
+                "reused": 1,
+                "evictions": 0,
+                "idle": 1,
+                "in_use": 0,
+                "max_in_use": 1,
+            },
+        )
+
+    def test_eviction(self):
+        pool = zstd.ZstdContextPool(zstd.ZstdDecompressor, max_idle=1)
+
+        contexts = [pool.acquire() for i in range(3)]
+        self.assertEqual(len(set(map(id, contexts))), 3)
+
+        stats = pool.stats()
+        self.assertEqual(stats["in_use"], 3)
+        self.assertEqual(stats["max_in_use"], 3)
+
+        for context in contexts:
+            pool.release(context)
+
+        stats = pool.stats()
+        self.assertEqual(stats["created"], 3)
+        self.assertEqual(stats["idle"], 1)
+        self.assertEqual(stats["evictions"], 2)
+
+        pool.clear()
+        stats = pool.stats()
+        self.assertEqual(stats["idle"], 0)
+        self.assertEqual(stats["evictions"], 3)
+
+    def test_released_on_exception(self):
+        pool = zstd.ZstdContextPool(zstd.ZstdCompressor)
+
+        with self.assertRaises(ValueError):
+            with pool.checkout():
+                raise ValueError("oops")
+
+        stats = pool.stats()
+        self.assertEqual(stats["in_use"], 0)
+        self.assertEqual(stats["idle"], 1)
+
+    def test_factory_failure(self):
+        def factory():
+            raise ValueError("oops")
+
+        pool = zstd.ZstdContextPool(factory)
+
+        with self.assertRaisesRegex(ValueError, "oops"):
+            pool.acquire()
+
+        stats = pool.stats()
+        self.assertEqual(stats["created"], 0)
+        self.assertEqual(stats["checkouts"], 0)
+        self.assertEqual(stats["in_use"], 0)
+
+    def test_invalid_release(self):
+        pool = zstd.ZstdContextPool(zstd.ZstdCompressor)
+        other = zstd.ZstdContextPool(zstd.ZstdCompressor)
+
+        with self.assertRaisesRegex(ValueError, "not checked out"):
+            pool.release(zstd.ZstdCompressor())
+
+        cctx = pool.acquire()
+
+        with self.assertRaisesRegex(ValueError, "not checked out"):
+            other.release(cctx)
+
+        pool.release(cctx)
+
+        with self.assertRaisesRegex(ValueError, "not checked out"):
+            pool.release(cctx)
+
+        stats = pool.stats()
+        self.assertEqual(stats["in_use"], 0)
+        self.assertEqual(stats["idle"], 1)
+        self.assertEqual(other.stats()["in_use"], 0)
+
+    def test_shared_dictionary_threads(self):
+        samples = [b"foo%dbar" % i * 16 for i in range(1024)]
+        d = zstd.train_dictionary(8192, samples)
+        d.precompute_compress(level=3)
+
+        cpool = zstd.ZstdContextPool(
+            functools.partial(zstd.ZstdCompressor, dict_data=d), max_idle=4
+        )
+        dpool = zstd.ZstdContextPool(
+            functools.partial(zstd.ZstdDecompressor, dict_data=d), max_idle=4
+        )
+
+        errors = []
+
+        def worker():
+            try:
+                for sample in samples[0:200]:
+                    with cpool.checkout() as cctx:
+                        frame = cctx.compress(sample)
+
+                    with dpool.checkout() as dctx:
+                        self.assertEqual(dctx.decompress(frame), sample)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+
+        for pool in (cpool, dpool):
+            stats = pool.stats()
+            self.assertEqual(stats["checkouts"], 1600)
+            self.assertEqual(stats["in_use"], 0)
+            self.assertLessEqual(stats["idle"], 4)
+            self.assertEqual(
+                stats["reused"], stats["checkouts"] - stats["created"]
+            )
@@ -1,7 +1,13 @@
+import struct
 import unittest
 
 import zstandard as zstd
 
+from .common import (
+    generate_samples,
+    get_optimal_dict_size_heuristically,
+)
+
 
 class TestCompressionParameters(unittest.TestCase):
     def test_bounds(self):
@@ -208,3 +214,168 @@ class TestFrameParameters(unittest.TestCase):
             self.assertEqual(params.window_size, 1024)
             self.assertEqual(params.dict_id, 0)
             self.assertFalse(params.has_checksum)
+
+    def test_readonly(self):
+        params = zstd.get_frame_parameters(zstd.FRAME_HEADER + b"\x00\x00")
+
+        with self.assertRaises(AttributeError):
+            params.content_size = 42
+
+        with self.assertRaises(AttributeError):
+            params.__dict__
+
+
+class TestFrameSummary(unittest.TestCase):
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            zstd.frame_summary(None)
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "not enough data for frame"
+        ):
+            zstd.frame_summary(zstd.FRAME_HEADER)
+
+        with self.assertRaisesRegex(zstd.ZstdError, "Unknown frame descriptor"):
+            zstd.frame_summary(b"foobarbaz")
+
+    def test_matches_frame_parameters(self):
+        frames = [
+            zstd.FRAME_HEADER + b"\x00\x00",
+            zstd.FRAME_HEADER + b"\x45\x40\x0f\x10\x00",
+            zstd.ZstdCompressor(write_checksum=True).compress(b"foo" * 64),
+        ]
+
+        for frame in frames:
+            params = zstd.get_frame_parameters(frame)
+            summary = zstd.frame_summary(frame)
+
+            self.assertIsInstance(summary, tuple)
+            self.assertEqual(
+                summary,
+                (
+                    params.content_size,
+                    params.window_size,
+                    params.dict_id,
+                    params.has_checksum,
+                ),
+            )
+            self.assertIsInstance(summary[3], bool)
+
+
+class TestScanFrames(unittest.TestCase):
+    COLUMNS = {
+        "offset": "Q",
+        "compressed_size": "Q",
+        "content_size": "Q",
+        "dict_id": "I",
+        "has_checksum": "B",
+        "window_size": "Q",
+        "skippable": "B",
+    }
+
+    def assertIndex(self, index, expected):
+        self.assertEqual(set(index), set(self.COLUMNS))
+
+        for name, fmt in self.COLUMNS.items():
+            self.assertIsInstance(index[name], memoryview)
+            self.assertEqual(index[name].format, fmt, name)
+            self.assertEqual(index[name].tolist(), expected[name], name)
+
+    def test_invalid_type(self):
+        with self.assertRaises(TypeError):
+            zstd.scan_frames(None)
+
+        with self.assertRaises(TypeError):
+            zstd.scan_frames("foobarbaz")
+
+    def test_empty(self):
+        index = zstd.scan_frames(b"")
+        self.assertIndex(index, {name: [] for name in self.COLUMNS})
+
+    def test_concatenated(self):
+        cctx = zstd.ZstdCompressor(write_checksum=True)
+        a = cctx.compress(b"foo" * 1024)
+        b = zstd.ZstdCompressor(write_content_size=False).compress(b"bar")
+        skippable = struct.pack("<II", 0x184D2A50, 7) + b"payload"
+
+        data = a + skippable + b
+
+        index = zstd.scan_frames(data)
+        self.assertIndex(
+            index,
+            {
+                "offset": [0, len(a), len(a) + len(skippable)],
+                "compressed_size": [len(a), len(skippable), len(b)],
+                "content_size": [3072, 7, zstd.CONTENTSIZE_UNKNOWN],
+                "dict_id": [0, 0, 0],
+                "has_checksum": [1, 0, 0],
+                "window_size": [
+                    zstd.get_frame_parameters(a).window_size,
+                    0,
+                    zstd.get_frame_parameters(b).window_size,
+                ],
+                "skippable": [0, 1, 0],
+            },
+        )
+
+        self.assertEqual(
+            zstd.scan_frames(bytearray(data))["offset"].tolist(),
+            index["offset"].tolist(),
+        )
+
+    def test_dict_id(self):
+        samples = generate_samples()
+        d = zstd.train_dictionary(
+            get_optimal_dict_size_heuristically(samples), samples, dict_id=42
+        )
+
+        with_dict = zstd.ZstdCompressor(dict_data=d).compress(b"foo" * 64)
+        without_dict_id = zstd.ZstdCompressor(
+            dict_data=d, write_dict_id=False
+        ).compress(b"foo" * 64)
+
+        index = zstd.scan_frames(with_dict + without_dict_id)
+        self.assertEqual(index["dict_id"].tolist(), [42, 0])
+
+    def test_incomplete(self):
+        frame = zstd.ZstdCompressor().compress(b"foobar" * 64)
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "error scanning frame at offset %d" % len(frame)
+        ):
+            zstd.scan_frames(frame + frame[:-1])
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "error scanning frame at offset 0"
+        ):
+            zstd.scan_frames(b"foobarbaz")
+
+    @unittest.skipUnless(
+        "buffer_types" in zstd.backend_features,
+        "buffer_types feature not available",
+    )
+    def test_buffer_with_segments(self):
+        cctx = zstd.ZstdCompressor()
+        frames = [cctx.compress(b"x" * i) for i in (10, 100, 1000)]
+
+        # The second segment holds 2 frames. Bytes between segments are
+        # ignored.
+        data = frames[0] + b"junk" + frames[1] + frames[2]
+        second = len(frames[0]) + 4
+        segments = struct.pack(
+            "=QQQQ",
+            0,
+            len(frames[0]),
+            second,
+            len(frames[1]) + len(frames[2]),
+        )
+
+        index = zstd.scan_frames(zstd.BufferWithSegments(data, segments))
+        self.assertEqual(
+            index["offset"].tolist(),
+            [0, second, second + len(frames[1])],
+        )
+        self.assertEqual(index["content_size"].tolist(), [10, 100, 1000])
+        self.assertEqual(
+            index["compressed_size"].tolist(), [len(f) for f in frames]
+        )
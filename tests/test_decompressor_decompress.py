@@ -76,7 +76,9 @@ class TestDecompressor_decompress(unittest.TestCase):
 
         # Input size - 1 fails
         with self.assertRaisesRegex(
-            zstd.ZstdError, "decompression error: did not decompress full frame"
+            zstd.ZstdError,
+            "decompression error: decompressed data exceeds max_output_size "
+            "of %d bytes" % (len(source) - 1),
         ):
             dctx.decompress(compressed, max_output_size=len(source) - 1)
 
@@ -97,10 +99,48 @@ class TestDecompressor_decompress(unittest.TestCase):
         compressed = cctx.compress(b"foobar" * 256)
         dctx = zstd.ZstdDecompressor()
 
-        # Will get OverflowError on some Python distributions that can't
-        # handle really large integers.
-        with self.assertRaises((MemoryError, OverflowError)):
-            dctx.decompress(compressed, max_output_size=2**62)
+        # max_output_size is only a limit. The output buffer is sized from an
+        # estimate.
+        self.assertEqual(
+            dctx.decompress(compressed, max_output_size=2**62), b"foobar" * 256
+        )
+
+    def test_unknown_content_size_growth(self):
+        cctx = zstd.ZstdCompressor(write_content_size=False)
+        # Compresses extremely well, so the output must grow many times.
+        source = b"x" * (4 * 1048576)
+        compressed = cctx.compress(source)
+
+        dctx = zstd.ZstdDecompressor()
+        self.assertEqual(
+            dctx.decompress(compressed, max_output_size=len(source)), source
+        )
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError,
+            "decompressed data exceeds max_output_size of 1048576 bytes",
+        ):
+            dctx.decompress(compressed, max_output_size=1048576)
+
+        # Streaming output lacks content size.
+        chunks = [b"chunk %d\n" % i for i in range(10000)]
+        cobj = zstd.ZstdCompressor().compressobj()
+        frame = b"".join(cobj.compress(c) for c in chunks) + cobj.flush()
+        self.assertEqual(
+            dctx.decompress(frame, max_output_size=2**30), b"".join(chunks)
+        )
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "4 bytes of unused data, which is disallowed"
+        ):
+            dctx.decompress(
+                frame + b"junk", max_output_size=2**30, allow_extra_data=False
+            )
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "did not decompress full frame"
+        ):
+            dctx.decompress(frame[:-1], max_output_size=2**30)
 
     def test_dictionary(self):
         samples = []
@@ -148,6 +188,38 @@ class TestDecompressor_decompress(unittest.TestCase):
             decompressed = dctx.decompress(compressed[i])
             self.assertEqual(decompressed, sources[i])
 
+    def test_dictionary_after_content_dict_chain(self):
+        d = zstd.ZstdCompressionDict(b"foobar" * 64)
+        frame = zstd.ZstdCompressor(dict_data=d).compress(b"foobar" * 128)
+
+        chain = [zstd.ZstdCompressor().compress(b"foo" * 64)]
+        chain.append(
+            zstd.ZstdCompressor(
+                dict_data=zstd.ZstdCompressionDict(b"foo" * 64)
+            ).compress(b"bar" * 64)
+        )
+
+        dctx = zstd.ZstdDecompressor(dict_data=d)
+        self.assertEqual(dctx.decompress(frame), b"foobar" * 128)
+        self.assertEqual(dctx.decompress_content_dict_chain(chain), b"bar" * 64)
+        self.assertEqual(dctx.decompress(frame), b"foobar" * 128)
+
+    def test_argument_forms(self):
+        frame = zstd.ZstdCompressor(write_content_size=False).compress(b"foo")
+
+        dctx = zstd.ZstdDecompressor()
+        self.assertEqual(dctx.decompress(frame, 3), b"foo")
+        self.assertEqual(dctx.decompress(data=frame, max_output_size=3), b"foo")
+
+        with self.assertRaises(TypeError):
+            dctx.decompress("foo")
+
+        with self.assertRaises(TypeError):
+            dctx.decompress(frame, 3, False, True, None)
+
+        with self.assertRaises(TypeError):
+            dctx.decompress()
+
     def test_max_window_size(self):
         with open(__file__, "rb") as fh:
             source = fh.read()
@@ -165,6 +237,13 @@ class TestDecompressor_decompress(unittest.TestCase):
         ):
             dctx.decompress(frame, max_output_size=len(source))
 
+        # The limit applies to every operation.
+        with self.assertRaisesRegex(
+            zstd.ZstdError,
+            "decompression error: Frame requires too much memory",
+        ):
+            dctx.decompress(frame, max_output_size=len(source))
+
     def test_explicit_default_params(self):
         cctx = zstd.ZstdCompressor(level=1)
         compressed = cctx.compress(b"foo")
@@ -187,17 +266,99 @@ class TestDecompressor_decompress(unittest.TestCase):
             dctx.decompress(foo + bar, allow_extra_data=True), b"foo"
         )
 
+        self.assertEqual(
+            dctx.decompress(foo + bar, read_across_frames=True), b"foobar"
+        )
+
         with self.assertRaisesRegex(
             zstd.ZstdError,
-            "ZstdDecompressor.read_across_frames=True is not yet implemented",
+            "%d bytes of unused data, which is disallowed" % len(bar),
         ):
-            dctx.decompress(foo + bar, read_across_frames=True)
+            dctx.decompress(foo + bar, allow_extra_data=False)
+
+    def test_read_across_frames(self):
+        cctx = zstd.ZstdCompressor()
+        frames = [
+            cctx.compress(b"foo" * 1024),
+            cctx.compress(b""),
+            cctx.compress(b"bar"),
+        ]
+
+        dctx = zstd.ZstdDecompressor()
+        self.assertEqual(
+            dctx.decompress(b"".join(frames), read_across_frames=True),
+            b"foo" * 1024 + b"bar",
+        )
+        self.assertEqual(
+            dctx.decompress(frames[1] + frames[1], read_across_frames=True),
+            b"",
+        )
+
+        # Skippable frames are skipped.
+        skippable = b"\x50\x2a\x4d\x18\x04\x00\x00\x00skip"
+        self.assertEqual(
+            dctx.decompress(
+                skippable + frames[0] + skippable + frames[2],
+                read_across_frames=True,
+            ),
+            b"foo" * 1024 + b"bar",
+        )
+
+    def test_read_across_frames_no_content_size(self):
+        cctx = zstd.ZstdCompressor(write_content_size=False)
+        foo = cctx.compress(b"foo" * 65536)
+        bar = zstd.ZstdCompressor().compress(b"bar")
+
+        dctx = zstd.ZstdDecompressor()
+        self.assertEqual(
+            dctx.decompress(foo + bar + foo, read_across_frames=True),
+            b"foo" * 65536 + b"bar" + b"foo" * 65536,
+        )
+        self.assertEqual(
+            dctx.decompress(
+                foo + bar, read_across_frames=True, max_output_size=196611
+            ),
+            b"foo" * 65536 + b"bar",
+        )
 
         with self.assertRaisesRegex(
             zstd.ZstdError,
-            "%d bytes of unused data, which is disallowed" % len(bar),
+            "decompressed data exceeds max_output_size of 196610 bytes",
         ):
-            dctx.decompress(foo + bar, allow_extra_data=False)
+            dctx.decompress(
+                foo + bar, read_across_frames=True, max_output_size=196610
+            )
+
+    def test_read_across_frames_errors(self):
+        cctx = zstd.ZstdCompressor()
+        foo = cctx.compress(b"foo")
+        bar = cctx.compress(b"bar")
+
+        dctx = zstd.ZstdDecompressor()
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "error determining content size from frame header"
+        ):
+            dctx.decompress(b"junk", read_across_frames=True)
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "did not decompress full frame"
+        ):
+            dctx.decompress(foo + bar[:-1], read_across_frames=True)
+
+        self.assertEqual(
+            dctx.decompress(foo + bar + b"junk", read_across_frames=True),
+            b"foobar",
+        )
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "4 bytes of unused data, which is disallowed"
+        ):
+            dctx.decompress(
+                foo + bar + b"junk",
+                read_across_frames=True,
+                allow_extra_data=False,
+            )
 
     def test_junk_after_frame(self):
         cctx = zstd.ZstdCompressor()
@@ -0,0 +1,116 @@
+import mmap
+import unittest
+
+import zstandard as zstd
+
+
+class TestDecompressor_decompress_into(unittest.TestCase):
+    def test_invalid_arguments(self):
+        dctx = zstd.ZstdDecompressor()
+        frame = zstd.ZstdCompressor().compress(b"foo")
+
+        with self.assertRaises(TypeError):
+            dctx.decompress_into(frame)
+
+        with self.assertRaises(TypeError):
+            dctx.decompress_into(frame, b"readonly buffer")
+
+    def test_invalid_input(self):
+        dctx = zstd.ZstdDecompressor()
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "error determining content size from frame header"
+        ):
+            dctx.decompress_into(b"foobar", bytearray(32))
+
+    def test_content_size_present(self):
+        source = b"foobar" * 1024
+        frame = zstd.ZstdCompressor().compress(source)
+
+        dctx = zstd.ZstdDecompressor()
+        out = bytearray(len(source) + 10)
+        self.assertEqual(dctx.decompress_into(frame, out), len(source))
+        self.assertEqual(bytes(out[: len(source)]), source)
+
+        # An exactly sized buffer is fine.
+        out = bytearray(len(source))
+        self.assertEqual(dctx.decompress_into(frame, out), len(source))
+        self.assertEqual(bytes(out), source)
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError,
+            "output buffer too small: frame content size 6144 exceeds 6143",
+        ):
+            dctx.decompress_into(frame, bytearray(len(source) - 1))
+
+    def test_no_content_size_in_frame(self):
+        source = b"foobar" * 1024
+        cctx = zstd.ZstdCompressor(
+            write_content_size=False, write_checksum=True
+        )
+        frame = cctx.compress(source)
+
+        dctx = zstd.ZstdDecompressor()
+        out = bytearray(len(source))
+        self.assertEqual(dctx.decompress_into(frame, out), len(source))
+        self.assertEqual(bytes(out), source)
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError,
+            "output buffer too small: decompressed data exceeds 6143 bytes",
+        ):
+            dctx.decompress_into(frame, bytearray(len(source) - 1))
+
+        # The decompressor is usable afterwards.
+        self.assertEqual(dctx.decompress_into(frame, out), len(source))
+
+    def test_empty(self):
+        frame = zstd.ZstdCompressor().compress(b"")
+
+        dctx = zstd.ZstdDecompressor()
+        self.assertEqual(dctx.decompress_into(frame, bytearray()), 0)
+
+    def test_output_types(self):
+        source = b"foo" * 256
+        frame = zstd.ZstdCompressor().compress(source)
+        dctx = zstd.ZstdDecompressor()
+
+        out = bytearray(1024)
+        size = dctx.decompress_into(frame, memoryview(out)[10:])
+        self.assertEqual(bytes(out[10 : 10 + size]), source)
+
+        with mmap.mmap(-1, 1024) as m:
+            size = dctx.decompress_into(frame, m)
+            self.assertEqual(m[:size], source)
+
+    def test_truncated_input(self):
+        frame = zstd.ZstdCompressor().compress(b"foobar" * 1024)
+
+        dctx = zstd.ZstdDecompressor()
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "did not decompress full frame"
+        ):
+            dctx.decompress_into(frame[:-1], bytearray(8192))
+
+    def test_dictionary(self):
+        samples = [b"foo%dbar" % i * 16 for i in range(1024)]
+        d = zstd.train_dictionary(8192, samples)
+
+        frame = zstd.ZstdCompressor(dict_data=d).compress(samples[42])
+
+        dctx = zstd.ZstdDecompressor(dict_data=d)
+        out = bytearray(len(samples[42]))
+        self.assertEqual(dctx.decompress_into(frame, out), len(samples[42]))
+        self.assertEqual(bytes(out), samples[42])
+
+    def test_allow_extra_data(self):
+        frame = zstd.ZstdCompressor().compress(b"foo")
+        dctx = zstd.ZstdDecompressor()
+        out = bytearray(3)
+
+        self.assertEqual(dctx.decompress_into(frame + b"junk", out), 3)
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "4 bytes of unused data, which is disallowed"
+        ):
+            dctx.decompress_into(frame + b"junk", out, allow_extra_data=False)
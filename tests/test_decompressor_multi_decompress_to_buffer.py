@@ -1,3 +1,4 @@
+import os
 import struct
 import unittest
 
@@ -206,6 +207,25 @@ class TestDecompressor_multi_decompress_to_buffer(unittest.TestCase):
         self.assertEqual(result[0].tobytes(), b"x" * 64)
         self.assertEqual(result[256].tobytes(), b"y" * 64)
 
+    def test_large_batch_threads(self):
+        # Large enough for the cost model to use several workers.
+        cctx = zstd.ZstdCompressor(level=1)
+        sources = [os.urandom(65536) for i in range(64)]
+        frames = [cctx.compress(source) for source in sources]
+
+        dctx = zstd.ZstdDecompressor()
+
+        result = dctx.multi_decompress_to_buffer(frames, threads=4)
+        self.assertEqual([o.tobytes() for o in result], sources)
+
+        # Bytes inserted into raw blocks go undetected. Truncate instead.
+        frames[-1] = frames[-1][:-100]
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "error decompressing item 63"
+        ):
+            dctx.multi_decompress_to_buffer(frames, threads=4)
+
     def test_item_failure(self):
         cctx = zstd.ZstdCompressor()
         frames = [cctx.compress(b"x" * 128), cctx.compress(b"y" * 128)]
@@ -0,0 +1,217 @@
+import struct
+import unittest
+
+import zstandard as zstd
+from zstandard import dict_tools
+
+from .common import generate_samples
+
+
+class FakeEvaluation(object):
+    def __init__(self, ratio, compress_speed, dict_size):
+        self.ratio = ratio
+        self.compress_speed = compress_speed
+        self.dict_size = dict_size
+
+
+class TestSplitSamples(unittest.TestCase):
+    def test_bad_held_out(self):
+        for value in (0.0, 1.0, 2.0):
+            with self.assertRaisesRegex(
+                ValueError, "held_out must be between 0 and 1"
+            ):
+                dict_tools.split_samples([b"foo"], held_out=value)
+
+    def test_split(self):
+        samples = [b"sample %d" % i for i in range(100)]
+
+        training, held_out = dict_tools.split_samples(samples, held_out=0.2)
+        self.assertEqual(len(training), 80)
+        self.assertEqual(len(held_out), 20)
+        self.assertEqual(sorted(training + held_out), sorted(samples))
+
+        self.assertEqual(
+            dict_tools.split_samples(iter(samples), held_out=0.2),
+            (training, held_out),
+        )
+        self.assertNotEqual(
+            dict_tools.split_samples(samples, held_out=0.2, seed=1),
+            (training, held_out),
+        )
+
+
+class TestTrainCandidates(unittest.TestCase):
+    def test_empty(self):
+        with self.assertRaisesRegex(ValueError, "dict_sizes must not be empty"):
+            dict_tools.train_candidates(generate_samples(), [])
+
+    def test_train(self):
+        sizes = [1024, 2048, 4096]
+        candidates = dict_tools.train_candidates(
+            iter(generate_samples()), sizes, threads=2, k=64, d=8
+        )
+
+        self.assertEqual(len(candidates), 3)
+        for d, size in zip(candidates, sizes):
+            self.assertIsInstance(d, zstd.ZstdCompressionDict)
+            self.assertLessEqual(len(d), size)
+            self.assertEqual(d.k, 64)
+            self.assertEqual(d.d, 8)
+
+
+class TestEvaluateDictionary(unittest.TestCase):
+    def test_bad_arguments(self):
+        with self.assertRaisesRegex(ValueError, "samples must not be empty"):
+            dict_tools.evaluate_dictionary(None, [])
+
+        with self.assertRaisesRegex(ValueError, "rounds must be positive"):
+            dict_tools.evaluate_dictionary(None, [b"foo"], rounds=0)
+
+    def test_evaluate(self):
+        training, held_out = dict_tools.split_samples(generate_samples())
+        d = zstd.train_dictionary(8192, training, k=64, d=8)
+
+        evaluations = dict_tools.evaluate_candidates(
+            [None, d], held_out, level=1, rounds=1
+        )
+
+        baseline, result = evaluations
+        self.assertIsNone(baseline.dict_data)
+        self.assertEqual(baseline.dict_size, 0)
+        self.assertIs(result.dict_data, d)
+        self.assertEqual(result.dict_size, len(d))
+        self.assertEqual(result.dict_id, d.dict_id())
+        self.assertEqual(result.k, 64)
+        self.assertEqual(result.level, 1)
+
+        for evaluation in evaluations:
+            self.assertEqual(evaluation.source_size, sum(map(len, held_out)))
+            self.assertEqual(
+                evaluation.ratio,
+                evaluation.source_size / evaluation.compressed_size,
+            )
+            self.assertGreater(evaluation.compress_speed, 0)
+            self.assertGreater(evaluation.decompress_speed, 0)
+
+        expected = sum(
+            len(zstd.ZstdCompressor(level=1, dict_data=d).compress(s))
+            for s in held_out
+        )
+        self.assertEqual(result.compressed_size, expected)
+
+    def test_dictionary_unchanged(self):
+        training, held_out = dict_tools.split_samples(generate_samples())
+        d = zstd.train_dictionary(8192, training, k=64, d=8)
+        source = b"".join(held_out)
+
+        expected = zstd.ZstdCompressor(level=1, dict_data=d).compress(source)
+
+        dict_tools.evaluate_dictionary(d, held_out, level=19, rounds=1)
+
+        self.assertEqual(d.cdict_stats()["cached"], 0)
+        self.assertEqual(
+            zstd.ZstdCompressor(level=1, dict_data=d).compress(source),
+            expected,
+        )
+
+    def test_dict_type(self):
+        training, held_out = dict_tools.split_samples(generate_samples())
+        trained = zstd.train_dictionary(8192, training, k=64, d=8)
+        d = zstd.ZstdCompressionDict(
+            trained.as_bytes(), dict_type=zstd.DICT_TYPE_RAWCONTENT
+        )
+
+        cctx = zstd.ZstdCompressor(level=1, dict_data=d)
+        expected = sum(len(cctx.compress(sample)) for sample in held_out)
+
+        evaluation = dict_tools.evaluate_dictionary(
+            d, held_out, level=1, rounds=1
+        )
+        self.assertEqual(evaluation.compressed_size, expected)
+
+    @unittest.skipUnless(
+        "buffer_types" in zstd.backend_features, "buffer types not available"
+    )
+    def test_buffer_with_segments(self):
+        samples = generate_samples()
+
+        segments = []
+        offset = 0
+        for sample in samples:
+            segments.append(struct.pack("=QQ", offset, len(sample)))
+            offset += len(sample)
+
+        buffer = zstd.BufferWithSegments(b"".join(samples), b"".join(segments))
+
+        self.assertEqual(
+            dict_tools.evaluate_dictionary(None, buffer, rounds=1).source_size,
+            offset,
+        )
+
+
+class TestParetoFront(unittest.TestCase):
+    def test_empty_objectives(self):
+        with self.assertRaisesRegex(ValueError, "objectives must not be empty"):
+            dict_tools.pareto_front([], objectives=())
+
+    def test_front(self):
+        a = FakeEvaluation(3.0, 100, 4096)
+        b = FakeEvaluation(2.0, 200, 1024)
+        c = FakeEvaluation(1.5, 150, 8192)
+        d = FakeEvaluation(3.0, 100, 4096)
+
+        self.assertEqual(
+            dict_tools.pareto_front(
+                [c, b, a], objectives=("ratio", "compress_speed")
+            ),
+            [a, b],
+        )
+
+        # Equal evaluations don't dominate each other.
+        self.assertEqual(
+            dict_tools.pareto_front(
+                [a, d], objectives=("ratio", "compress_speed")
+            ),
+            [a, d],
+        )
+
+        self.assertEqual(
+            dict_tools.pareto_front(
+                [a, b, c], objectives=("ratio", "-dict_size")
+            ),
+            [a, b],
+        )
+        self.assertEqual(
+            dict_tools.pareto_front([a, b, c], objectives=("-dict_size",)),
+            [b],
+        )
+
+
+class TestDetectDrift(unittest.TestCase):
+    def test_bad_arguments(self):
+        with self.assertRaisesRegex(
+            ValueError, "baseline_ratio must be positive"
+        ):
+            dict_tools.detect_drift(None, [b"foo"], 0)
+
+        with self.assertRaisesRegex(
+            ValueError, "threshold must not be negative"
+        ):
+            dict_tools.detect_drift(None, [b"foo"], 2.0, threshold=-1)
+
+    def test_drift(self):
+        training, held_out = dict_tools.split_samples(generate_samples())
+        d = zstd.train_dictionary(8192, training, k=64, d=8)
+
+        evaluation = dict_tools.evaluate_dictionary(d, held_out, rounds=1)
+
+        report = dict_tools.detect_drift(d, held_out, evaluation.ratio)
+        self.assertAlmostEqual(report.ratio, evaluation.ratio)
+        self.assertAlmostEqual(report.change, 0.0)
+        self.assertFalse(report.drifted)
+
+        live = [bytes(range(256)) * 4 for _ in range(16)]
+        report = dict_tools.detect_drift(d, live, evaluation.ratio)
+        self.assertLess(report.ratio, evaluation.ratio)
+        self.assertGreater(report.change, 0.1)
+        self.assertTrue(report.drifted)
@@ -0,0 +1,245 @@
+import io
+import unittest
+
+import zstandard as zstd
+
+from .common import (
+    generate_samples,
+    get_optimal_dict_size_heuristically,
+)
+
+
+def make_dicts(count):
+    samples = generate_samples()
+    dict_size = get_optimal_dict_size_heuristically(samples)
+
+    return [
+        zstd.train_dictionary(dict_size, samples, dict_id=100 + i)
+        for i in range(count)
+    ]
+
+
+def make_frames(dicts):
+    frames = []
+
+    for i, d in enumerate(dicts):
+        source = b"frame %d " % i + b"sometext" * (64 + i)
+        cctx = zstd.ZstdCompressor(dict_data=d)
+        frames.append((source, cctx.compress(source)))
+
+    return frames
+
+
+class TestDictionaryRegistry(unittest.TestCase):
+    def test_bad_arguments(self):
+        with self.assertRaisesRegex(ValueError, "max_cached must be positive"):
+            zstd.ZstdDictionaryRegistry(max_cached=0)
+
+        registry = zstd.ZstdDictionaryRegistry()
+
+        with self.assertRaises(TypeError):
+            registry.add(b"foo")
+
+        with self.assertRaisesRegex(
+            ValueError, "dictionary does not have a dictionary ID"
+        ):
+            registry.add(zstd.ZstdCompressionDict(b"foo" * 64))
+
+        with self.assertRaises(KeyError):
+            registry.remove(42)
+
+        with self.assertRaisesRegex(
+            TypeError, "dict_registry must be zstd.ZstdDictionaryRegistry"
+        ):
+            zstd.ZstdDecompressor(dict_registry=True)
+
+        with self.assertRaisesRegex(
+            ValueError, "cannot use both dict_data and dict_registry"
+        ):
+            zstd.ZstdDecompressor(
+                dict_data=make_dicts(1)[0], dict_registry=registry
+            )
+
+    def test_membership(self):
+        dicts = make_dicts(2)
+        registry = zstd.ZstdDictionaryRegistry(max_cached=4)
+        self.assertEqual(registry.max_cached, 4)
+        self.assertEqual(len(registry), 0)
+
+        for d in dicts:
+            registry.add(d)
+
+        self.assertEqual(len(registry), 2)
+        self.assertIn(100, registry)
+        self.assertIn(101, registry)
+        self.assertNotIn(102, registry)
+
+        registry.remove(100)
+        self.assertEqual(len(registry), 1)
+        self.assertNotIn(100, registry)
+
+    def test_decompress(self):
+        dicts = make_dicts(3)
+        frames = make_frames(dicts)
+
+        registry = zstd.ZstdDictionaryRegistry()
+        for d in dicts:
+            registry.add(d)
+
+        dctx = zstd.ZstdDecompressor(dict_registry=registry)
+
+        for _ in range(2):
+            for source, frame in frames:
+                self.assertEqual(dctx.decompress(frame), source)
+
+        stats = registry.stats()
+        self.assertEqual(stats["misses"], 3)
+        self.assertEqual(stats["hits"], 3)
+        self.assertEqual(stats["evictions"], 0)
+        self.assertEqual(stats["cached"], 3)
+        self.assertGreater(stats["memory"], 0)
+
+        # Frames not using a dictionary still work.
+        frame = zstd.ZstdCompressor().compress(b"foobar" * 64)
+        self.assertEqual(dctx.decompress(frame), b"foobar" * 64)
+
+    def test_decompress_unregistered(self):
+        dicts = make_dicts(2)
+        frames = make_frames(dicts)
+
+        registry = zstd.ZstdDictionaryRegistry()
+        registry.add(dicts[0])
+
+        dctx = zstd.ZstdDecompressor(dict_registry=registry)
+        self.assertEqual(dctx.decompress(frames[0][1]), frames[0][0])
+
+        with self.assertRaises(zstd.ZstdError):
+            dctx.decompress(frames[1][1])
+
+    def test_eviction(self):
+        dicts = make_dicts(5)
+        frames = make_frames(dicts)
+
+        registry = zstd.ZstdDictionaryRegistry(max_cached=2)
+        for d in dicts:
+            registry.add(d)
+
+        dctx = zstd.ZstdDecompressor(dict_registry=registry)
+
+        for _ in range(3):
+            for source, frame in frames:
+                self.assertEqual(dctx.decompress(frame), source)
+
+        stats = registry.stats()
+        self.assertEqual(stats["cached"], 2)
+        self.assertEqual(stats["misses"], 15)
+        self.assertEqual(stats["evictions"], 13)
+
+    def test_read_across_frames(self):
+        dicts = make_dicts(3)
+        frames = make_frames(dicts)
+
+        registry = zstd.ZstdDictionaryRegistry()
+        for d in dicts:
+            registry.add(d)
+
+        dctx = zstd.ZstdDecompressor(dict_registry=registry)
+
+        self.assertEqual(
+            dctx.decompress(
+                b"".join(frame for _, frame in frames), read_across_frames=True
+            ),
+            b"".join(source for source, _ in frames),
+        )
+
+    def test_decompress_into(self):
+        dicts = make_dicts(2)
+        frames = make_frames(dicts)
+
+        registry = zstd.ZstdDictionaryRegistry()
+        for d in dicts:
+            registry.add(d)
+
+        dctx = zstd.ZstdDecompressor(dict_registry=registry)
+        out = bytearray(4096)
+
+        for source, frame in frames:
+            size = dctx.decompress_into(frame, out)
+            self.assertEqual(out[:size], source)
+
+    def test_streaming_uses_cached(self):
+        dicts = make_dicts(2)
+        frames = make_frames(dicts)
+
+        registry = zstd.ZstdDictionaryRegistry()
+        for d in dicts:
+            registry.add(d)
+
+        # Digest the dictionaries.
+        dctx = zstd.ZstdDecompressor(dict_registry=registry)
+        for _, frame in frames:
+            dctx.decompress(frame)
+
+        dctx = zstd.ZstdDecompressor(dict_registry=registry)
+
+        for source, frame in frames:
+            dobj = dctx.decompressobj()
+            self.assertEqual(dobj.decompress(frame), source)
+
+            with dctx.stream_reader(io.BytesIO(frame)) as reader:
+                self.assertEqual(reader.read(), source)
+
+    def test_replace(self):
+        dicts = make_dicts(1)
+        frames = make_frames(dicts)
+
+        registry = zstd.ZstdDictionaryRegistry()
+        registry.add(dicts[0])
+
+        dctx = zstd.ZstdDecompressor(dict_registry=registry)
+        self.assertEqual(dctx.decompress(frames[0][1]), frames[0][0])
+
+        registry.add(zstd.ZstdCompressionDict(dicts[0].as_bytes()))
+        self.assertEqual(registry.stats()["cached"], 0)
+        self.assertEqual(dctx.decompress(frames[0][1]), frames[0][0])
+        self.assertEqual(registry.stats()["misses"], 2)
+
+    def test_many_dicts_one_decompressor(self):
+        dicts = make_dicts(12)
+        frames = make_frames(dicts)
+
+        registry = zstd.ZstdDictionaryRegistry(max_cached=2)
+        for d in dicts:
+            registry.add(d)
+
+        dctx = zstd.ZstdDecompressor(dict_registry=registry)
+
+        for _ in range(4):
+            for source, frame in frames:
+                self.assertEqual(dctx.decompress(frame), source)
+
+
+@unittest.skipUnless(
+    "multi_decompress_to_buffer" in zstd.backend_features,
+    "multi_decompress_to_buffer feature not available",
+)
+class TestDictionaryRegistryMultiDecompress(unittest.TestCase):
+    def test_multi_decompress_to_buffer(self):
+        dicts = make_dicts(4)
+        frames = make_frames(dicts)
+
+        registry = zstd.ZstdDictionaryRegistry()
+        for d in dicts:
+            registry.add(d)
+
+        dctx = zstd.ZstdDecompressor(dict_registry=registry)
+
+        for threads in (0, 2):
+            result = dctx.multi_decompress_to_buffer(
+                [frame for _, frame in frames], threads=threads
+            )
+
+            self.assertEqual(
+                [result[i].tobytes() for i in range(len(result))],
+                [source for source, _ in frames],
+            )
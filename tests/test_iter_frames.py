@@ -0,0 +1,146 @@
+import io
+import struct
+import unittest
+
+import zstandard as zstd
+
+from .common import NonClosingBytesIO
+
+
+def skippable(payload, magic_variant=0):
+    return (
+        struct.pack("<II", 0x184D2A50 + magic_variant, len(payload)) + payload
+    )
+
+
+class UnseekableBytesIO(io.BytesIO):
+    def seekable(self):
+        return False
+
+    def seek(self, *args):
+        raise io.UnsupportedOperation()
+
+
+class TestIterFrames(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual(list(zstd.iter_frames(b"")), [])
+        self.assertEqual(list(zstd.iter_frames(io.BytesIO())), [])
+
+    def test_bad_arguments(self):
+        with self.assertRaisesRegex(ValueError, "read_size must be positive"):
+            list(zstd.iter_frames(b"", read_size=0))
+
+        with self.assertRaises(TypeError):
+            list(zstd.iter_frames("foo"))
+
+    def test_mixed(self):
+        cctx = zstd.ZstdCompressor()
+        data = b"".join(
+            [
+                skippable(b"first"),
+                cctx.compress(b"foo" * 1024),
+                skippable(b"", 7),
+                skippable(b"second", 15),
+                cctx.compress(b"bar"),
+            ]
+        )
+
+        expected = [
+            (0, b"first"),
+            (None, b"foo" * 1024),
+            (7, b""),
+            (15, b"second"),
+            (None, b"bar"),
+        ]
+
+        for source in (data, bytearray(data), io.BytesIO(data)):
+            self.assertEqual(list(zstd.iter_frames(source)), expected)
+
+        # Small reads and writes split output but don't change it.
+        items = list(
+            zstd.iter_frames(io.BytesIO(data), read_size=1, write_size=16)
+        )
+        self.assertEqual(
+            b"".join(d for v, d in items if v is None), b"foo" * 1024 + b"bar"
+        )
+        self.assertEqual(
+            [(v, d) for v, d in items if v is not None],
+            expected[0:1] + expected[2:4],
+        )
+
+    def test_skip(self):
+        cctx = zstd.ZstdCompressor()
+        payload = b"x" * 100000
+        data = (
+            cctx.compress(b"foo")
+            + skippable(payload)
+            + skippable(b"")
+            + cctx.compress(b"bar")
+        )
+
+        for source in (io.BytesIO(data), UnseekableBytesIO(data)):
+            self.assertEqual(
+                list(
+                    zstd.iter_frames(
+                        source, read_size=1024, skippable_frames=False
+                    )
+                ),
+                [(None, b"foo"), (None, b"bar")],
+            )
+
+    def test_seeks_past_skippable(self):
+        source = NonClosingBytesIO(skippable(b"x" * 100000))
+
+        self.assertEqual(
+            list(
+                zstd.iter_frames(source, read_size=64, skippable_frames=False)
+            ),
+            [],
+        )
+        self.assertEqual(source.tell(), 100008)
+
+    def test_truncated(self):
+        frame = zstd.ZstdCompressor().compress(b"foo" * 64)
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "input ends in the middle of a frame"
+        ):
+            list(zstd.iter_frames(frame[:-1]))
+
+        truncated = skippable(b"payload")[:-1]
+
+        for skippable_frames in (True, False):
+            for source in (
+                io.BytesIO(truncated),
+                UnseekableBytesIO(truncated),
+            ):
+                with self.assertRaisesRegex(
+                    zstd.ZstdError,
+                    "input ends in the middle of a skippable frame",
+                ):
+                    list(
+                        zstd.iter_frames(
+                            source,
+                            read_size=1,
+                            skippable_frames=skippable_frames,
+                        )
+                    )
+
+        with self.assertRaisesRegex(
+            zstd.ZstdError, "input ends in the middle of a frame header"
+        ):
+            list(zstd.iter_frames(skippable(b"")[:6]))
+
+    def test_invalid(self):
+        with self.assertRaises(zstd.ZstdError):
+            list(zstd.iter_frames(b"foobarbaz"))
+
+    def test_dict(self):
+        d = zstd.ZstdCompressionDict(b"foobarbaz" * 64)
+        frame = zstd.ZstdCompressor(dict_data=d).compress(b"foobarbaz" * 8)
+
+        dctx = zstd.ZstdDecompressor(dict_data=d)
+        self.assertEqual(
+            list(zstd.iter_frames(skippable(b"meta") + frame, dctx=dctx)),
+            [(0, b"meta"), (None, b"foobarbaz" * 8)],
+        )
@@ -18,7 +18,11 @@ class TestModuleAttributes(unittest.TestCase):
                 "multi_compress_to_buffer",
                 "multi_decompress_to_buffer",
             },
-            "cffi": set(),
+            "cffi": {
+                "buffer_types",
+                "multi_compress_to_buffer",
+                "multi_decompress_to_buffer",
+            },
             "rust": {
                 "buffer_types",
                 "multi_compress_to_buffer",
@@ -0,0 +1,154 @@
+import io
+import struct
+import unittest
+
+import zstandard as zstd
+
+
+def make_frames(count=32, size=65536, **kwargs):
+    cctx = zstd.ZstdCompressor(**kwargs)
+
+    chunks = [
+        b"".join(struct.pack(">I", i * size + j) for j in range(size // 4))
+        for i in range(count)
+    ]
+
+    return chunks, b"".join(cctx.compress(chunk) for chunk in chunks)
+
+
+class TestParallelDecompressor(unittest.TestCase):
+    def test_invalid_arguments(self):
+        with self.assertRaisesRegex(ValueError, "threads must be non-zero"):
+            zstd.ZstdParallelDecompressor(threads=0)
+
+        with self.assertRaisesRegex(ValueError, "max_pending_frames"):
+            zstd.ZstdParallelDecompressor(max_pending_frames=-1)
+
+        dctx = zstd.ZstdParallelDecompressor(threads=2)
+        self.assertEqual(dctx.threads, 2)
+
+        # Matches the backends' notion of the number of CPUs.
+        self.assertEqual(
+            zstd.ZstdParallelDecompressor().threads, zstd._cpu_count() or 1
+        )
+
+        with self.assertRaisesRegex(ValueError, "read\\(\\) method"):
+            dctx.read_to_iter(True)
+
+        with self.assertRaisesRegex(ValueError, "read\\(\\) method"):
+            dctx.copy_stream(b"", io.BytesIO())
+
+        with self.assertRaisesRegex(ValueError, "write\\(\\) method"):
+            dctx.copy_stream(io.BytesIO(), True)
+
+    def test_read_to_iter_buffer(self):
+        chunks, data = make_frames()
+
+        dctx = zstd.ZstdParallelDecompressor(threads=4)
+        self.assertEqual(list(dctx.read_to_iter(data)), chunks)
+        self.assertEqual(dctx.decompress(data), b"".join(chunks))
+
+        self.assertEqual(dctx.decompress(b""), b"")
+
+    def test_read_to_iter_stream(self):
+        chunks, data = make_frames()
+
+        dctx = zstd.ZstdParallelDecompressor(threads=4, max_pending_frames=1)
+        self.assertEqual(
+            list(dctx.read_to_iter(io.BytesIO(data), read_size=7)), chunks
+        )
+
+    def test_copy_stream(self):
+        chunks, data = make_frames(write_checksum=True)
+
+        dest = io.BytesIO()
+        dctx = zstd.ZstdParallelDecompressor(threads=3)
+        self.assertEqual(
+            dctx.copy_stream(io.BytesIO(data), dest),
+            (len(data), sum(map(len, chunks))),
+        )
+        self.assertEqual(dest.getvalue(), b"".join(chunks))
+
+    def test_unknown_content_size(self):
+        chunks, _ = make_frames(count=4)
+        cctx = zstd.ZstdCompressor(write_content_size=False)
+        data = b"".join(cctx.compress(chunk) for chunk in chunks)
+
+        dctx = zstd.ZstdParallelDecompressor(threads=2)
+        self.assertEqual(list(dctx.read_to_iter(data)), chunks)
+
+    def test_streaming_frames(self):
+        # stream_writer() output has multiple blocks and no content size.
+        buffer = io.BytesIO()
+        cctx = zstd.ZstdCompressor(level=1)
+        with cctx.stream_writer(buffer, closefd=False) as writer:
+            writer.write(b"foo" * 200000)
+            writer.flush(zstd.FLUSH_FRAME)
+            writer.write(b"")
+            writer.write(b"bar" * 10)
+
+        dctx = zstd.ZstdParallelDecompressor(threads=2)
+        self.assertEqual(
+            dctx.decompress(buffer.getvalue()), b"foo" * 200000 + b"bar" * 10
+        )
+
+    def test_rle_and_empty_frames(self):
+        cctx = zstd.ZstdCompressor()
+        data = cctx.compress(b"\x00" * 1000000) + cctx.compress(b"")
+
+        dctx = zstd.ZstdParallelDecompressor(threads=2)
+        self.assertEqual(list(dctx.read_to_iter(data)), [b"\x00" * 1000000])
+
+    def test_skippable_frames(self):
+        cctx = zstd.ZstdCompressor()
+        skippable = struct.pack("<II", 0x184D2A5F, 3) + b"abc"
+        data = skippable + cctx.compress(b"foo") + skippable
+
+        dctx = zstd.ZstdParallelDecompressor(threads=2)
+        self.assertEqual(dctx.decompress(data), b"foo")
+        self.assertEqual(dctx.decompress(io.BytesIO(data).getbuffer()), b"foo")
+
+    def test_seekable_output(self):
+        buffer = io.BytesIO()
+        with zstd.ZstdSeekableWriter(
+            buffer, max_frame_size=1000, closefd=False
+        ) as writer:
+            writer.write(b"foobar" * 10000)
+
+        dctx = zstd.ZstdParallelDecompressor(threads=4)
+        self.assertEqual(dctx.decompress(buffer.getvalue()), b"foobar" * 10000)
+
+    def test_dictionary(self):
+        d = zstd.train_dictionary(
+            8192, [b"foo%dbar" % i * 16 for i in range(1024)]
+        )
+        cctx = zstd.ZstdCompressor(dict_data=d)
+        chunks = [b"foo%dbar" % i * 16 for i in range(64)]
+        data = b"".join(cctx.compress(chunk) for chunk in chunks)
+
+        dctx = zstd.ZstdParallelDecompressor(dict_data=d, threads=4)
+        self.assertEqual(list(dctx.read_to_iter(data)), chunks)
+
+    def test_truncated_input(self):
+        _, data = make_frames(count=2)
+
+        dctx = zstd.ZstdParallelDecompressor(threads=2)
+
+        with self.assertRaisesRegex(zstd.ZstdError, "input ends in the middle"):
+            dctx.decompress(data[:-1])
+
+        with self.assertRaisesRegex(zstd.ZstdError, "input ends in the middle"):
+            dctx.decompress(io.BytesIO(data[:-10]))
+
+        with self.assertRaises(zstd.ZstdError):
+            dctx.decompress(data + b"\x00" * 8)
+
+    def test_corrupt_frame(self):
+        chunks, data = make_frames(count=4, write_checksum=True)
+
+        data = bytearray(data)
+        data[-5] ^= 0xFF
+
+        dctx = zstd.ZstdParallelDecompressor(threads=2)
+        with self.assertRaises(zstd.ZstdError):
+            dctx.decompress(data)
@@ -0,0 +1,230 @@
+import io
+import os
+import struct
+import unittest
+
+import zstandard as zstd
+
+from .common import (
+    NonClosingBytesIO,
+)
+
+
+def make_seekable(data, max_frame_size=1024, cctx=None, chunk_size=None):
+    dest = NonClosingBytesIO()
+    with zstd.ZstdSeekableWriter(
+        dest, cctx=cctx, max_frame_size=max_frame_size
+    ) as writer:
+        if chunk_size:
+            for i in range(0, len(data), chunk_size):
+                writer.write(data[i : i + chunk_size])
+        else:
+            writer.write(data)
+
+    return dest.getvalue()
+
+
+def source_data(size=100000):
+    return b"".join(
+        b"line %d of seekable test data\n" % i for i in range(size // 28 + 1)
+    )[:size]
+
+
+class TestSeekableWriter(unittest.TestCase):
+    def test_bad_arguments(self):
+        with self.assertRaisesRegex(ValueError, "write\\(\\) method"):
+            zstd.ZstdSeekableWriter(b"foo")
+
+        with self.assertRaisesRegex(ValueError, "max_frame_size"):
+            zstd.ZstdSeekableWriter(io.BytesIO(), max_frame_size=0)
+
+    def test_empty(self):
+        dest = NonClosingBytesIO()
+        with zstd.ZstdSeekableWriter(dest) as writer:
+            self.assertEqual(writer.frame_count, 0)
+
+        frame = dest.getvalue()
+        self.assertEqual(
+            frame,
+            struct.pack("<II", 0x184D2A5E, 9)
+            + struct.pack("<IBI", 0, 0, 0x8F92EAB1),
+        )
+
+        self.assertEqual(zstd.ZstdSeekableReader(frame).read(), b"")
+
+    def test_frame_boundaries(self):
+        dest = NonClosingBytesIO()
+        with zstd.ZstdSeekableWriter(dest, max_frame_size=100) as writer:
+            self.assertEqual(writer.write(b"a" * 50), 50)
+            self.assertEqual(writer.frame_count, 0)
+            writer.write(b"b" * 60)
+            self.assertEqual(writer.frame_count, 1)
+            writer.write(b"c" * 350)
+            self.assertEqual(writer.frame_count, 4)
+            self.assertGreater(writer.flush(), 0)
+            self.assertEqual(writer.frame_count, 5)
+            self.assertEqual(writer.flush(), 0)
+            self.assertEqual(writer.frame_count, 5)
+            self.assertEqual(writer.tell(), len(dest.getvalue()))
+
+        frame = dest.getvalue()
+        count, descriptor, magic = struct.unpack("<IBI", frame[-9:])
+        self.assertEqual(count, 5)
+        self.assertEqual(descriptor, 0)
+        self.assertEqual(magic, 0x8F92EAB1)
+
+        self.assertEqual(writer.tell(), len(frame))
+
+    def test_checksums(self):
+        cctx = zstd.ZstdCompressor(write_checksum=True)
+        frame = make_seekable(source_data(5000), cctx=cctx)
+
+        count, descriptor, magic = struct.unpack("<IBI", frame[-9:])
+        self.assertEqual(count, 5)
+        self.assertEqual(descriptor, 0x80)
+
+        header = frame[-(9 + 12 * count + 8) :][0:8]
+        self.assertEqual(
+            struct.unpack("<II", header), (0x184D2A5E, 9 + 12 * count)
+        )
+
+    def test_write_closed(self):
+        writer = zstd.ZstdSeekableWriter(NonClosingBytesIO())
+        writer.close()
+        self.assertTrue(writer.closed)
+
+        with self.assertRaisesRegex(ValueError, "stream is closed"):
+            writer.write(b"foo")
+
+    def test_closefd(self):
+        dest = io.BytesIO()
+        zstd.ZstdSeekableWriter(dest, closefd=False).close()
+        self.assertFalse(dest.closed)
+
+        zstd.ZstdSeekableWriter(dest).close()
+        self.assertTrue(dest.closed)
+
+    def test_compatible_with_regular_decompression(self):
+        data = source_data()
+        frame = make_seekable(data, chunk_size=333)
+
+        dctx = zstd.ZstdDecompressor()
+        with dctx.stream_reader(frame, read_across_frames=True) as reader:
+            self.assertEqual(reader.read(), data)
+
+
+class TestSeekableReader(unittest.TestCase):
+    def test_bad_arguments(self):
+        with self.assertRaises(TypeError):
+            zstd.ZstdSeekableReader(True)
+
+    def test_invalid_data(self):
+        with self.assertRaisesRegex(zstd.ZstdError, "too small"):
+            zstd.ZstdSeekableReader(b"foo")
+
+        with self.assertRaisesRegex(zstd.ZstdError, "invalid magic number"):
+            zstd.ZstdSeekableReader(zstd.ZstdCompressor().compress(b"x" * 64))
+
+        frame = bytearray(make_seekable(source_data(4096)))
+
+        bad = bytearray(frame)
+        bad[-5] |= 0x04
+        with self.assertRaisesRegex(zstd.ZstdError, "reserved bits"):
+            zstd.ZstdSeekableReader(bad)
+
+        bad = bytearray(frame)
+        bad[-9] += 1
+        with self.assertRaisesRegex(zstd.ZstdError, "skippable frame header"):
+            zstd.ZstdSeekableReader(bad)
+
+        with self.assertRaisesRegex(zstd.ZstdError, "does not match"):
+            zstd.ZstdSeekableReader(b"\x00" + frame)
+
+    def test_read_all(self):
+        data = source_data()
+        frame = make_seekable(data)
+
+        for source in (frame, io.BytesIO(frame)):
+            with zstd.ZstdSeekableReader(source) as reader:
+                self.assertEqual(reader.frame_count, 98)
+                self.assertEqual(reader.read(), data)
+                self.assertEqual(reader.read(), b"")
+                self.assertEqual(reader.tell(), len(data))
+
+    def test_seek(self):
+        data = source_data()
+        frame = make_seekable(data, max_frame_size=4000)
+
+        reader = zstd.ZstdSeekableReader(io.BytesIO(frame))
+        self.assertTrue(reader.seekable())
+
+        self.assertEqual(reader.seek(50000), 50000)
+        self.assertEqual(reader.read(10000), data[50000:60000])
+
+        # Backwards.
+        self.assertEqual(reader.seek(10), 10)
+        self.assertEqual(reader.read(7), data[10:17])
+
+        self.assertEqual(reader.seek(-7, os.SEEK_CUR), 10)
+        self.assertEqual(reader.read(7), data[10:17])
+
+        self.assertEqual(reader.seek(-100, os.SEEK_END), len(data) - 100)
+        self.assertEqual(reader.read(), data[-100:])
+
+        self.assertEqual(reader.seek(3999), 3999)
+        self.assertEqual(reader.read(2), data[3999:4001])
+
+        # Past the end.
+        self.assertEqual(reader.seek(len(data) + 10), len(data) + 10)
+        self.assertEqual(reader.read(), b"")
+
+        with self.assertRaises(OSError):
+            reader.seek(-1)
+
+        with self.assertRaisesRegex(ValueError, "invalid whence"):
+            reader.seek(0, 42)
+
+    def test_readinto(self):
+        data = source_data(10000)
+        frame = make_seekable(data, max_frame_size=1000)
+
+        reader = zstd.ZstdSeekableReader(frame)
+        reader.seek(2500)
+
+        b = bytearray(3000)
+        self.assertEqual(reader.readinto(b), 3000)
+        self.assertEqual(b, data[2500:5500])
+
+        reader.seek(-500, os.SEEK_END)
+        self.assertEqual(reader.readinto1(b), 500)
+        self.assertEqual(b[0:500], data[-500:])
+
+    def test_checksums(self):
+        data = source_data(10000)
+        frame = make_seekable(
+            data, cctx=zstd.ZstdCompressor(write_checksum=True)
+        )
+
+        reader = zstd.ZstdSeekableReader(frame)
+        reader.seek(9000)
+        self.assertEqual(reader.read(), data[9000:])
+
+    def test_close(self):
+        frame = make_seekable(b"foo")
+
+        source = io.BytesIO(frame)
+        reader = zstd.ZstdSeekableReader(source, closefd=False)
+        reader.close()
+        self.assertTrue(reader.closed)
+        self.assertFalse(source.closed)
+
+        with self.assertRaisesRegex(ValueError, "stream is closed"):
+            reader.read()
+
+        with self.assertRaisesRegex(ValueError, "stream is closed"):
+            reader.seek(0)
+
+        with zstd.ZstdSeekableReader(source):
+            pass
+
+        self.assertTrue(source.closed)
@@ -0,0 +1,56 @@
+import os
+import unittest
+
+import zstandard as zstd
+
+
+class TestThreadPool(unittest.TestCase):
+    def test_threads(self):
+        self.assertEqual(zstd.ZstdThreadPool(threads=2).threads, 2)
+        self.assertEqual(zstd.ZstdThreadPool(threads=0).threads, 1)
+        self.assertGreaterEqual(zstd.ZstdThreadPool().threads, 1)
+
+    def test_bad_pool(self):
+        with self.assertRaisesRegex(
+            TypeError, "thread_pool must be zstd.ZstdThreadPool"
+        ):
+            zstd.ZstdCompressor(thread_pool=True)
+
+    def test_shared(self):
+        pool = zstd.ZstdThreadPool(threads=2)
+
+        source = os.urandom(64) * 65536
+
+        cctx1 = zstd.ZstdCompressor(thread_pool=pool)
+        cctx2 = zstd.ZstdCompressor(level=1, threads=1, thread_pool=pool)
+
+        dctx = zstd.ZstdDecompressor()
+
+        for cctx in (cctx1, cctx2):
+            frame = cctx.compress(source)
+            self.assertEqual(dctx.decompress(frame), source)
+
+            cobj = cctx.compressobj()
+            frame = cobj.compress(source) + cobj.flush()
+            self.assertEqual(
+                dctx.decompress(frame, max_output_size=len(source)), source
+            )
+
+    def test_outlives_reference(self):
+        cctx = zstd.ZstdCompressor(thread_pool=zstd.ZstdThreadPool(threads=2))
+
+        source = b"foo" * 1048576
+        frame = cctx.compress(source)
+
+        self.assertEqual(zstd.ZstdDecompressor().decompress(frame), source)
+
+    def test_compression_params(self):
+        pool = zstd.ZstdThreadPool(threads=2)
+        params = zstd.ZstdCompressionParameters.from_level(3, threads=2)
+
+        cctx = zstd.ZstdCompressor(compression_params=params, thread_pool=pool)
+
+        source = b"bar" * 1048576
+        self.assertEqual(
+            zstd.ZstdDecompressor().decompress(cctx.compress(source)), source
+        )
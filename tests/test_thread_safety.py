@@ -0,0 +1,217 @@
+import io
+import threading
+import unittest
+
+import zstandard as zstd
+
+from .common import (
+    generate_samples,
+    get_optimal_dict_size_heuristically,
+)
+
+THREADS = 8
+
+
+def run_threads(worker, count=THREADS):
+    """Run ``worker(index)`` on ``count`` threads started at the same time.
+
+    Returns the results in thread order. Re-raises the first exception.
+    """
+    barrier = threading.Barrier(count)
+    results = [None] * count
+    errors = []
+
+    def run(index):
+        try:
+            barrier.wait()
+            results[index] = worker(index)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    if errors:
+        raise errors[0]
+
+    return results
+
+
+def make_sources(index, count=64):
+    return [
+        b"thread %d chunk %d " % (index, i) * (64 + i * 16)
+        for i in range(count)
+    ]
+
+
+def make_dict():
+    samples = generate_samples()
+
+    return zstd.train_dictionary(
+        get_optimal_dict_size_heuristically(samples), samples
+    )
+
+
+class TestSharedDictionary(unittest.TestCase):
+    def test_precompute_compress(self):
+        d = make_dict()
+
+        def worker(index):
+            for i in range(50):
+                d.precompute_compress(level=1 + (index + i) % 4)
+
+        run_threads(worker)
+
+        stats = d.cdict_stats()
+        self.assertEqual(stats["cached"], 4)
+        self.assertEqual(stats["hits"] + stats["misses"], THREADS * 50)
+        self.assertEqual(stats["evictions"], 0)
+
+    def test_compress_and_decompress(self):
+        d = make_dict()
+
+        def worker(index):
+            cctx = zstd.ZstdCompressor(level=1 + index % 3, dict_data=d)
+            dctx = zstd.ZstdDecompressor(dict_data=d)
+
+            for source in make_sources(index, 16):
+                if index % 2:
+                    d.precompute_compress(level=1 + index % 3)
+
+                frame = cctx.compress(source)
+                self.assertEqual(dctx.decompress(frame), source)
+
+        run_threads(worker)
+
+
+class TestSharedRegistry(unittest.TestCase):
+    def test_decompress(self):
+        samples = generate_samples()
+        dict_size = get_optimal_dict_size_heuristically(samples)
+        dicts = [
+            zstd.train_dictionary(dict_size, samples, dict_id=200 + i)
+            for i in range(4)
+        ]
+
+        frames = []
+        for i, d in enumerate(dicts):
+            source = b"registry %d " % i * 256
+            frames.append(
+                (source, zstd.ZstdCompressor(dict_data=d).compress(source))
+            )
+
+        registry = zstd.ZstdDictionaryRegistry(max_cached=2)
+        for d in dicts:
+            registry.add(d)
+
+        def worker(index):
+            dctx = zstd.ZstdDecompressor(dict_registry=registry)
+
+            for i in range(100):
+                source, frame = frames[(index + i) % len(frames)]
+                self.assertEqual(dctx.decompress(frame), source)
+
+                with dctx.stream_reader(io.BytesIO(frame)) as reader:
+                    self.assertEqual(reader.read(), source)
+
+        run_threads(worker)
+
+        stats = registry.stats()
+        self.assertLessEqual(stats["cached"], 2)
+        self.assertEqual(stats["hits"] + stats["misses"], THREADS * 100)
+
+
+class TestThreadLocalContexts(unittest.TestCase):
+    def test_streaming(self):
+        def worker(index):
+            cctx = zstd.ZstdCompressor(level=1)
+            dctx = zstd.ZstdDecompressor()
+            source = b"".join(make_sources(index, 16))
+
+            def decompress(frame):
+                return dctx.decompressobj().decompress(frame)
+
+            cobj = cctx.compressobj()
+            frame = cobj.compress(source) + cobj.flush()
+            self.assertEqual(decompress(frame), source)
+
+            buffer = io.BytesIO()
+            with cctx.stream_writer(buffer, closefd=False) as writer:
+                for i in range(0, len(source), 8192):
+                    writer.write(source[i : i + 8192])
+            self.assertEqual(decompress(buffer.getvalue()), source)
+
+            chunks = cctx.read_to_iter(io.BytesIO(source), read_size=8192)
+            self.assertEqual(decompress(b"".join(chunks)), source)
+
+            with cctx.stream_reader(source) as reader:
+                self.assertEqual(decompress(reader.read()), source)
+
+            with dctx.stream_reader(frame) as reader:
+                self.assertEqual(reader.read(), source)
+
+            self.assertEqual(
+                b"".join(dctx.read_to_iter(io.BytesIO(frame))), source
+            )
+
+        run_threads(worker)
+
+
+@unittest.skipUnless(
+    zstd.backend == "cext", "only the C backend serializes shared contexts"
+)
+class TestSharedContext(unittest.TestCase):
+    def test_compress(self):
+        cctx = zstd.ZstdCompressor(level=3, write_checksum=True)
+        dctx = zstd.ZstdDecompressor()
+
+        def worker(index):
+            frames = [cctx.compress(source) for source in make_sources(index)]
+
+            for source, frame in zip(make_sources(index), frames):
+                self.assertEqual(dctx.decompress(frame), source)
+
+        run_threads(worker)
+
+    def test_one_shot_during_streaming(self):
+        cctx = zstd.ZstdCompressor(level=1)
+        dctx = zstd.ZstdDecompressor()
+
+        # Calls on a shared context are serialized, but a multi-call operation
+        # can still be interrupted by other threads. Its output is undefined.
+        # Everything else must keep working.
+        def worker(index):
+            sources = make_sources(index, 16)
+
+            if index % 2:
+                with cctx.stream_writer(io.BytesIO()) as writer:
+                    for source in sources:
+                        writer.write(source)
+            else:
+                for source in sources:
+                    frame = cctx.compress(source)
+                    self.assertEqual(dctx.decompress(frame), source)
+
+        run_threads(worker)
+
+    @unittest.skipUnless(
+        "multi_compress_to_buffer" in zstd.backend_features,
+        "multi_compress_to_buffer feature not available",
+    )
+    def test_multi_compress_to_buffer(self):
+        cctx = zstd.ZstdCompressor(level=1)
+        dctx = zstd.ZstdDecompressor()
+
+        def worker(index):
+            sources = make_sources(index, 16)
+            result = cctx.multi_compress_to_buffer(sources, threads=2)
+            frames = dctx.multi_decompress_to_buffer(result, threads=2)
+
+            self.assertEqual(
+                [frames[i].tobytes() for i in range(len(frames))], sources
+            )
+
+        run_threads(worker, 4)
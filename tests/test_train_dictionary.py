@@ -68,6 +68,87 @@ class TestTrainDictionary(unittest.TestCase):
         self.assertIn(d.k, (50, 2000))
         self.assertEqual(d.d, 6)
 
+    def test_bad_max_samples_size(self):
+        with self.assertRaisesRegex(
+            ValueError, "max_samples_size must be non-negative"
+        ):
+            zstd.train_dictionary(8192, generate_samples(), max_samples_size=-1)
+
+    def test_iterable(self):
+        samples = generate_samples()
+        dict_size = get_optimal_dict_size_heuristically(samples)
+
+        expected = zstd.train_dictionary(
+            dict_size, samples, k=64, d=8, dict_id=42
+        )
+
+        d = zstd.train_dictionary(
+            dict_size, (s for s in samples), k=64, d=8, dict_id=42
+        )
+        self.assertEqual(d.as_bytes(), expected.as_bytes())
+
+        d = zstd.train_dictionary(
+            dict_size, tuple(samples), k=64, d=8, dict_id=42
+        )
+        self.assertEqual(d.as_bytes(), expected.as_bytes())
+
+    @unittest.skipUnless(
+        "buffer_types" in zstd.backend_features, "buffer types not available"
+    )
+    def test_buffer_with_segments(self):
+        samples = generate_samples()
+        dict_size = get_optimal_dict_size_heuristically(samples)
+
+        segments = []
+        offset = 0
+        for sample in samples:
+            segments.append(struct.pack("=QQ", offset, len(sample)))
+            offset += len(sample)
+
+        buffer = zstd.BufferWithSegments(b"".join(samples), b"".join(segments))
+
+        expected = zstd.train_dictionary(
+            dict_size, samples, k=64, d=8, dict_id=42
+        )
+        d = zstd.train_dictionary(dict_size, buffer, k=64, d=8, dict_id=42)
+        self.assertEqual(d.as_bytes(), expected.as_bytes())
+
+    def test_max_samples_size(self):
+        samples = generate_samples()
+        dict_size = get_optimal_dict_size_heuristically(samples)
+        total_size = sum(map(len, samples))
+
+        # A budget covering every sample retains all of them.
+        expected = zstd.train_dictionary(
+            dict_size, samples, k=64, d=8, dict_id=42
+        )
+        d = zstd.train_dictionary(
+            dict_size,
+            iter(samples),
+            k=64,
+            d=8,
+            dict_id=42,
+            max_samples_size=total_size,
+        )
+        self.assertEqual(d.as_bytes(), expected.as_bytes())
+
+        # Sampling is reproducible for a given seed.
+        results = [
+            zstd.train_dictionary(
+                dict_size,
+                iter(samples),
+                k=64,
+                d=8,
+                dict_id=42,
+                max_samples_size=total_size // 4,
+                seed=seed,
+            ).as_bytes()
+            for seed in (1, 1, 2)
+        ]
+        self.assertEqual(results[0], results[1])
+        self.assertNotEqual(results[0], results[2])
+        self.assertNotEqual(results[0], expected.as_bytes())
+
 
 class TestCompressionDict(unittest.TestCase):
     def test_bad_mode(self):
@@ -105,3 +186,94 @@ class TestCompressionDict(unittest.TestCase):
             zstd.ZstdError, "unable to precompute dictionary"
         ):
             d.precompute_compress(level=1)
+
+    def test_bad_cdict_cache_size(self):
+        with self.assertRaisesRegex(
+            ValueError, "cdict_cache_size must be positive"
+        ):
+            zstd.ZstdCompressionDict(b"foo" * 64, cdict_cache_size=0)
+
+    def test_cdict_cache_size_keyword_only(self):
+        with self.assertRaises(TypeError):
+            zstd.ZstdCompressionDict(b"foo" * 64, zstd.DICT_TYPE_AUTO, 0, 0, 2)
+
+        d = zstd.ZstdCompressionDict(
+            b"foo" * 64, zstd.DICT_TYPE_AUTO, cdict_cache_size=2
+        )
+        self.assertEqual(d.cdict_cache_size, 2)
+
+    def test_precompute_compress_cache(self):
+        samples = generate_samples()
+        d = zstd.train_dictionary(
+            get_optimal_dict_size_heuristically(samples), samples
+        )
+        self.assertEqual(d.cdict_cache_size, 4)
+
+        stats = d.cdict_stats()
+        self.assertEqual(stats["cached"], 0)
+        self.assertEqual(stats["memory"], 0)
+
+        for level in (1, 3, 19, 1, 3, 19):
+            d.precompute_compress(level=level)
+
+        stats = d.cdict_stats()
+        self.assertEqual(stats["hits"], 3)
+        self.assertEqual(stats["misses"], 3)
+        self.assertEqual(stats["evictions"], 0)
+        self.assertEqual(stats["cached"], 3)
+        self.assertGreater(stats["memory"], 0)
+
+        params = zstd.ZstdCompressionParameters.from_level(
+            19, source_size=0, dict_size=len(d)
+        )
+        d.precompute_compress(compression_params=params)
+        self.assertEqual(d.cdict_stats()["misses"], 3)
+
+    def test_precompute_compress_eviction(self):
+        samples = generate_samples()
+        d = zstd.ZstdCompressionDict(
+            zstd.train_dictionary(
+                get_optimal_dict_size_heuristically(samples), samples
+            ).as_bytes(),
+            cdict_cache_size=2,
+        )
+        self.assertEqual(d.cdict_cache_size, 2)
+
+        d.precompute_compress(level=1)
+        cctx = zstd.ZstdCompressor(level=1, dict_data=d)
+
+        for level in (2, 3, 4):
+            d.precompute_compress(level=level)
+
+        stats = d.cdict_stats()
+        self.assertEqual(stats["cached"], 2)
+        self.assertEqual(stats["evictions"], 2)
+
+        # The evicted dictionary remains usable by the existing compressor.
+        source = b"foo bar foobar" * 64
+        frame = cctx.compress(source)
+        dctx = zstd.ZstdDecompressor(dict_data=d)
+        self.assertEqual(dctx.decompress(frame), source)
+
+    def test_compressor_selects_cached(self):
+        samples = generate_samples()
+        d = zstd.train_dictionary(
+            get_optimal_dict_size_heuristically(samples), samples
+        )
+
+        for level in (1, 19):
+            d.precompute_compress(level=level)
+
+        source = b"".join(samples[0:32])
+        dctx = zstd.ZstdDecompressor(dict_data=d)
+
+        for level in (1, 19, 5):
+            cctx = zstd.ZstdCompressor(level=level, dict_data=d)
+            frame = cctx.compress(source)
+            self.assertEqual(dctx.decompress(frame), source)
+
+        # Levels 1 and 19 are served from the cache. Level 5 uses the most
+        # recently precomputed dictionary.
+        stats = d.cdict_stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 2)
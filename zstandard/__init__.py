@@ -14,11 +14,19 @@ from __future__ import absolute_import, unicode_literals
 #
 # 1) Export the C or CFFI "backend" through a central module.
 # 2) Implement additional functionality built on top of C or CFFI backend.
+import array
+import bisect
 import builtins
+import collections
+import concurrent.futures
 import io
+import mmap
 import os
 import platform
-from typing import ByteString
+import queue
+import struct
+import threading
+from typing import ByteString, Optional, Tuple
 
 # Some Python implementations don't support C extensions. That's why we have
 # a CFFI implementation in the first place. The code here import one of our
@@ -79,6 +87,15 @@ else:
         "cext, or cffi" % _module_policy
     )
 
+# Private helpers aren't re-exported by the star imports above. Thread counts
+# must be resolved the same way the backend resolves them.
+if backend == "cext":
+    from .backend_c import _cpu_count
+elif backend == "cffi":
+    from .backend_cffi import _cpu_count
+else:
+    from .backend_rust import _cpu_count
+
 # Keep this in sync with python-zstandard.h, rust-ext/src/lib.rs, and debian/changelog.
 __version__ = "0.24.0.dev0"
 
@@ -208,3 +225,1726 @@ def decompress(data: ByteString, max_output_size: int = 0) -> bytes:
     dctx = ZstdDecompressor()
 
     return dctx.decompress(data, max_output_size=max_output_size)
+
+
+# Output is written in chunks of this size by compress_file() and
+# decompress_file(). Large chunks minimize how often the GIL is reacquired to
+# call write().
+_FILE_WRITE_SIZE = 1048576
+
+
+class _MappedFile(object):
+    """Context manager exposing a file's content via a read-only mmap."""
+
+    def __init__(self, path):
+        self._path = path
+        self._fh = None
+        self._stat = None
+        self._mmap = None
+
+    def __enter__(self):
+        self._fh = builtins.open(self._path, "rb")
+
+        try:
+            self._stat = os.fstat(self._fh.fileno())
+
+            # Empty files can't be mapped.
+            if not self._stat.st_size:
+                return b""
+
+            self._mmap = mmap.mmap(
+                self._fh.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except BaseException:
+            self._fh.close()
+            raise
+
+        if hasattr(self._mmap, "madvise"):
+            self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+
+        return self._mmap
+
+    def check_distinct(self, path):
+        """Raise ``ValueError`` if ``path`` refers to the mapped file.
+
+        Truncating a mapped file makes accessing its pages raise ``SIGBUS``.
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return
+
+        if (st.st_dev, st.st_ino) == (self._stat.st_dev, self._stat.st_ino):
+            raise ValueError("source and destination are the same file")
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        if self._mmap is not None:
+            self._mmap.close()
+
+        self._fh.close()
+
+        return False
+
+
+def compress_file(
+    src_path,
+    dst_path,
+    cctx: Optional["ZstdCompressor"] = None,
+    write_size: int = _FILE_WRITE_SIZE,
+) -> Tuple[int, int]:
+    """Compress the content of a file into a new file.
+
+    The source file is memory mapped and passed to the compressor as a single
+    input buffer, avoiding the ``read()`` calls and intermediate ``bytes``
+    objects of :py:meth:`ZstdCompressor.copy_stream`. Since the size of the
+    source is known, it is written into the frame header.
+
+    The GIL is released while zstd compresses data. It is only held to write
+    each ``write_size`` chunk of output to the destination file.
+
+    >>> zstandard.compress_file("access.log", "access.log.zst")
+
+    The source file must not be truncated while it is being compressed.
+    Accessing the missing pages of the mapping kills the process with
+    ``SIGBUS``.
+
+    :param src_path:
+       Path of the file to compress.
+    :param dst_path:
+       Path of the file to write compressed data to. Existing files are
+       truncated. ``ValueError`` is raised if this is the source file.
+    :param cctx:
+       ``ZstdCompressor`` to compress with. If not specified, the default
+       ``ZstdCompressor`` is used.
+    :param write_size:
+       Size in bytes of chunks written to the destination file.
+    :return:
+       2-tuple of integers of bytes read and written, respectively.
+    """
+    cctx = cctx or ZstdCompressor()
+
+    mapped = _MappedFile(src_path)
+
+    with mapped as source:
+        mapped.check_distinct(dst_path)
+
+        with builtins.open(dst_path, "wb") as ofh:
+            with cctx.stream_writer(
+                ofh, size=len(source), write_size=write_size, closefd=False
+            ) as writer:
+                writer.write(source)
+
+            return len(source), ofh.tell()
+
+
+def decompress_file(
+    src_path,
+    dst_path,
+    dctx: Optional["ZstdDecompressor"] = None,
+    write_size: int = _FILE_WRITE_SIZE,
+) -> Tuple[int, int]:
+    """Decompress the content of a file into a new file.
+
+    This is the inverse of :py:func:`compress_file`. The source file is memory
+    mapped and passed to the decompressor as a single input buffer. All
+    frames in the source file are decompressed.
+
+    The GIL is released while zstd decompresses data. It is only held to write
+    each ``write_size`` chunk of output to the destination file.
+
+    >>> zstandard.decompress_file("access.log.zst", "access.log")
+
+    As with :py:func:`compress_file`, the source file must not be truncated
+    while it is being decompressed.
+
+    :param src_path:
+       Path of the file to decompress.
+    :param dst_path:
+       Path of the file to write decompressed data to. Existing files are
+       truncated. ``ValueError`` is raised if this is the source file.
+    :param dctx:
+       ``ZstdDecompressor`` to decompress with. If not specified, the default
+       ``ZstdDecompressor`` is used.
+    :param write_size:
+       Size in bytes of chunks written to the destination file.
+    :return:
+       2-tuple of integers of bytes read and written, respectively.
+    """
+    dctx = dctx or ZstdDecompressor()
+
+    mapped = _MappedFile(src_path)
+
+    with mapped as source:
+        mapped.check_distinct(dst_path)
+
+        with builtins.open(dst_path, "wb") as ofh:
+            with dctx.stream_writer(
+                ofh, write_size=write_size, closefd=False
+            ) as writer:
+                writer.write(source)
+
+            return len(source), ofh.tell()
+
+
+class _PooledContext(object):
+    __slots__ = ("_pool", "_context")
+
+    def __init__(self, pool):
+        self._pool = pool
+        self._context = None
+
+    def __enter__(self):
+        self._context = self._pool.acquire()
+        return self._context
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        context, self._context = self._context, None
+        self._pool.release(context)
+
+        return False
+
+
+class ZstdContextPool(object):
+    """Thread-safe pool of reusable ``ZstdCompressor`` or ``ZstdDecompressor``.
+
+    ``ZstdCompressor`` and ``ZstdDecompressor`` instances can't be used by
+    multiple threads at the same time. But constructing a new instance for
+    every operation means allocating and configuring a new zstd context every
+    time. This pool retains idle instances so each thread can check one out,
+    use it, and return it for reuse by another thread.
+
+    Instances are created on demand by calling ``factory``. Use
+    ``functools.partial`` to create instances with specific settings. Every
+    instance created this way shares the same ``ZstdCompressionDict``:
+
+    >>> pool = zstandard.ZstdContextPool(
+    ...     functools.partial(zstandard.ZstdCompressor, level=9, dict_data=d)
+    ... )
+    >>> with pool.checkout() as cctx:
+    ...     compressed = cctx.compress(data)
+
+    Calling :py:meth:`ZstdCompressionDict.precompute_compress` before
+    creating the pool means the dictionary is digested once instead of by
+    every instance.
+
+    At most ``max_idle`` instances are retained while not checked out.
+    Instances returned while the pool is full are discarded and counted as
+    evictions. The number of instances checked out at the same time is not
+    limited.
+
+    :param factory:
+       Callable returning a new ``ZstdCompressor`` or ``ZstdDecompressor``.
+    :param max_idle:
+       Maximum number of idle instances to retain. Defaults to the number of
+       logical CPUs in the machine.
+    """
+
+    def __init__(self, factory, max_idle=None):
+        if not callable(factory):
+            raise TypeError("factory must be callable")
+
+        if max_idle is None:
+            max_idle = os.cpu_count() or 1
+
+        if max_idle < 0:
+            raise ValueError("max_idle must not be negative")
+
+        self._factory = factory
+        self._max_idle = max_idle
+        self._lock = threading.Lock()
+        # Used as a stack so recently used (and cache warm) instances are
+        # handed out first.
+        self._idle = []
+        # id() -> instance of checked out instances. Holding the instance
+        # keeps its id() from being reused while it is checked out.
+        self._checked_out = {}
+        self._in_use = 0
+        self._max_in_use = 0
+        self._created = 0
+        self._checkouts = 0
+        self._evictions = 0
+
+    @property
+    def max_idle(self):
+        """Maximum number of idle instances retained."""
+        return self._max_idle
+
+    def acquire(self):
+        """Obtain an instance from the pool.
+
+        An idle instance is returned if available. Otherwise a new instance is
+        created. The instance must be returned with :py:meth:`release`.
+        """
+        with self._lock:
+            self._checkouts += 1
+            self._in_use += 1
+            self._max_in_use = max(self._max_in_use, self._in_use)
+
+            if self._idle:
+                context = self._idle.pop()
+                self._checked_out[id(context)] = context
+                return context
+
+            self._created += 1
+
+        try:
+            context = self._factory()
+        except BaseException:
+            with self._lock:
+                self._checkouts -= 1
+                self._in_use -= 1
+                self._created -= 1
+
+            raise
+
+        with self._lock:
+            self._checked_out[id(context)] = context
+
+        return context
+
+    def release(self, context):
+        """Return an instance obtained from :py:meth:`acquire` to the pool.
+
+        Raises ``ValueError`` if the instance isn't checked out from this
+        pool, such as when it was already returned.
+        """
+        with self._lock:
+            if self._checked_out.get(id(context)) is not context:
+                raise ValueError("context is not checked out from this pool")
+
+            del self._checked_out[id(context)]
+            self._in_use -= 1
+
+            if len(self._idle) < self._max_idle:
+                self._idle.append(context)
+            else:
+                self._evictions += 1
+
+    def checkout(self):
+        """Obtain a context manager which checks out an instance.
+
+        The instance is returned to the pool when the context manager exits.
+        """
+        return _PooledContext(self)
+
+    def clear(self):
+        """Discard all idle instances."""
+        with self._lock:
+            self._evictions += len(self._idle)
+            self._idle = []
+
+    def stats(self):
+        """Obtain usage statistics.
+
+        Returns a dict with the following keys:
+
+        ``created``
+           Number of instances created by calling ``factory``.
+        ``checkouts``
+           Number of times an instance was checked out.
+        ``reused``
+           Number of checkouts satisfied by an idle instance.
+        ``evictions``
+           Number of instances discarded because the pool was full or
+           :py:meth:`clear` was called.
+        ``idle``
+           Number of idle instances currently retained.
+        ``in_use``
+           Number of instances currently checked out.
+        ``max_in_use``
+           Maximum number of instances checked out at the same time.
+        """
+        with self._lock:
+            return {
+                "created": self._created,
+                "checkouts": self._checkouts,
+                "reused": self._checkouts - self._created,
+                "evictions": self._evictions,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "max_in_use": self._max_in_use,
+            }
+
+
+# Constants defined by the zstd seekable format. See
+# https://github.com/facebook/zstd/blob/dev/contrib/seekable_format/zstd_seekable_compression_format.md
+_SEEKABLE_MAGIC_NUMBER = 0x8F92EAB1
+_SEEK_TABLE_SKIPPABLE_MAGIC = 0x184D2A5E
+_SEEKABLE_MAX_FRAMES = 0x8000000
+_SEEKABLE_MAX_FRAME_SIZE = 0x40000000
+_SEEKABLE_FOOTER = struct.Struct("<IBI")
+_SKIPPABLE_HEADER = struct.Struct("<II")
+
+
+class ZstdSeekableWriter(object):
+    """Writable stream producing data in the zstd *seekable* format.
+
+    The seekable format is a sequence of independent zstd frames, each holding
+    at most ``max_frame_size`` bytes of uncompressed data, followed by a
+    skippable frame containing a *seek table* recording the compressed and
+    decompressed size of every frame. Because the seek table lives in a
+    skippable frame, the output is a valid zstd stream and can be read by any
+    zstd decompressor. :py:class:`ZstdSeekableReader` uses the seek table to
+    provide efficient random access.
+
+    >>> with open(path, "wb") as fh:
+    ...     with zstandard.ZstdSeekableWriter(fh) as writer:
+    ...         writer.write(b"chunk 0")
+    ...         writer.write(b"chunk 1")
+
+    ``flush()`` ends the current frame early. This can be used to align frame
+    boundaries with logical records in the data.
+
+    If the ``ZstdCompressor`` writes content checksums, the checksums are
+    also recorded in the seek table.
+
+    The seek table is written when the stream is closed. Failing to close the
+    stream results in output without a seek table, which can't be read with
+    :py:class:`ZstdSeekableReader`.
+
+    :param writer:
+       Stream to write compressed data to. Must have a ``write(data)`` method.
+    :param cctx:
+       ``ZstdCompressor`` used to compress each frame. If not specified, the
+       default ``ZstdCompressor`` is used.
+    :param max_frame_size:
+       Maximum number of uncompressed bytes in each frame. Smaller values
+       make random access cheaper at the cost of compression ratio.
+    :param closefd:
+       Whether to ``close()`` the inner stream when this stream is closed.
+    """
+
+    def __init__(
+        self,
+        writer,
+        cctx=None,
+        max_frame_size=1048576,
+        closefd=True,
+    ):
+        if not hasattr(writer, "write"):
+            raise ValueError("must pass an object with a write() method")
+
+        if max_frame_size < 1 or max_frame_size > _SEEKABLE_MAX_FRAME_SIZE:
+            raise ValueError(
+                "max_frame_size must be between 1 and %d"
+                % _SEEKABLE_MAX_FRAME_SIZE
+            )
+
+        self._writer = writer
+        self._cctx = cctx or ZstdCompressor()
+        self._max_frame_size = max_frame_size
+        self._closefd = bool(closefd)
+        self._buffer = bytearray()
+        self._compressed_sizes = array.array("L")
+        self._decompressed_sizes = array.array("L")
+        self._checksums = array.array("L")
+        self._have_checksums = True
+        self._entered = False
+        self._closed = False
+        self._bytes_compressed = 0
+
+    def __enter__(self):
+        if self._entered:
+            raise ZstdError("cannot __enter__ multiple times")
+
+        if self._closed:
+            raise ValueError("stream is closed")
+
+        self._entered = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self._entered = False
+        self.close()
+
+        return False
+
+    def __iter__(self):
+        raise io.UnsupportedOperation()
+
+    def __next__(self):
+        raise io.UnsupportedOperation()
+
+    @property
+    def closed(self):
+        return self._closed
+
+    @property
+    def frame_count(self):
+        """Number of frames written so far."""
+        return len(self._compressed_sizes)
+
+    def isatty(self):
+        return False
+
+    def readable(self):
+        return False
+
+    def seekable(self):
+        return False
+
+    def writable(self):
+        return True
+
+    def read(self, size=-1):
+        raise io.UnsupportedOperation()
+
+    def tell(self):
+        """Number of compressed bytes written to the inner stream so far."""
+        return self._bytes_compressed
+
+    def _write_frame(self, data):
+        if len(self._compressed_sizes) >= _SEEKABLE_MAX_FRAMES:
+            raise ZstdError(
+                "seekable format is limited to %d frames" % _SEEKABLE_MAX_FRAMES
+            )
+
+        frame = self._cctx.compress(data)
+
+        if len(frame) > 0xFFFFFFFF:
+            raise ZstdError("compressed frame is too large for seek table")
+
+        if get_frame_parameters(frame).has_checksum:
+            self._checksums.append(struct.unpack("<I", frame[-4:])[0])
+        else:
+            self._have_checksums = False
+
+        self._writer.write(frame)
+
+        self._compressed_sizes.append(len(frame))
+        self._decompressed_sizes.append(len(data))
+        self._bytes_compressed += len(frame)
+
+        return len(frame)
+
+    def write(self, data):
+        """Write uncompressed data to the stream.
+
+        Frames are emitted to the inner stream as soon as ``max_frame_size``
+        bytes have been accumulated.
+
+        :return:
+           The number of bytes consumed from ``data``.
+        """
+        if self._closed:
+            raise ValueError("stream is closed")
+
+        view = memoryview(data).cast("B")
+        total = len(view)
+        offset = 0
+
+        while offset < total:
+            # Avoid copying through the staging buffer for full frames.
+            if not self._buffer and total - offset >= self._max_frame_size:
+                self._write_frame(view[offset : offset + self._max_frame_size])
+                offset += self._max_frame_size
+                continue
+
+            chunk_size = min(
+                total - offset, self._max_frame_size - len(self._buffer)
+            )
+            self._buffer += view[offset : offset + chunk_size]
+            offset += chunk_size
+
+            if len(self._buffer) >= self._max_frame_size:
+                self._write_frame(self._buffer)
+                self._buffer.clear()
+
+        return total
+
+    def flush(self):
+        """End the current frame and flush the inner stream.
+
+        :return:
+           The number of compressed bytes written to the inner stream.
+        """
+        if self._closed:
+            raise ValueError("stream is closed")
+
+        written = 0
+
+        if self._buffer:
+            written = self._write_frame(self._buffer)
+            self._buffer.clear()
+
+        f = getattr(self._writer, "flush", None)
+        if f:
+            f()
+
+        return written
+
+    def _seek_table(self):
+        count = len(self._compressed_sizes)
+        checksums = self._have_checksums and count > 0
+
+        if checksums:
+            entry = struct.Struct("<III")
+            entries = b"".join(
+                entry.pack(c, d, x)
+                for c, d, x in zip(
+                    self._compressed_sizes,
+                    self._decompressed_sizes,
+                    self._checksums,
+                )
+            )
+        else:
+            entry = struct.Struct("<II")
+            entries = b"".join(
+                entry.pack(c, d)
+                for c, d in zip(
+                    self._compressed_sizes, self._decompressed_sizes
+                )
+            )
+
+        footer = _SEEKABLE_FOOTER.pack(
+            count, 0x80 if checksums else 0, _SEEKABLE_MAGIC_NUMBER
+        )
+
+        return (
+            _SKIPPABLE_HEADER.pack(
+                _SEEK_TABLE_SKIPPABLE_MAGIC, len(entries) + len(footer)
+            )
+            + entries
+            + footer
+        )
+
+    def close(self):
+        """End the current frame, write the seek table and close the stream."""
+        if self._closed:
+            return
+
+        try:
+            self.flush()
+
+            table = self._seek_table()
+            self._writer.write(table)
+            self._bytes_compressed += len(table)
+
+            f = getattr(self._writer, "flush", None)
+            if f:
+                f()
+        finally:
+            self._closed = True
+
+        f = getattr(self._writer, "close", None)
+        if self._closefd and f:
+            f()
+
+
+class ZstdSeekableReader(object):
+    """Random access reader for data in the zstd *seekable* format.
+
+    Instances conform to the ``io.RawIOBase`` interface. Unlike
+    :py:class:`ZstdDecompressionReader`, instances are fully seekable: the
+    seek table at the end of the data is used to locate the frame holding a
+    given offset with a binary search and only that frame is decompressed.
+    Seeking backwards and relative to the end of the stream is supported.
+
+    >>> with open(path, "rb") as fh:
+    ...     with zstandard.ZstdSeekableReader(fh) as reader:
+    ...         reader.seek(1048576)
+    ...         data = reader.read(8192)
+
+    The most recently decompressed frame is cached, so sequential reads
+    within a frame don't decompress it again.
+
+    :param source:
+       Seekable stream with ``read()`` and ``seek()`` methods or an object
+       conforming to the buffer protocol holding the compressed data.
+    :param dctx:
+       ``ZstdDecompressor`` used to decompress frames. If not specified, the
+       default ``ZstdDecompressor`` is used.
+    :param closefd:
+       Whether to ``close()`` the source stream when this stream is closed.
+    """
+
+    def __init__(self, source, dctx=None, closefd=True):
+        if hasattr(source, "read"):
+            if not hasattr(source, "seek"):
+                raise ValueError("source stream must have a seek() method")
+
+            self._source = source
+            self._source_buffer = None
+        else:
+            try:
+                self._source_buffer = memoryview(source).cast("B")
+            except TypeError:
+                raise TypeError(
+                    "must pass an object with read() and seek() methods or "
+                    "that conforms to the buffer protocol"
+                )
+
+            self._source = None
+
+        self._dctx = dctx or ZstdDecompressor()
+        self._closefd = bool(closefd)
+        self._entered = False
+        self._closed = False
+        self._pos = 0
+        self._frame_index = -1
+        self._frame_data = None
+
+        self._load_seek_table()
+
+    def _read_source(self, offset, size):
+        if self._source_buffer is not None:
+            return self._source_buffer[offset : offset + size]
+
+        self._source.seek(offset)
+
+        chunks = []
+        remaining = size
+        while remaining:
+            chunk = self._source.read(remaining)
+            if not chunk:
+                raise ZstdError("unexpected end of source data")
+
+            chunks.append(chunk)
+            remaining -= len(chunk)
+
+        return b"".join(chunks)
+
+    def _load_seek_table(self):
+        if self._source_buffer is not None:
+            total_size = len(self._source_buffer)
+        else:
+            total_size = self._source.seek(0, os.SEEK_END)
+
+        if total_size < _SKIPPABLE_HEADER.size + _SEEKABLE_FOOTER.size:
+            raise ZstdError("data is too small to contain a seek table")
+
+        count, descriptor, magic = _SEEKABLE_FOOTER.unpack(
+            self._read_source(
+                total_size - _SEEKABLE_FOOTER.size, _SEEKABLE_FOOTER.size
+            )
+        )
+
+        if magic != _SEEKABLE_MAGIC_NUMBER:
+            raise ZstdError("seek table footer has invalid magic number")
+
+        if descriptor & 0x7C:
+            raise ZstdError("seek table descriptor has reserved bits set")
+
+        entry_size = 12 if descriptor & 0x80 else 8
+        table_size = count * entry_size + _SEEKABLE_FOOTER.size
+
+        if table_size + _SKIPPABLE_HEADER.size > total_size:
+            raise ZstdError("seek table is larger than data")
+
+        frames_size = total_size - table_size - _SKIPPABLE_HEADER.size
+
+        magic, frame_size = _SKIPPABLE_HEADER.unpack(
+            self._read_source(frames_size, _SKIPPABLE_HEADER.size)
+        )
+
+        if magic != _SEEK_TABLE_SKIPPABLE_MAGIC or frame_size != table_size:
+            raise ZstdError("seek table has invalid skippable frame header")
+
+        entries = self._read_source(
+            frames_size + _SKIPPABLE_HEADER.size, count * entry_size
+        )
+
+        # Cumulative offsets of each frame. There is a trailing entry holding
+        # the total size so frame N spans offsets[N] to offsets[N + 1].
+        self._compressed_offsets = array.array("Q", [0])
+        self._decompressed_offsets = array.array("Q", [0])
+
+        compressed_offset = 0
+        decompressed_offset = 0
+
+        for entry in struct.iter_unpack("<" + "I" * (entry_size // 4), entries):
+            compressed_offset += entry[0]
+            decompressed_offset += entry[1]
+            self._compressed_offsets.append(compressed_offset)
+            self._decompressed_offsets.append(decompressed_offset)
+
+        if compressed_offset != frames_size:
+            raise ZstdError("seek table does not match size of compressed data")
+
+    def _get_frame(self, index):
+        if index == self._frame_index:
+            return self._frame_data
+
+        compressed_offset = self._compressed_offsets[index]
+        compressed_size = (
+            self._compressed_offsets[index + 1] - compressed_offset
+        )
+        decompressed_size = (
+            self._decompressed_offsets[index + 1]
+            - self._decompressed_offsets[index]
+        )
+
+        if decompressed_size:
+            data = self._dctx.decompress(
+                self._read_source(compressed_offset, compressed_size),
+                max_output_size=decompressed_size,
+            )
+
+            if len(data) != decompressed_size:
+                raise ZstdError(
+                    "frame %d decompressed to %d bytes; expected %d"
+                    % (index, len(data), decompressed_size)
+                )
+        else:
+            data = b""
+
+        self._frame_index = index
+        self._frame_data = memoryview(data)
+
+        return self._frame_data
+
+    def _read_views(self, size):
+        """Yield views of decompressed data from the current position."""
+        end = self._decompressed_offsets[-1]
+
+        while size and self._pos < end:
+            index = bisect.bisect_right(self._decompressed_offsets, self._pos)
+            data = self._get_frame(index - 1)
+
+            start = self._pos - self._decompressed_offsets[index - 1]
+            chunk = data[start : start + size]
+
+            self._pos += len(chunk)
+            size -= len(chunk)
+
+            yield chunk
+
+    def __enter__(self):
+        if self._entered:
+            raise ValueError("cannot __enter__ multiple times")
+
+        if self._closed:
+            raise ValueError("stream is closed")
+
+        self._entered = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self._entered = False
+        self.close()
+
+        return False
+
+    def __iter__(self):
+        raise io.UnsupportedOperation()
+
+    def __next__(self):
+        raise io.UnsupportedOperation()
+
+    @property
+    def closed(self):
+        return self._closed
+
+    @property
+    def frame_count(self):
+        """Number of frames in the seek table."""
+        return len(self._compressed_offsets) - 1
+
+    def close(self):
+        if self._closed:
+            return
+
+        self._closed = True
+        self._frame_data = None
+        self._frame_index = -1
+        self._source_buffer = None
+
+        f = getattr(self._source, "close", None)
+        if self._closefd and f:
+            f()
+
+    def isatty(self):
+        return False
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def writable(self):
+        return False
+
+    def write(self, data):
+        raise io.UnsupportedOperation()
+
+    def flush(self):
+        return None
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, pos, whence=os.SEEK_SET):
+        if self._closed:
+            raise ValueError("stream is closed")
+
+        if whence == os.SEEK_SET:
+            new_pos = pos
+        elif whence == os.SEEK_CUR:
+            new_pos = self._pos + pos
+        elif whence == os.SEEK_END:
+            new_pos = self._decompressed_offsets[-1] + pos
+        else:
+            raise ValueError("invalid whence value: %r" % whence)
+
+        if new_pos < 0:
+            raise OSError("cannot seek to negative position")
+
+        self._pos = new_pos
+
+        return self._pos
+
+    def read(self, size=-1):
+        if self._closed:
+            raise ValueError("stream is closed")
+
+        if size < -1:
+            raise ValueError("cannot read negative amounts less than -1")
+
+        if size == -1:
+            size = max(self._decompressed_offsets[-1] - self._pos, 0)
+
+        return b"".join(self._read_views(size))
+
+    def readall(self):
+        return self.read(-1)
+
+    read1 = read
+
+    def readinto(self, b):
+        if self._closed:
+            raise ValueError("stream is closed")
+
+        dest = memoryview(b).cast("B")
+        offset = 0
+
+        for chunk in self._read_views(len(dest)):
+            dest[offset : offset + len(chunk)] = chunk
+            offset += len(chunk)
+
+        return offset
+
+    readinto1 = readinto
+
+
+_SKIPPABLE_MAGIC_MASK = 0xFFFFFFF0
+_SKIPPABLE_MAGIC_BASE = 0x184D2A50
+_BLOCK_HEADER_SIZE = 3
+_BLOCK_TYPE_RLE = 1
+_BLOCK_TYPE_RESERVED = 3
+_CONTENT_CHECKSUM_SIZE = 4
+
+
+def _scan_frame(data, start, fill):
+    """Find the end of the frame beginning at offset ``start`` of ``data``.
+
+    Only frame and block headers are examined: the frame is not decompressed.
+
+    ``fill(size)`` is called to ensure ``data`` holds at least ``size`` bytes.
+    It returns ``False`` if the input ends before then.
+
+    Returns a ``(end, content_size)`` tuple. ``content_size`` is ``None`` for
+    skippable frames.
+    """
+    if not fill(start + _SKIPPABLE_HEADER.size):
+        raise ZstdError("input ends in the middle of a frame header")
+
+    magic, size = _SKIPPABLE_HEADER.unpack_from(data, start)
+
+    if magic & _SKIPPABLE_MAGIC_MASK == _SKIPPABLE_MAGIC_BASE:
+        end = start + _SKIPPABLE_HEADER.size + size
+        if not fill(end):
+            raise ZstdError("input ends in the middle of a skippable frame")
+
+        return end, None
+
+    header_size = frame_header_size(
+        data[start : start + _SKIPPABLE_HEADER.size]
+    )
+    if not fill(start + header_size):
+        raise ZstdError("input ends in the middle of a frame header")
+
+    params = get_frame_parameters(data[start : start + header_size])
+
+    offset = start + header_size
+    while True:
+        if not fill(offset + _BLOCK_HEADER_SIZE):
+            raise ZstdError("input ends in the middle of a frame")
+
+        header = data[offset] | data[offset + 1] << 8 | data[offset + 2] << 16
+        block_type = (header >> 1) & 3
+
+        if block_type == _BLOCK_TYPE_RESERVED:
+            raise ZstdError("frame contains a block with a reserved type")
+
+        # RLE blocks store a single byte regardless of their size.
+        offset += _BLOCK_HEADER_SIZE + (
+            1 if block_type == _BLOCK_TYPE_RLE else header >> 3
+        )
+
+        if header & 1:
+            break
+
+    if params.has_checksum:
+        offset += _CONTENT_CHECKSUM_SIZE
+
+    if not fill(offset):
+        raise ZstdError("input ends in the middle of a frame")
+
+    return offset, params.content_size
+
+
+def _iter_buffer_frames(data):
+    data = memoryview(data).cast("B")
+    size = len(data)
+
+    def fill(end):
+        return end <= size
+
+    offset = 0
+    while offset < size:
+        end, content_size = _scan_frame(data, offset, fill)
+        yield data[offset:end], content_size
+        offset = end
+
+
+def _iter_stream_frames(source, read_size):
+    data = bytearray()
+
+    def fill(end):
+        while len(data) < end:
+            chunk = source.read(max(end - len(data), read_size))
+            if not chunk:
+                return False
+
+            data.extend(chunk)
+
+        return True
+
+    while fill(1):
+        end, content_size = _scan_frame(data, 0, fill)
+        yield bytes(data[:end]), content_size
+        del data[:end]
+
+
+def _skippable_frame(data, magic_variant):
+    if not 0 <= magic_variant <= 15:
+        raise ValueError("magic_variant must be between 0 and 15")
+
+    data = memoryview(data).cast("B")
+
+    if len(data) > 0xFFFFFFFF:
+        raise ZstdError("skippable frame payload must be smaller than 4 GiB")
+
+    return (
+        _SKIPPABLE_HEADER.pack(_SKIPPABLE_MAGIC_BASE + magic_variant, len(data))
+        + data
+    )
+
+
+def iter_frames(
+    source,
+    dctx=None,
+    read_size=DECOMPRESSION_RECOMMENDED_INPUT_SIZE,
+    write_size=DECOMPRESSION_RECOMMENDED_OUTPUT_SIZE,
+    skippable_frames=True,
+):
+    """Decompress data, surfacing the skippable frames within it.
+
+    Decompressors ignore skippable frames. This generator instead yields
+    their payloads alongside decompressed data, so metadata stored in
+    skippable frames (e.g. by
+    :py:meth:`ZstdCompressionWriter.write_skippable_frame`) can be read
+    back.
+
+    Items are 2-tuples of ``(magic_variant, data)``. For skippable frames,
+    ``magic_variant`` is the integer between 0 and 15 stored in the frame's
+    magic number and ``data`` is the frame's payload. For regular frames,
+    ``magic_variant`` is ``None`` and ``data`` is a chunk of decompressed
+    data. The decompressed content of a frame may be split across multiple
+    items.
+
+    >>> for magic_variant, data in zstandard.iter_frames(fh):
+    ...     if magic_variant is None:
+    ...         ofh.write(data)
+    ...     else:
+    ...         metadata.append(data)
+
+    When ``skippable_frames`` is ``False``, skippable frames are skipped
+    using the size in their header without reading their payload, seeking
+    past it if ``source`` is seekable. Only decompressed data is yielded.
+
+    :param source:
+       Object with a ``read(size)`` method or conforming to the buffer
+       protocol to read compressed data from.
+    :param dctx:
+       :py:class:`ZstdDecompressor` to decompress regular frames with. If
+       not specified, a default ``ZstdDecompressor`` is used.
+    :param read_size:
+       Number of bytes to read from ``source`` at a time.
+    :param write_size:
+       Maximum size of chunks of decompressed data.
+    :param skippable_frames:
+       Whether to yield the payloads of skippable frames.
+    """
+    if read_size < 1:
+        raise ValueError("read_size must be positive")
+
+    if not hasattr(source, "read"):
+        source = io.BytesIO(source)
+
+    seekable = getattr(source, "seekable", None)
+    seekable = bool(seekable and seekable())
+
+    dctx = dctx or ZstdDecompressor()
+
+    pending = b""
+
+    def fill(size):
+        nonlocal pending
+
+        while len(pending) < size:
+            chunk = source.read(max(size - len(pending), read_size))
+            if not chunk:
+                return False
+
+            pending += chunk
+
+        return True
+
+    while fill(_SKIPPABLE_HEADER.size) or pending:
+        magic = int.from_bytes(pending[0:4], "little")
+
+        if magic & _SKIPPABLE_MAGIC_MASK == _SKIPPABLE_MAGIC_BASE:
+            if len(pending) < _SKIPPABLE_HEADER.size:
+                raise ZstdError("input ends in the middle of a frame header")
+
+            _, size = _SKIPPABLE_HEADER.unpack_from(pending)
+            pending = pending[_SKIPPABLE_HEADER.size :]
+
+            if skippable_frames or len(pending) >= size:
+                if not fill(size):
+                    raise ZstdError(
+                        "input ends in the middle of a skippable frame"
+                    )
+
+                if skippable_frames:
+                    yield magic - _SKIPPABLE_MAGIC_BASE, bytes(pending[:size])
+
+                pending = pending[size:]
+                continue
+
+            remaining = size - len(pending)
+            pending = b""
+
+            # Read the last byte so truncated input is detected.
+            if seekable:
+                source.seek(remaining - 1, os.SEEK_CUR)
+                truncated = not source.read(1)
+            else:
+                while remaining:
+                    chunk = source.read(min(remaining, read_size))
+                    if not chunk:
+                        break
+
+                    remaining -= len(chunk)
+
+                truncated = bool(remaining)
+
+            if truncated:
+                raise ZstdError("input ends in the middle of a skippable frame")
+
+            continue
+
+        dobj = dctx.decompressobj(write_size=write_size)
+        data = pending
+        pending = b""
+
+        while True:
+            chunk = dobj.decompress(data)
+            if chunk:
+                yield None, chunk
+
+            if dobj.eof:
+                pending = dobj.unused_data
+                break
+
+            data = source.read(read_size)
+            if not data:
+                raise ZstdError("input ends in the middle of a frame")
+
+
+class ZstdParallelDecompressor(object):
+    """Decompress data consisting of many frames using multiple threads.
+
+    Many zstd producers emit data as a sequence of independent frames. For
+    example, the output of :py:class:`ZstdSeekableWriter` or of repeatedly
+    calling :py:meth:`ZstdCompressor.compress`. :py:class:`ZstdDecompressor`
+    decompresses such data one frame at a time on a single thread.
+
+    This type locates frame boundaries by parsing frame and block headers,
+    which is cheap relative to decompression, and decompresses frames on a
+    pool of worker threads. Output is emitted in input order. At most
+    ``max_pending_frames`` frames are in flight at any time, which bounds
+    memory usage to roughly that many frames of compressed and decompressed
+    data.
+
+    >>> dctx = zstandard.ZstdParallelDecompressor(threads=4)
+    >>> with open(src_path, "rb") as ifh, open(dst_path, "wb") as ofh:
+    ...     dctx.copy_stream(ifh, ofh)
+
+    Parallelism comes from decompressing separate frames, so data consisting
+    of a single frame is not decompressed any faster. Skippable frames are
+    ignored.
+
+    Each worker thread uses its own ``ZstdDecompressor``. Instances can be
+    reused but must not be used by multiple threads concurrently.
+
+    :param dict_data:
+       Compression dictionary to use.
+    :param max_window_size:
+       Sets an upper limit on the window size for decompression operations.
+       See :py:class:`ZstdDecompressor`.
+    :param threads:
+       Number of worker threads to use. Negative values use the number of
+       logical CPUs in the machine.
+    :param max_pending_frames:
+       Maximum number of frames being decompressed or waiting to be emitted.
+       Defaults to twice the number of threads.
+    """
+
+    def __init__(
+        self,
+        dict_data=None,
+        max_window_size=0,
+        threads=-1,
+        max_pending_frames=0,
+    ):
+        if threads < 0:
+            threads = _cpu_count() or 1
+
+        if threads < 1:
+            raise ValueError("threads must be non-zero")
+
+        if max_pending_frames < 0:
+            raise ValueError("max_pending_frames must not be negative")
+
+        self._dict_data = dict_data
+        self._max_window_size = max_window_size
+        self._threads = threads
+        self._max_pending_frames = max_pending_frames or threads * 2
+
+        self._dctxs = [
+            ZstdDecompressor(
+                dict_data=dict_data, max_window_size=max_window_size
+            )
+            for i in range(threads)
+        ]
+
+        # Dictionaries are digested lazily on first use. Force that to happen
+        # now so worker threads don't race to do it.
+        if dict_data is not None:
+            self._dctxs[0].decompressobj()
+
+    @property
+    def threads(self):
+        """Number of worker threads."""
+        return self._threads
+
+    def _decompress_frames(self, frames):
+        # Each worker checks out a decompressor for the duration of a frame.
+        dctxs = queue.SimpleQueue()
+        for dctx in self._dctxs:
+            dctxs.put(dctx)
+
+        def decompress_frame(frame, content_size):
+            dctx = dctxs.get()
+            try:
+                if content_size == CONTENTSIZE_UNKNOWN:
+                    return dctx.decompressobj().decompress(frame)
+
+                return dctx.decompress(frame)
+            finally:
+                dctxs.put(dctx)
+
+        pending = collections.deque()
+
+        with concurrent.futures.ThreadPoolExecutor(self._threads) as executor:
+            try:
+                for frame, content_size in frames:
+                    if content_size is None:
+                        continue
+
+                    pending.append(
+                        executor.submit(decompress_frame, frame, content_size)
+                    )
+
+                    if len(pending) >= self._max_pending_frames:
+                        data = pending.popleft().result()
+                        if data:
+                            yield data
+
+                while pending:
+                    data = pending.popleft().result()
+                    if data:
+                        yield data
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def read_to_iter(
+        self, reader, read_size=DECOMPRESSION_RECOMMENDED_INPUT_SIZE
+    ):
+        """Decompress data from a reader, yielding the output of each frame.
+
+        :param reader:
+           Source of compressed data. Can be an object with a ``read(size)``
+           method or an object conforming to the buffer protocol.
+        :param read_size:
+           Minimum number of bytes to request from ``reader`` at a time.
+        :return:
+           Generator of ``bytes`` holding the decompressed output of each
+           frame, in input order.
+        """
+        if hasattr(reader, "read"):
+            frames = _iter_stream_frames(reader, read_size)
+        elif hasattr(reader, "__getitem__"):
+            frames = _iter_buffer_frames(reader)
+        else:
+            raise ValueError(
+                "must pass an object with a read() method or conforms to "
+                "buffer protocol"
+            )
+
+        return self._decompress_frames(frames)
+
+    def copy_stream(
+        self, ifh, ofh, read_size=DECOMPRESSION_RECOMMENDED_INPUT_SIZE
+    ):
+        """Decompress data from ``ifh`` and write it to ``ofh``.
+
+        :return:
+           2-tuple of integers of bytes read and written, respectively.
+        """
+        if not hasattr(ifh, "read"):
+            raise ValueError("first argument must have a read() method")
+        if not hasattr(ofh, "write"):
+            raise ValueError("second argument must have a write() method")
+
+        total_read = 0
+        total_write = 0
+
+        def frames():
+            nonlocal total_read
+
+            for frame, content_size in _iter_stream_frames(ifh, read_size):
+                total_read += len(frame)
+                yield frame, content_size
+
+        for data in self._decompress_frames(frames()):
+            ofh.write(data)
+            total_write += len(data)
+
+        return total_read, total_write
+
+    def decompress(self, data):
+        """Decompress all frames in ``data``, returning a single ``bytes``."""
+        return b"".join(self.read_to_iter(data))
+
+
+# Inputs at least this large are compressed on an executor thread instead of
+# on the event loop thread. The value is large enough that the thread handoff
+# is cheap relative to the work and small enough that inline work blocks the
+# event loop for at most a few hundred microseconds.
+_ASYNC_EXECUTOR_THRESHOLD = 131072
+
+
+async def _run_in_executor(executor, fn, *args):
+    """Call ``fn(*args)`` on ``executor``.
+
+    (De)compression releases the GIL, so offloaded calls don't stall other
+    coroutines.
+    """
+    # Deferred so importing zstandard doesn't pay for importing asyncio.
+    import asyncio
+
+    return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+
+
+async def _async_call(executor, threshold, size, fn, *args):
+    """Call ``fn(*args)`` inline or on ``executor`` depending on ``size``."""
+    if size < threshold:
+        return fn(*args)
+
+    return await _run_in_executor(executor, fn, *args)
+
+
+class AsyncZstdCompressionWriter(object):
+    """Compress data and write it to an ``asyncio.StreamWriter``.
+
+    This is the asyncio equivalent of :py:meth:`ZstdCompressor.stream_writer`.
+    All methods that perform I/O are coroutines.
+
+    >>> reader, writer = await asyncio.open_connection(host, port)
+    >>> async with zstandard.AsyncZstdCompressionWriter(writer) as compressor:
+    ...     await compressor.write(b"chunk 0")
+    ...     await compressor.write(b"chunk 1")
+
+    Small inputs are compressed inline on the event loop thread. Inputs of at
+    least ``executor_threshold`` bytes are compressed on ``executor`` so the
+    event loop isn't blocked while they are compressed. Buffers passed to
+    ``write()`` must not be modified until the call completes.
+
+    After every write, the output stream's ``drain()`` is awaited, so the
+    output stream's flow control applies.
+
+    Instances must not be used by multiple tasks concurrently.
+
+    :param writer:
+       Stream to write compressed data to. Must have ``write(data)`` and
+       ``drain()`` methods, like ``asyncio.StreamWriter``.
+    :param cctx:
+       ``ZstdCompressor`` used to compress data. If not specified, the
+       default ``ZstdCompressor`` is used.
+    :param size:
+       Size in bytes of the data that will be written to the first frame. If
+       known, it is written into the frame header.
+    :param executor:
+       ``concurrent.futures.Executor`` to offload large inputs to. The
+       default is the event loop's default executor.
+    :param executor_threshold:
+       Minimum input size in bytes to offload to ``executor``.
+    :param closefd:
+       Whether to close the inner stream when this stream is closed.
+    """
+
+    def __init__(
+        self,
+        writer,
+        cctx=None,
+        size=-1,
+        executor=None,
+        executor_threshold=_ASYNC_EXECUTOR_THRESHOLD,
+        closefd=True,
+    ):
+        if not hasattr(writer, "write") or not hasattr(writer, "drain"):
+            raise ValueError(
+                "must pass an object with write() and drain() methods"
+            )
+
+        self._writer = writer
+        self._cctx = cctx or ZstdCompressor()
+        self._cobj = self._cctx.compressobj(size=size)
+        self._executor = executor
+        self._executor_threshold = executor_threshold
+        self._closefd = bool(closefd)
+        self._entered = False
+        self._closing = False
+        self._closed = False
+        self._bytes_compressed = 0
+        # Input bytes not yet flushed out of the compressor.
+        self._pending = 0
+        # Whether data was written since the current frame started.
+        self._frame_started = False
+
+    async def __aenter__(self):
+        if self._entered:
+            raise ValueError("cannot __aenter__ multiple times")
+
+        if self._closed:
+            raise ValueError("stream is closed")
+
+        self._entered = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        self._entered = False
+        await self.close()
+
+        return False
+
+    async def _write_output(self, data):
+        if data:
+            self._writer.write(data)
+            self._bytes_compressed += len(data)
+            await self._writer.drain()
+
+        return len(data)
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def tell(self):
+        """Number of compressed bytes written to the output stream."""
+        return self._bytes_compressed
+
+    async def write(self, data):
+        """Compress data and write the output to the inner stream.
+
+        Returns the number of input bytes consumed.
+        """
+        if self._closed:
+            raise ValueError("stream is closed")
+
+        data = memoryview(data).cast("B")
+
+        chunk = await _async_call(
+            self._executor,
+            self._executor_threshold,
+            len(data),
+            self._cobj.compress,
+            data,
+        )
+        self._pending += len(data)
+        if data:
+            self._frame_started = True
+        await self._write_output(chunk)
+
+        return len(data)
+
+    async def flush(self, flush_mode=FLUSH_BLOCK):
+        """Flush buffered data to the inner stream.
+
+        ``FLUSH_BLOCK`` ends the current zstd block so a reader can
+        decompress all data written so far. ``FLUSH_FRAME`` ends the
+        current frame. Subsequent writes start a new frame.
+
+        Returns the number of compressed bytes written to the inner stream.
+        """
+        if self._closed:
+            raise ValueError("stream is closed")
+
+        if flush_mode == FLUSH_BLOCK:
+            mode = COMPRESSOBJ_FLUSH_BLOCK
+        elif flush_mode == FLUSH_FRAME:
+            mode = COMPRESSOBJ_FLUSH_FINISH
+        else:
+            raise ValueError("unknown flush_mode: %r" % flush_mode)
+
+        chunk = await _async_call(
+            self._executor,
+            self._executor_threshold,
+            self._pending,
+            self._cobj.flush,
+            mode,
+        )
+        self._pending = 0
+
+        if flush_mode == FLUSH_FRAME:
+            self._cobj = self._cctx.compressobj()
+            self._frame_started = False
+
+        return await self._write_output(chunk)
+
+    async def write_skippable_frame(self, data, magic_variant=0):
+        """Write a skippable frame to the inner stream.
+
+        If data has been written since the current frame started, the frame
+        is ended first. See
+        :py:meth:`ZstdCompressionWriter.write_skippable_frame`.
+
+        Returns the number of bytes written to the inner stream.
+        """
+        if self._closed:
+            raise ValueError("stream is closed")
+
+        frame = _skippable_frame(data, magic_variant)
+
+        total_write = 0
+        if self._frame_started:
+            total_write += await self.flush(FLUSH_FRAME)
+
+        return total_write + await self._write_output(frame)
+
+    async def close(self):
+        """End the current frame and close the inner stream."""
+        if self._closed or self._closing:
+            return
+
+        self._closing = True
+        try:
+            await self.flush(FLUSH_FRAME)
+        finally:
+            self._closing = False
+            self._closed = True
+
+        if self._closefd:
+            self._writer.close()
+
+            wait_closed = getattr(self._writer, "wait_closed", None)
+            if wait_closed:
+                await wait_closed()
+
+
+class AsyncZstdDecompressionReader(object):
+    """Read and decompress data from an ``asyncio.StreamReader``.
+
+    This is the asyncio equivalent of
+    :py:meth:`ZstdDecompressor.stream_reader`. All methods that perform I/O
+    are coroutines. Instances can be used as asynchronous iterators yielding
+    chunks of decompressed data.
+
+    >>> reader, writer = await asyncio.open_connection(host, port)
+    >>> async with zstandard.AsyncZstdDecompressionReader(reader) as dreader:
+    ...     async for chunk in dreader:
+    ...         process(chunk)
+
+    Compressed input is read from the inner stream in chunks of ``read_size``
+    bytes. Every chunk is decompressed on ``executor``. The size of the output
+    isn't known until a chunk has been decompressed and a small chunk of
+    compressed input can expand to a very large output, so decompressing even
+    small chunks inline could block the event loop for an unbounded time.
+
+    Like ``asyncio.StreamReader.read()``, ``read(size)`` returns as soon as
+    any decompressed data is available and may return fewer than ``size``
+    bytes. An empty ``bytes`` is returned at end of stream.
+
+    Instances must not be used by multiple tasks concurrently.
+
+    :param reader:
+       Stream to read compressed data from. Must have a ``read(size)``
+       coroutine method, like ``asyncio.StreamReader``.
+    :param dctx:
+       ``ZstdDecompressor`` used to decompress data. If not specified, the
+       default ``ZstdDecompressor`` is used.
+    :param read_size:
+       Number of compressed bytes to request from the inner stream at a time.
+    :param read_across_frames:
+       Whether to decompress all frames in the input. By default, the stream
+       ends at the end of the first frame.
+    :param executor:
+       ``concurrent.futures.Executor`` to decompress on. The default is the
+       event loop's default executor.
+    :param closefd:
+       Whether to close the inner stream when this stream is closed.
+    """
+
+    def __init__(
+        self,
+        reader,
+        dctx=None,
+        read_size=DECOMPRESSION_RECOMMENDED_INPUT_SIZE,
+        read_across_frames=False,
+        executor=None,
+        closefd=True,
+    ):
+        if not hasattr(reader, "read"):
+            raise ValueError("must pass an object with a read() method")
+
+        if read_size < 1:
+            raise ValueError("read_size must be positive")
+
+        self._reader = reader
+        self._dctx = dctx or ZstdDecompressor()
+        self._dobj = self._dctx.decompressobj(
+            read_across_frames=read_across_frames
+        )
+        self._read_size = read_size
+        self._executor = executor
+        self._closefd = bool(closefd)
+        self._entered = False
+        self._closed = False
+        self._finished = False
+        self._buffer = bytearray()
+        self._bytes_decompressed = 0
+
+    async def __aenter__(self):
+        if self._entered:
+            raise ValueError("cannot __aenter__ multiple times")
+
+        if self._closed:
+            raise ValueError("stream is closed")
+
+        self._entered = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        self._entered = False
+        self.close()
+
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        chunk = await self.read(DECOMPRESSION_RECOMMENDED_OUTPUT_SIZE)
+        if not chunk:
+            raise StopAsyncIteration
+
+        return chunk
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def tell(self):
+        """Number of decompressed bytes returned so far."""
+        return self._bytes_decompressed
+
+    async def _fill(self):
+        """Read and decompress input until output is available or input ends."""
+        while not self._buffer and not self._finished:
+            chunk = await self._reader.read(self._read_size)
+            if not chunk:
+                self._finished = True
+                break
+
+            self._buffer += await _run_in_executor(
+                self._executor, self._dobj.decompress, chunk
+            )
+
+            if self._dobj.eof:
+                self._finished = True
+
+    async def read(self, size=-1):
+        if self._closed:
+            raise ValueError("stream is closed")
+
+        if size < -1:
+            raise ValueError("cannot read negative amounts less than -1")
+
+        if size == -1:
+            return await self.readall()
+
+        if not size:
+            return b""
+
+        await self._fill()
+
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self._bytes_decompressed += len(data)
+
+        return data
+
+    async def readall(self):
+        if self._closed:
+            raise ValueError("stream is closed")
+
+        chunks = []
+
+        while True:
+            await self._fill()
+            if not self._buffer:
+                break
+
+            chunks.append(bytes(self._buffer))
+            self._buffer.clear()
+
+        data = b"".join(chunks)
+        self._bytes_decompressed += len(data)
+
+        return data
+
+    def close(self):
+        if self._closed:
+            return
+
+        self._closed = True
+        self._buffer = bytearray()
+
+        f = getattr(self._reader, "close", None)
+        if self._closefd and f:
+            f()
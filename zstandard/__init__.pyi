@@ -5,10 +5,15 @@
 # of the BSD license. See the LICENSE file for details.
 
 import os
+from concurrent.futures import Executor
 from typing import (
     IO,
+    Any,
     BinaryIO,
     ByteString,
+    Callable,
+    ContextManager,
+    Dict,
     Generator,
     Iterable,
     List,
@@ -107,6 +112,21 @@ class BufferWithSegmentsCollection(object):
     def __getitem__(self, i: int) -> BufferSegment: ...
     def size(self) -> int: ...
 
+class BufferWithSegmentsBuilder(object):
+    size: int
+    def __init__(self, size_hint: int = ..., count_hint: int = ...): ...
+    def __len__(self) -> int: ...
+    def append(self, data: ByteString) -> None: ...
+    def extend(
+        self,
+        data: Union[
+            BufferWithSegments,
+            BufferWithSegmentsCollection,
+            Iterable[ByteString],
+        ],
+    ) -> None: ...
+    def finish(self) -> BufferWithSegments: ...
+
 class ZstdCompressionParameters(object):
     @staticmethod
     def from_level(
@@ -191,8 +211,12 @@ class ZstdCompressionDict(object):
         dict_type: int = ...,
         k: int = ...,
         d: int = ...,
+        *,
+        cdict_cache_size: int = ...,
     ): ...
     def __len__(self) -> int: ...
+    @property
+    def cdict_cache_size(self) -> int: ...
     def dict_id(self) -> int: ...
     def as_bytes(self) -> bytes: ...
     def precompute_compress(
@@ -200,6 +224,7 @@ class ZstdCompressionDict(object):
         level: int = ...,
         compression_params: ZstdCompressionParameters = ...,
     ): ...
+    def cdict_stats(self) -> Dict[str, int]: ...
 
 class ZstdCompressionObj(object):
     def compress(self, data: ByteString) -> bytes: ...
@@ -258,6 +283,14 @@ class ZstdCompressionWriter(BinaryIO):
     def write(self, data: ByteString) -> int: ...
     def flush(self, flush_mode: int = ...) -> int: ...
     def tell(self) -> int: ...
+    def write_skippable_frame(
+        self, data: ByteString, magic_variant: int = ...
+    ) -> int: ...
+
+class ZstdThreadPool(object):
+    def __init__(self, threads: int = ...) -> None: ...
+    @property
+    def threads(self) -> int: ...
 
 class ZstdCompressor(object):
     def __init__(
@@ -269,12 +302,17 @@ class ZstdCompressor(object):
         write_content_size: Optional[bool] = ...,
         write_dict_id: Optional[bool] = ...,
         threads: int = ...,
+        thread_pool: Optional[ZstdThreadPool] = ...,
+        size_hint: int = ...,
     ): ...
     def memory_size(self) -> int: ...
     def compress(self, data: ByteString) -> bytes: ...
-    def compressobj(self, size: int = ...) -> ZstdCompressionObj: ...
+    def compress_into(self, data: ByteString, out: ByteString) -> int: ...
+    def compressobj(
+        self, size: int = ..., size_hint: int = ...
+    ) -> ZstdCompressionObj: ...
     def chunker(
-        self, size: int = ..., chunk_size: int = ...
+        self, size: int = ..., chunk_size: int = ..., size_hint: int = ...
     ) -> ZstdCompressionChunker: ...
     def copy_stream(
         self,
@@ -300,6 +338,7 @@ class ZstdCompressor(object):
         write_return_read: bool = ...,
         *,
         closefd: bool = ...,
+        size_hint: int = ...,
     ) -> ZstdCompressionWriter: ...
     def read_to_iter(
         self,
@@ -318,6 +357,7 @@ class ZstdCompressor(object):
         ],
         threads: int = ...,
     ) -> BufferWithSegmentsCollection: ...
+    def multi_compress_stats(self) -> Dict[str, int]: ...
 
 class ZstdDecompressionObj(object):
     def decompress(self, data: ByteString) -> bytes: ...
@@ -379,12 +419,23 @@ class ZstdDecompressionWriter(BinaryIO):
     def readinto(self, b): ...
     def write(self, data: ByteString) -> int: ...
 
+class ZstdDictionaryRegistry(object):
+    def __init__(self, max_cached: int = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, dict_id: object) -> bool: ...
+    @property
+    def max_cached(self) -> int: ...
+    def add(self, dict_data: ZstdCompressionDict) -> None: ...
+    def remove(self, dict_id: int) -> None: ...
+    def stats(self) -> Dict[str, int]: ...
+
 class ZstdDecompressor(object):
     def __init__(
         self,
         dict_data: Optional[ZstdCompressionDict] = ...,
         max_window_size: int = ...,
         format: int = ...,
+        dict_registry: Optional[ZstdDictionaryRegistry] = ...,
     ): ...
     def memory_size(self) -> int: ...
     def decompress(
@@ -394,6 +445,12 @@ class ZstdDecompressor(object):
         read_across_frames: bool = ...,
         allow_extra_data: bool = ...,
     ) -> bytes: ...
+    def decompress_into(
+        self,
+        data: ByteString,
+        out: ByteString,
+        allow_extra_data: bool = ...,
+    ) -> int: ...
     def stream_reader(
         self,
         source: Union[IO[bytes], ByteString],
@@ -450,10 +507,14 @@ class FrameParameters(object):
 def estimate_decompression_context_size() -> int: ...
 def frame_content_size(data: ByteString) -> int: ...
 def frame_header_size(data: ByteString) -> int: ...
+def frame_summary(data: ByteString) -> Tuple[int, int, int, bool]: ...
 def get_frame_parameters(data: ByteString) -> FrameParameters: ...
+def scan_frames(
+    data: Union[ByteString, BufferWithSegments],
+) -> Dict[str, memoryview]: ...
 def train_dictionary(
     dict_size: int,
-    samples: list[ByteString],
+    samples: Union[Iterable[bytes], BufferWithSegments],
     k: int = ...,
     d: int = ...,
     f: int = ...,
@@ -464,6 +525,8 @@ def train_dictionary(
     level: int = ...,
     steps: int = ...,
     threads: int = ...,
+    max_samples_size: int = ...,
+    seed: int = ...,
 ) -> ZstdCompressionDict: ...
 def open(
     filename: Union[bytes, str, os.PathLike, BinaryIO],
@@ -477,3 +540,158 @@ def open(
 ): ...
 def compress(data: ByteString, level: int = ...) -> bytes: ...
 def decompress(data: ByteString, max_output_size: int = ...) -> bytes: ...
+def compress_file(
+    src_path: Union[str, bytes, os.PathLike],
+    dst_path: Union[str, bytes, os.PathLike],
+    cctx: Optional[ZstdCompressor] = ...,
+    write_size: int = ...,
+) -> Tuple[int, int]: ...
+def decompress_file(
+    src_path: Union[str, bytes, os.PathLike],
+    dst_path: Union[str, bytes, os.PathLike],
+    dctx: Optional[ZstdDecompressor] = ...,
+    write_size: int = ...,
+) -> Tuple[int, int]: ...
+def iter_frames(
+    source: Union[IO[bytes], ByteString],
+    dctx: Optional[ZstdDecompressor] = ...,
+    read_size: int = ...,
+    write_size: int = ...,
+    skippable_frames: bool = ...,
+) -> Generator[Tuple[Optional[int], bytes], None, None]: ...
+
+class ZstdContextPool(object):
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_idle: Optional[int] = ...,
+    ) -> None: ...
+    @property
+    def max_idle(self) -> int: ...
+    def acquire(self) -> Any: ...
+    def release(self, context: Any) -> None: ...
+    def checkout(self) -> ContextManager[Any]: ...
+    def clear(self) -> None: ...
+    def stats(self) -> Dict[str, int]: ...
+
+class ZstdSeekableWriter(BinaryIO):
+    def __init__(
+        self,
+        writer: IO[bytes],
+        cctx: Optional[ZstdCompressor] = ...,
+        max_frame_size: int = ...,
+        closefd: bool = ...,
+    ) -> None: ...
+    def __enter__(self) -> "ZstdSeekableWriter": ...
+    def __exit__(self, exc_type, exc_value, exc_tb): ...
+    def __iter__(self): ...
+    def __next__(self): ...
+    @property
+    def closed(self) -> bool: ...
+    @property
+    def frame_count(self) -> int: ...
+    def isatty(self) -> bool: ...
+    def readable(self) -> bool: ...
+    def seekable(self) -> bool: ...
+    def writable(self) -> bool: ...
+    def read(self, size: int = ...): ...
+    def tell(self) -> int: ...
+    def write(self, data: ByteString) -> int: ...
+    def flush(self) -> int: ...
+    def close(self) -> None: ...
+
+class ZstdSeekableReader(BinaryIO):
+    def __init__(
+        self,
+        source: Union[IO[bytes], ByteString],
+        dctx: Optional[ZstdDecompressor] = ...,
+        closefd: bool = ...,
+    ) -> None: ...
+    def __enter__(self) -> "ZstdSeekableReader": ...
+    def __exit__(self, exc_type, exc_value, exc_tb): ...
+    def __iter__(self): ...
+    def __next__(self): ...
+    @property
+    def closed(self) -> bool: ...
+    @property
+    def frame_count(self) -> int: ...
+    def close(self) -> None: ...
+    def isatty(self) -> bool: ...
+    def readable(self) -> bool: ...
+    def seekable(self) -> bool: ...
+    def writable(self) -> bool: ...
+    def write(self, data: ByteString): ...
+    def flush(self): ...
+    def tell(self) -> int: ...
+    def seek(self, pos: int, whence: int = ...) -> int: ...
+    def read(self, size: int = ...) -> bytes: ...
+    def readall(self) -> bytes: ...
+    def read1(self, size: int = ...) -> bytes: ...
+    def readinto(self, b) -> int: ...
+    def readinto1(self, b) -> int: ...
+
+class ZstdParallelDecompressor(object):
+    def __init__(
+        self,
+        dict_data: Optional[ZstdCompressionDict] = ...,
+        max_window_size: int = ...,
+        threads: int = ...,
+        max_pending_frames: int = ...,
+    ) -> None: ...
+    @property
+    def threads(self) -> int: ...
+    def read_to_iter(
+        self,
+        reader: Union[IO[bytes], ByteString],
+        read_size: int = ...,
+    ) -> Generator[bytes, None, None]: ...
+    def copy_stream(
+        self,
+        ifh: IO[bytes],
+        ofh: IO[bytes],
+        read_size: int = ...,
+    ) -> Tuple[int, int]: ...
+    def decompress(self, data: ByteString) -> bytes: ...
+
+class AsyncZstdCompressionWriter(object):
+    def __init__(
+        self,
+        writer: Any,
+        cctx: Optional[ZstdCompressor] = ...,
+        size: int = ...,
+        executor: Optional[Executor] = ...,
+        executor_threshold: int = ...,
+        closefd: bool = ...,
+    ) -> None: ...
+    async def __aenter__(self) -> "AsyncZstdCompressionWriter": ...
+    async def __aexit__(self, exc_type, exc_value, exc_tb): ...
+    @property
+    def closed(self) -> bool: ...
+    def tell(self) -> int: ...
+    async def write(self, data: ByteString) -> int: ...
+    async def flush(self, flush_mode: int = ...) -> int: ...
+    async def write_skippable_frame(
+        self, data: ByteString, magic_variant: int = ...
+    ) -> int: ...
+    async def close(self) -> None: ...
+
+class AsyncZstdDecompressionReader(object):
+    def __init__(
+        self,
+        reader: Any,
+        dctx: Optional[ZstdDecompressor] = ...,
+        read_size: int = ...,
+        read_across_frames: bool = ...,
+        executor: Optional[Executor] = ...,
+        closefd: bool = ...,
+    ) -> None: ...
+    async def __aenter__(self) -> "AsyncZstdDecompressionReader": ...
+    async def __aexit__(self, exc_type, exc_value, exc_tb): ...
+    def __aiter__(self) -> "AsyncZstdDecompressionReader": ...
+    async def __anext__(self) -> bytes: ...
+    @property
+    def closed(self) -> bool: ...
+    def tell(self) -> int: ...
+    async def read(self, size: int = ...) -> bytes: ...
+    async def readall(self) -> bytes: ...
+    def close(self) -> None: ...
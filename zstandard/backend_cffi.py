@@ -13,6 +13,7 @@ __all__ = [
     "BufferSegment",
     "BufferSegments",
     "BufferWithSegments",
+    "BufferWithSegmentsBuilder",
     "BufferWithSegmentsCollection",
     "ZstdCompressionChunker",
     "ZstdCompressionDict",
@@ -25,13 +26,17 @@ __all__ = [
     "ZstdDecompressionReader",
     "ZstdDecompressionWriter",
     "ZstdDecompressor",
+    "ZstdDictionaryRegistry",
     "ZstdError",
+    "ZstdThreadPool",
     "FrameParameters",
     "backend_features",
     "estimate_decompression_context_size",
     "frame_content_size",
     "frame_header_size",
+    "frame_summary",
     "get_frame_parameters",
+    "scan_frames",
     "train_dictionary",
     # Constants.
     "FLUSH_BLOCK",
@@ -83,15 +88,24 @@ __all__ = [
     "FORMAT_ZSTD1_MAGICLESS",
 ]
 
+import array
+import bisect
+import concurrent.futures
+import heapq
 import io
 import os
+import threading
 
 from ._cffi import (  # type: ignore
     ffi,
     lib,
 )
 
-backend_features = set()  # type: ignore
+backend_features = {
+    "buffer_types",
+    "multi_compress_to_buffer",
+    "multi_decompress_to_buffer",
+}
 
 COMPRESSION_RECOMMENDED_INPUT_SIZE = lib.ZSTD_CStreamInSize()
 COMPRESSION_RECOMMENDED_OUTPUT_SIZE = lib.ZSTD_CStreamOutSize()
@@ -182,18 +196,33 @@ class BufferSegment:
     The object conforms to the buffer protocol.
     """
 
+    __slots__ = ("_parent", "_offset", "_length")
+
+    def __init__(self, parent, offset, length):
+        self._parent = parent
+        self._offset = offset
+        self._length = length
+
     @property
     def offset(self):
         """The byte offset of this segment within its parent buffer."""
-        raise NotImplementedError()
+        return self._offset
 
     def __len__(self):
         """Obtain the length of the segment, in bytes."""
-        raise NotImplementedError()
+        return self._length
+
+    def __buffer__(self, flags):
+        return memoryview(
+            ffi.buffer(self._parent._data + self._offset, self._length)
+        ).toreadonly()
+
+    def __release_buffer__(self, view):
+        view.release()
 
     def tobytes(self):
         """Obtain bytes copy of this segment."""
-        raise NotImplementedError()
+        return ffi.buffer(self._parent._data + self._offset, self._length)[:]
 
 
 class BufferSegments:
@@ -206,6 +235,15 @@ class BufferSegments:
     Instances conform to the buffer protocol.
     """
 
+    def __init__(self, segments):
+        self._segments = segments
+
+    def __buffer__(self, flags):
+        return memoryview(self._segments).cast("B").toreadonly()
+
+    def __release_buffer__(self, view):
+        view.release()
+
 
 class BufferWithSegments:
     """A memory buffer containing N discrete items of known lengths.
@@ -226,15 +264,63 @@ class BufferWithSegments:
     APIs like :py:meth:`ZstdDecompressor.multi_decompress_to_buffer`, it
     is possible to decompress many objects in parallel without the GIL
     held, leading to even better performance.
+
+    .. note::
+
+       With the CFFI backend, the buffer protocol is implemented via
+       ``__buffer__`` (PEP 688), which requires Python 3.12+. On older
+       versions, ``memoryview()`` of this type, :py:class:`BufferSegment`
+       and :py:class:`BufferSegments` raises ``TypeError``. Use
+       ``tobytes()`` to obtain a copy of the data instead.
     """
 
+    def __init__(self, data, segments):
+        segments = memoryview(segments).cast("B")
+
+        if len(segments) % 16:
+            raise ValueError("segments array size is not a multiple of 16")
+
+        data_buffer = ffi.from_buffer(data)
+
+        # Make a copy of the segments data. It is cheap to do so and is a
+        # guard against caller changing offsets, which has security
+        # implications.
+        offsets = array.array("Q")
+        offsets.frombytes(segments)
+
+        # Validate segments data, as blindly trusting it could lead to
+        # arbitrary memory access.
+        size = len(data_buffer)
+        for i in range(0, len(offsets), 2):
+            if offsets[i] + offsets[i + 1] > size:
+                raise ValueError(
+                    "offset within segments array references memory "
+                    "outside buffer"
+                )
+
+        self._parent = data
+        self._data = data_buffer
+        self._size = size
+        self._segments = offsets
+
+    @classmethod
+    def _from_memory(cls, data, size, segments):
+        """Construct an instance from trusted cdata and an array of offsets."""
+        self = cls.__new__(cls)
+        self._parent = None
+        self._data = data
+        self._size = size
+        self._segments = segments
+
+        return self
+
     @property
     def size(self):
         """Total sizein bytes of the backing buffer."""
-        raise NotImplementedError()
+        return self._size
 
     def __len__(self):
-        raise NotImplementedError()
+        return len(self._segments) // 2
 
     def __getitem__(self, i):
         """Obtains a segment within the buffer.
@@ -246,7 +332,21 @@ class BufferWithSegments:
         :return:
            :py:class:`BufferSegment`
         """
-        raise NotImplementedError()
+        if i < 0:
+            raise IndexError("offset must be non-negative")
+
+        if i >= len(self):
+            raise IndexError("offset must be less than %d" % len(self))
+
+        return BufferSegment(
+            self, self._segments[i * 2], self._segments[i * 2 + 1]
+        )
+
+    def __buffer__(self, flags):
+        return memoryview(ffi.buffer(self._data, self._size)).toreadonly()
+
+    def __release_buffer__(self, view):
+        view.release()
 
     def segments(self):
         """Obtain the array of ``(offset, length)`` segments in the buffer.
@@ -254,11 +354,11 @@ class BufferWithSegments:
         :return:
            :py:class:`BufferSegments`
         """
-        raise NotImplementedError()
+        return BufferSegments(self._segments)
 
     def tobytes(self):
         """Obtain bytes copy of this instance."""
-        raise NotImplementedError()
+        return ffi.buffer(self._data, self._size)[:]
 
 
 class BufferWithSegmentsCollection:
@@ -274,13 +374,307 @@ class BufferWithSegmentsCollection:
     and ``b[4]`` access segments from the second.
     """
 
+    def __init__(self, *buffers):
+        if not buffers:
+            raise ValueError("must pass at least 1 argument")
+
+        # Cumulative segment counts, used to locate the buffer holding an
+        # item with a binary search.
+        offsets = []
+        count = 0
+
+        for buffer in buffers:
+            if not isinstance(buffer, BufferWithSegments):
+                raise TypeError(
+                    "arguments must be BufferWithSegments instances"
+                )
+
+            if not len(buffer) or not buffer.size:
+                raise ValueError("ZstdBufferWithSegments cannot be empty")
+
+            count += len(buffer)
+            offsets.append(count)
+
+        self._buffers = buffers
+        self._offsets = offsets
+
     def __len__(self):
         """The number of segments within all ``BufferWithSegments``."""
-        raise NotImplementedError()
+        return self._offsets[-1]
 
     def __getitem__(self, i):
         """Obtain the ``BufferSegment`` at an offset."""
-        raise NotImplementedError()
+        if i < 0:
+            raise IndexError("offset must be non-negative")
+
+        if i >= len(self):
+            raise IndexError("offset must be less than %d" % len(self))
+
+        index = bisect.bisect_right(self._offsets, i)
+        if index:
+            i -= self._offsets[index - 1]
+
+        return self._buffers[index][i]
+
+    def size(self):
+        """Total size in bytes of all ``BufferWithSegments``."""
+        return sum(buffer.size for buffer in self._buffers)
+
+
+class BufferWithSegmentsBuilder:
+    """Incrementally constructs a :py:class:`BufferWithSegments`.
+
+    Data is appended to a growable buffer, recording the offset and length
+    of each appended item. Growth is geometric, so building up a buffer from
+    many small items has amortized linear cost.
+
+    When done, :py:meth:`finish` transfers the accumulated data to a new
+    :py:class:`BufferWithSegments` without copying it and resets the builder
+    to an empty state.
+
+    :param size_hint:
+       Expected total size in bytes of all appended data. Used to
+       pre-allocate memory.
+    :param count_hint:
+       Expected number of segments. Used to pre-allocate memory.
+    """
+
+    def __init__(self, size_hint=0, count_hint=0):
+        if size_hint < 0 or count_hint < 0:
+            raise ValueError("hints must be non-negative")
+
+        # Storage is pre-sized from the hints and filled in place. Growing a
+        # bytearray over-allocates, giving amortized growth beyond the hints.
+        self._data = bytearray(size_hint)
+        self._size = 0
+        self._segments = array.array("Q", [0]) * (2 * count_hint)
+        self._count = 0
+
+    @property
+    def size(self):
+        """Total size in bytes of appended data."""
+        return self._size
+
+    def __len__(self):
+        return self._count
+
+    def _push(self, data):
+        offset = self._size
+        self._size = offset + len(data)
+
+        # Overwrites pre-sized storage and grows it where that runs out.
+        self._data[offset : self._size] = data
+
+        index = 2 * self._count
+        if index < len(self._segments):
+            self._segments[index] = offset
+            self._segments[index + 1] = len(data)
+        else:
+            self._segments.append(offset)
+            self._segments.append(len(data))
+
+        self._count += 1
+
+    def append(self, data):
+        """Append a copy of a bytes-like object as a new segment."""
+        self._push(memoryview(data).cast("B"))
+
+    def extend(self, data):
+        """Append multiple segments.
+
+        ``data`` can be a :py:class:`BufferWithSegments`, a
+        :py:class:`BufferWithSegmentsCollection`, or an iterable of
+        bytes-like objects. Each segment or item becomes a new segment.
+        """
+        if isinstance(data, BufferWithSegments):
+            buffers = [data]
+        elif isinstance(data, BufferWithSegmentsCollection):
+            buffers = data._buffers
+        else:
+            for item in data:
+                self.append(item)
+
+            return
+
+        for buffer in buffers:
+            segments = buffer._segments
+            for i in range(0, len(segments), 2):
+                self._push(
+                    ffi.buffer(buffer._data + segments[i], segments[i + 1])
+                )
+
+    def finish(self):
+        """Obtain a :py:class:`BufferWithSegments` holding appended data.
+
+        The builder is reset and can be reused afterwards.
+
+        :return:
+           :py:class:`BufferWithSegments`
+        """
+        data = self._data
+        segments = self._segments
+
+        # Drop unused pre-sized storage.
+        del data[self._size :]
+        del segments[2 * self._count :]
+
+        self._data = bytearray()
+        self._size = 0
+        self._segments = array.array("Q")
+        self._count = 0
+
+        # ffi.from_buffer() keeps a reference to (and pins) the bytearray,
+        # so the memory is handed over as-is.
+        return BufferWithSegments._from_memory(
+            ffi.from_buffer(data), len(data), segments
+        )
+
+
+def _buffer_sources(data):
+    """Resolve input to the multi_* APIs to a list of ``(pointer, size)``.
+
+    Returns ``None`` if the input type isn't supported.
+    """
+    if isinstance(data, BufferWithSegments):
+        buffers = [data]
+    elif isinstance(data, BufferWithSegmentsCollection):
+        buffers = data._buffers
+    elif isinstance(data, list):
+        sources = []
+        for i, item in enumerate(data):
+            try:
+                item_buffer = ffi.from_buffer(item)
+            except TypeError:
+                raise TypeError("item %d not a bytes like object" % i)
+
+            sources.append((item_buffer, len(item_buffer)))
+
+        return sources
+    else:
+        return None
+
+    sources = []
+    for buffer in buffers:
+        segments = buffer._segments
+        for i in range(0, len(segments), 2):
+            sources.append((buffer._data + segments[i], segments[i + 1]))
+
+    return sources
+
+
+def _split_work(sizes, threads):
+    """Split items into at most ``threads`` contiguous ranges of equal bytes.
+
+    Mirrors the strategy of the C backend: each worker receives roughly the
+    same number of input bytes.
+    """
+    threads = max(min(threads, len(sizes)), 1)
+    bytes_per_worker = sum(sizes) // threads
+
+    ranges = []
+    start = 0
+    worker_bytes = 0
+
+    for i, size in enumerate(sizes):
+        worker_bytes += size
+
+        # The last worker handles all remaining work.
+        if len(ranges) == threads - 1:
+            break
+
+        if worker_bytes >= bytes_per_worker:
+            ranges.append((start, i + 1))
+            start = i + 1
+            worker_bytes = 0
+
+    if start < len(sizes):
+        ranges.append((start, len(sizes)))
+
+    return ranges
+
+
+def _run_workers(fn, ranges, executor=None):
+    """Run ``fn(index, start, end)`` for each range, returning results in order.
+
+    Work is dispatched to a thread pool when there are multiple ranges. zstd
+    functions called via CFFI release the GIL, so workers run concurrently.
+    If ``executor`` is given, it is used instead of a temporary pool.
+    """
+    if len(ranges) == 1:
+        return [fn(0, *ranges[0])]
+
+    if executor is None:
+        with concurrent.futures.ThreadPoolExecutor(len(ranges)) as pool:
+            return _run_workers(fn, ranges, pool)
+
+    futures = [
+        executor.submit(fn, i, start, end)
+        for i, (start, end) in enumerate(ranges)
+    ]
+
+    # Wait for everything before surfacing the error from the earliest
+    # failing range so no worker is still writing to shared state.
+    concurrent.futures.wait(futures)
+
+    return [f.result() for f in futures]
+
+
+# Cost model used to pick the number of workers for multi_compress_to_buffer().
+# Dispatching work to another thread has a fixed cost. For batches of small
+# inputs, that cost can exceed the cost of compressing everything on the
+# calling thread. So we estimate how long compressing the batch will take and
+# only add a worker for every _MULTI_COMPRESS_MIN_WORKER_USEC of work. The
+# throughput figures are conservative single core estimates in bytes per
+# microsecond, keyed by the maximum compression level they apply to.
+_MULTI_COMPRESS_MIN_WORKER_USEC = 200
+_MULTI_COMPRESS_ITEM_OVERHEAD_USEC = 1
+_MULTI_COMPRESS_BYTES_PER_USEC = (
+    (0, 600),
+    (2, 300),
+    (4, 150),
+    (9, 50),
+    (15, 15),
+)
+
+
+def _multi_compress_thread_count(threads, sizes, level):
+    threads = min(threads, len(sizes))
+
+    if threads < 2:
+        return 1
+
+    bytes_per_usec = 3
+    for max_level, value in _MULTI_COMPRESS_BYTES_PER_USEC:
+        if level <= max_level:
+            bytes_per_usec = value
+            break
+
+    cost_usec = (
+        sum(sizes) // bytes_per_usec
+        + len(sizes) * _MULTI_COMPRESS_ITEM_OVERHEAD_USEC
+    )
+
+    return max(min(threads, cost_usec // _MULTI_COMPRESS_MIN_WORKER_USEC), 1)
+
+
+# The same cost model for multi_decompress_to_buffer(). Decompression speed
+# barely depends on settings, so a single conservative estimate of compressed
+# input consumed per microsecond is used.
+_MULTI_DECOMPRESS_BYTES_PER_USEC = 300
+
+
+def _multi_decompress_thread_count(threads, sizes):
+    threads = min(threads, len(sizes))
+
+    if threads < 2:
+        return 1
+
+    cost_usec = (
+        sum(sizes) // _MULTI_DECOMPRESS_BYTES_PER_USEC
+        + len(sizes) * _MULTI_COMPRESS_ITEM_OVERHEAD_USEC
+    )
+
+    return max(min(threads, cost_usec // _MULTI_COMPRESS_MIN_WORKER_USEC), 1)
 
 
 class ZstdError(Exception):
@@ -744,6 +1138,8 @@ class ZstdCompressionWriter(object):
         self._closing = False
         self._closed = False
         self._bytes_compressed = 0
+        # Whether data was written since the current frame started.
+        self._frame_started = False
 
         self._dst_buffer = ffi.new("char[]", write_size)
         self._out_buffer = ffi.new("ZSTD_outBuffer *")
@@ -860,6 +1256,9 @@ class ZstdCompressionWriter(object):
         in_buffer.size = len(data_buffer)
         in_buffer.pos = 0
 
+        if in_buffer.size:
+            self._frame_started = True
+
         out_buffer = self._out_buffer
         out_buffer.pos = 0
 
@@ -950,12 +1349,63 @@ class ZstdCompressionWriter(object):
             if not zresult:
                 break
 
+        if flush == lib.ZSTD_e_end:
+            self._frame_started = False
+
         f = getattr(self._writer, "flush", None)
         if f and not self._closing:
             f()
 
         return total_write
 
+    def write_skippable_frame(self, data, magic_variant=0):
+        """Write a skippable frame to the inner stream.
+
+        Skippable frames hold arbitrary data that is ignored by decompressors.
+        They can be used to embed metadata in a stream of compressed data. Use
+        :py:func:`zstandard.iter_frames` to read them back.
+
+        Skippable frames can only appear between frames. If data has been
+        written since the current frame started, the frame is ended first, as
+        if ``flush(FLUSH_FRAME)`` were called. Subsequent writes start a new
+        frame.
+
+        :param data:
+           Payload of the skippable frame. Must be smaller than 4 GiB.
+        :param magic_variant:
+           Integer between 0 and 15 stored in the frame's magic number. Can
+           be used to distinguish different kinds of skippable frames.
+        :return:
+           Integer number of bytes written to the inner stream.
+        """
+        if self._closed:
+            raise ValueError("stream is closed")
+
+        if not 0 <= magic_variant <= 15:
+            raise ValueError("magic_variant must be between 0 and 15")
+
+        data_buffer = ffi.from_buffer(data)
+
+        total_write = 0
+
+        if self._frame_started:
+            total_write += self.flush(FLUSH_FRAME)
+
+        frame = new_nonzero("char[]", len(data_buffer) + 8)
+        zresult = lib.ZSTD_writeSkippableFrame(
+            frame, len(frame), data_buffer, len(data_buffer), magic_variant
+        )
+        if lib.ZSTD_isError(zresult):
+            raise ZstdError(
+                "cannot write skippable frame: %s" % _zstd_error(zresult)
+            )
+
+        self._writer.write(ffi.buffer(frame, zresult)[:])
+        total_write += zresult
+        self._bytes_compressed += zresult
+
+        return total_write
+
     def tell(self):
         return self._bytes_compressed
 
@@ -1737,6 +2187,71 @@ class ZstdCompressionReader(object):
         return out_buffer.pos
 
 
+class ZstdThreadPool(object):
+    """A pool of compression worker threads that can be shared by compressors.
+
+    By default, every ``ZstdCompressor`` using multiple threads creates its
+    own pool of worker threads. When many compressors are active at once,
+    this can lead to far more threads than there are CPU cores. Passing a
+    ``ZstdThreadPool`` to multiple ``ZstdCompressor`` instances via their
+    ``thread_pool`` argument makes them share a single set of workers,
+    bounding the number of compression threads in the process and
+    avoiding thread startup costs for each compressor.
+
+    >>> pool = zstandard.ZstdThreadPool(threads=4)
+    >>> cctx1 = zstandard.ZstdCompressor(thread_pool=pool)
+    >>> cctx2 = zstandard.ZstdCompressor(thread_pool=pool)
+
+    :param threads:
+       Number of threads in the pool. Negative values (the default) use the
+       number of logical CPUs in the machine.
+    """
+
+    def __init__(self, threads=-1):
+        if threads < 0:
+            threads = _cpu_count()
+
+        threads = max(threads, 1)
+
+        pool = lib.ZSTD_createThreadPool(threads)
+        if pool == ffi.NULL:
+            raise ZstdError("unable to create thread pool")
+
+        self._pool = ffi.gc(pool, lib.ZSTD_freeThreadPool)
+        self._threads = threads
+
+    @property
+    def threads(self):
+        """Number of threads in the pool."""
+        return self._threads
+
+
+def _configure_cctx(cctx, params, dict_data, cdict):
+    zresult = lib.ZSTD_CCtx_setParametersUsingCCtxParams(cctx, params)
+    if lib.ZSTD_isError(zresult):
+        raise ZstdError(
+            "could not set compression parameters: %s" % _zstd_error(zresult)
+        )
+
+    if dict_data:
+        if cdict:
+            zresult = lib.ZSTD_CCtx_refCDict(cctx, cdict)
+        else:
+            zresult = lib.ZSTD_CCtx_loadDictionary_advanced(
+                cctx,
+                dict_data.as_bytes(),
+                len(dict_data),
+                lib.ZSTD_dlm_byRef,
+                dict_data._dict_type,
+            )
+
+        if lib.ZSTD_isError(zresult):
+            raise ZstdError(
+                "could not load compression dictionary: %s"
+                % _zstd_error(zresult)
+            )
+
+
 class ZstdCompressor(object):
     """
     Create an object used to perform Zstandard compression.
@@ -1803,6 +2318,18 @@ class ZstdCompressor(object):
        compression operations are performed on multiple threads. The default
        value (0) disables multi-threaded compression. A value of ``-1`` means
        to set the number of threads to the number of detected logical CPUs.
+    :param thread_pool:
+       A :py:class:`ZstdThreadPool` providing the worker threads used for
+       multi-threaded compression. The pool can be shared by multiple
+       compressors. If ``threads`` is not specified, it defaults to the
+       number of threads in the pool.
+    :param size_hint:
+       Expected size in bytes of inputs whose size isn't known in advance,
+       such as data fed to :py:meth:`ZstdCompressor.stream_writer`. When
+       set, compression parameters are tuned for inputs of about this size,
+       which can considerably reduce memory usage and context setup time for
+       small streams. The value is only a hint: inputs may be larger or
+       smaller. The default (0) disables the hint.
     """
 
     def __init__(
@@ -1814,15 +2341,29 @@ class ZstdCompressor(object):
         write_content_size=None,
         write_dict_id=None,
         threads=0,
+        thread_pool=None,
+        size_hint=0,
     ):
         if level > lib.ZSTD_maxCLevel():
             raise ValueError(
                 "level must be less than %d" % lib.ZSTD_maxCLevel()
             )
 
+        if size_hint < 0:
+            raise ValueError("size_hint must be non-negative")
+
         if threads < 0:
             threads = _cpu_count()
 
+        if thread_pool is not None and not isinstance(
+            thread_pool, ZstdThreadPool
+        ):
+            raise TypeError("thread_pool must be zstd.ZstdThreadPool")
+
+        # Use all the threads in a shared pool unless told otherwise.
+        if thread_pool and not compression_params and not threads:
+            threads = thread_pool.threads
+
         if compression_params and write_checksum is not None:
             raise ValueError(
                 "cannot define compression_params and " "write_checksum"
@@ -1878,12 +2419,32 @@ class ZstdCompressor(object):
                     self._params, lib.ZSTD_c_nbWorkers, threads
                 )
 
+        if size_hint:
+            _set_compression_parameter(
+                self._params, lib.ZSTD_c_srcSizeHint, size_hint
+            )
+
+        self._size_hint = size_hint
+
         cctx = lib.ZSTD_createCCtx()
         if cctx == ffi.NULL:
             raise MemoryError()
 
         self._cctx = cctx
         self._dict_data = dict_data
+        self._thread_pool = thread_pool
+
+        # State for multi_compress_to_buffer(). Worker threads and contexts
+        # persist between calls.
+        self._multi_executor = None
+        self._multi_executor_threads = 0
+        self._multi_cctxs = []
+        self._multi_stats = {
+            "single_threaded_calls": 0,
+            "multi_threaded_calls": 0,
+            "threads_started": 0,
+            "last_threads": 0,
+        }
 
         # We defer setting up garbage collection until after calling
         # _setup_cctx() to ensure the memory size estimate is more accurate.
@@ -1895,42 +2456,51 @@ class ZstdCompressor(object):
             )
 
     def _setup_cctx(self):
-        zresult = lib.ZSTD_CCtx_setParametersUsingCCtxParams(
-            self._cctx, self._params
-        )
-        if lib.ZSTD_isError(zresult):
-            raise ZstdError(
-                "could not set compression parameters: %s"
-                % _zstd_error(zresult)
+        if self._thread_pool:
+            zresult = lib.ZSTD_CCtx_refThreadPool(
+                self._cctx, self._thread_pool._pool
             )
-
-        dict_data = self._dict_data
-
-        if dict_data:
-            if dict_data._cdict:
-                zresult = lib.ZSTD_CCtx_refCDict(self._cctx, dict_data._cdict)
-            else:
-                zresult = lib.ZSTD_CCtx_loadDictionary_advanced(
-                    self._cctx,
-                    dict_data.as_bytes(),
-                    len(dict_data),
-                    lib.ZSTD_dlm_byRef,
-                    dict_data._dict_type,
-                )
-
             if lib.ZSTD_isError(zresult):
                 raise ZstdError(
-                    "could not load compression dictionary: %s"
-                    % _zstd_error(zresult)
+                    "could not set thread pool: %s" % _zstd_error(zresult)
                 )
 
+        # Hold a reference to the precomputed dictionary so it outlives
+        # eviction from the dictionary's cache.
+        if self._dict_data:
+            self._cdict = self._dict_data._get_cdict(self._params)
+        else:
+            self._cdict = None
+
+        _configure_cctx(self._cctx, self._params, self._dict_data, self._cdict)
+
+    def _set_size_hint(self, size_hint):
+        # Must be called after resetting the context. 0 restores the hint
+        # the compressor was constructed with.
+        if size_hint < 0:
+            raise ValueError("size_hint must be non-negative")
+
+        zresult = lib.ZSTD_CCtx_setParameter(
+            self._cctx, lib.ZSTD_c_srcSizeHint, size_hint or self._size_hint
+        )
+        if lib.ZSTD_isError(zresult):
+            raise ZstdError(
+                "error setting source size hint: %s" % _zstd_error(zresult)
+            )
+
     def memory_size(self):
         """Obtain the memory usage of this compressor, in bytes.
 
         >>> cctx = zstandard.ZstdCompressor()
         >>> memory = cctx.memory_size()
         """
-        return lib.ZSTD_sizeof_CCtx(self._cctx)
+        size = lib.ZSTD_sizeof_CCtx(self._cctx)
+
+        # Worker contexts retained by multi_compress_to_buffer().
+        for cctx in self._multi_cctxs:
+            size += lib.ZSTD_sizeof_CCtx(cctx)
+
+        return size
 
     def compress(self, data):
         """
@@ -1987,7 +2557,73 @@ class ZstdCompressor(object):
 
         return ffi.buffer(out, out_buffer.pos)[:]
 
-    def compressobj(self, size=-1):
+    def compress_into(self, data, out):
+        """
+        Compress data in a single operation into a caller-provided buffer.
+
+        This is like :py:meth:`compress` except the compressed frame is written
+        into ``out``, which must be a writable object conforming to the buffer
+        protocol, such as a ``bytearray``, ``memoryview``, ``mmap.mmap``, or
+        numpy array. This avoids allocating a new ``bytes`` for every call.
+
+        If the compressed frame doesn't fit in ``out``, ``ZstdError`` is
+        raised and the contents of ``out`` are undefined. A buffer of
+        ``len(data) + len(data) // 256 + 64`` bytes is always large enough.
+
+        >>> cctx = zstandard.ZstdCompressor()
+        >>> out = bytearray(len(data) + len(data) // 256 + 64)
+        >>> size = cctx.compress_into(data, out)
+        >>> compressed = out[:size]
+
+        :param data:
+           Source data to compress
+        :param out:
+           Writable buffer to write compressed data to.
+        :return:
+           Integer number of bytes written to ``out``.
+        """
+        lib.ZSTD_CCtx_reset(self._cctx, lib.ZSTD_reset_session_only)
+
+        data_buffer = ffi.from_buffer(data)
+        try:
+            dest_buffer = ffi.from_buffer(out, require_writable=True)
+        except BufferError:
+            raise TypeError("out must be a writable buffer")
+
+        zresult = lib.ZSTD_CCtx_setPledgedSrcSize(self._cctx, len(data_buffer))
+        if lib.ZSTD_isError(zresult):
+            raise ZstdError(
+                "error setting source size: %s" % _zstd_error(zresult)
+            )
+
+        out_buffer = ffi.new("ZSTD_outBuffer *")
+        in_buffer = ffi.new("ZSTD_inBuffer *")
+
+        out_buffer.dst = dest_buffer
+        out_buffer.size = len(dest_buffer)
+        out_buffer.pos = 0
+
+        in_buffer.src = data_buffer
+        in_buffer.size = len(data_buffer)
+        in_buffer.pos = 0
+
+        zresult = lib.ZSTD_compressStream2(
+            self._cctx, out_buffer, in_buffer, lib.ZSTD_e_end
+        )
+
+        if lib.ZSTD_isError(zresult):
+            raise ZstdError("cannot compress: %s" % _zstd_error(zresult))
+        elif zresult:
+            # Don't leave a partial frame behind for the next operation.
+            lib.ZSTD_CCtx_reset(self._cctx, lib.ZSTD_reset_session_only)
+            raise ZstdError(
+                "output buffer too small: compressed data exceeds %d bytes"
+                % len(dest_buffer)
+            )
+
+        return out_buffer.pos
+
+    def compressobj(self, size=-1, size_hint=0):
         """
         Obtain a compressor exposing the Python standard library compression API.
 
@@ -1995,10 +2631,15 @@ class ZstdCompressor(object):
 
         :param size:
            Size in bytes of data that will be compressed.
+        :param size_hint:
+           Expected size in bytes of data that will be compressed when
+           ``size`` isn't known. Overrides the hint the compressor was
+           constructed with.
         :return:
            :py:class:`ZstdCompressionObj`
         """
         lib.ZSTD_CCtx_reset(self._cctx, lib.ZSTD_reset_session_only)
+        self._set_size_hint(size_hint)
 
         if size < 0:
             size = lib.ZSTD_CONTENTSIZE_UNKNOWN
@@ -2013,7 +2654,12 @@ class ZstdCompressor(object):
 
         return cobj
 
-    def chunker(self, size=-1, chunk_size=COMPRESSION_RECOMMENDED_OUTPUT_SIZE):
+    def chunker(
+        self,
+        size=-1,
+        chunk_size=COMPRESSION_RECOMMENDED_OUTPUT_SIZE,
+        size_hint=0,
+    ):
         """
         Create an object for iterative compressing to same-sized chunks.
 
@@ -2024,10 +2670,15 @@ class ZstdCompressor(object):
            Size in bytes of data that will be compressed.
         :param chunk_size:
            Size of compressed chunks.
+        :param size_hint:
+           Expected size in bytes of data that will be compressed when
+           ``size`` isn't known. Overrides the hint the compressor was
+           constructed with.
         :return:
            :py:class:`ZstdCompressionChunker`
         """
         lib.ZSTD_CCtx_reset(self._cctx, lib.ZSTD_reset_session_only)
+        self._set_size_hint(size_hint)
 
         if size < 0:
             size = lib.ZSTD_CONTENTSIZE_UNKNOWN
@@ -2097,6 +2748,7 @@ class ZstdCompressor(object):
             raise ValueError("second argument must have a write() method")
 
         lib.ZSTD_CCtx_reset(self._cctx, lib.ZSTD_reset_session_only)
+        self._set_size_hint(0)
 
         if size < 0:
             size = lib.ZSTD_CONTENTSIZE_UNKNOWN
@@ -2195,6 +2847,7 @@ class ZstdCompressor(object):
            :py:class:`ZstdCompressionReader`
         """
         lib.ZSTD_CCtx_reset(self._cctx, lib.ZSTD_reset_session_only)
+        self._set_size_hint(0)
 
         try:
             size = len(source)
@@ -2219,6 +2872,7 @@ class ZstdCompressor(object):
         write_size=COMPRESSION_RECOMMENDED_OUTPUT_SIZE,
         write_return_read=True,
         closefd=True,
+        size_hint=0,
     ):
         """
         Create a stream that will write compressed data into another stream.
@@ -2244,6 +2898,10 @@ class ZstdCompressor(object):
            consumed from the input.
         :param closefd:
            Whether to ``close`` the ``writer`` when this stream is closed.
+        :param size_hint:
+           Expected size in bytes of data to be compressed when ``size``
+           isn't known. Overrides the hint the compressor was constructed
+           with.
         :return:
            :py:class:`ZstdCompressionWriter`
         """
@@ -2251,6 +2909,7 @@ class ZstdCompressor(object):
             raise ValueError("must pass an object with a write() method")
 
         lib.ZSTD_CCtx_reset(self._cctx, lib.ZSTD_reset_session_only)
+        self._set_size_hint(size_hint)
 
         if size < 0:
             size = lib.ZSTD_CONTENTSIZE_UNKNOWN
@@ -2342,6 +3001,7 @@ class ZstdCompressor(object):
             )
 
         lib.ZSTD_CCtx_reset(self._cctx, lib.ZSTD_reset_session_only)
+        self._set_size_hint(0)
 
         if size < 0:
             size = lib.ZSTD_CONTENTSIZE_UNKNOWN
@@ -2428,11 +3088,11 @@ class ZstdCompressor(object):
             if zresult == 0:
                 break
 
-    def multi_compress_to_buffer(self, data, threads=-1):
+    def multi_compress_to_buffer(self, data, threads=0):
         """
         Compress multiple pieces of data as a single function call.
 
-        (Experimental. Not yet supported by CFFI backend.)
+        (Experimental.)
 
         This function is optimized to perform multiple compression operations
         as as possible with as little overhead as possible.
@@ -2442,9 +3102,17 @@ class ZstdCompressor(object):
         element of the container will be compressed individually using the
         configured parameters on the ``ZstdCompressor`` instance.
 
-        The ``threads`` argument controls how many threads to use for
-        compression. The default is ``0`` which means to use a single thread.
-        Negative values use the number of logical CPUs in the machine.
+        The ``threads`` argument controls the maximum number of threads to use
+        for compression. The default is ``0`` which means to use a single
+        thread. Negative values use the number of logical CPUs in the machine.
+
+        Fewer threads than requested are used when the batch is too small to
+        benefit from them. The number of workers is derived from an estimate
+        of the cost of compressing the batch, based on the total input size,
+        the number of inputs, and the compression level. Worker threads and
+        their compression contexts are retained by the ``ZstdCompressor``
+        and reused by subsequent calls. See :py:meth:`multi_compress_stats`
+        to find out which strategy was used.
 
         The function returns a ``BufferWithSegmentsCollection``. This type
         represents N discrete memory allocations, each holding 1 or more
@@ -2458,10 +3126,6 @@ class ZstdCompressor(object):
         The API and behavior of this function is experimental and will likely
         change. Known deficiencies include:
 
-        * If asked to use multiple threads, it will always spawn that many
-          threads, even if the input is too small to use them. It should
-          automatically lower the thread count when the extra threads would
-          just add overhead.
         * The buffer allocation strategy is fixed. There is room to make it
           dynamic, perhaps even to allow one output buffer per input,
           facilitating a variation of the API to return a list without the
@@ -2475,11 +3139,149 @@ class ZstdCompressor(object):
         :return:
            BufferWithSegmentsCollection holding compressed data.
         """
-        raise NotImplementedError()
+        if threads < 0:
+            threads = _cpu_count()
 
-    def frame_progression(self):
-        """
-        Return information on how much work the compressor has done.
+        sources = _buffer_sources(data)
+        if sources is None:
+            raise TypeError("argument must be list of BufferWithSegments")
+
+        if not sources:
+            raise ValueError("no source elements found")
+
+        sizes = [size for _, size in sources]
+
+        if not sum(sizes):
+            raise ValueError("source elements are empty")
+
+        level = ffi.new("int *")
+        zresult = lib.ZSTD_CCtxParams_getParameter(
+            self._params, lib.ZSTD_c_compressionLevel, level
+        )
+        if lib.ZSTD_isError(zresult) or not level[0]:
+            level[0] = 3
+
+        threads = _multi_compress_thread_count(threads, sizes, level[0])
+
+        stats = self._multi_stats
+        stats["last_threads"] = threads
+        if threads > 1:
+            stats["multi_threaded_calls"] += 1
+        else:
+            stats["single_threaded_calls"] += 1
+
+        if threads > 1 and self._multi_executor_threads < threads:
+            # Wait for the old workers to exit before the contexts they used
+            # are reconfigured. No jobs are pending between calls, so this is
+            # cheap.
+            if self._multi_executor:
+                self._multi_executor.shutdown(wait=True)
+
+            # The replacement executor starts all of its threads afresh.
+            stats["threads_started"] += threads
+            self._multi_executor = concurrent.futures.ThreadPoolExecutor(
+                threads
+            )
+            self._multi_executor_threads = threads
+
+        cctxs = self._multi_cctxs
+
+        while len(cctxs) < threads:
+            cctx = lib.ZSTD_createCCtx()
+            if cctx == ffi.NULL:
+                raise MemoryError()
+
+            cctxs.append(ffi.gc(cctx, lib.ZSTD_freeCCtx))
+
+        for cctx in cctxs[0:threads]:
+            lib.ZSTD_CCtx_reset(cctx, lib.ZSTD_reset_session_and_parameters)
+            _configure_cctx(cctx, self._params, self._dict_data, self._cdict)
+
+        def compress_range(index, start, end):
+            cctx = cctxs[index]
+
+            # Allocate enough space to hold the worst case output of every
+            # item so we never need to grow the buffer. The caller copies the
+            # output into a single exactly sized buffer.
+            dest_size = sum(
+                lib.ZSTD_compressBound(sizes[i]) for i in range(start, end)
+            )
+            dest = new_nonzero("char[]", dest_size)
+            segments = array.array("Q")
+            offset = 0
+
+            for i in range(start, end):
+                source, source_size = sources[i]
+
+                zresult = lib.ZSTD_compress2(
+                    cctx, dest + offset, dest_size - offset, source, source_size
+                )
+                if lib.ZSTD_isError(zresult):
+                    raise ZstdError(
+                        "error compressing item %d: %s"
+                        % (i, _zstd_error(zresult))
+                    )
+
+                segments.append(offset)
+                segments.append(zresult)
+                offset += zresult
+
+            return dest, offset, segments
+
+        results = _run_workers(
+            compress_range, _split_work(sizes, threads), self._multi_executor
+        )
+
+        # Coalesce the output of all workers into a single allocation.
+        total_size = sum(size for _, size, _ in results)
+        dest = new_nonzero("char[]", total_size)
+        segments = array.array("Q")
+        offset = 0
+
+        for worker_dest, size, worker_segments in results:
+            ffi.memmove(dest + offset, worker_dest, size)
+
+            for i in range(0, len(worker_segments), 2):
+                segments.append(worker_segments[i] + offset)
+                segments.append(worker_segments[i + 1])
+
+            offset += size
+
+        return BufferWithSegmentsCollection(
+            BufferWithSegments._from_memory(dest, total_size, segments)
+        )
+
+    def multi_compress_stats(self):
+        """
+        Obtain counters describing how :py:meth:`multi_compress_to_buffer`
+        performed work.
+
+        Returns a dict with the following keys:
+
+        ``single_threaded_calls``
+           Number of calls that compressed everything on the calling thread.
+        ``multi_threaded_calls``
+           Number of calls that dispatched work to worker threads.
+        ``threads_started``
+           Total number of worker threads started.
+        ``last_threads``
+           Number of workers used by the most recent call.
+        ``pool_threads``
+           Number of persistent worker threads currently retained.
+
+        >>> cctx = zstandard.ZstdCompressor()
+        >>> buffer = cctx.multi_compress_to_buffer([b"foo", b"bar"], threads=4)
+        >>> cctx.multi_compress_stats()["single_threaded_calls"]
+        1
+        """
+        stats = dict(self._multi_stats)
+        stats["pool_threads"] = self._multi_executor_threads
+
+        return stats
+
+    def frame_progression(self):
+        """
+        Return information on how much work the compressor has done.
 
         Returns a 3-tuple of (ingested, consumed, produced).
 
@@ -2514,11 +3316,31 @@ class FrameParameters(object):
        of the frame.
     """
 
+    # Instances are commonly retained in large numbers. Store only the
+    # exposed fields, mirroring the C and Rust backends.
+    __slots__ = ("_content_size", "_window_size", "_dict_id", "_has_checksum")
+
     def __init__(self, fparams):
-        self.content_size = fparams.frameContentSize
-        self.window_size = fparams.windowSize
-        self.dict_id = fparams.dictID
-        self.has_checksum = bool(fparams.checksumFlag)
+        self._content_size = fparams.frameContentSize
+        self._window_size = fparams.windowSize
+        self._dict_id = fparams.dictID
+        self._has_checksum = bool(fparams.checksumFlag)
+
+    @property
+    def content_size(self):
+        return self._content_size
+
+    @property
+    def window_size(self):
+        return self._window_size
+
+    @property
+    def dict_id(self):
+        return self._dict_id
+
+    @property
+    def has_checksum(self):
+        return self._has_checksum
 
 
 def frame_content_size(data):
@@ -2559,6 +3381,24 @@ def frame_header_size(data):
     return zresult
 
 
+def _read_frame_header(data):
+    params = ffi.new("ZSTD_frameHeader *")
+
+    data_buffer = ffi.from_buffer(data)
+    zresult = lib.ZSTD_getFrameHeader(params, data_buffer, len(data_buffer))
+    if lib.ZSTD_isError(zresult):
+        raise ZstdError(
+            "cannot get frame parameters: %s" % _zstd_error(zresult)
+        )
+
+    if zresult:
+        raise ZstdError(
+            "not enough data for frame parameters; need %d bytes" % zresult
+        )
+
+    return params[0]
+
+
 def get_frame_parameters(data):
     """
     Parse a zstd frame header into frame parameters.
@@ -2573,21 +3413,172 @@ def get_frame_parameters(data):
     :return:
        :py:class:`FrameParameters`
     """
-    params = ffi.new("ZSTD_frameHeader *")
+    return FrameParameters(_read_frame_header(data))
 
-    data_buffer = ffi.from_buffer(data)
-    zresult = lib.ZSTD_getFrameHeader(params, data_buffer, len(data_buffer))
-    if lib.ZSTD_isError(zresult):
-        raise ZstdError(
-            "cannot get frame parameters: %s" % _zstd_error(zresult)
-        )
 
-    if zresult:
-        raise ZstdError(
-            "not enough data for frame parameters; need %d bytes" % zresult
-        )
+def frame_summary(data):
+    """
+    Parse a zstd frame header into a tuple of frame parameters.
 
-    return FrameParameters(params[0])
+    This is equivalent to :py:func:`get_frame_parameters` but returns a
+    ``(content_size, window_size, dict_id, has_checksum)`` tuple instead of
+    a :py:class:`FrameParameters` instance. This is cheaper to create and
+    can be unpacked directly.
+
+    >>> content_size, window_size, dict_id, has_checksum = (
+    ...     zstandard.frame_summary(data)
+    ... )
+
+    :param data:
+       Data from which to read frame parameters.
+    :return:
+       4-tuple of ``int``, ``int``, ``int`` and ``bool``.
+    """
+    header = _read_frame_header(data)
+
+    return (
+        header.frameContentSize,
+        header.windowSize,
+        header.dictID,
+        bool(header.checksumFlag),
+    )
+
+
+_SCAN_COLUMNS = (
+    ("offset", "Q"),
+    ("compressed_size", "Q"),
+    ("content_size", "Q"),
+    ("dict_id", "I"),
+    ("has_checksum", "B"),
+    ("window_size", "Q"),
+    ("skippable", "B"),
+)
+
+
+def scan_frames(data):
+    """
+    Build an index of the zstd frames in a buffer.
+
+    Frame headers are parsed in bulk without creating a Python object per
+    frame. This is much faster than calling :py:func:`get_frame_parameters`
+    for each frame when indexing large amounts of data.
+
+    ``data`` is either a :py:class:`BufferWithSegments`, in which case each
+    segment holds one or more complete frames, or any object conforming to
+    the buffer protocol holding zero or more concatenated frames.
+
+    The result is a dict mapping column names to ``memoryview`` instances
+    of equal length, with one entry per frame:
+
+    ``offset`` (``Q``)
+       Offset of the frame from the start of the buffer.
+    ``compressed_size`` (``Q``)
+       Size of the frame in bytes.
+    ``content_size`` (``Q``)
+       Decompressed size of the frame, or :py:data:`CONTENTSIZE_UNKNOWN`
+       if the frame header doesn't record it. For skippable frames, the
+       size of the payload.
+    ``dict_id`` (``I``)
+       Dictionary ID the frame was compressed with, or ``0``.
+    ``has_checksum`` (``B``)
+       Whether the frame has a content checksum.
+    ``window_size`` (``Q``)
+       Window size required to decompress the frame.
+    ``skippable`` (``B``)
+       Whether the frame is a skippable frame.
+
+    Columns conform to the buffer protocol, so they can be used without
+    copying via e.g. ``numpy.frombuffer()``.
+
+    >>> index = zstandard.scan_frames(data)
+    >>> offsets = numpy.frombuffer(index["offset"], dtype=numpy.uint64)
+
+    :param data:
+       :py:class:`BufferWithSegments` or object conforming to the buffer
+       protocol.
+    :return:
+       dict of ``memoryview``
+    :raises ZstdError:
+       if data isn't a sequence of complete frames.
+    """
+    if isinstance(data, BufferWithSegments):
+        data_buffer = data._data
+        segments = data._segments
+        ranges = [
+            (segments[i], segments[i] + segments[i + 1])
+            for i in range(0, len(segments), 2)
+        ]
+    else:
+        data_buffer = ffi.from_buffer(data)
+        ranges = [(0, len(data_buffer))]
+
+    columns = [array.array(typecode) for _, typecode in _SCAN_COLUMNS]
+    (
+        offsets,
+        compressed_sizes,
+        content_sizes,
+        dict_ids,
+        checksums,
+        window_sizes,
+        skippables,
+    ) = columns
+
+    header = ffi.new("ZSTD_frameHeader *")
+
+    for offset, end in ranges:
+        while offset < end:
+            source = data_buffer + offset
+
+            frame_size = lib.ZSTD_findFrameCompressedSize(source, end - offset)
+            if lib.ZSTD_isError(frame_size):
+                raise ZstdError(
+                    "error scanning frame at offset %d: %s"
+                    % (offset, _zstd_error(frame_size))
+                )
+
+            zresult = lib.ZSTD_getFrameHeader(header, source, end - offset)
+            if lib.ZSTD_isError(zresult):
+                raise ZstdError(
+                    "error scanning frame at offset %d: %s"
+                    % (offset, _zstd_error(zresult))
+                )
+
+            offsets.append(offset)
+            compressed_sizes.append(frame_size)
+            content_sizes.append(header.frameContentSize)
+
+            if header.frameType == lib.ZSTD_skippableFrame:
+                dict_ids.append(0)
+                checksums.append(0)
+                window_sizes.append(0)
+                skippables.append(1)
+            else:
+                dict_ids.append(header.dictID)
+                checksums.append(1 if header.checksumFlag else 0)
+                window_sizes.append(header.windowSize)
+                skippables.append(0)
+
+            offset += frame_size
+
+    return {
+        name: memoryview(column)
+        for (name, _), column in zip(_SCAN_COLUMNS, columns)
+    }
+
+
+_CPARAM_FIELDS = (
+    (lib.ZSTD_c_windowLog, "windowLog"),
+    (lib.ZSTD_c_chainLog, "chainLog"),
+    (lib.ZSTD_c_hashLog, "hashLog"),
+    (lib.ZSTD_c_searchLog, "searchLog"),
+    (lib.ZSTD_c_minMatch, "minMatch"),
+    (lib.ZSTD_c_targetLength, "targetLength"),
+    (lib.ZSTD_c_strategy, "strategy"),
+)
+
+
+def _cdict_key(cparams):
+    return tuple(getattr(cparams, field) for _, field in _CPARAM_FIELDS)
 
 
 class ZstdCompressionDict(object):
@@ -2665,13 +3656,32 @@ class ZstdCompressionDict(object):
        precompute the dictionary overwrite some of the compression parameters
        specified to ``ZstdCompressor``.
 
+    Precomputed dictionaries are cached by compression parameters. Calling
+    ``precompute_compress()`` again with parameters that are still cached
+    doesn't digest the dictionary again. A ``ZstdCompressor`` uses the
+    cached dictionary matching its compression level and parameters,
+    falling back to the most recently precomputed one. So a dictionary can
+    be precomputed once for every level in use:
+
+    >>> for level in (1, 3, 19):
+    ...     d.precompute_compress(level=level)
+    >>> cctx = zstandard.ZstdCompressor(level=19, dict_data=d)
+
+    Up to ``cdict_cache_size`` precomputed dictionaries are retained, evicting
+    the least recently used. ``cdict_stats()`` reports how well the cache is
+    performing.
+
     :param data:
        Dictionary data.
     :param dict_type:
        Type of dictionary. One of the ``DICT_TYPE_*`` constants.
+    :param cdict_cache_size:
+       Maximum number of precomputed dictionaries to retain. Keyword only.
     """
 
-    def __init__(self, data, dict_type=DICT_TYPE_AUTO, k=0, d=0):
+    def __init__(
+        self, data, dict_type=DICT_TYPE_AUTO, k=0, d=0, *, cdict_cache_size=4
+    ):
         assert isinstance(data, bytes)
         self._data = data
         self.k = k
@@ -2687,8 +3697,19 @@ class ZstdCompressionDict(object):
                 "DICT_TYPE_* constants"
             )
 
+        if cdict_cache_size < 1:
+            raise ValueError("cdict_cache_size must be positive")
+
         self._dict_type = dict_type
         self._cdict = None
+        self._cdicts = {}
+        self._cdict_cache_size = cdict_cache_size
+        self._cdict_lock = threading.Lock()
+        self._cdict_hits = 0
+        self._cdict_misses = 0
+        self._cdict_evictions = 0
+        self._ddict_cache = None
+        self._ddict_lock = threading.Lock()
 
     def __len__(self):
         return len(self._data)
@@ -2706,6 +3727,9 @@ class ZstdCompressionDict(object):
 
         Calling this method on an instance that will be used by multiple
         :py:class:`ZstdCompressor` instances will improve performance.
+
+        A dictionary precomputed with the same parameters that is still
+        cached is reused instead of digesting the dictionary again.
         """
         if level and compression_params:
             raise ValueError(
@@ -2718,7 +3742,8 @@ class ZstdCompressionDict(object):
         if level:
             cparams = lib.ZSTD_getCParams(level, 0, len(self._data))
         else:
-            cparams = ffi.new("ZSTD_compressionParameters")
+            cparams_ptr = ffi.new("ZSTD_compressionParameters *")
+            cparams = cparams_ptr[0]
             cparams.chainLog = compression_params.chain_log
             cparams.hashLog = compression_params.hash_log
             cparams.minMatch = compression_params.min_match
@@ -2727,6 +3752,18 @@ class ZstdCompressionDict(object):
             cparams.targetLength = compression_params.target_length
             cparams.windowLog = compression_params.window_log
 
+        key = _cdict_key(cparams)
+
+        with self._cdict_lock:
+            cdict = self._cdicts.pop(key, None)
+            if cdict is not None:
+                self._cdict_hits += 1
+                self._cdicts[key] = cdict
+                self._cdict = cdict
+                return
+
+            self._cdict_misses += 1
+
         cdict = lib.ZSTD_createCDict_advanced(
             self._data,
             len(self._data),
@@ -2738,29 +3775,216 @@ class ZstdCompressionDict(object):
         if cdict == ffi.NULL:
             raise ZstdError("unable to precompute dictionary")
 
-        self._cdict = ffi.gc(
+        cdict = ffi.gc(
             cdict, lib.ZSTD_freeCDict, size=lib.ZSTD_sizeof_CDict(cdict)
         )
 
+        with self._cdict_lock:
+            # Another thread may have digested the same parameters.
+            cdict = self._cdicts.pop(key, cdict)
+            self._cdicts[key] = cdict
+            self._cdict = cdict
+
+            while len(self._cdicts) > self._cdict_cache_size:
+                del self._cdicts[next(iter(self._cdicts))]
+                self._cdict_evictions += 1
+
     @property
-    def _ddict(self):
-        ddict = lib.ZSTD_createDDict_advanced(
-            self._data,
+    def cdict_cache_size(self):
+        """Maximum number of precomputed dictionaries to retain."""
+        return self._cdict_cache_size
+
+    def cdict_stats(self):
+        """Obtain statistics about the precomputed dictionary cache.
+
+        Returns a dict with the number of cache ``hits``, ``misses`` and
+        ``evictions``, the number of ``cached`` precomputed dictionaries and
+        the ``memory`` in bytes used by them. Hits include compressors
+        finding a precomputed dictionary matching their parameters. Misses
+        count how many times the dictionary was digested.
+        """
+        with self._cdict_lock:
+            return {
+                "hits": self._cdict_hits,
+                "misses": self._cdict_misses,
+                "evictions": self._cdict_evictions,
+                "cached": len(self._cdicts),
+                "memory": sum(
+                    lib.ZSTD_sizeof_CDict(cdict)
+                    for cdict in self._cdicts.values()
+                ),
+            }
+
+    def _get_cdict(self, params):
+        # Prefer a precomputed dictionary matching the compressor's parameters
+        # and fall back to the most recently precomputed one.
+        with self._cdict_lock:
+            if not self._cdicts:
+                return self._cdict
+
+        cparams = lib.ZSTD_getCParams(
+            _get_compression_parameter(params, lib.ZSTD_c_compressionLevel),
+            0,
             len(self._data),
-            lib.ZSTD_dlm_byRef,
-            self._dict_type,
-            lib.ZSTD_defaultCMem,
         )
 
-        if ddict == ffi.NULL:
-            raise ZstdError("could not create decompression dict")
+        for param, field in _CPARAM_FIELDS:
+            value = _get_compression_parameter(params, param)
+            if value:
+                setattr(cparams, field, value)
 
-        ddict = ffi.gc(
-            ddict, lib.ZSTD_freeDDict, size=lib.ZSTD_sizeof_DDict(ddict)
-        )
-        self.__dict__["_ddict"] = ddict
+        key = _cdict_key(cparams)
+
+        with self._cdict_lock:
+            cdict = self._cdicts.pop(key, None)
+            if cdict is None:
+                return self._cdict
+
+            self._cdict_hits += 1
+            self._cdicts[key] = cdict
+            return cdict
+
+    @property
+    def _ddict(self):
+        # Decompression contexts only reference the DDict, so it must live as
+        # long as this instance. Create it once, even with concurrent callers.
+        with self._ddict_lock:
+            if self._ddict_cache is not None:
+                return self._ddict_cache
+
+            ddict = lib.ZSTD_createDDict_advanced(
+                self._data,
+                len(self._data),
+                lib.ZSTD_dlm_byRef,
+                self._dict_type,
+                lib.ZSTD_defaultCMem,
+            )
+
+            if ddict == ffi.NULL:
+                raise ZstdError("could not create decompression dict")
+
+            self._ddict_cache = ffi.gc(
+                ddict, lib.ZSTD_freeDDict, size=lib.ZSTD_sizeof_DDict(ddict)
+            )
+
+            return self._ddict_cache
+
+
+def _splitmix64(state):
+    state = (state + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    z = state
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return state, z ^ (z >> 31)
+
+
+def _iter_samples(samples):
+    if isinstance(samples, BufferWithSegments):
+        for i in range(len(samples)):
+            offset = samples._segments[i * 2]
+            length = samples._segments[i * 2 + 1]
+            yield ffi.buffer(samples._data + offset, length)
+
+        return
+
+    if isinstance(samples, (bytes, str)):
+        raise TypeError("samples must be an iterable of bytes")
+
+    for sample in samples:
+        if not isinstance(sample, bytes):
+            raise ValueError("samples must be bytes")
+
+        yield sample
+
+
+def _compact_samples(buffer, entries):
+    """Drop evicted samples, moving live samples to the front of ``buffer``.
+
+    ``entries`` are ``[priority, offset, size, live]`` lists. Returns the
+    entries of the live samples.
+    """
+    live = []
+    offset = 0
+
+    for priority, start, size, alive in entries:
+        if not alive:
+            continue
+
+        if start != offset:
+            buffer[offset : offset + size] = buffer[start : start + size]
+
+        live.append([priority, offset, size, True])
+        offset += size
+
+    del buffer[offset:]
+
+    return live
+
+
+def _collect_samples(samples, max_samples_size, seed):
+    """Assemble training samples into a single buffer.
+
+    With a ``max_samples_size`` budget, each sample is assigned a random
+    priority and the samples with the lowest priorities fitting the budget
+    are retained. Evicted samples leave holes in the buffer, which are
+    reclaimed by compacting it once they take up as much room as the live
+    samples.
+
+    Returns a tuple of the buffer and a list of sample sizes.
+    """
+    if not max_samples_size:
+        buffer = bytearray()
+        sizes = []
+
+        for sample in _iter_samples(samples):
+            buffer += sample
+            sizes.append(len(sample))
+
+        return buffer, sizes
+
+    buffer = bytearray()
+    # [priority, offset, size, live] of samples in the order received.
+    entries = []
+    # Max-heap of indices of live entries via negated priorities.
+    heap = []
+    live_size = 0
+
+    for sample in _iter_samples(samples):
+        size = len(sample)
+        if size > max_samples_size:
+            continue
+
+        seed, priority = _splitmix64(seed)
+
+        # The sample would be the first to be evicted.
+        if (
+            live_size + size > max_samples_size
+            and heap
+            and priority > -heap[0][0]
+        ):
+            continue
+
+        dead_size = len(buffer) - live_size
+        if (dead_size and dead_size >= live_size) or (
+            len(entries) - len(heap) > len(heap)
+        ):
+            entries = _compact_samples(buffer, entries)
+            heap = [(-entry[0], i) for i, entry in enumerate(entries)]
+            heapq.heapify(heap)
+
+        heapq.heappush(heap, (-priority, len(entries)))
+        entries.append([priority, len(buffer), size, True])
+        buffer += sample
+        live_size += size
+
+        while live_size > max_samples_size:
+            evicted = entries[heapq.heappop(heap)[1]]
+            evicted[3] = False
+            live_size -= evicted[2]
 
-        return ddict
+    entries = _compact_samples(buffer, entries)
+
+    return buffer, [entry[2] for entry in entries]
 
 
 def train_dictionary(
@@ -2776,6 +4000,8 @@ def train_dictionary(
     level=0,
     steps=0,
     threads=0,
+    max_samples_size=0,
+    seed=0,
 ):
     """Train a dictionary from sample data using the COVER algorithm.
 
@@ -2806,11 +4032,27 @@ def train_dictionary(
     and ``level`` will be used that are equivalent with what
     ``ZDICT_trainFromBuffer()`` would use.
 
+    ``samples`` can be any iterable, such as a generator, or a
+    :py:class:`BufferWithSegments`. Samples are copied into the buffer
+    passed to zstd as they are received, so the input doesn't need to be
+    materialized. To bound memory usage when training from large corpora,
+    ``max_samples_size`` limits the total size of retained samples. A random
+    subset of samples fitting this budget is kept via reservoir sampling.
+    ``seed`` seeds the sampling, making the selection reproducible.
+
+    >>> def records():
+    ...     for path in paths:
+    ...         with open(path, "rb") as fh:
+    ...             yield fh.read()
+    >>> d = zstandard.train_dictionary(
+    ...     112640, records(), max_samples_size=100 * 1048576
+    ... )
 
     :param dict_size:
        Target size in bytes of the dictionary to generate.
     :param samples:
-       A list of bytes holding samples the dictionary will be trained from.
+       An iterable of bytes or a :py:class:`BufferWithSegments` holding
+       samples the dictionary will be trained from.
     :param k:
        Segment size : constraint: 0 < k : Reasonable range [16, 2048+]
     :param d:
@@ -2843,10 +4085,15 @@ def train_dictionary(
        Controls writing of informational messages to ``stderr``. ``0`` (the
        default) means to write nothing. ``1`` writes errors. ``2`` writes
        progression info. ``3`` writes more details. And ``4`` writes all info.
+    :param max_samples_size:
+       Maximum total size in bytes of samples to train from. Samples larger
+       than this are ignored. ``0`` (the default) retains every sample.
+    :param seed:
+       Integer seed for choosing samples when ``max_samples_size`` is set.
     """
 
-    if not isinstance(samples, list):
-        raise TypeError("samples must be a list")
+    if max_samples_size < 0:
+        raise ValueError("max_samples_size must be non-negative")
 
     if threads < 0:
         threads = _cpu_count()
@@ -2856,20 +4103,10 @@ def train_dictionary(
         steps = steps or 4
         level = level or 3
 
-    total_size = sum(map(len, samples))
-
-    samples_buffer = new_nonzero("char[]", total_size)
-    sample_sizes = new_nonzero("size_t[]", len(samples))
-
-    offset = 0
-    for i, sample in enumerate(samples):
-        if not isinstance(sample, bytes):
-            raise ValueError("samples must be bytes")
+    buffer, sizes = _collect_samples(samples, max_samples_size, seed)
 
-        sample_len = len(sample)
-        ffi.memmove(samples_buffer + offset, sample, sample_len)
-        offset += sample_len
-        sample_sizes[i] = sample_len
+    samples_buffer = ffi.from_buffer(buffer)
+    sample_sizes = ffi.new("size_t[]", sizes)
 
     dict_data = new_nonzero("char[]", dict_size)
 
@@ -2888,9 +4125,9 @@ def train_dictionary(
     zresult = lib.ZDICT_optimizeTrainFromBuffer_fastCover(
         ffi.addressof(dict_data),
         dict_size,
-        ffi.addressof(samples_buffer),
-        ffi.addressof(sample_sizes, 0),
-        len(samples),
+        samples_buffer,
+        sample_sizes,
+        len(sizes),
         ffi.addressof(dparams),
     )
 
@@ -3659,6 +4896,248 @@ class ZstdDecompressionWriter(object):
             return total_write
 
 
+# Assumed compression ratio when estimating the decompressed size of frames
+# that don't record their content size.
+_DECOMPRESS_ESTIMATED_RATIO = 4
+
+
+def _estimate_content_size(frame_buffer, frame_size):
+    """Estimate the decompressed size of a frame that doesn't record it.
+
+    Assumes a typical compression ratio, capped by the most the frame's
+    blocks can decompress to. The estimate only sizes the initial output
+    allocation.
+    """
+    estimate = max(
+        frame_size * _DECOMPRESS_ESTIMATED_RATIO,
+        DECOMPRESSION_RECOMMENDED_OUTPUT_SIZE,
+    )
+
+    bound = lib.ZSTD_decompressBound(frame_buffer, frame_size)
+    if bound != lib.ZSTD_CONTENTSIZE_ERROR:
+        estimate = min(estimate, bound)
+
+    return estimate
+
+
+def _scan_frames(data_buffer):
+    """Find the extent of the run of complete frames at the start of input.
+
+    Returns a 4-tuple of the number of input bytes occupied by frames, the
+    sum of content sizes of frames recording it, the number of frames that
+    don't, and the estimated total content size of all frames. Scanning stops
+    at data that isn't the start of a frame.
+    """
+    size = len(data_buffer)
+    offset = 0
+    content_size = 0
+    unknown_count = 0
+    estimated_size = 0
+
+    while offset < size:
+        frame_content_size = lib.ZSTD_getFrameContentSize(
+            data_buffer + offset, size - offset
+        )
+        if frame_content_size == lib.ZSTD_CONTENTSIZE_ERROR:
+            break
+
+        frame_size = lib.ZSTD_findFrameCompressedSize(
+            data_buffer + offset, size - offset
+        )
+        if lib.ZSTD_isError(frame_size):
+            raise ZstdError(
+                "decompression error: did not decompress full frame"
+            )
+
+        if frame_content_size == lib.ZSTD_CONTENTSIZE_UNKNOWN:
+            unknown_count += 1
+            estimated_size += _estimate_content_size(
+                data_buffer + offset, frame_size
+            )
+        else:
+            content_size += frame_content_size
+
+        offset += frame_size
+
+    return offset, content_size, unknown_count, content_size + estimated_size
+
+
+class ZstdDictionaryRegistry(object):
+    """A collection of dictionaries selected by dictionary ID.
+
+    Applications using many dictionaries can register all of them with a
+    registry and pass it to :py:class:`ZstdDecompressor` via its
+    ``dict_registry`` argument. The decompressor then uses the dictionary ID
+    recorded in each frame header to pick the dictionary needed to decompress
+    that frame.
+
+    >>> registry = zstandard.ZstdDictionaryRegistry(max_cached=16)
+    >>> for d in dictionaries:
+    ...     registry.add(d)
+    >>> dctx = zstandard.ZstdDecompressor(dict_registry=registry)
+    >>> data = dctx.decompress(frame)
+
+    Dictionaries must be *digested* before they can be used for decompression.
+    The registry digests dictionaries when they are first needed and retains
+    up to ``max_cached`` digested dictionaries, evicting the least recently
+    used one when the limit is reached.
+
+    Instances can be shared by multiple decompressors and threads.
+
+    :param max_cached:
+       Maximum number of digested dictionaries to retain.
+    """
+
+    def __init__(self, max_cached=64):
+        if max_cached < 1:
+            raise ValueError("max_cached must be positive")
+
+        self._max_cached = max_cached
+        self._dicts = {}
+        self._cache = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._version = 1
+
+    def __len__(self):
+        return len(self._dicts)
+
+    def __contains__(self, dict_id):
+        return dict_id in self._dicts
+
+    @property
+    def max_cached(self):
+        """Maximum number of digested dictionaries to retain."""
+        return self._max_cached
+
+    def add(self, dict_data):
+        """Register a dictionary under its dictionary ID.
+
+        A dictionary previously registered under the same ID is replaced.
+
+        :param dict_data:
+           :py:class:`ZstdCompressionDict` to register. It must have a
+           non-0 dictionary ID.
+        """
+        if not isinstance(dict_data, ZstdCompressionDict):
+            raise TypeError("dict_data must be zstd.ZstdCompressionDict")
+
+        dict_id = dict_data.dict_id()
+        if not dict_id:
+            raise ValueError("dictionary does not have a dictionary ID")
+
+        with self._lock:
+            self._dicts[dict_id] = dict_data
+            if self._cache.pop(dict_id, None) is not None:
+                self._version += 1
+
+    def remove(self, dict_id):
+        """Unregister the dictionary with the given ID.
+
+        Raises ``KeyError`` if no such dictionary is registered.
+        """
+        with self._lock:
+            del self._dicts[dict_id]
+            if self._cache.pop(dict_id, None) is not None:
+                self._version += 1
+
+    def stats(self):
+        """Obtain cache statistics.
+
+        Returns a dict with the number of cache ``hits``, ``misses`` and
+        ``evictions``, the number of ``cached`` digested dictionaries and
+        the ``memory`` in bytes used by them.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "cached": len(self._cache),
+                "memory": sum(
+                    lib.ZSTD_sizeof_DDict(d._ddict)
+                    for d in self._cache.values()
+                ),
+            }
+
+    def _get(self, dict_id):
+        with self._lock:
+            digest = self._cache.pop(dict_id, None)
+            if digest is not None:
+                self._hits += 1
+                self._cache[dict_id] = digest
+                return digest
+
+            source = self._dicts.get(dict_id)
+            if source is None:
+                return None
+
+            self._misses += 1
+
+        # Digest a private copy so evicting it releases its memory.
+        digest = ZstdCompressionDict(
+            source._data, dict_type=source._dict_type, k=source.k, d=source.d
+        )
+        digest._ddict
+
+        with self._lock:
+            self._cache[dict_id] = digest
+            self._version += 1
+
+            while len(self._cache) > self._max_cached:
+                del self._cache[next(iter(self._cache))]
+                self._evictions += 1
+
+        return digest
+
+    def _cached(self):
+        with self._lock:
+            return self._version, list(self._cache.items())
+
+
+def _configure_dctx(dctx, max_window_size, format, dict_data):
+    if max_window_size:
+        zresult = lib.ZSTD_DCtx_setMaxWindowSize(dctx, max_window_size)
+        if lib.ZSTD_isError(zresult):
+            raise ZstdError(
+                "unable to set max window size: %s" % _zstd_error(zresult)
+            )
+
+    zresult = lib.ZSTD_DCtx_setParameter(dctx, lib.ZSTD_d_format, format)
+    if lib.ZSTD_isError(zresult):
+        raise ZstdError(
+            "unable to set decoding format: %s" % _zstd_error(zresult)
+        )
+
+    if dict_data:
+        zresult = lib.ZSTD_DCtx_refDDict(dctx, dict_data._ddict)
+        if lib.ZSTD_isError(zresult):
+            raise ZstdError(
+                "unable to reference prepared dictionary: %s"
+                % _zstd_error(zresult)
+            )
+
+
+def _configure_dctx_dicts(dctx, dicts):
+    zresult = lib.ZSTD_DCtx_setParameter(
+        dctx, lib.ZSTD_d_refMultipleDDicts, lib.ZSTD_rmd_refMultipleDDicts
+    )
+    if lib.ZSTD_isError(zresult):
+        raise ZstdError(
+            "unable to enable multiple dictionaries: %s" % _zstd_error(zresult)
+        )
+
+    for dict_data in dicts:
+        zresult = lib.ZSTD_DCtx_refDDict(dctx, dict_data._ddict)
+        if lib.ZSTD_isError(zresult):
+            raise ZstdError(
+                "unable to reference prepared dictionary: %s"
+                % _zstd_error(zresult)
+            )
+
+
 class ZstdDecompressor(object):
     """
     Context for performing zstandard decompression.
@@ -3699,12 +5178,46 @@ class ZstdDecompressor(object):
        By default this is ``zstandard.FORMAT_ZSTD1``. It can be set to
        ``zstandard.FORMAT_ZSTD1_MAGICLESS`` to allow decoding frames without
        the 4 byte magic header. Not all decompression APIs support this mode.
+    :param dict_registry:
+       A :py:class:`ZstdDictionaryRegistry` to select the dictionary for each
+       frame from, based on the dictionary ID in the frame header. Cannot be
+       used with ``dict_data``.
+
+       :py:meth:`decompress`, :py:meth:`decompress_into` and
+       :py:meth:`multi_decompress_to_buffer` look up the dictionaries the
+       input frames need. Streaming APIs can only use dictionaries that the
+       registry has already digested when the operation starts.
     """
 
-    def __init__(self, dict_data=None, max_window_size=0, format=FORMAT_ZSTD1):
+    def __init__(
+        self,
+        dict_data=None,
+        max_window_size=0,
+        format=FORMAT_ZSTD1,
+        dict_registry=None,
+    ):
+        if dict_registry is not None:
+            if not isinstance(dict_registry, ZstdDictionaryRegistry):
+                raise TypeError(
+                    "dict_registry must be zstd.ZstdDictionaryRegistry"
+                )
+
+            if dict_data:
+                raise ValueError("cannot use both dict_data and dict_registry")
+
         self._dict_data = dict_data
         self._max_window_size = max_window_size
         self._format = format
+        self._dict_registry = dict_registry
+        # Digested registry dictionaries referenced by the context, keyed by
+        # dictionary ID. Keeps them alive for as long as the context may use
+        # them.
+        self._registry_dicts = {}
+        self._registry_version = 0
+        # Whether the decoding parameters and the dictionary have been
+        # applied to the context. Both survive session resets.
+        self._params_applied = False
+        self._dict_applied = False
 
         dctx = lib.ZSTD_createDCtx()
         if dctx == ffi.NULL:
@@ -3749,11 +5262,15 @@ class ZstdDecompressor(object):
 
         ``read_across_frames`` controls whether to read multiple zstandard
         frames in the input. When False, decompression stops after reading the
-        first frame. This feature is not yet implemented but the argument is
-        provided for forward API compatibility when the default is changed to
-        True in a future release. For now, if you need to decompress multiple
-        frames, use an API like :py:meth:`ZstdCompressor.stream_reader` with
-        ``read_across_frames=True``.
+        first frame. When True, all consecutive frames at the start of the
+        input are decompressed and their output is concatenated. Frame headers
+        are scanned up front so that, if every frame records its content size,
+        the output is allocated once with its exact size and decompressed
+        without further allocations. If any frame lacks a content size, the
+        output buffer is sized from an estimate and grown as needed, bounded
+        by ``max_output_size`` if non-0. Skippable frames are skipped. Input
+        after the last frame is treated as extra data. The default will likely
+        change to True in a future release.
 
         ``allow_extra_data`` controls how to handle extra input data after a
         fully decoded frame. If False, any extra data (which could be a valid
@@ -3768,10 +5285,11 @@ class ZstdDecompressor(object):
 
         If the frame header of the compressed data does not contain the content
         size, ``max_output_size`` must be specified or ``ZstdError`` will be
-        raised. An allocation of size ``max_output_size`` will be performed and an
-        attempt will be made to perform decompression into that buffer. If the
-        buffer is too small or cannot be allocated, ``ZstdError`` will be
-        raised. The buffer will be resized if it is too large.
+        raised. The output buffer is initially sized from an estimate based on
+        the compressed size and grows geometrically as needed. It is resized to
+        fit the decompressed data at the end. ``max_output_size`` is a hard
+        limit: if the decompressed data would exceed it, ``ZstdError`` will be
+        raised.
 
         Uncompressed data could be much larger than compressed data. As a result,
         calling this function could result in a very large memory allocation
@@ -3792,8 +5310,8 @@ class ZstdDecompressor(object):
         >>> dctx = zstandard.ZstdDecompressor()
         >>> uncompressed = dctx.decompress(data, max_output_size=1048576)
 
-        Ideally, ``max_output_size`` will be identical to the decompressed
-        output size.
+        ``max_output_size`` doesn't need to be close to the decompressed size:
+        it is only an upper bound and memory isn't allocated for it up front.
 
         .. important::
 
@@ -3812,15 +5330,18 @@ class ZstdDecompressor(object):
            ``bytes`` representing decompressed output.
         """
 
-        if read_across_frames:
-            raise ZstdError(
-                "ZstdDecompressor.read_across_frames=True is not yet implemented"
-            )
-
         self._ensure_dctx()
 
         data_buffer = ffi.from_buffer(data)
 
+        if self._dict_registry is not None:
+            self._select_frame_dicts(data_buffer, read_across_frames)
+
+        if read_across_frames:
+            return self._decompress_frames(
+                data_buffer, max_output_size, allow_extra_data
+            )
+
         output_size = lib.ZSTD_getFrameContentSize(
             data_buffer, len(data_buffer)
         )
@@ -3835,9 +5356,31 @@ class ZstdDecompressor(object):
                     "could not determine content size in frame header"
                 )
 
-            result_buffer = ffi.new("char[]", max_output_size)
-            result_size = max_output_size
-            output_size = 0
+            # Grow output from an estimate, up to max_output_size.
+            frame_size = lib.ZSTD_findFrameCompressedSize(
+                data_buffer, len(data_buffer)
+            )
+            if lib.ZSTD_isError(frame_size):
+                raise ZstdError(
+                    "decompression error: did not decompress full frame"
+                )
+
+            if not allow_extra_data and frame_size < len(data_buffer):
+                raise ZstdError(
+                    "compressed input contains %d bytes of unused data, "
+                    "which is disallowed" % (len(data_buffer) - frame_size)
+                )
+
+            in_buffer = ffi.new("ZSTD_inBuffer *")
+            in_buffer.src = data_buffer
+            in_buffer.size = frame_size
+            in_buffer.pos = 0
+
+            return self._decompress_growable(
+                in_buffer,
+                _estimate_content_size(data_buffer, frame_size),
+                max_output_size,
+            )
         else:
             result_buffer = ffi.new("char[]", output_size)
             result_size = output_size
@@ -3874,6 +5417,204 @@ class ZstdDecompressor(object):
 
         return ffi.buffer(result_buffer, out_buffer.pos)[:]
 
+    def decompress_into(self, data, out, allow_extra_data=True):
+        """
+        Decompress a frame in a single operation into a caller-provided buffer.
+
+        This is like :py:meth:`decompress` except decompressed data is written
+        into ``out``, which must be a writable object conforming to the buffer
+        protocol, such as a ``bytearray``, ``memoryview``, ``mmap.mmap``, or
+        numpy array. This avoids allocating a new ``bytes`` for every call.
+
+        The frame doesn't need to have its content size in the frame header.
+        If it does and the content size is larger than ``out``, ``ZstdError``
+        is raised before decompression starts. If decompressed data doesn't
+        fit in ``out``, ``ZstdError`` is raised and the contents of ``out``
+        are undefined.
+
+        >>> dctx = zstandard.ZstdDecompressor()
+        >>> out = bytearray(65536)
+        >>> size = dctx.decompress_into(frame, out)
+        >>> decompressed = out[:size]
+
+        :param data:
+           Compressed data to decompress.
+        :param out:
+           Writable buffer to write decompressed data to.
+        :param allow_extra_data:
+           Whether to ignore extra input data after the frame. See
+           :py:meth:`decompress`.
+        :return:
+           Integer number of bytes written to ``out``.
+        """
+        self._ensure_dctx()
+
+        data_buffer = ffi.from_buffer(data)
+        try:
+            dest_buffer = ffi.from_buffer(out, require_writable=True)
+        except BufferError:
+            raise TypeError("out must be a writable buffer")
+
+        if self._dict_registry is not None:
+            self._select_frame_dicts(data_buffer, False)
+
+        output_size = lib.ZSTD_getFrameContentSize(
+            data_buffer, len(data_buffer)
+        )
+
+        if output_size == lib.ZSTD_CONTENTSIZE_ERROR:
+            raise ZstdError("error determining content size from frame header")
+        elif output_size == lib.ZSTD_CONTENTSIZE_UNKNOWN:
+            output_size = 0
+        elif output_size > len(dest_buffer):
+            raise ZstdError(
+                "output buffer too small: frame content size %d exceeds %d "
+                "bytes" % (output_size, len(dest_buffer))
+            )
+
+        out_buffer = ffi.new("ZSTD_outBuffer *")
+        out_buffer.dst = dest_buffer
+        out_buffer.size = len(dest_buffer)
+        out_buffer.pos = 0
+
+        in_buffer = ffi.new("ZSTD_inBuffer *")
+        in_buffer.src = data_buffer
+        in_buffer.size = len(data_buffer)
+        in_buffer.pos = 0
+
+        zresult = lib.ZSTD_decompressStream(self._dctx, out_buffer, in_buffer)
+        if lib.ZSTD_isError(zresult):
+            raise ZstdError("decompression error: %s" % _zstd_error(zresult))
+        elif zresult:
+            if out_buffer.pos == out_buffer.size:
+                raise ZstdError(
+                    "output buffer too small: decompressed data exceeds %d "
+                    "bytes" % len(dest_buffer)
+                )
+
+            raise ZstdError(
+                "decompression error: did not decompress full frame"
+            )
+        elif output_size and out_buffer.pos != output_size:
+            raise ZstdError(
+                "decompression error: decompressed %d bytes; expected %d"
+                % (out_buffer.pos, output_size)
+            )
+        elif not allow_extra_data and in_buffer.pos < in_buffer.size:
+            count = in_buffer.size - in_buffer.pos
+
+            raise ZstdError(
+                "compressed input contains %d bytes of unused data, which is "
+                "disallowed" % count
+            )
+
+        return out_buffer.pos
+
+    def _decompress_growable(self, in_buffer, initial_size, max_output_size):
+        """Decompress all input into an output buffer that grows as needed.
+
+        The buffer starts at ``initial_size`` and doubles whenever it fills
+        up, up to ``max_output_size`` if non-0.
+
+        The buffer is a ``bytearray`` resized in place, which lets the
+        allocator extend the existing allocation instead of copying
+        decompressed data to a new one, and is trimmed once at the end.
+        Converting it to ``bytes`` is the only full copy.
+        """
+        if max_output_size:
+            initial_size = min(initial_size, max_output_size)
+
+        result = bytearray(initial_size)
+        result_buffer = ffi.from_buffer(result)
+
+        out_buffer = ffi.new("ZSTD_outBuffer *")
+        out_buffer.dst = result_buffer
+        out_buffer.size = initial_size
+        out_buffer.pos = 0
+
+        while True:
+            # Frame boundaries return 0. Keep going while there is input and
+            # either room for output or a new frame to start.
+            while True:
+                zresult = lib.ZSTD_decompressStream(
+                    self._dctx, out_buffer, in_buffer
+                )
+                if lib.ZSTD_isError(zresult):
+                    raise ZstdError(
+                        "decompression error: %s" % _zstd_error(zresult)
+                    )
+
+                if in_buffer.pos == in_buffer.size or (
+                    zresult and out_buffer.pos == out_buffer.size
+                ):
+                    break
+
+            if not zresult and in_buffer.pos == in_buffer.size:
+                break
+
+            if out_buffer.pos < out_buffer.size:
+                raise ZstdError(
+                    "decompression error: did not decompress full frame"
+                )
+
+            if max_output_size and out_buffer.size >= max_output_size:
+                raise ZstdError(
+                    "decompression error: decompressed data exceeds "
+                    "max_output_size of %d bytes" % max_output_size
+                )
+
+            new_size = (
+                out_buffer.size * 2 or DECOMPRESSION_RECOMMENDED_OUTPUT_SIZE
+            )
+            if max_output_size:
+                new_size = min(new_size, max_output_size)
+
+            # The bytearray can't be resized while its memory is exported.
+            ffi.release(result_buffer)
+            result += bytes(new_size - out_buffer.size)
+            result_buffer = ffi.from_buffer(result)
+
+            out_buffer.dst = result_buffer
+            out_buffer.size = new_size
+
+        ffi.release(result_buffer)
+        del result[out_buffer.pos :]
+
+        return bytes(result)
+
+    def _decompress_frames(
+        self, data_buffer, max_output_size, allow_extra_data
+    ):
+        """Decompress every frame in the input into a single output buffer."""
+        frames_size, content_size, unknown_count, estimated_size = _scan_frames(
+            data_buffer
+        )
+
+        if not frames_size:
+            raise ZstdError("error determining content size from frame header")
+
+        if not allow_extra_data and frames_size < len(data_buffer):
+            raise ZstdError(
+                "compressed input contains %d bytes of unused data, which is "
+                "disallowed" % (len(data_buffer) - frames_size)
+            )
+
+        in_buffer = ffi.new("ZSTD_inBuffer *")
+        in_buffer.src = data_buffer
+        in_buffer.size = frames_size
+        in_buffer.pos = 0
+
+        # All frames record their content size: the output is exact.
+        if not unknown_count:
+            if not content_size:
+                return b""
+
+            return self._decompress_growable(in_buffer, content_size, 0)
+
+        return self._decompress_growable(
+            in_buffer, estimated_size, max_output_size
+        )
+
     def stream_reader(
         self,
         source,
@@ -4377,7 +6118,7 @@ class ZstdDecompressor(object):
         """
         Decompress multiple zstd frames to output buffers as a single operation.
 
-        (Experimental. Not available in CFFI backend.)
+        (Experimental.)
 
         Compressed frames can be passed to the function as a
         ``BufferWithSegments``, a ``BufferWithSegmentsCollection``, or as a
@@ -4430,10 +6171,12 @@ class ZstdDecompressor(object):
         they need to access data for multiple frames, such as when  *delta chains* are
         being used.
 
-        Currently, the implementation always spawns multiple threads when requested,
-        even if the amount of work to do is small. In the future, it will be smarter
-        about avoiding threads and their associated overhead when the amount of
-        work to do is small.
+        Fewer threads than requested are used when the batch is too small to
+        benefit from them. The number of workers is derived from an estimate
+        of the cost of decompressing the batch, based on the total compressed
+        size and the number of frames. Unlike
+        :py:meth:`ZstdCompressor.multi_compress_to_buffer`, worker threads and
+        contexts are not retained between calls.
 
         :param frames:
            Source defining zstd frames to decompress.
@@ -4447,32 +6190,201 @@ class ZstdDecompressor(object):
         :return:
            ``BufferWithSegmentsCollection``
         """
-        raise NotImplementedError()
+        if threads < 0:
+            threads = _cpu_count()
 
-    def _ensure_dctx(self, load_dict=True):
-        lib.ZSTD_DCtx_reset(self._dctx, lib.ZSTD_reset_session_only)
+        sources = _buffer_sources(frames)
+        if sources is None:
+            raise TypeError("argument must be list or BufferWithSegments")
 
-        if self._max_window_size:
-            zresult = lib.ZSTD_DCtx_setMaxWindowSize(
-                self._dctx, self._max_window_size
-            )
-            if lib.ZSTD_isError(zresult):
-                raise ZstdError(
-                    "unable to set max window size: %s" % _zstd_error(zresult)
+        if not sources:
+            raise ValueError("no source elements found")
+
+        if decompressed_sizes is not None:
+            sizes_buffer = memoryview(decompressed_sizes).cast("B")
+            if len(sizes_buffer) != len(sources) * 8:
+                raise ValueError(
+                    "decompressed_sizes size mismatch; expected %d, got %d"
+                    % (len(sources) * 8, len(sizes_buffer))
                 )
 
-        zresult = lib.ZSTD_DCtx_setParameter(
-            self._dctx, lib.ZSTD_d_format, self._format
+            frame_sizes = array.array("Q")
+            frame_sizes.frombytes(sizes_buffer)
+        else:
+            frame_sizes = None
+
+        # Resolve output sizes up front so all output can be written to a
+        # single allocation, with each worker writing to its own region.
+        segments = array.array("Q")
+        total_size = 0
+
+        for i, (source, source_size) in enumerate(sources):
+            size = frame_sizes[i] if frame_sizes else 0
+
+            if not size:
+                size = lib.ZSTD_getFrameContentSize(source, source_size)
+
+                if size in (
+                    lib.ZSTD_CONTENTSIZE_ERROR,
+                    lib.ZSTD_CONTENTSIZE_UNKNOWN,
+                ):
+                    raise ValueError(
+                        "could not determine decompressed size of item %d" % i
+                    )
+
+            segments.append(total_size)
+            segments.append(size)
+            total_size += size
+
+        dest = new_nonzero("char[]", total_size)
+
+        max_window_size = self._max_window_size
+        format = self._format
+        dict_data = self._dict_data
+
+        # Digest the dictionary before handing it to multiple threads.
+        if dict_data:
+            dict_data._ddict
+
+        # Resolve the registry dictionaries the frames need. Holding them
+        # here keeps them alive while workers use them.
+        registry_dicts = None
+        if self._dict_registry is not None:
+            registry_dicts = {}
+            for source, source_size in sources:
+                dict_id = lib.ZSTD_getDictID_fromFrame(source, source_size)
+                if dict_id and dict_id not in registry_dicts:
+                    digest = self._dict_registry._get(dict_id)
+                    if digest is not None:
+                        registry_dicts[dict_id] = digest
+
+        def decompress_range(index, start, end):
+            dctx = lib.ZSTD_createDCtx()
+            if dctx == ffi.NULL:
+                raise MemoryError()
+
+            dctx = ffi.gc(dctx, lib.ZSTD_freeDCtx)
+            _configure_dctx(dctx, max_window_size, format, dict_data)
+            if registry_dicts is not None:
+                _configure_dctx_dicts(dctx, registry_dicts.values())
+
+            in_buffer = ffi.new("ZSTD_inBuffer *")
+            out_buffer = ffi.new("ZSTD_outBuffer *")
+
+            for i in range(start, end):
+                in_buffer.src, in_buffer.size = sources[i]
+                in_buffer.pos = 0
+
+                out_buffer.dst = dest + segments[i * 2]
+                out_buffer.size = segments[i * 2 + 1]
+                out_buffer.pos = 0
+
+                zresult = lib.ZSTD_decompressStream(dctx, out_buffer, in_buffer)
+                if lib.ZSTD_isError(zresult):
+                    raise ZstdError(
+                        "error decompressing item %d: %s"
+                        % (i, _zstd_error(zresult))
+                    )
+                elif zresult or out_buffer.pos != out_buffer.size:
+                    raise ZstdError(
+                        "error decompressing item %d: decompressed %d bytes; "
+                        "expected %d" % (i, out_buffer.pos, out_buffer.size)
+                    )
+
+        sizes = [size for _, size in sources]
+        threads = _multi_decompress_thread_count(threads, sizes)
+
+        _run_workers(decompress_range, _split_work(sizes, threads))
+
+        return BufferWithSegmentsCollection(
+            BufferWithSegments._from_memory(dest, total_size, segments)
         )
-        if lib.ZSTD_isError(zresult):
-            raise ZstdError(
-                "unable to set decoding format: %s" % _zstd_error(zresult)
+
+    def _ensure_dctx(self, load_dict=True):
+        registry = self._dict_registry
+
+        # Dictionaries referenced by the context can't be released
+        # individually. Start over with a fresh context once too many have
+        # accumulated.
+        if (
+            registry is not None
+            and len(self._registry_dicts) > 2 * registry._max_cached
+        ):
+            dctx = lib.ZSTD_createDCtx()
+            if dctx == ffi.NULL:
+                raise MemoryError()
+
+            self._dctx = ffi.gc(
+                dctx, lib.ZSTD_freeDCtx, size=lib.ZSTD_sizeof_DCtx(dctx)
+            )
+            self._registry_dicts = {}
+            self._registry_version = 0
+            self._params_applied = False
+
+        lib.ZSTD_DCtx_reset(self._dctx, lib.ZSTD_reset_session_only)
+
+        # Skip reapplying parameters and the dictionary on every operation.
+        if not self._params_applied:
+            _configure_dctx(
+                self._dctx, self._max_window_size, self._format, None
             )
+            self._params_applied = True
 
-        if self._dict_data and load_dict:
+        if load_dict and self._dict_data and not self._dict_applied:
             zresult = lib.ZSTD_DCtx_refDDict(self._dctx, self._dict_data._ddict)
             if lib.ZSTD_isError(zresult):
                 raise ZstdError(
                     "unable to reference prepared dictionary: %s"
                     % _zstd_error(zresult)
                 )
+
+            self._dict_applied = True
+
+        if load_dict and registry is not None:
+            _configure_dctx_dicts(self._dctx, [])
+
+            # Reference everything currently cached by the registry so
+            # streaming operations can use it.
+            version, cached = registry._cached()
+            if version != self._registry_version:
+                for dict_id, dict_data in cached:
+                    self._reference_registry_dict(dict_id, dict_data)
+
+                self._registry_version = version
+
+    def _reference_registry_dict(self, dict_id, dict_data):
+        if self._registry_dicts.get(dict_id) is dict_data:
+            return
+
+        zresult = lib.ZSTD_DCtx_refDDict(self._dctx, dict_data._ddict)
+        if lib.ZSTD_isError(zresult):
+            raise ZstdError(
+                "unable to reference prepared dictionary: %s"
+                % _zstd_error(zresult)
+            )
+
+        self._registry_dicts[dict_id] = dict_data
+
+    def _select_frame_dicts(self, data_buffer, all_frames):
+        offset = 0
+        size = len(data_buffer)
+
+        while offset < size:
+            dict_id = lib.ZSTD_getDictID_fromFrame(
+                data_buffer + offset, size - offset
+            )
+            if dict_id:
+                dict_data = self._dict_registry._get(dict_id)
+                if dict_data is not None:
+                    self._reference_registry_dict(dict_id, dict_data)
+
+            if not all_frames:
+                break
+
+            frame_size = lib.ZSTD_findFrameCompressedSize(
+                data_buffer + offset, size - offset
+            )
+            if lib.ZSTD_isError(frame_size):
+                break
+
+            offset += frame_size
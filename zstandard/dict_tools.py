@@ -0,0 +1,426 @@
+# Copyright (c) 2024-present, Gregory Szorc
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license. See the LICENSE file for details.
+
+"""Tools for choosing, evaluating and maintaining compression dictionaries."""
+
+import concurrent.futures
+import os
+import random
+import time
+
+from . import (
+    BufferWithSegments,
+    ZstdCompressionDict,
+    ZstdCompressor,
+    ZstdDecompressor,
+    backend_features,
+    train_dictionary,
+)
+
+__all__ = [
+    "DictionaryEvaluation",
+    "DriftReport",
+    "detect_drift",
+    "evaluate_candidates",
+    "evaluate_dictionary",
+    "pareto_front",
+    "split_samples",
+    "train_candidates",
+]
+
+
+def _sample_list(samples):
+    if isinstance(samples, list):
+        return samples
+    elif isinstance(samples, BufferWithSegments):
+        return [samples[i].tobytes() for i in range(len(samples))]
+    else:
+        return list(samples)
+
+
+class DictionaryEvaluation(object):
+    """Result of evaluating a dictionary against a set of samples.
+
+    Speeds are in bytes of uncompressed data per second.
+    """
+
+    __slots__ = (
+        "dict_data",
+        "dict_size",
+        "dict_id",
+        "k",
+        "d",
+        "level",
+        "source_size",
+        "compressed_size",
+        "ratio",
+        "compress_speed",
+        "decompress_speed",
+    )
+
+    def __init__(
+        self,
+        dict_data,
+        level,
+        source_size,
+        compressed_size,
+        compress_speed,
+        decompress_speed,
+    ):
+        #: The evaluated :py:class:`zstandard.ZstdCompressionDict`. ``None``
+        #: when evaluating compression without a dictionary.
+        self.dict_data = dict_data
+        self.dict_size = len(dict_data) if dict_data is not None else 0
+        self.dict_id = dict_data.dict_id() if dict_data is not None else 0
+        self.k = dict_data.k if dict_data is not None else 0
+        self.d = dict_data.d if dict_data is not None else 0
+        self.level = level
+        self.source_size = source_size
+        self.compressed_size = compressed_size
+        self.ratio = source_size / compressed_size
+        self.compress_speed = compress_speed
+        self.decompress_speed = decompress_speed
+
+    def __repr__(self):
+        return (
+            "DictionaryEvaluation(dict_size=%d, level=%d, ratio=%.3f, "
+            "compress_speed=%.0f, decompress_speed=%.0f)"
+            % (
+                self.dict_size,
+                self.level,
+                self.ratio,
+                self.compress_speed,
+                self.decompress_speed,
+            )
+        )
+
+
+class DriftReport(object):
+    """Result of :py:func:`detect_drift`."""
+
+    __slots__ = ("ratio", "baseline_ratio", "change", "drifted")
+
+    def __init__(self, ratio, baseline_ratio, threshold):
+        #: Compression ratio achieved on the live samples.
+        self.ratio = ratio
+        #: Compression ratio the dictionary was expected to achieve.
+        self.baseline_ratio = baseline_ratio
+        #: Relative decrease of the ratio compared to the baseline. Negative
+        #: if the dictionary performs better than the baseline.
+        self.change = (baseline_ratio - ratio) / baseline_ratio
+        #: Whether the decrease exceeds the threshold.
+        self.drifted = self.change > threshold
+
+    def __repr__(self):
+        return "DriftReport(ratio=%.3f, baseline_ratio=%.3f, drifted=%r)" % (
+            self.ratio,
+            self.baseline_ratio,
+            self.drifted,
+        )
+
+
+def split_samples(samples, held_out=0.25, seed=0):
+    """Split samples into a training set and a held-out evaluation set.
+
+    Samples are assigned randomly. The split is reproducible for a given
+    ``seed``.
+
+    :param samples:
+       An iterable of bytes or a :py:class:`zstandard.BufferWithSegments`.
+    :param held_out:
+       Fraction of samples to hold out for evaluation.
+    :param seed:
+       Seed for the random assignment.
+    :return:
+       A 2-tuple of lists of bytes: the training and held-out samples.
+    """
+    if not 0.0 < held_out < 1.0:
+        raise ValueError("held_out must be between 0 and 1")
+
+    samples = list(_sample_list(samples))
+    random.Random(seed).shuffle(samples)
+
+    count = int(len(samples) * held_out)
+
+    return samples[count:], samples[:count]
+
+
+def train_candidates(samples, dict_sizes, threads=None, **kwargs):
+    """Train candidate dictionaries of several sizes in parallel.
+
+    Each candidate is trained with :py:func:`zstandard.train_dictionary` on
+    its own thread. Training releases the GIL, so candidates are trained
+    concurrently.
+
+    >>> candidates = dict_tools.train_candidates(
+    ...     samples, [16384, 65536, 112640], k=64, d=8
+    ... )
+
+    :param samples:
+       An iterable of bytes or a :py:class:`zstandard.BufferWithSegments`.
+    :param dict_sizes:
+       Iterable of target dictionary sizes in bytes.
+    :param threads:
+       Maximum number of candidates to train at the same time. Defaults to
+       the number of logical CPUs.
+    :param kwargs:
+       Additional arguments passed to :py:func:`zstandard.train_dictionary`.
+    :return:
+       List of :py:class:`zstandard.ZstdCompressionDict`, in the order of
+       ``dict_sizes``.
+    """
+    dict_sizes = list(dict_sizes)
+    if not dict_sizes:
+        raise ValueError("dict_sizes must not be empty")
+
+    # Samples are consumed once per candidate.
+    if not isinstance(samples, BufferWithSegments):
+        samples = _sample_list(samples)
+
+    threads = min(threads or os.cpu_count() or 1, len(dict_sizes))
+
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        futures = [
+            executor.submit(train_dictionary, size, samples, **kwargs)
+            for size in dict_sizes
+        ]
+
+        return [future.result() for future in futures]
+
+
+def _compress_all(cctx, samples, threads):
+    if "multi_compress_to_buffer" in backend_features:
+        return cctx.multi_compress_to_buffer(samples, threads=threads)
+    else:
+        return [cctx.compress(sample) for sample in samples]
+
+
+def _decompress_all(dctx, frames, threads):
+    if "multi_decompress_to_buffer" in backend_features and not isinstance(
+        frames, list
+    ):
+        dctx.multi_decompress_to_buffer(frames, threads=threads)
+    else:
+        for frame in frames:
+            dctx.decompress(frame)
+
+
+def _total_size(items):
+    if isinstance(items, list):
+        return sum(map(len, items))
+    elif isinstance(items, BufferWithSegments):
+        return sum(len(items[i]) for i in range(len(items)))
+    else:
+        # BufferWithSegmentsCollection.
+        return items.size()
+
+
+def evaluate_dictionary(dict_data, samples, level=3, threads=0, rounds=3):
+    """Measure how a dictionary performs on a set of samples.
+
+    Every sample is compressed as its own frame and then decompressed. The
+    fastest of ``rounds`` passes is used for the reported speeds. A copy of
+    the dictionary is precomputed for ``level`` beforehand so digesting it
+    isn't measured. ``dict_data`` itself is left untouched.
+
+    Samples should not have been used to train the dictionary. See
+    :py:func:`split_samples`.
+
+    :param dict_data:
+       :py:class:`zstandard.ZstdCompressionDict` to evaluate. ``None``
+       evaluates compression without a dictionary, which is useful as a
+       baseline.
+    :param samples:
+       An iterable of bytes or a :py:class:`zstandard.BufferWithSegments`.
+    :param level:
+       Compression level to evaluate.
+    :param threads:
+       Number of threads to use for compressing and decompressing. See
+       :py:meth:`zstandard.ZstdCompressor.multi_compress_to_buffer`.
+    :param rounds:
+       Number of timed passes over the samples.
+    :return:
+       :py:class:`DictionaryEvaluation`
+    """
+    if rounds < 1:
+        raise ValueError("rounds must be positive")
+
+    if not isinstance(samples, BufferWithSegments):
+        samples = _sample_list(samples)
+
+    if not len(samples):
+        raise ValueError("samples must not be empty")
+
+    source_size = _total_size(samples)
+
+    # Compressors fall back to the most recently precomputed parameters of
+    # a dictionary. Precomputing the caller's dictionary would change what
+    # their other compressors produce.
+    if dict_data is not None:
+        evaluated = ZstdCompressionDict(
+            dict_data.as_bytes(), dict_type=dict_data._dict_type
+        )
+        evaluated.precompute_compress(level=level)
+    else:
+        evaluated = None
+
+    cctx = ZstdCompressor(level=level, dict_data=evaluated)
+    dctx = ZstdDecompressor(dict_data=evaluated)
+
+    compress_time = None
+    decompress_time = None
+    frames = None
+
+    for _ in range(rounds):
+        start = time.perf_counter()
+        frames = _compress_all(cctx, samples, threads)
+        elapsed = time.perf_counter() - start
+
+        if compress_time is None or elapsed < compress_time:
+            compress_time = elapsed
+
+    for _ in range(rounds):
+        start = time.perf_counter()
+        _decompress_all(dctx, frames, threads)
+        elapsed = time.perf_counter() - start
+
+        if decompress_time is None or elapsed < decompress_time:
+            decompress_time = elapsed
+
+    # Guard against timer resolution on tiny inputs.
+    compress_time = max(compress_time, 1e-9)
+    decompress_time = max(decompress_time, 1e-9)
+
+    return DictionaryEvaluation(
+        dict_data,
+        level,
+        source_size,
+        _total_size(frames),
+        source_size / compress_time,
+        source_size / decompress_time,
+    )
+
+
+def evaluate_candidates(candidates, samples, **kwargs):
+    """Evaluate multiple dictionaries on the same samples.
+
+    Candidates are evaluated one after the other so their throughput
+    measurements don't interfere with each other.
+
+    :param candidates:
+       Iterable of :py:class:`zstandard.ZstdCompressionDict`.
+    :param samples:
+       An iterable of bytes or a :py:class:`zstandard.BufferWithSegments`.
+    :param kwargs:
+       Additional arguments passed to :py:func:`evaluate_dictionary`.
+    :return:
+       List of :py:class:`DictionaryEvaluation`, in the order of
+       ``candidates``.
+    """
+    if not isinstance(samples, BufferWithSegments):
+        samples = _sample_list(samples)
+
+    return [evaluate_dictionary(d, samples, **kwargs) for d in candidates]
+
+
+def pareto_front(
+    evaluations, objectives=("ratio", "compress_speed", "decompress_speed")
+):
+    """Obtain the evaluations that aren't dominated by another evaluation.
+
+    An evaluation is dominated if another evaluation is at least as good for
+    every objective and better for at least one. What remains is the set of
+    best trade-offs to choose from.
+
+    Objectives name :py:class:`DictionaryEvaluation` attributes, which are
+    maximized. Prefix a name with ``-`` to minimize it instead:
+
+    >>> front = dict_tools.pareto_front(
+    ...     evaluations, objectives=("ratio", "-dict_size")
+    ... )
+
+    :param evaluations:
+       Iterable of :py:class:`DictionaryEvaluation`.
+    :param objectives:
+       Iterable of attribute names to optimize.
+    :return:
+       List of :py:class:`DictionaryEvaluation` on the Pareto front, ordered
+       from best to worst by the first objective.
+    """
+    objectives = list(objectives)
+    if not objectives:
+        raise ValueError("objectives must not be empty")
+
+    def score(evaluation):
+        return tuple(
+            -getattr(evaluation, name[1:])
+            if name.startswith("-")
+            else getattr(evaluation, name)
+            for name in objectives
+        )
+
+    scored = [(score(e), e) for e in evaluations]
+
+    front = [
+        (values, e)
+        for values, e in scored
+        if not any(
+            other != values and all(o >= v for o, v in zip(other, values))
+            for other, _ in scored
+        )
+    ]
+
+    front.sort(key=lambda entry: entry[0][0], reverse=True)
+
+    return [e for _, e in front]
+
+
+def detect_drift(dict_data, samples, baseline_ratio, threshold=0.1, level=3):
+    """Detect whether a dictionary no longer fits the data being compressed.
+
+    Data changes over time and a dictionary trained on old data compresses
+    new data less effectively. This compresses a sample of live data with
+    the dictionary and compares the compression ratio against the ratio
+    recorded when the dictionary was evaluated, such as
+    :py:attr:`DictionaryEvaluation.ratio`.
+
+    >>> report = dict_tools.detect_drift(d, recent, evaluation.ratio)
+    >>> if report.drifted:
+    ...     d = retrain()
+
+    :param dict_data:
+       :py:class:`zstandard.ZstdCompressionDict` currently in use.
+    :param samples:
+       An iterable of bytes or a :py:class:`zstandard.BufferWithSegments`
+       holding recent data.
+    :param baseline_ratio:
+       Compression ratio the dictionary is expected to achieve.
+    :param threshold:
+       Relative decrease of the ratio beyond which the dictionary is
+       considered to have drifted.
+    :param level:
+       Compression level to use.
+    :return:
+       :py:class:`DriftReport`
+    """
+    if baseline_ratio <= 0:
+        raise ValueError("baseline_ratio must be positive")
+
+    if threshold < 0:
+        raise ValueError("threshold must not be negative")
+
+    if not isinstance(samples, BufferWithSegments):
+        samples = _sample_list(samples)
+
+    if not len(samples):
+        raise ValueError("samples must not be empty")
+
+    cctx = ZstdCompressor(level=level, dict_data=dict_data)
+    frames = _compress_all(cctx, samples, 0)
+
+    return DriftReport(
+        _total_size(samples) / _total_size(frames), baseline_ratio, threshold
+    )